@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bulk pruning benchmark for the framework MemoryIndex.
+
+Fills a MemoryIndex with synthetic senate memories, then removes a random half
+of them and updates a sample of the rest. For contrast it also times the former
+removal, which scanned the whole timestamp list and every word of the text
+index for each memory. That removal is quadratic overall, so it is timed on a
+sample and extrapolated to the full prune.
+
+Usage:
+    python scripts/benchmark_memory_index.py [--size 100000] [--fraction 0.5] [--legacy-sample 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the project root to Python path
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.insert(0, base_dir)
+
+from src.agentic_game_framework.memory.memory_index import MemoryIndex
+from src.agentic_game_framework.memory.memory_interface import MemoryItem
+
+WORDS = ("grain egypt legion gaul senate consul tribune tax aqueduct pirate ostia "
+         "treaty carthage vote debate law province revolt harbor temple").split()
+SENATORS = ("cicero", "cato", "caesar", "pompey", "crassus", "brutus")
+
+
+def make_index(size: int, rng: random.Random) -> MemoryIndex:
+    """A MemoryIndex holding size random memories."""
+    index = MemoryIndex()
+    for i in range(size):
+        index.index_memory(MemoryItem(
+            f"memory_{i}", rng.uniform(0, size), " ".join(rng.choices(WORDS, k=8)) + f" session{i // 100}",
+            importance=rng.random(), associations={"speaker": rng.choice(SENATORS)}
+        ))
+    return index
+
+
+def legacy_remove(timestamp_index, text_index, memory_id: str) -> None:
+    """The former removal: a scan of the timestamp list and of every word."""
+    for i, (_, mid) in enumerate(timestamp_index):
+        if mid == memory_id:
+            timestamp_index.pop(i)
+            break
+    for word, memory_ids in list(text_index.items()):
+        if memory_id in memory_ids:
+            memory_ids.remove(memory_id)
+            if not memory_ids:
+                del text_index[word]
+
+
+def main():
+    """Parse command line arguments and print the timings."""
+    parser = argparse.ArgumentParser(description="Benchmark MemoryIndex bulk pruning.")
+    parser.add_argument("--size", type=int, default=100000, help="Memories to index (default: 100000)")
+    parser.add_argument("--fraction", type=float, default=0.5, help="Fraction to prune (default: 0.5)")
+    parser.add_argument("--updates", type=int, default=10000, help="Memories to update afterwards (default: 10000)")
+    parser.add_argument("--legacy-sample", type=int, default=200,
+                        help="Removals timed with the former algorithm (default: 200)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    index = make_index(args.size, rng)
+    victims = rng.sample([memory.id for memory in index.get_all_memories()], int(args.size * args.fraction))
+
+    # The former structures: a sorted list and word -> set of ids
+    timestamp_list = list(index._timestamp_index)
+    text_sets = {term: set(postings) for term, postings in index._text_index._postings.items()}
+    start = time.perf_counter()
+    for memory_id in victims[:args.legacy_sample]:
+        legacy_remove(timestamp_list, text_sets, memory_id)
+    legacy = (time.perf_counter() - start) / args.legacy_sample
+
+    start = time.perf_counter()
+    for memory_id in victims:
+        index.remove_memory(memory_id)
+    prune = time.perf_counter() - start
+
+    survivors = rng.sample(index.get_all_memories(), min(args.updates, len(index.get_all_memories())))
+    start = time.perf_counter()
+    for memory in survivors:
+        memory.importance = rng.random()
+        memory.timestamp += 1.0
+        index.update_memory(memory)
+    update = (time.perf_counter() - start) / len(survivors)
+
+    print(f"memories: {args.size}, pruned: {len(victims)}")
+    print(f"prune:          {prune:8.2f} s  ({prune / len(victims) * 1e6:.1f} us/removal)")
+    print(f"legacy prune:   {legacy * len(victims):8.2f} s  ({legacy * 1e6:.1f} us/removal, "
+          f"extrapolated from {args.legacy_sample})")
+    print(f"update:         {update * 1e6:8.1f} us/update")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Snapshot save/restore benchmark for VectorizedMemory.
+
+Fills a VectorizedMemory with synthetic senate memories, saves a snapshot and
+times loading it into a fresh memory. For contrast it also times rebuilding
+the same memory from its items, which re-embeds and re-indexes everything
+(what a load had to do before snapshots covered the index and mappings).
+
+Usage:
+    python scripts/benchmark_memory_snapshot.py [--sizes 10000 100000 1000000] [--dimension 128]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add the project root to Python path
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.insert(0, base_dir)
+
+from src.agentic_game_framework.knowledge.embeddings import HashingEmbedder
+from src.agentic_game_framework.knowledge.vector_store import VectorStore, VectorStoreConfig
+from src.agentic_game_framework.memory.memory_interface import MemoryItem
+from src.agentic_game_framework.memory.vectorized_memory import VectorizedMemory
+
+WORDS = ("grain egypt legion gaul senate consul tribune tax aqueduct pirate ostia "
+         "treaty carthage vote debate law province revolt harbor temple").split()
+SENATORS = ("cicero", "cato", "caesar", "pompey", "crassus", "brutus")
+
+
+def new_memory(dimension: int) -> VectorizedMemory:
+    store = VectorStore(VectorStoreConfig(dimension=dimension), embedder=HashingEmbedder(dimension))
+    return VectorizedMemory(vector_store=store)
+
+
+def make_items(size: int, rng: random.Random):
+    """size random memories with text content and a few associations."""
+    return [
+        MemoryItem(
+            f"memory_{i}", float(i), " ".join(rng.choices(WORDS, k=8)) + f" session {i // 100}",
+            importance=rng.random(),
+            associations={"speaker": rng.choice(SENATORS), "session": i // 100}
+        )
+        for i in range(size)
+    ]
+
+
+def main():
+    """Parse command line arguments and print a timing table."""
+    parser = argparse.ArgumentParser(description="Benchmark VectorizedMemory snapshot save/restore.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Memory counts to measure (default: 10000 100000 1000000)")
+    parser.add_argument("--dimension", type=int, default=128, help="Embedding dimension (default: 128)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'memories':>9}  {'rebuild s':>9}  {'save s':>7}  {'restore s':>9}  {'size MB':>8}")
+    for size in args.sizes:
+        items = make_items(size, rng)
+
+        memory = new_memory(args.dimension)
+        start = time.perf_counter()
+        memory.add_memories(items)
+        rebuild = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "memory.json")
+            start = time.perf_counter()
+            memory.save(path)
+            save = time.perf_counter() - start
+            megabytes = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)) / 1e6
+
+            restored = new_memory(args.dimension)
+            start = time.perf_counter()
+            restored.load(path)
+            restore = time.perf_counter() - start
+
+        print(f"{size:>9}  {rebuild:>9.2f}  {save:>7.2f}  {restore:>9.2f}  {megabytes:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Query latency benchmark for the Roman Senate MemoryIndex.
+
+Fills one senator's MemoryIndex with synthetic event and stance memories and
+times typical query() shapes, get_memory() and remove_memory() as the number
+of memories grows.
+
+Usage:
+    python scripts/benchmark_senate_memory_index.py [--sizes 1000 10000 100000] [--queries 200]
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+# Add the src directory to Python path
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_dir = os.path.join(base_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from roman_senate.agents.memory_index import MemoryIndex
+from roman_senate.agents.memory_items import EventMemoryItem, StanceChangeMemoryItem
+
+SENATORS = ("Cicero", "Cato", "Caesar", "Pompey", "Crassus", "Brutus")
+EVENT_TYPES = ("speech", "vote", "interjection", "debate_started", "debate_ended")
+TOPICS = ("grain_dole", "land_reform", "pirate_war", "aqueduct", "gallic_campaign")
+START = datetime.datetime(2026, 1, 1)
+
+
+def make_index(size: int, rng: random.Random) -> MemoryIndex:
+    """A MemoryIndex holding size random memories over about a year."""
+    index = MemoryIndex()
+    for i in range(size):
+        timestamp = START + datetime.timedelta(minutes=rng.randrange(525600))
+        if i % 10 == 0:
+            memory = StanceChangeMemoryItem(
+                rng.choice(TOPICS), "neutral", rng.choice(("support", "oppose")), "persuaded",
+                timestamp=timestamp, importance=rng.random(), memory_id=f"memory_{i}"
+            )
+        else:
+            memory = EventMemoryItem(
+                f"event_{i}", rng.choice(EVENT_TYPES), rng.choice(SENATORS), {"topic": rng.choice(TOPICS)},
+                timestamp=timestamp, importance=rng.random(), memory_id=f"memory_{i}"
+            )
+        index.add_memory(memory)
+    return index
+
+
+def time_per_call(function, arguments) -> float:
+    """Mean seconds per call of function over arguments."""
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return (time.perf_counter() - start) / len(arguments)
+
+
+def main():
+    """Parse command line arguments and print a latency table."""
+    parser = argparse.ArgumentParser(description="Benchmark Roman Senate MemoryIndex queries.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Memories per senator (default: 1000 10000 100000)")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per shape (default: 200)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    shapes = {
+        "senator+type": lambda: {"senator_name": rng.choice(SENATORS), "event_type": rng.choice(EVENT_TYPES),
+                                 "limit": 10},
+        "tags": lambda: {"tags": [rng.choice(EVENT_TYPES), rng.choice(SENATORS)], "limit": 10},
+        "topic+week": lambda: {"topic": rng.choice(TOPICS),
+                               "time_start": START + datetime.timedelta(weeks=rng.randrange(50)),
+                               "time_end": START + datetime.timedelta(weeks=51)},
+        "text": lambda: {"text": rng.choice(SENATORS), "limit": 10},
+        "relevance": lambda: {"context": {"tags": [rng.choice(EVENT_TYPES)], "senator_name": rng.choice(SENATORS),
+                                          "topic": rng.choice(TOPICS)}, "limit": 10},
+    }
+    print(f"{'memories':>9}  " + "  ".join(f"{name + ' us':>16}" for name in shapes)
+          + f"  {'get us':>7}  {'remove us':>9}")
+    for size in args.sizes:
+        index = make_index(size, rng)
+        row = []
+        for make_criteria in shapes.values():
+            criteria = [make_criteria() for _ in range(args.queries)]
+            row.append(time_per_call(index.query, criteria))
+
+        ids = rng.sample(list(index.memories), min(args.queries, size))
+        get = time_per_call(index.get_memory, ids)
+        remove = time_per_call(index.remove_memory, [index.get_memory(memory_id) for memory_id in ids])
+
+        print(f"{size:>9}  " + "  ".join(f"{seconds * 1e6:>16.1f}" for seconds in row)
+              + f"  {get * 1e6:>7.2f}  {remove * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
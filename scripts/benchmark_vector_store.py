@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Recall/latency benchmark for the Agentic Game Framework vector stores.
+
+Fills the exact MemoryVectorStore and the approximate stores (NumPy LSH, and
+FAISS HNSW when installed) with clustered random vectors, standing in for
+memory embeddings. It then reports build time, per-query latency (p50/p99)
+and recall@k against the exact results.
+
+Usage:
+    python scripts/benchmark_vector_store.py [--sizes 10000 100000 300000] [--dimension 64]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the project root to Python path
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.insert(0, base_dir)
+
+from src.agentic_game_framework.knowledge.ann_store import FAISSVectorStore, LSHVectorStore
+from src.agentic_game_framework.knowledge.vector_store import (
+    FAISS_AVAILABLE, MemoryVectorStore, VectorStoreConfig, VectorStoreItem
+)
+
+
+def make_data(size: int, dimension: int, queries: int, seed: int = 0):
+    """Clustered vectors plus queries drawn near stored vectors."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(10, size // 100), dimension))
+    vectors = centers[rng.integers(0, len(centers), size)] + 0.3 * rng.normal(size=(size, dimension))
+    query_vectors = vectors[rng.integers(0, size, queries)] + 0.3 * rng.normal(size=(queries, dimension))
+    return vectors.astype(np.float32), query_vectors.astype(np.float32)
+
+
+def measure(store, items, query_vectors, limit):
+    """Build the store, run the queries, and return (build seconds, latencies, result ids)."""
+    start = time.perf_counter()
+    store.add_items(items)
+    build = time.perf_counter() - start
+
+    latencies, results = [], []
+    for query in query_vectors:
+        start = time.perf_counter()
+        found = store.search_by_vector(query, limit)
+        latencies.append(time.perf_counter() - start)
+        results.append({item.id for item, _ in found})
+    return build, np.array(latencies), results
+
+
+def main():
+    """Parse command line arguments and print a recall/latency table."""
+    parser = argparse.ArgumentParser(description="Benchmark exact and approximate vector search.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 300000],
+                        help="Store sizes to measure (default: 10000 100000 300000)")
+    parser.add_argument("--dimension", type=int, default=64, help="Vector dimension (default: 64)")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per store (default: 200)")
+    parser.add_argument("--limit", type=int, default=10, help="Results per query, k (default: 10)")
+    args = parser.parse_args()
+
+    backends = {"exact": MemoryVectorStore, "lsh": LSHVectorStore}
+    if FAISS_AVAILABLE:
+        backends["faiss-hnsw"] = FAISSVectorStore
+
+    print(f"{'size':>8}  {'backend':<10}  {'build s':>8}  {'p50 ms':>7}  {'p99 ms':>7}  recall@{args.limit}")
+    for size in args.sizes:
+        vectors, query_vectors = make_data(size, args.dimension, args.queries)
+        items = [VectorStoreItem(vector, f"memory {i}", item_id=str(i)) for i, vector in enumerate(vectors)]
+        config = VectorStoreConfig(dimension=args.dimension)
+
+        exact_results = None
+        for name, store_class in backends.items():
+            build, latencies, results = measure(store_class(config), items, query_vectors, args.limit)
+            if exact_results is None:
+                exact_results = results
+            recall = np.mean([len(found & exact) / len(exact) for found, exact in zip(results, exact_results)])
+            print(f"{size:>8}  {name:<10}  {build:>8.2f}  {np.percentile(latencies, 50) * 1000:>7.3f}"
+                  f"  {np.percentile(latencies, 99) * 1000:>7.3f}  {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Semantic retrieval benchmark for VectorizedMemory.
+
+Fills a VectorizedMemory with synthetic senate memories and times
+retrieve_semantic() and the batched retrieve_semantic_many() as the number of
+memories grows. For contrast it also times the former lookup, which found each
+hit's memory by scanning every stored vector for matching content.
+
+Usage:
+    python scripts/benchmark_vectorized_memory.py [--sizes 1000 10000 50000] [--queries 100]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the project root to Python path
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.insert(0, base_dir)
+
+from src.agentic_game_framework.knowledge.embeddings import HashingEmbedder
+from src.agentic_game_framework.knowledge.vector_store import VectorStore, VectorStoreConfig
+from src.agentic_game_framework.memory.memory_interface import MemoryItem
+from src.agentic_game_framework.memory.vectorized_memory import VectorizedMemory
+
+WORDS = ("grain egypt legion gaul senate consul tribune tax aqueduct pirate ostia "
+         "treaty carthage vote debate law province revolt harbor temple").split()
+
+
+def make_memory(size: int, dimension: int, rng: random.Random) -> VectorizedMemory:
+    """A VectorizedMemory holding size random memories."""
+    store = VectorStore(VectorStoreConfig(dimension=dimension), embedder=HashingEmbedder(dimension))
+    memory = VectorizedMemory(vector_store=store)
+    for i in range(size):
+        content = " ".join(rng.choices(WORDS, k=8)) + f" {i}"
+        memory.add_memory(MemoryItem(f"memory_{i}", float(i), content, importance=rng.random()))
+    return memory
+
+
+def legacy_lookup(memory: VectorizedMemory, content: str):
+    """The former content scan from a search hit back to its memory id."""
+    for vector_id, item in memory.vector_store._store.items.items():
+        if item.content == content:
+            return item.metadata.get("memory_id")
+    return None
+
+
+def main():
+    """Parse command line arguments and print a latency table."""
+    parser = argparse.ArgumentParser(description="Benchmark VectorizedMemory semantic retrieval.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000],
+                        help="Memory counts to measure (default: 1000 10000 50000)")
+    parser.add_argument("--dimension", type=int, default=256, help="Embedding dimension (default: 256)")
+    parser.add_argument("--queries", type=int, default=100, help="Queries per size (default: 100)")
+    parser.add_argument("--limit", type=int, default=5, help="Memories per query (default: 5)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'memories':>9}  {'single ms':>9}  {'batch ms/q':>10}  {'mapping us/hit':>14}  {'legacy scan us/hit':>18}")
+    for size in args.sizes:
+        memory = make_memory(size, args.dimension, rng)
+        queries = [" ".join(rng.choices(WORDS, k=3)) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        for query in queries:
+            memory.retrieve_semantic(query, args.limit)
+        single = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        memory.retrieve_semantic_many(queries, args.limit)
+        batch = (time.perf_counter() - start) / len(queries)
+
+        hits = [item for results in memory.vector_store.search_items(queries[:10], args.limit)
+                for item, _ in results]
+        start = time.perf_counter()
+        for item in hits:
+            memory.get_memory(memory._vector_to_memory_id[item.id])
+        mapping = (time.perf_counter() - start) / len(hits)
+
+        start = time.perf_counter()
+        for item in hits:
+            memory.get_memory(legacy_lookup(memory, item.content))
+        legacy = (time.perf_counter() - start) / len(hits)
+
+        print(f"{size:>9}  {single * 1000:>9.3f}  {batch * 1000:>10.3f}  {mapping * 1e6:>14.2f}  {legacy * 1e6:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
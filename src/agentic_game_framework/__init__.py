@@ -10,6 +10,7 @@ __version__ = '0.1.0'
 # Import core components for easier access
 from .events.base import BaseEvent, EventHandler
 from .events.event_bus import EventBus
+from .events.async_event_bus import AsyncEventBus
 
 from .agents.base_agent import BaseAgent
 from .agents.agent_factory import AgentFactory
@@ -17,7 +18,7 @@ from .agents.agent_manager import AgentManager
 
 from .memory.memory_interface import MemoryItem, MemoryInterface, EventMemoryItem
 from .memory.memory_index import MemoryIndex
-from .memory.persistence import MemoryPersistenceManager, MemoryStore
+from .memory.persistence import MemoryPersistenceManager, MemoryStore, SQLitePersistenceManager
 
 from .relationships.base_relationship import BaseRelationship, SimpleRelationship
 from .relationships.relationship_manager import RelationshipManager
@@ -54,6 +55,7 @@ __all__ = [
     'BaseEvent',
     'EventHandler',
     'EventBus',
+    'AsyncEventBus',
     
     # Agent System
     'BaseAgent',
@@ -67,6 +69,7 @@ __all__ = [
     'MemoryIndex',
     'MemoryPersistenceManager',
     'MemoryStore',
+    'SQLitePersistenceManager',
     
     # Relationship System
     'BaseRelationship',
@@ -0,0 +1,363 @@
+"""
+Asyncio Event Bus for Agentic Game Framework.
+
+This module provides an asyncio-native counterpart to the EventBus. Handlers
+may be coroutines, so LLM-backed work (interjections, reactions, memory
+summaries) can overlap instead of running one after another, while a bounded
+queue pushes back on publishers that outrun the handlers.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+from .base import BaseEvent, EventHandler
+
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+# A handler is an EventHandler (whose handle_event may be async) or a plain
+# function/coroutine function taking the event
+AsyncHandler = Union[EventHandler, Callable[[BaseEvent], Any]]
+
+
+class AsyncEventBus:
+    """
+    Event dispatcher for asyncio applications.
+
+    Published events wait in a bounded ``asyncio.Queue``; ``publish`` blocks
+    while the queue is full. A dispatcher task takes events off the queue and
+    fans each one out to its handlers concurrently. At most
+    ``max_concurrency_per_type`` events of one type are dispatched at a time,
+    and at most ``max_in_flight`` events overall. An event takes its type's
+    slot before a global one, so events queued behind a busy type hold no
+    global slot and a slow handler type cannot starve the others. At most
+    ``max_queue_size`` taken events wait for their slots, which keeps the
+    task count bounded. ``drain()`` waits until every published event has
+    been fully handled.
+    """
+
+    def __init__(self, max_queue_size: int = 1000, max_concurrency_per_type: int = 4,
+                 max_in_flight: int = 64):
+        """
+        Initialize a new async event bus with empty handler registries.
+
+        Args:
+            max_queue_size: Events that may wait for dispatch before publish blocks
+            max_concurrency_per_type: Events of one type dispatched concurrently
+            max_in_flight: Events dispatched concurrently across all types
+        """
+        # Map of event_type -> set of handlers
+        self._handlers: Dict[str, Set[AsyncHandler]] = defaultdict(set)
+
+        # Wildcard handlers (receive all events)
+        self._wildcard_handlers: Set[AsyncHandler] = set()
+
+        # Optional event filters that can block events
+        self._filters: List[Callable[[BaseEvent], bool]] = []
+
+        # Handler priorities (higher numbers = higher priority, started first)
+        self._priorities: Dict[AsyncHandler, int] = {}
+
+        # Settings
+        self._max_queue_size = max_queue_size
+        self._max_concurrency_per_type = max_concurrency_per_type
+        self._max_in_flight = max_in_flight
+
+        # Created on first use so the bus binds to the running loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._waiting: Optional[asyncio.Semaphore] = None
+        self._running = 0
+        self._waiting_count = 0
+        self._type_limits: Dict[str, asyncio.Semaphore] = {}
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        # Performance metrics
+        self._metrics = {
+            "events_published": 0,
+            "events_filtered": 0,
+            "events_processed": 0,
+            "handler_calls": 0,
+            "handler_errors": 0,
+            "avg_processing_time": 0.0,
+            "max_processing_time": 0.0,
+            "queue_high_water_mark": 0
+        }
+
+    def subscribe(self, event_type: str, handler: AsyncHandler, priority: int = 0) -> None:
+        """
+        Register a handler to receive events of a specific type.
+
+        Args:
+            event_type: The event type to subscribe to
+            handler: EventHandler or (coroutine) function that will process these events
+            priority: Handler priority (higher numbers = higher priority)
+        """
+        self._handlers[event_type].add(handler)
+        self._priorities[handler] = priority
+
+    def subscribe_to_all(self, handler: AsyncHandler, priority: int = 0) -> None:
+        """
+        Register a handler to receive all events regardless of type.
+
+        Args:
+            handler: EventHandler or (coroutine) function that will process all events
+            priority: Handler priority (higher numbers = higher priority)
+        """
+        self._wildcard_handlers.add(handler)
+        self._priorities[handler] = priority
+
+    def unsubscribe(self, event_type: str, handler: AsyncHandler) -> None:
+        """
+        Remove a handler's subscription to a specific event type.
+
+        Args:
+            event_type: The event type to unsubscribe from
+            handler: The handler to remove
+        """
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[event_type]
+        self._forget_priority(handler)
+
+    def unsubscribe_from_all(self, handler: AsyncHandler) -> None:
+        """
+        Remove a handler from all event subscriptions.
+
+        Args:
+            handler: The handler to remove
+        """
+        self._wildcard_handlers.discard(handler)
+        for event_type in list(self._handlers.keys()):
+            self._handlers[event_type].discard(handler)
+            if not self._handlers[event_type]:
+                del self._handlers[event_type]
+        self._priorities.pop(handler, None)
+
+    def _forget_priority(self, handler: AsyncHandler) -> None:
+        if handler in self._wildcard_handlers:
+            return
+        if not any(handler in handlers for handlers in self._handlers.values()):
+            self._priorities.pop(handler, None)
+
+    def add_filter(self, filter_func: Callable[[BaseEvent], bool]) -> None:
+        """
+        Add a filter function that can block events from being processed.
+
+        Args:
+            filter_func: Function that returns True if event should be processed, False to block
+        """
+        self._filters.append(filter_func)
+
+    def remove_filter(self, filter_func: Callable[[BaseEvent], bool]) -> None:
+        """
+        Remove a previously added filter function.
+
+        Args:
+            filter_func: The filter function to remove
+        """
+        if filter_func in self._filters:
+            self._filters.remove(filter_func)
+
+    def get_handlers(self, event_type: str) -> List[AsyncHandler]:
+        """
+        Get all handlers for a specific event type, sorted by priority.
+
+        Args:
+            event_type: The event type to get handlers for
+
+        Returns:
+            List[AsyncHandler]: Sorted list of handlers (highest priority first)
+        """
+        handlers = set(self._handlers.get(event_type, ())) | self._wildcard_handlers
+        return sorted(handlers, key=lambda h: self._priorities.get(h, 0), reverse=True)
+
+    def _ensure_started(self) -> None:
+        """Create the queue and dispatcher task on the running loop."""
+        if self._dispatcher is not None and not self._dispatcher.done():
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._in_flight = asyncio.Semaphore(self._max_in_flight)
+        self._waiting = asyncio.Semaphore(self._max_queue_size)
+        self._type_limits = {}
+        self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch_loop())
+        logger.info(f"AsyncEventBus started with queue size {self._max_queue_size}, "
+                    f"{self._max_concurrency_per_type} concurrent events per type")
+
+    def _passes_filters(self, event: BaseEvent) -> bool:
+        for filter_func in self._filters:
+            if not filter_func(event):
+                self._metrics["events_filtered"] += 1
+                logger.debug(f"Event filtered: {event.event_type}")
+                return False
+        return True
+
+    def _record_queued(self) -> None:
+        queue_size = self._queue.qsize()
+        if queue_size > self._metrics["queue_high_water_mark"]:
+            self._metrics["queue_high_water_mark"] = queue_size
+
+    async def publish(self, event: BaseEvent) -> bool:
+        """
+        Publish an event, waiting while the queue is full.
+
+        Args:
+            event: The event to publish
+
+        Returns:
+            bool: True if the event was queued, False if it was filtered out
+        """
+        self._metrics["events_published"] += 1
+        if not self._passes_filters(event):
+            return False
+
+        self._ensure_started()
+        await self._queue.put(event)
+        self._record_queued()
+        return True
+
+    def publish_nowait(self, event: BaseEvent) -> bool:
+        """
+        Publish an event without waiting (must be called from the event loop).
+
+        Args:
+            event: The event to publish
+
+        Returns:
+            bool: True if the event was queued, False if it was filtered out
+
+        Raises:
+            asyncio.QueueFull: If the queue is full
+        """
+        self._metrics["events_published"] += 1
+        if not self._passes_filters(event):
+            return False
+
+        self._ensure_started()
+        self._queue.put_nowait(event)
+        self._record_queued()
+        return True
+
+    async def _dispatch_loop(self) -> None:
+        """Take events off the queue and start a dispatch task for each."""
+        while True:
+            event = await self._queue.get()
+            # Bound the events waiting for a dispatch slot; the queue fills behind us
+            await self._waiting.acquire()
+            self._waiting_count += 1
+            task = asyncio.get_running_loop().create_task(self._dispatch(event))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, event: BaseEvent) -> None:
+        """Fan an event out to its handlers under the per-type and global concurrency limits."""
+        type_limit = self._type_limits.get(event.event_type)
+        if type_limit is None:
+            type_limit = asyncio.Semaphore(self._max_concurrency_per_type)
+            self._type_limits[event.event_type] = type_limit
+
+        waiting = True
+        try:
+            # The type's slot comes first, so waiting on a busy type holds no global slot
+            async with type_limit, self._in_flight:
+                self._waiting.release()
+                self._waiting_count -= 1
+                waiting = False
+                self._running += 1
+                try:
+                    start_time = time.perf_counter()
+                    handlers = self.get_handlers(event.event_type)
+                    if handlers:
+                        # Handlers start in priority order and then run concurrently
+                        await asyncio.gather(*[self._call_handler(handler, event) for handler in handlers])
+                    else:
+                        logger.debug(f"No handlers for event type: {event.event_type}")
+                    self._record_processed(time.perf_counter() - start_time)
+                finally:
+                    self._running -= 1
+        finally:
+            if waiting:
+                self._waiting.release()
+                self._waiting_count -= 1
+            self._queue.task_done()
+
+    async def _call_handler(self, handler: AsyncHandler, event: BaseEvent) -> None:
+        """Run one handler, awaiting it if it is a coroutine."""
+        self._metrics["handler_calls"] += 1
+        try:
+            handle = handler.handle_event if isinstance(handler, EventHandler) else handler
+            result = handle(event)
+            if inspect.isawaitable(result):
+                await result
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._metrics["handler_errors"] += 1
+            logger.error(f"Error in handler {handler} processing event {event}: {e}", exc_info=True)
+
+    def _record_processed(self, processing_time: float) -> None:
+        processed = self._metrics["events_processed"]
+        self._metrics["avg_processing_time"] = (
+            (self._metrics["avg_processing_time"] * processed + processing_time) / (processed + 1)
+        )
+        self._metrics["events_processed"] = processed + 1
+        if processing_time > self._metrics["max_processing_time"]:
+            self._metrics["max_processing_time"] = processing_time
+
+    async def drain(self) -> None:
+        """
+        Wait until every event published so far has been handled.
+
+        Events published by handlers while draining are waited for as well.
+        """
+        if self._queue is None:
+            return
+        await self._queue.join()
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the dispatcher task.
+
+        Args:
+            drain: Handle queued events first; otherwise cancel them along
+                with the events being dispatched
+        """
+        if self._dispatcher is None:
+            return
+        if drain:
+            await self.drain()
+
+        self._dispatcher.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(self._dispatcher, *self._tasks, return_exceptions=True)
+        self._dispatcher = None
+        logger.info(f"AsyncEventBus stopped. Final metrics: {self.get_metrics()}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get dispatch statistics.
+
+        Returns:
+            Dictionary of counters plus the current queue size, in-flight events
+            and taken events waiting for a dispatch slot
+        """
+        metrics = dict(self._metrics)
+        metrics["queue_size"] = self._queue.qsize() if self._queue is not None else 0
+        metrics["in_flight"] = self._running
+        metrics["waiting"] = self._waiting_count
+        return metrics
+
+    async def __aenter__(self) -> "AsyncEventBus":
+        self._ensure_started()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop(drain=exc_type is None)
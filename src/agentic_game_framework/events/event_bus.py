@@ -5,13 +5,15 @@ This module provides the central event dispatching mechanism that allows compone
 to publish events and subscribe to event types they're interested in.
 """
 
+import itertools
 import logging
 import time
 import threading
-from collections import defaultdict, deque
-from typing import Callable, Dict, List, Optional, Set, Type, Tuple, Any, Iterable
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, List, Optional, Set, Type, Tuple, Any, Iterable, Union
 
 from .base import BaseEvent, EventHandler
+from .event_queue import OverflowPolicy, PriorityEventQueue
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -27,63 +29,23 @@ class EventBus:
     
     It maintains a registry of event handlers for each event type and
     dispatches events to the appropriate handlers when they are published.
+    
+    With ``compiled_dispatch`` enabled, every subscription change compiles an
+    immutable, priority-sorted handler tuple per event type (wildcard handlers
+    merged in) and swaps the new table in by reference. Publishing then reads
+    the current table without taking the lock, and per-handler timing is only
+    collected for the sampled fraction of events set by ``timing_sample_rate``.
+    
+    With ``enable_async``, published events wait in a bounded priority queue
+    (see PriorityEventQueue) and a worker thread dispatches them highest
+    priority first; ``overflow_policy`` decides what a full queue does.
     """
     
-    def _start_processing_thread(self) -> None:
-        """Start a background thread for processing events asynchronously."""
-        if self._processing_thread is not None and self._processing_thread.is_alive():
-            return
-            
-        def process_events() -> None:
-            """Process events from the queue in a loop."""
-            logger.info("Event processing thread started")
-            while not self._stop_processing.is_set():
-                # Process a batch of events
-                processed = 0
-                start_time = time.time()
-                
-                with self._lock:
-                    # Check if there are events in the queue
-                    if len(self._event_queue) == 0:
-                        self._stop_processing.wait(0.01)  # Brief pause if queue is empty
-                        continue
-                    
-                    # Track high water mark
-                    queue_size = len(self._event_queue)
-                    if queue_size > self._metrics["queue_high_water_mark"]:
-                        self._metrics["queue_high_water_mark"] = queue_size
-                    
-                    # Get a batch of events to process
-                    batch = []
-                    for _ in range(min(self._batch_size, len(self._event_queue))):
-                        if self._event_queue:
-                            batch.append(self._event_queue.popleft())
-                
-                # Process each event in the batch
-                for event in batch:
-                    self._process_event(event)
-                    processed += 1
-                    
-                # Record metrics
-                if processed > 0 and self._monitor_performance:
-                    batch_time = time.time() - start_time
-                    avg_time = batch_time / processed
-                    with self._lock:
-                        self._metrics["avg_processing_time"] = (
-                            (self._metrics["avg_processing_time"] * self._metrics["events_processed"] + batch_time) /
-                            (self._metrics["events_processed"] + processed)
-                        )
-                        self._metrics["events_processed"] += processed
-                        
-                    if batch_time > 0.1:  # Log slow batch processing
-                        logger.debug(f"Processed {processed} events in {batch_time:.3f}s ({avg_time:.3f}s per event)")
-                
-        self._stop_processing.clear()
-        self._processing_thread = threading.Thread(target=process_events, daemon=True)
-        self._processing_thread.start()
-
     def __init__(self, enable_async: bool = False, batch_size: int = 10,
-                monitor_performance: bool = True):
+                monitor_performance: bool = True, compiled_dispatch: bool = False,
+                timing_sample_rate: float = 0.0, max_queue_size: int = 10000,
+                overflow_policy: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+                coalesce_key: Optional[Callable[[BaseEvent], Hashable]] = None):
         """
         Initialize a new event bus with empty handler registries.
         
@@ -91,6 +53,15 @@ class EventBus:
             enable_async: Whether to enable asynchronous event processing
             batch_size: Number of events to process in a batch (for async mode)
             monitor_performance: Whether to track detailed performance metrics
+            compiled_dispatch: Whether to publish through the precompiled,
+                copy-on-write dispatch table without locking
+            timing_sample_rate: Fraction of events (0.0-1.0) whose handlers are
+                timed in compiled dispatch mode; 0 disables handler timing
+            max_queue_size: Maximum number of queued events (for async mode)
+            overflow_policy: What a full queue does with a new event: "block",
+                "drop_oldest", "drop_lowest_priority" or "coalesce"
+            coalesce_key: Key under which queued events replace each other with
+                the coalesce policy (defaults to event type, source and target)
         """
         # Map of event_type -> set of handlers
         self._handlers: Dict[str, Set[EventHandler]] = defaultdict(set)
@@ -115,9 +86,20 @@ class EventBus:
         self._enable_async = enable_async
         self._batch_size = batch_size
         self._monitor_performance = monitor_performance
+        self._compiled_dispatch = compiled_dispatch
+        
+        # Compiled dispatch state: replaced wholesale on change, never mutated in place
+        self._dispatch_table: Dict[str, Tuple[EventHandler, ...]] = {}
+        self._wildcard_dispatch: Tuple[EventHandler, ...] = ()
+        self._filter_snapshot: Tuple[Callable[[BaseEvent], bool], ...] = ()
+        
+        # Time handlers on every Nth event in compiled mode (0 = never)
+        self._sample_every = int(round(1.0 / timing_sample_rate)) if timing_sample_rate > 0 else 0
+        self._sample_counter = itertools.count()
         
         # Event queue for asynchronous processing
-        self._event_queue = deque()
+        self._event_queue = PriorityEventQueue(max_queue_size, overflow_policy, coalesce_key)
+        self._event_priorities: Dict[str, int] = {}
         self._processing_thread = None
         self._stop_processing = threading.Event()
         
@@ -145,7 +127,7 @@ class EventBus:
             self._start_processing_thread()
             
         logger.info(f"Initialized EventBus with async={'enabled' if enable_async else 'disabled'}, " +
-                   f"batch_size={batch_size}")
+                   f"batch_size={batch_size}, compiled_dispatch={compiled_dispatch}")
     
     def subscribe(self, event_type: str, handler: EventHandler, priority: int = 0) -> None:
         """
@@ -156,12 +138,17 @@ class EventBus:
             handler: The handler that will process these events
             priority: Handler priority (higher numbers = higher priority)
         """
-        self._handlers[event_type].add(handler)
-        self._priorities[handler] = priority
-        
-        # Invalidate cache for this event type
-        if event_type in self._handlers_cache:
-            del self._handlers_cache[event_type]
+        with self._lock:
+            priority_changed = self._priorities.get(handler, priority) != priority
+            self._handlers[event_type].add(handler)
+            self._priorities[handler] = priority
+            
+            # Invalidate cache for this event type
+            if event_type in self._handlers_cache:
+                del self._handlers_cache[event_type]
+            
+            # A priority change reorders every type the handler is subscribed to
+            self._compile_dispatch_table(None if priority_changed else [event_type])
     
     def subscribe_to_all(self, handler: EventHandler, priority: int = 0) -> None:
         """
@@ -171,11 +158,13 @@ class EventBus:
             handler: The handler that will process all events
             priority: Handler priority (higher numbers = higher priority)
         """
-        self._wildcard_handlers.add(handler)
-        self._priorities[handler] = priority
-        
-        # Invalidate all caches since wildcard handlers affect all event types
-        self._handlers_cache.clear()
+        with self._lock:
+            self._wildcard_handlers.add(handler)
+            self._priorities[handler] = priority
+            
+            # Invalidate all caches since wildcard handlers affect all event types
+            self._handlers_cache.clear()
+            self._compile_dispatch_table()
         logger.debug(f"Handler {handler} subscribed to all events with priority {priority}")
     
     def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
@@ -186,24 +175,28 @@ class EventBus:
             event_type: The event type to unsubscribe from
             handler: The handler to remove
         """
-        was_removed = False
-        if event_type in self._handlers and handler in self._handlers[event_type]:
-            self._handlers[event_type].remove(handler)
-            was_removed = True
+        with self._lock:
+            was_removed = False
+            if event_type in self._handlers and handler in self._handlers[event_type]:
+                self._handlers[event_type].remove(handler)
+                was_removed = True
             
-            # Clean up empty handler sets
-            if not self._handlers[event_type]:
-                del self._handlers[event_type]
+                # Clean up empty handler sets
+                if not self._handlers[event_type]:
+                    del self._handlers[event_type]
                 
-        # Clean up priorities if no longer needed
-        if not any(handler in handlers for handlers in self._handlers.values()) and handler not in self._wildcard_handlers:
-            if handler in self._priorities:
-                del self._priorities[handler]
+            # Clean up priorities if no longer needed
+            if not any(handler in handlers for handlers in self._handlers.values()) and handler not in self._wildcard_handlers:
+                if handler in self._priorities:
+                    del self._priorities[handler]
                 
-        # Invalidate cache for this event type
-        if was_removed and event_type in self._handlers_cache:
-            del self._handlers_cache[event_type]
-            logger.debug(f"Handler {handler} unsubscribed from {event_type}")
+            # Invalidate cache for this event type
+            if was_removed and event_type in self._handlers_cache:
+                del self._handlers_cache[event_type]
+                logger.debug(f"Handler {handler} unsubscribed from {event_type}")
+            
+            if was_removed:
+                self._compile_dispatch_table([event_type])
     
     def unsubscribe_from_all(self, handler: EventHandler) -> None:
         """
@@ -212,39 +205,42 @@ class EventBus:
         Args:
             handler: The handler to remove
         """
-        was_wildcard = False
-        # Remove from wildcard handlers
-        if handler in self._wildcard_handlers:
-            self._wildcard_handlers.remove(handler)
-            was_wildcard = True
+        with self._lock:
+            was_wildcard = False
+            # Remove from wildcard handlers
+            if handler in self._wildcard_handlers:
+                self._wildcard_handlers.remove(handler)
+                was_wildcard = True
             
-        # Remove from specific event type handlers
-        affected_types = []
-        for event_type in list(self._handlers.keys()):
-            if handler in self._handlers[event_type]:
-                self._handlers[event_type].remove(handler)
-                affected_types.append(event_type)
+            # Remove from specific event type handlers
+            affected_types = []
+            for event_type in list(self._handlers.keys()):
+                if handler in self._handlers[event_type]:
+                    self._handlers[event_type].remove(handler)
+                    affected_types.append(event_type)
                 
-                # Clean up empty handler sets
-                if not self._handlers[event_type]:
-                    del self._handlers[event_type]
+                    # Clean up empty handler sets
+                    if not self._handlers[event_type]:
+                        del self._handlers[event_type]
                     
-        # Clean up priorities
-        if handler in self._priorities:
-            del self._priorities[handler]
+            # Clean up priorities
+            if handler in self._priorities:
+                del self._priorities[handler]
         
-        # Invalidate caches
-        if was_wildcard:
-            # Wildcard handlers affect all events, so clear entire cache
-            self._handlers_cache.clear()
-            logger.debug(f"Wildcard handler {handler} unsubscribed from all events")
-        else:
-            # Only clear cache for affected event types
-            for event_type in affected_types:
-                if event_type in self._handlers_cache:
-                    del self._handlers_cache[event_type]
-            if affected_types:
-                logger.debug(f"Handler {handler} unsubscribed from {len(affected_types)} event types")
+            # Invalidate caches
+            if was_wildcard:
+                # Wildcard handlers affect all events, so clear entire cache
+                self._handlers_cache.clear()
+                logger.debug(f"Wildcard handler {handler} unsubscribed from all events")
+            else:
+                # Only clear cache for affected event types
+                for event_type in affected_types:
+                    if event_type in self._handlers_cache:
+                        del self._handlers_cache[event_type]
+                if affected_types:
+                    logger.debug(f"Handler {handler} unsubscribed from {len(affected_types)} event types")
+            
+            self._compile_dispatch_table(None if was_wildcard else affected_types)
     
     def add_filter(self, filter_func: Callable[[BaseEvent], bool]) -> None:
         """
@@ -253,7 +249,9 @@ class EventBus:
         Args:
             filter_func: Function that returns True if event should be processed, False to block
         """
-        self._filters.append(filter_func)
+        with self._lock:
+            self._filters.append(filter_func)
+            self._filter_snapshot = tuple(self._filters)
     
     def remove_filter(self, filter_func: Callable[[BaseEvent], bool]) -> None:
         """
@@ -262,8 +260,10 @@ class EventBus:
         Args:
             filter_func: The filter function to remove
         """
-        if filter_func in self._filters:
-            self._filters.remove(filter_func)
+        with self._lock:
+            if filter_func in self._filters:
+                self._filters.remove(filter_func)
+                self._filter_snapshot = tuple(self._filters)
     
     def get_handlers(self, event_type: str) -> List[EventHandler]:
         """
@@ -276,6 +276,9 @@ class EventBus:
         Returns:
             List[EventHandler]: Sorted list of handlers (highest priority first)
         """
+        if self._compiled_dispatch:
+            return list(self._dispatch_table.get(event_type, self._wildcard_dispatch))
+        
         # Check cache first
         if event_type in self._handlers_cache:
             return self._handlers_cache[event_type]
@@ -291,64 +294,154 @@ class EventBus:
         
         return sorted_handlers
     
+    def _compile_dispatch_table(self, event_types: Optional[Iterable[str]] = None) -> None:
+        """
+        Rebuild compiled handler tuples and swap the new table in.
+        
+        Must be called with the lock held. The table is copied rather than
+        modified, so readers on the publish path see either the old or the
+        new table, never a partially built one.
+        
+        Args:
+            event_types: Event types whose handlers changed, or None to
+                rebuild every entry (wildcard or priority changes)
+        """
+        if not self._compiled_dispatch:
+            return
+        
+        def by_priority(handlers: Iterable[EventHandler]) -> Tuple[EventHandler, ...]:
+            return tuple(sorted(handlers, key=lambda h: self._priorities.get(h, 0), reverse=True))
+        
+        if event_types is None:
+            self._wildcard_dispatch = by_priority(self._wildcard_handlers)
+            self._dispatch_table = {
+                event_type: by_priority(handlers | self._wildcard_handlers)
+                for event_type, handlers in self._handlers.items()
+            }
+            return
+        
+        table = dict(self._dispatch_table)
+        for event_type in event_types:
+            handlers = self._handlers.get(event_type)
+            if handlers:
+                table[event_type] = by_priority(handlers | self._wildcard_handlers)
+            else:
+                table.pop(event_type, None)
+        self._dispatch_table = table
+    
+    def _dispatch_compiled(self, event: BaseEvent) -> bool:
+        """
+        Dispatch an event through the compiled table without taking the lock.
+        
+        Counters are updated without the lock, so they are approximate when
+        several threads publish at once; sampled timings are exact.
+        
+        Args:
+            event: The event to process
+            
+        Returns:
+            bool: True if the event was processed, False if it was filtered out
+        """
+        for filter_func in self._filter_snapshot:
+            if not filter_func(event):
+                self._metrics["events_filtered"] += 1
+                return False
+        
+        handlers = self._dispatch_table.get(event.event_type, self._wildcard_dispatch)
+        
+        if self._sample_every and next(self._sample_counter) % self._sample_every == 0:
+            return self._dispatch_sampled(event, handlers)
+        
+        for handler in handlers:
+            try:
+                handler.handle_event(event)
+            except Exception as e:
+                self._metrics["handler_errors"] += 1
+                logger.error(f"Error in handler {handler} processing event {event}: {e}", exc_info=True)
+        
+        self._metrics["handler_calls"] += len(handlers)
+        return True
+    
+    def _dispatch_sampled(self, event: BaseEvent, handlers: Tuple[EventHandler, ...]) -> bool:
+        """Dispatch a sampled event, timing each handler."""
+        start_time = time.perf_counter()
+        timings = []
+        for handler in handlers:
+            handler_start = time.perf_counter()
+            error = False
+            try:
+                handler.handle_event(event)
+            except Exception as e:
+                error = True
+                logger.error(f"Error in handler {handler} processing event {event}: {e}", exc_info=True)
+            timings.append((handler, time.perf_counter() - handler_start, error))
+        processing_time = time.perf_counter() - start_time
+        
+        with self._lock:
+            self._metrics["handler_calls"] += len(handlers)
+            self._event_frequency[event.event_type] += 1
+            if processing_time > self._metrics["max_processing_time"]:
+                self._metrics["max_processing_time"] = processing_time
+            for handler, handler_time, error in timings:
+                metrics = self._handler_metrics.setdefault(
+                    handler, {"calls": 0, "errors": 0, "total_time": 0, "avg_time": 0}
+                )
+                metrics["calls"] += 1
+                metrics["total_time"] += handler_time
+                metrics["avg_time"] = metrics["total_time"] / metrics["calls"]
+                if error:
+                    metrics["errors"] += 1
+                    self._metrics["handler_errors"] += 1
+        return True
+    
     def _start_processing_thread(self) -> None:
         """Start a background thread for processing events asynchronously."""
         if self._processing_thread is not None and self._processing_thread.is_alive():
             return
             
         def process_events() -> None:
-            """Process events from the queue in a loop."""
+            """Process events from the queue until the bus is stopped."""
             logger.info("Event processing thread started")
             while not self._stop_processing.is_set():
-                # Process a batch of events
-                processed = 0
-                start_time = time.time()
-                
-                with self._lock:
-                    # Check if there are events in the queue
-                    if len(self._event_queue) == 0:
-                        self._stop_processing.wait(0.01)  # Brief pause if queue is empty
-                        continue
-                    
-                    # Track high water mark
-                    queue_size = len(self._event_queue)
-                    if queue_size > self._metrics["queue_high_water_mark"]:
-                        self._metrics["queue_high_water_mark"] = queue_size
-                    
-                    # Get a batch of events to process
-                    batch = []
-                    for _ in range(min(self._batch_size, len(self._event_queue))):
-                        if self._event_queue:
-                            batch.append(self._event_queue.popleft())
-                
-                # Process each event in the batch
-                for event in batch:
-                    self._process_event(event)
-                    processed += 1
-                    
-                # Record metrics
-                if processed > 0 and self._monitor_performance:
-                    batch_time = time.time() - start_time
-                    avg_time = batch_time / processed
-                    with self._lock:
-                        self._metrics["avg_processing_time"] = (
-                            (self._metrics["avg_processing_time"] * self._metrics["events_processed"] + batch_time) /
-                            (self._metrics["events_processed"] + processed)
-                        )
-                        self._metrics["events_processed"] += processed
-                        
-                    if batch_time > 0.1:  # Log slow batch processing
-                        logger.debug(f"Processed {processed} events in {batch_time:.3f}s ({avg_time:.3f}s per event)")
+                # Sleeps on the queue's condition variable until events arrive or stop() closes it
+                batch = self._event_queue.get_batch(self._batch_size)
+                if not batch:
+                    continue
+                self._process_batch(batch)
                 
         self._stop_processing.clear()
+        self._event_queue.reopen()
         self._processing_thread = threading.Thread(target=process_events, daemon=True)
         self._processing_thread.start()
 
+    def _process_batch(self, batch: List[BaseEvent]) -> None:
+        """Dispatch a batch of queued events and record batch metrics."""
+        start_time = time.time()
+        for event in batch:
+            self._process_event(event)
+        processed = len(batch)
+            
+        # Record metrics
+        if self._monitor_performance:
+            batch_time = time.time() - start_time
+            avg_time = batch_time / processed
+            with self._lock:
+                self._metrics["avg_processing_time"] = (
+                    (self._metrics["avg_processing_time"] * self._metrics["events_processed"] + batch_time) /
+                    (self._metrics["events_processed"] + processed)
+                )
+                self._metrics["events_processed"] += processed
+                
+            if batch_time > 0.1:  # Log slow batch processing
+                logger.debug(f"Processed {processed} events in {batch_time:.3f}s ({avg_time:.3f}s per event)")
+
     def stop(self) -> None:
         """Stop the event processing thread and clean up resources."""
         if self._processing_thread and self._processing_thread.is_alive():
             logger.info("Stopping event processing thread...")
             self._stop_processing.set()
+            # Wakes the worker and any publisher blocked on a full queue
+            self._event_queue.close()
             self._processing_thread.join(timeout=1.0)
             if self._processing_thread.is_alive():
                 logger.warning("Event processing thread did not stop gracefully")
@@ -357,13 +450,43 @@ class EventBus:
         remaining = len(self._event_queue)
         if remaining > 0:
             logger.info(f"Processing {remaining} remaining events before shutdown")
-            while self._event_queue:
-                event = self._event_queue.popleft()
-                self._process_event(event)
+            while True:
+                batch = self._event_queue.get_batch(self._batch_size, timeout=0)
+                if not batch:
+                    break
+                self._process_batch(batch)
                 
         # Log final metrics
         if self._monitor_performance:
-            logger.info(f"EventBus shutdown. Final metrics: {self._metrics}")
+            logger.info(f"EventBus shutdown. Final metrics: {self.get_metrics()}")
+
+    def set_event_priority(self, event_type: str, priority: int) -> None:
+        """
+        Set the default queue priority for an event type (for async mode).
+        
+        Args:
+            event_type: The event type
+            priority: Queue priority (higher numbers are dispatched first)
+        """
+        with self._lock:
+            self._event_priorities[event_type] = priority
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get dispatch statistics and event queue gauges.
+        
+        Returns:
+            Dictionary of bus counters; in async mode also a "queue" entry with the
+            queue depth, high water mark, drops and queueing latency
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        if self._enable_async:
+            queue_stats = self._event_queue.get_stats()
+            metrics["queue"] = queue_stats
+            metrics["queue_high_water_mark"] = max(metrics["queue_high_water_mark"],
+                                                   queue_stats["high_water_mark"])
+        return metrics
 
     def _process_event(self, event: BaseEvent) -> bool:
         """
@@ -375,6 +498,9 @@ class EventBus:
         Returns:
             bool: True if the event was processed, False if it was filtered out
         """
+        if self._compiled_dispatch:
+            return self._dispatch_compiled(event)
+        
         start_time = time.time()
         
         # Check if event passes all filters
@@ -446,7 +572,7 @@ class EventBus:
         
         return True
 
-    def publish(self, event: BaseEvent) -> bool:
+    def publish(self, event: BaseEvent, priority: Optional[int] = None) -> bool:
         """
         Publish an event to all subscribed handlers.
         
@@ -455,12 +581,19 @@ class EventBus:
         
         Args:
             event: The event to publish
+            priority: Queue priority in async mode (higher numbers are dispatched
+                first); defaults to the priority set for the event type, or 0
             
         Returns:
-            bool: True if the event was queued/processed, False if it was filtered out
+            bool: True if the event was queued/processed, False if it was filtered
+                out or dropped by the queue's overflow policy
         """
-        with self._lock:
+        if self._compiled_dispatch:
+            # Lock-free fast path; see _dispatch_compiled
             self._metrics["events_published"] += 1
+        else:
+            with self._lock:
+                self._metrics["events_published"] += 1
         
         # In async mode, add to queue and return immediately
         if self._enable_async:
@@ -471,15 +604,22 @@ class EventBus:
                         self._metrics["events_filtered"] += 1
                     return False
             
-            # Add to queue for async processing
             with self._lock:
-                self._event_queue.append(event)
-                self._metrics["events_queued"] += 1
-                
                 # Start processing thread if it's not running
                 if not self._processing_thread or not self._processing_thread.is_alive():
                     self._start_processing_thread()
-                    
+            
+            if priority is None:
+                priority = self._event_priorities.get(event.event_type, 0)
+            
+            # A handler publishing from the worker thread must not wait for it to make room
+            block = threading.current_thread() is not self._processing_thread
+            if not self._event_queue.put(event, priority, block=block):
+                logger.debug(f"Event dropped by {self._event_queue.policy.value} queue: {event.event_type}")
+                return False
+            
+            with self._lock:
+                self._metrics["events_queued"] += 1
             return True
         
         # In synchronous mode, process immediately
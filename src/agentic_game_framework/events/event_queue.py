@@ -0,0 +1,303 @@
+"""
+Event Queue for Agentic Game Framework.
+
+This module provides the bounded priority queue behind the threaded EventBus.
+Urgent events are dispatched ahead of the backlog, the queue never grows past
+its capacity, and an overflow policy decides what happens to a burst that
+would exceed it.
+"""
+
+import bisect
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+from .base import BaseEvent
+
+
+class OverflowPolicy(Enum):
+    """What a full event queue does with a new event."""
+    BLOCK = "block"                                  # Publisher waits for space
+    DROP_OLDEST = "drop_oldest"                      # Oldest queued event is discarded
+    DROP_LOWEST_PRIORITY = "drop_lowest_priority"    # Oldest event of the lowest priority is discarded
+    COALESCE = "coalesce"                            # Queued event with the same key is replaced
+
+
+def default_coalesce_key(event: BaseEvent) -> Hashable:
+    """
+    Key under which queued events replace each other with the COALESCE policy.
+
+    Args:
+        event: The event being queued
+
+    Returns:
+        The event's type, source and target
+    """
+    return (event.event_type, event.source, event.target)
+
+
+class _Entry:
+    """A queued event; dead entries are skipped when popped."""
+    __slots__ = ("seq", "priority", "event", "enqueued_at", "key", "alive")
+
+    def __init__(self, seq: int, priority: int, event: BaseEvent, key: Optional[Hashable]):
+        self.seq = seq
+        self.priority = priority
+        self.event = event
+        self.enqueued_at = time.perf_counter()
+        self.key = key
+        self.alive = True
+
+
+class PriorityEventQueue:
+    """
+    Thread-safe bounded queue that hands out events highest priority first.
+
+    Events of equal priority keep their publish order. Each priority level is
+    a FIFO deque, and the levels in use are kept sorted, so puts, gets and
+    overflow drops cost O(number of levels) rather than O(queue size).
+    Consumers wait on a condition variable instead of polling.
+    """
+
+    def __init__(self, maxsize: int = 10000, policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 coalesce_key: Optional[Callable[[BaseEvent], Hashable]] = None):
+        """
+        Initialize an empty queue.
+
+        Args:
+            maxsize: Maximum number of queued events
+            policy: Overflow policy (an OverflowPolicy or its string value)
+            coalesce_key: Key function for the COALESCE policy
+                (defaults to event type, source and target)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._policy = OverflowPolicy(policy)
+        self._coalesce_key = coalesce_key or default_coalesce_key
+
+        # priority -> FIFO of entries, plus the sorted list of non-empty levels
+        self._levels: Dict[int, Deque[_Entry]] = {}
+        self._dead: Dict[int, int] = {}
+        self._priorities: List[int] = []
+        self._by_key: Dict[Hashable, _Entry] = {}
+        self._size = 0
+        self._seq = 0
+        self._closed = False
+
+        self._condition = threading.Condition(threading.Lock())
+
+        # Gauges
+        self._stats = {
+            "enqueued": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "high_water_mark": 0,
+            "avg_latency": 0.0,
+            "max_latency": 0.0,
+            "dequeued": 0
+        }
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        """The overflow policy of this queue."""
+        return self._policy
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, event: BaseEvent, priority: int = 0, block: bool = True,
+            timeout: Optional[float] = None) -> bool:
+        """
+        Queue an event, applying the overflow policy if the queue is full.
+
+        Args:
+            event: The event to queue
+            priority: Dispatch priority (higher numbers are dispatched first)
+            block: Whether the BLOCK policy may wait for space
+            timeout: Maximum seconds to wait for space (None waits forever)
+
+        Returns:
+            bool: True if the event was queued (or merged into a queued event),
+                False if it was dropped or the queue is closed
+        """
+        with self._condition:
+            if self._closed:
+                return False
+
+            key = None
+            if self._policy is OverflowPolicy.COALESCE:
+                key = self._coalesce_key(event)
+                queued = self._by_key.get(key)
+                if queued is not None:
+                    self._stats["coalesced"] += 1
+                    if queued.priority == priority:
+                        # Keep the queue position, deliver the newest event
+                        queued.event = event
+                        return True
+                    self._discard(queued)
+
+            if self._size >= self._maxsize and not self._make_room(priority, block, timeout):
+                self._stats["dropped"] += 1
+                return False
+
+            self._push(_Entry(self._seq, priority, event, key))
+            self._seq += 1
+            self._stats["enqueued"] += 1
+            if self._size > self._stats["high_water_mark"]:
+                self._stats["high_water_mark"] = self._size
+            self._condition.notify()
+            return True
+
+    def _make_room(self, priority: int, block: bool, timeout: Optional[float]) -> bool:
+        """Free a slot for an incoming event (called with the lock held)."""
+        if self._policy is OverflowPolicy.DROP_OLDEST:
+            oldest = min((self._head(level) for level in self._priorities), key=lambda entry: entry.seq)
+            self._discard(oldest)
+            self._stats["dropped"] += 1
+            return True
+
+        if self._policy is OverflowPolicy.DROP_LOWEST_PRIORITY:
+            lowest = self._priorities[0]
+            if priority < lowest:
+                # The incoming event is the least important one
+                return False
+            self._discard(self._head(lowest))
+            self._stats["dropped"] += 1
+            return True
+
+        # BLOCK, and COALESCE without a matching queued event
+        if not block:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._size >= self._maxsize and not self._closed:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._condition.wait(remaining)
+        return not self._closed
+
+    def _push(self, entry: _Entry) -> None:
+        level = self._levels.get(entry.priority)
+        if level is None:
+            level = self._levels[entry.priority] = deque()
+            self._dead[entry.priority] = 0
+            bisect.insort(self._priorities, entry.priority)
+        level.append(entry)
+        if entry.key is not None:
+            self._by_key[entry.key] = entry
+        self._size += 1
+
+    def _head(self, priority: int) -> _Entry:
+        """Oldest live entry of a level, dropping dead entries in front of it."""
+        level = self._levels[priority]
+        self._drop_dead_heads(priority, level)
+        return level[0]
+
+    def _drop_dead_heads(self, priority: int, level: Deque[_Entry]) -> None:
+        while level and not level[0].alive:
+            level.popleft()
+            self._dead[priority] -= 1
+
+    def _discard(self, entry: _Entry) -> None:
+        """Remove a queued entry without dispatching it."""
+        entry.alive = False
+        self._forget(entry)
+        priority = entry.priority
+        level = self._levels[priority]
+        self._dead[priority] += 1
+        self._drop_dead_heads(priority, level)
+        if not level:
+            self._remove_level(priority)
+        elif self._dead[priority] * 2 > len(level):
+            # Dead entries outnumber live ones; rebuild the level so that
+            # memory stays bounded by maxsize while nothing is consumed
+            self._levels[priority] = deque(queued for queued in level if queued.alive)
+            self._dead[priority] = 0
+
+    def _forget(self, entry: _Entry) -> None:
+        self._size -= 1
+        if entry.key is not None and self._by_key.get(entry.key) is entry:
+            del self._by_key[entry.key]
+
+    def _remove_level(self, priority: int) -> None:
+        del self._levels[priority]
+        del self._dead[priority]
+        del self._priorities[bisect.bisect_left(self._priorities, priority)]
+
+    def _pop(self) -> _Entry:
+        priority = self._priorities[-1]
+        entry = self._head(priority)
+        level = self._levels[priority]
+        level.popleft()
+        self._drop_dead_heads(priority, level)
+        if not level:
+            self._remove_level(priority)
+        self._forget(entry)
+        return entry
+
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> List[BaseEvent]:
+        """
+        Take up to max_items events, highest priority first.
+
+        Waits until an event is available, the timeout expires or the queue
+        is closed.
+
+        Args:
+            max_items: Maximum number of events to return
+            timeout: Maximum seconds to wait (None waits forever, 0 never waits)
+
+        Returns:
+            List[BaseEvent]: The events, empty if none arrived in time
+        """
+        with self._condition:
+            if timeout is None:
+                while self._size == 0 and not self._closed:
+                    self._condition.wait()
+            elif self._size == 0 and timeout > 0:
+                self._condition.wait_for(lambda: self._size > 0 or self._closed, timeout)
+
+            now = time.perf_counter()
+            batch = []
+            while self._size and len(batch) < max_items:
+                entry = self._pop()
+                latency = now - entry.enqueued_at
+                dequeued = self._stats["dequeued"]
+                self._stats["avg_latency"] = (self._stats["avg_latency"] * dequeued + latency) / (dequeued + 1)
+                self._stats["dequeued"] = dequeued + 1
+                if latency > self._stats["max_latency"]:
+                    self._stats["max_latency"] = latency
+                batch.append(entry.event)
+
+            if batch:
+                # Publishers blocked on a full queue can continue
+                self._condition.notify_all()
+            return batch
+
+    def close(self) -> None:
+        """Wake all waiting publishers and consumers; later puts are rejected."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def reopen(self) -> None:
+        """Accept events again after close()."""
+        with self._condition:
+            self._closed = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue gauges.
+
+        Returns:
+            Dictionary with the current depth, capacity, policy, high water mark,
+            drop and coalesce counts, and queueing latency in seconds
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats["depth"] = self._size
+            stats["capacity"] = self._maxsize
+            stats["policy"] = self._policy.value
+            return stats
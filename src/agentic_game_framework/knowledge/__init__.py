@@ -6,6 +6,7 @@ capabilities for agents, allowing them to store, retrieve, and leverage
 knowledge for decision-making.
 """
 
+from .embeddings import CachedEmbedder, Embedder, HashingEmbedder, create_embedder
 from .vector_store import VectorStore, VectorStoreConfig
 from .rag_client import RAGClient
 
@@ -13,4 +14,8 @@ __all__ = [
     "VectorStore",
     "VectorStoreConfig",
     "RAGClient",
+    "Embedder",
+    "HashingEmbedder",
+    "CachedEmbedder",
+    "create_embedder",
 ]
\ No newline at end of file
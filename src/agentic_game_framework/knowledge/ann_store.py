@@ -0,0 +1,324 @@
+"""
+Approximate Nearest Neighbour Stores for Agentic Game Framework.
+
+This module provides vector stores that answer similarity searches without
+scoring every stored vector: an HNSW graph index built on FAISS when it is
+installed, and a pure-NumPy random-projection LSH index otherwise. Both keep
+their vectors in the MemoryVectorStore matrix, so the ANN index only proposes
+candidate rows. The candidates are then re-ranked exactly, and metadata
+filters, tombstone deletes and persistence work as in the exact store.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .embeddings import Embedder
+from .vector_store import (
+    FAISS_AVAILABLE, MemoryVectorStore, VectorStoreConfig, VectorStoreItem
+)
+
+if FAISS_AVAILABLE:
+    import faiss
+
+logger = logging.getLogger(__name__)
+
+
+class ANNVectorStore(MemoryVectorStore):
+    """
+    Base class for stores that search through an approximate index.
+
+    Subclasses maintain the index as rows are appended and rebuild it when
+    the matrix is compacted. A query is scored exactly against the
+    candidate rows its index returns. When a metadata filter leaves only a
+    few rows, those rows are scored directly instead.
+    """
+
+    # Filters matching at most this many rows are answered by exact search
+    EXACT_FILTER_ROWS = 2048
+
+    def __init__(self, config: VectorStoreConfig, compaction_ratio: float = 0.25,
+                 embedder: Optional[Embedder] = None):
+        self._loading = False
+        super().__init__(config, compaction_ratio, embedder)
+
+    def _index_rows(self, start: int, end: int) -> None:
+        """Add matrix rows [start, end) to the index."""
+        raise NotImplementedError
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the index from all rows of the matrix."""
+        raise NotImplementedError
+
+    def _candidate_rows(self, query: np.ndarray, limit: int) -> np.ndarray:
+        """Rows that likely hold the nearest neighbours of a prepared query."""
+        raise NotImplementedError
+
+    def _save_index(self, path: str) -> None:
+        """Write the index next to the saved items (optional)."""
+
+    def _load_index(self, path: str) -> bool:
+        """Read an index written by _save_index; False means rebuild it."""
+        return False
+
+    def _append_rows(self, items: List[VectorStoreItem]) -> None:
+        start = self._size
+        super()._append_rows(items)
+        if not self._loading and self._size > start:
+            self._index_rows(start, self._size)
+
+    def compact(self) -> None:
+        """Rebuild the matrix without tombstoned rows, and the index with it."""
+        super().compact()
+        if not self._loading:
+            self._rebuild_index()
+
+    def search_by_vectors(
+        self,
+        query_vectors: Union[np.ndarray, List[np.ndarray]],
+        limit: int = 10,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[VectorStoreItem, float]]]:
+        """Search for the items most similar to each of several query vectors.
+
+        Args:
+            query_vectors: Query vectors, one per row
+            limit: Maximum number of results per query
+            filter_metadata: Filter results by metadata
+
+        Returns:
+            List[List[Tuple[VectorStoreItem, float]]]: (item, similarity) tuples for each query
+        """
+        if not self.items or limit <= 0 or len(query_vectors) == 0:
+            return [[] for _ in range(len(query_vectors))]
+
+        filter_rows = self._filter_rows(filter_metadata)
+        if filter_rows is not None and len(filter_rows) <= max(self.EXACT_FILTER_ROWS, limit):
+            return super().search_by_vectors(query_vectors, limit, filter_metadata)
+
+        results = []
+        for vector in query_vectors:
+            query = self._prepare_vector(vector)
+            rows = self._candidate_rows(query, limit)
+            rows = rows[self._alive[rows]]
+            if filter_rows is not None:
+                rows = np.intersect1d(rows, filter_rows, assume_unique=True)
+            if len(rows) < limit:
+                # The index missed too much; answer this query exactly
+                results.append(super().search_by_vectors([vector], limit, filter_metadata)[0])
+                continue
+            results.append(self._rank_rows(query, rows, limit))
+        return results
+
+    def _rank_rows(self, query: np.ndarray, rows: np.ndarray, limit: int) -> List[Tuple[VectorStoreItem, float]]:
+        """Exact top-k among candidate rows."""
+        scores = self._scores(query[None, :], rows)[0]
+        if limit < len(rows):
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.items[self._row_ids[rows[i]]], float(scores[i])) for i in top]
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """Save the items, and the index if the backend can persist it.
+
+        Args:
+            path: Path to save to (uses config.storage_path if None)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self._tombstones:
+            # Saved items are reloaded into consecutive rows; make the index match
+            self.compact()
+        if not super().save(path):
+            return False
+        try:
+            self._save_index(path or self.config.storage_path)
+        except Exception as e:
+            # The index is rebuilt from the items on load
+            logger.warning(f"Could not save ANN index: {e}")
+        return True
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """Load the items, then the saved index or a rebuilt one.
+
+        Args:
+            path: Path to load from (uses config.storage_path if None)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self._loading = True
+        try:
+            loaded = super().load(path)
+        finally:
+            self._loading = False
+        if not loaded:
+            self._rebuild_index()
+            return False
+        if not self._load_index(path or self.config.storage_path):
+            self._rebuild_index()
+        return True
+
+
+class LSHVectorStore(ANNVectorStore):
+    """
+    Vector store with a random-projection locality-sensitive hash index.
+
+    Each of ``lsh_tables`` tables hashes a vector to the sign pattern of
+    ``lsh_bits`` random projections, so vectors at a small angle share
+    buckets. A query reads its own bucket in every table, plus the
+    ``lsh_probes`` buckets one flipped bit away from its least certain
+    projections. Works best with the cosine and dot product metrics.
+
+    The tables are stored as code arrays sorted once per table, so a bucket is
+    a binary-searched slice. Rows inserted since the last sort are matched by
+    comparing their codes directly, and are merged into the sorted arrays once
+    they exceed ``PENDING_RATIO`` of the store.
+    """
+
+    PENDING_RATIO = 0.1
+    MIN_PENDING = 1024
+
+    def __init__(self, config: VectorStoreConfig, compaction_ratio: float = 0.25,
+                 embedder: Optional[Embedder] = None):
+        self._bit_values = np.left_shift(1, np.arange(config.lsh_bits, dtype=np.int64))
+        super().__init__(config, compaction_ratio, embedder)
+
+    def _reset_matrix(self, dimension: Optional[int] = None) -> None:
+        super()._reset_matrix(dimension)
+        tables = self.config.lsh_tables
+        self._codes = np.zeros((0, tables), dtype=np.int64)
+        self._sorted_codes = np.zeros((tables, 0), dtype=np.int64)
+        self._sorted_rows = np.zeros((tables, 0), dtype=np.int64)
+        self._sorted_upto = 0  # Rows below this are in the sorted arrays
+        if dimension is None:
+            self._planes = None
+        else:
+            rng = np.random.default_rng(self.config.seed)
+            self._planes = rng.standard_normal(
+                (self.config.lsh_tables * self.config.lsh_bits, dimension)
+            ).astype(np.float32)
+
+    def _hash(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Bucket codes (n, tables) and raw projections (n, tables, bits) of vectors."""
+        projections = (vectors @ self._planes.T).reshape(
+            len(vectors), self.config.lsh_tables, self.config.lsh_bits
+        )
+        return (projections > 0) @ self._bit_values, projections
+
+    def _index_rows(self, start: int, end: int) -> None:
+        if end > self._codes.shape[0]:
+            codes = np.zeros((max(end, 2 * self._codes.shape[0]), self.config.lsh_tables), dtype=np.int64)
+            codes[:start] = self._codes[:start]
+            self._codes = codes
+        self._codes[start:end] = self._hash(self._matrix[start:end])[0]
+        if end - self._sorted_upto > max(self.MIN_PENDING, self.PENDING_RATIO * end):
+            self._sort_tables()
+
+    def _sort_tables(self) -> None:
+        codes = self._codes[:self._size].T
+        self._sorted_rows = np.argsort(codes, axis=1, kind="stable")
+        self._sorted_codes = np.take_along_axis(codes, self._sorted_rows, axis=1)
+        self._sorted_upto = self._size
+
+    def _rebuild_index(self) -> None:
+        self._codes = np.zeros((0, self.config.lsh_tables), dtype=np.int64)
+        self._sorted_upto = 0
+        if self._planes is not None and self._size:
+            self._index_rows(0, self._size)
+        self._sort_tables()
+
+    def _candidate_rows(self, query: np.ndarray, limit: int) -> np.ndarray:
+        codes, projections = self._hash(query[None, :])
+        codes, projections = codes[0], projections[0]
+        probes = min(self.config.lsh_probes, self.config.lsh_bits)
+        uncertain = np.argsort(np.abs(projections), axis=1)[:, :probes]
+        # (tables, 1 + probes) bucket codes: the query's own and its one-bit neighbours
+        probe_codes = np.concatenate([codes[:, None], codes[:, None] ^ self._bit_values[uncertain]], axis=1)
+
+        found = []
+        for table in range(self.config.lsh_tables):
+            lo = np.searchsorted(self._sorted_codes[table], probe_codes[table], side="left")
+            hi = np.searchsorted(self._sorted_codes[table], probe_codes[table], side="right")
+            found.extend(self._sorted_rows[table, a:b] for a, b in zip(lo, hi) if b > a)
+
+        if self._sorted_upto < self._size:
+            pending = self._codes[self._sorted_upto:self._size]
+            hits = (pending[:, :, None] == probe_codes[None, :, :]).any(axis=(1, 2))
+            found.append(np.flatnonzero(hits) + self._sorted_upto)
+
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        rows = np.sort(np.concatenate(found))
+        if len(rows) > 1:
+            rows = rows[np.concatenate(([True], rows[1:] != rows[:-1]))]
+        return rows
+
+
+class FAISSVectorStore(ANNVectorStore):
+    """
+    Vector store with a FAISS HNSW graph index.
+
+    FAISS assigns sequential ids, which line up with the matrix rows, so
+    inserts are appended to the graph directly. HNSW cannot remove vectors,
+    so deletes stay tombstones until compaction rebuilds the graph. Searches
+    over-fetch candidates to make up for tombstoned rows.
+    """
+
+    def __init__(self, config: VectorStoreConfig, compaction_ratio: float = 0.25,
+                 embedder: Optional[Embedder] = None):
+        if not FAISS_AVAILABLE:
+            raise ImportError("FAISS is not installed. Install it with 'pip install faiss-cpu' or 'pip install faiss-gpu'.")
+        self._index = None
+        super().__init__(config, compaction_ratio, embedder)
+
+    def _reset_matrix(self, dimension: Optional[int] = None) -> None:
+        super()._reset_matrix(dimension)
+        self._index = self._new_index(dimension) if dimension is not None else None
+
+    def _new_index(self, dimension: int):
+        metric = faiss.METRIC_L2 if self.config.distance_metric == "euclidean" else faiss.METRIC_INNER_PRODUCT
+        index = faiss.IndexHNSWFlat(dimension, self.config.hnsw_m, metric)
+        index.hnsw.efSearch = self.config.ef_search
+        return index
+
+    def _index_rows(self, start: int, end: int) -> None:
+        self._index.add(np.ascontiguousarray(self._matrix[start:end]))
+
+    def _rebuild_index(self) -> None:
+        if self._dimension is None:
+            self._index = None
+            return
+        self._index = self._new_index(self._dimension)
+        if self._size:
+            self._index_rows(0, self._size)
+
+    def _candidate_rows(self, query: np.ndarray, limit: int) -> np.ndarray:
+        fetch = min(self._size, max(2 * limit, limit + self._tombstones))
+        self._index.hnsw.efSearch = max(self.config.ef_search, fetch)
+        _, ids = self._index.search(query[None, :], fetch)
+        ids = ids[0]
+        return ids[ids >= 0]
+
+    def _index_path(self, path: str) -> str:
+        return path + ".faiss"
+
+    def _save_index(self, path: str) -> None:
+        if self._index is not None:
+            faiss.write_index(self._index, self._index_path(path))
+
+    def _load_index(self, path: str) -> bool:
+        index_path = self._index_path(path)
+        if not os.path.exists(index_path):
+            return False
+        index = faiss.read_index(index_path)
+        if index.ntotal != self._size or index.d != self._dimension:
+            logger.warning("Saved FAISS index does not match the stored items; rebuilding it")
+            return False
+        self._index = index
+        return True
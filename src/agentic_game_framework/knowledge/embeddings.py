@@ -0,0 +1,319 @@
+"""
+Text Embeddings for Agentic Game Framework.
+
+This module provides the pluggable embedding pipeline used by the vector
+stores. An Embedder turns a batch of texts into one matrix of vectors. The
+default HashingEmbedder is a deterministic, dependency-free hashing-trick
+TF-IDF model. A sentence-transformers model can be used instead when it is
+installed. CachedEmbedder keeps a persistent content-hash -> vector cache, so
+repeated texts are never embedded twice.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+# Optional imports for local embedding models
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Common words that carry no topic information
+STOP_WORDS = frozenset("""
+    a an and are as at be by for from has have he her his i in is it its of on or our she that the
+    their them they this to was we were will with you your
+""".split())
+
+
+class Embedder(ABC):
+    """Interface for turning texts into fixed-size vectors."""
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Length of the vectors this embedder produces."""
+        pass
+
+    @property
+    def name(self) -> str:
+        """Identifier of the model and its settings (used to key caches)."""
+        return f"{type(self).__name__}-{self.dimension}"
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed a batch of texts.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            np.ndarray: float32 matrix with one row per text
+        """
+        pass
+
+    def embed_one(self, text: str) -> np.ndarray:
+        """Embed a single text.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            np.ndarray: The embedding vector
+        """
+        return self.embed([text])[0]
+
+
+class HashingEmbedder(Embedder):
+    """
+    Deterministic hashing-trick TF-IDF embedder.
+
+    Words and word bigrams are hashed (CRC32, stable across processes) into
+    ``dimension`` signed buckets, weighted by sublinear term frequency and,
+    once fit() has seen a corpus, by inverse document frequency. Rows are
+    L2-normalized, so texts sharing vocabulary have a high cosine similarity.
+    Fit before adding texts to a store, because refitting changes the vectors.
+    """
+
+    def __init__(self, dimension: int = 768, ngram_range: tuple = (1, 2),
+                 stop_words: Iterable[str] = STOP_WORDS):
+        """Initialize the embedder.
+
+        Args:
+            dimension: Number of hash buckets (vector length)
+            ngram_range: Smallest and largest word n-gram to hash
+            stop_words: Words ignored when tokenizing
+        """
+        self._dimension = dimension
+        self.ngram_range = ngram_range
+        self.stop_words = frozenset(stop_words)
+        self.idf: Optional[np.ndarray] = None
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    @property
+    def name(self) -> str:
+        fitted = "-idf" + hashlib.sha1(self.idf.tobytes()).hexdigest()[:8] if self.idf is not None else ""
+        return f"hashing-{self._dimension}-{self.ngram_range[0]}-{self.ngram_range[1]}{fitted}"
+
+    def _features(self, text: str) -> Counter:
+        """Bucket -> signed count of a text's n-grams."""
+        words = [word for word in _TOKEN_PATTERN.findall(text.lower()) if word not in self.stop_words]
+        features = Counter()
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            for i in range(len(words) - n + 1):
+                gram = " ".join(words[i:i + n]).encode()
+                hashed = zlib.crc32(gram)
+                sign = 1 if zlib.crc32(gram, 0x9E3779B9) & 1 else -1
+                features[hashed % self._dimension] += sign
+        return features
+
+    def fit(self, texts: Sequence[str]) -> "HashingEmbedder":
+        """Learn inverse document frequencies from a corpus.
+
+        Args:
+            texts: Representative texts (e.g. the knowledge base)
+
+        Returns:
+            HashingEmbedder: This embedder
+        """
+        document_frequency = np.zeros(self._dimension, dtype=np.float64)
+        for text in texts:
+            buckets = list(self._features(text).keys())
+            document_frequency[buckets] += 1
+        self.idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+        return self
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self._dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for bucket, count in self._features(text).items():
+                if count:
+                    vectors[row, bucket] = math.copysign(1 + math.log(abs(count)), count)
+        if self.idf is not None:
+            vectors *= self.idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class SentenceTransformerEmbedder(Embedder):
+    """Embedder backed by a local sentence-transformers model."""
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", batch_size: int = 64):
+        """Load the model.
+
+        Args:
+            model_name: Model name or path of a model on disk
+            batch_size: Texts per forward pass
+        """
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers is not installed. "
+                              "Install it with 'pip install sentence-transformers'.")
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = SentenceTransformer(model_name)
+        self._dimension = self._model.get_sentence_embedding_dimension()
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    @property
+    def name(self) -> str:
+        return f"sentence-transformers-{self.model_name}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self._dimension), dtype=np.float32)
+        return np.asarray(
+            self._model.encode(list(texts), batch_size=self.batch_size, normalize_embeddings=True),
+            dtype=np.float32
+        )
+
+
+class CachedEmbedder(Embedder):
+    """
+    Embedder wrapper with a persistent content-hash -> vector cache.
+
+    Each batch embeds only the texts it has not seen before, and repeated
+    texts within the batch are embedded once. Keys combine the embedder's name
+    with the text hash, so a different model or setting never reuses a vector.
+    With a ``cache_path``, the cache is loaded on construction and written by
+    save(). The vectors go in a .npy matrix and the keys in a JSON sidecar.
+    """
+
+    def __init__(self, embedder: Embedder, cache_path: Optional[str] = None):
+        """Wrap an embedder.
+
+        Args:
+            embedder: The embedder that computes missing vectors
+            cache_path: Sidecar path of the persistent cache (in memory only if None)
+        """
+        self.embedder = embedder
+        self.cache_path = cache_path
+        self._cache: Dict[str, np.ndarray] = {}
+        self.hits = 0
+        self.misses = 0
+        if cache_path:
+            self.load()
+
+    @property
+    def dimension(self) -> int:
+        return self.embedder.dimension
+
+    @property
+    def name(self) -> str:
+        return self.embedder.name
+
+    @staticmethod
+    def content_hash(text: str, namespace: str = "") -> str:
+        """Cache key of a text embedded by the embedder named namespace."""
+        return hashlib.sha1(f"{namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        namespace = self.name
+        keys = [self.content_hash(text, namespace) for text in texts]
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in self._cache and key not in missing:
+                missing[key] = text
+
+        self.misses += len(missing)
+        self.hits += len(texts) - len(missing)
+        if missing:
+            vectors = self.embedder.embed(list(missing.values()))
+            for key, vector in zip(missing, vectors):
+                self._cache[key] = vector
+
+        if not keys:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.stack([self._cache[key] for key in keys])
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _vectors_path(self) -> str:
+        return os.path.splitext(self.cache_path)[0] + ".vectors.npy"
+
+    def save(self) -> bool:
+        """Write the cache to cache_path.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self.cache_path:
+            return False
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            keys = list(self._cache)
+            matrix = np.stack([self._cache[key] for key in keys]) if keys else \
+                np.zeros((0, self.dimension), dtype=np.float32)
+            vectors_path = self._vectors_path()
+            with open(vectors_path + ".tmp", "wb") as f:
+                np.save(f, matrix.astype(np.float32, copy=False))
+            with open(self.cache_path + ".tmp", "w") as f:
+                json.dump({"keys": keys}, f, separators=(",", ":"))
+            os.replace(vectors_path + ".tmp", vectors_path)
+            os.replace(self.cache_path + ".tmp", self.cache_path)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving embedding cache: {e}")
+            return False
+
+    def load(self) -> bool:
+        """Read the cache from cache_path.
+
+        Returns:
+            bool: True if a cache was loaded, False otherwise
+        """
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "r") as f:
+                sidecar = json.load(f)
+            matrix = np.load(self._vectors_path())
+            self._cache.update(zip(sidecar["keys"], matrix))
+            return True
+        except Exception as e:
+            logger.error(f"Error loading embedding cache: {e}")
+            return False
+
+
+def create_embedder(model: str = "default", dimension: int = 768,
+                    cache_path: Optional[str] = None) -> Embedder:
+    """Create the embedder named by a VectorStoreConfig.embedding_model value.
+
+    Args:
+        model: "default" or "hashing" for the HashingEmbedder, or
+            "sentence-transformers:<model name or path>"
+        dimension: Vector length for the HashingEmbedder
+        cache_path: Persistent cache location (the cache is kept in memory if None)
+
+    Returns:
+        Embedder: The embedder, wrapped in a CachedEmbedder
+    """
+    if model in ("default", "hashing"):
+        embedder = HashingEmbedder(dimension)
+    elif model.startswith("sentence-transformers:"):
+        embedder = SentenceTransformerEmbedder(model.split(":", 1)[1])
+    else:
+        raise ValueError(f"Unknown embedding model: {model}")
+    return CachedEmbedder(embedder, cache_path)
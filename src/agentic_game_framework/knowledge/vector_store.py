@@ -9,12 +9,15 @@ import json
 import os
 import uuid
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+from .embeddings import CachedEmbedder, Embedder, create_embedder
+
 # Optional imports for different backends
 try:
     import faiss
@@ -34,6 +37,8 @@ class VectorStoreBackend(Enum):
     MEMORY = auto()  # In-memory vector store
     FAISS = auto()   # Facebook AI Similarity Search
     CHROMA = auto()  # ChromaDB
+    LSH = auto()     # Pure-NumPy random-projection LSH
+    ANN = auto()     # FAISS HNSW if installed, otherwise LSH
 
 
 @dataclass
@@ -46,7 +51,16 @@ class VectorStoreConfig:
         storage_path: Path to store persistent vector data (if applicable)
         collection_name: Name of the collection/index
         distance_metric: Distance metric for similarity search
-        embedding_model: Model to use for generating embeddings
+        embedding_model: Model to use for generating embeddings ("default"/"hashing"
+            or "sentence-transformers:<model>", see embeddings.create_embedder)
+        embedding_cache_path: Path of the persistent embedding cache (in memory if None)
+        hnsw_m: Graph degree of the FAISS HNSW index
+        ef_search: Candidate list size of FAISS HNSW searches
+        lsh_tables: Number of LSH hash tables
+        lsh_bits: Hyperplanes (hash bits) per LSH table
+        lsh_probes: Extra buckets probed per LSH table, flipping the least certain bits
+        seed: Random seed for the LSH hyperplanes
+        mmap_vectors: Whether load() memory-maps the saved vector matrix read-only
     """
     backend: VectorStoreBackend = VectorStoreBackend.MEMORY
     dimension: int = 768  # Default for many embedding models
@@ -54,6 +68,14 @@ class VectorStoreConfig:
     collection_name: str = "default"
     distance_metric: str = "cosine"  # cosine, euclidean, dot_product
     embedding_model: str = "default"  # Can be a model name or identifier
+    embedding_cache_path: Optional[str] = None
+    hnsw_m: int = 32
+    ef_search: int = 64
+    lsh_tables: int = 12
+    lsh_bits: int = 16
+    lsh_probes: int = 8
+    seed: int = 0
+    mmap_vectors: bool = True
 
 
 class VectorStoreItem:
@@ -188,6 +210,26 @@ class VectorStoreBase(ABC):
         """
         pass
     
+    def search_by_vectors(
+        self,
+        query_vectors: Union[np.ndarray, List[np.ndarray]],
+        limit: int = 10,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[VectorStoreItem, float]]]:
+        """Search for similar items for each of several query vectors.
+        
+        Backends that can score queries together should override this.
+        
+        Args:
+            query_vectors: Query vectors, one per row
+            limit: Maximum number of results per query
+            filter_metadata: Filter results by metadata
+            
+        Returns:
+            List[List[Tuple[VectorStoreItem, float]]]: (item, similarity) tuples for each query
+        """
+        return [self.search_by_vector(vector, limit, filter_metadata) for vector in query_vectors]
+    
     @abstractmethod
     def search_by_text(
         self,
@@ -236,17 +278,136 @@ class VectorStoreBase(ABC):
         """
         pass
 
+# Marks the sidecar of the columnar (.npy matrix + JSON) store format
+COLUMNAR_FORMAT = "vector-store-npy-v1"
+
+
+def vectors_path(path: str) -> str:
+    """Path of the .npy matrix that goes with a saved store's sidecar file.
+    
+    Args:
+        path: Path of the sidecar (the path passed to save/load)
+        
+    Returns:
+        str: The sidecar path with its extension replaced by ``.vectors.npy``
+    """
+    return os.path.splitext(path)[0] + ".vectors.npy"
+
+
+_COMPARISONS = {
+    "$eq": lambda value, operand: value == operand,
+    "$ne": lambda value, operand: value != operand,
+    "$gt": lambda value, operand: value is not None and value > operand,
+    "$gte": lambda value, operand: value is not None and value >= operand,
+    "$lt": lambda value, operand: value is not None and value < operand,
+    "$lte": lambda value, operand: value is not None and value <= operand,
+    "$in": lambda value, operand: value in operand,
+}
+
+
+def _matches_condition(metadata: Dict[str, Any], key: str, condition: Dict[str, Any]) -> bool:
+    """Check a metadata value against a dict of comparison operators."""
+    value = metadata.get(key)
+    try:
+        return all(_COMPARISONS[op](value, operand) for op, operand in condition.items())
+    except (KeyError, TypeError):
+        return False
+
+
 class MemoryVectorStore(VectorStoreBase):
-    """In-memory implementation of a vector store."""
+    """In-memory implementation of a vector store.
+    
+    Vectors live in one contiguous float32 matrix (rows pre-normalized for the
+    cosine metric) that grows by doubling, with an id <-> row mapping. A search
+    is a single matrix-vector product followed by an ``argpartition`` top-k.
+    Equality filters on hashable metadata values are answered from an
+    inverted index as a boolean row mask. Deleted rows become tombstones and
+    are compacted away once they make up ``compaction_ratio`` of the matrix.
+    """
+    
+    # Smallest matrix allocation, in rows
+    INITIAL_CAPACITY = 64
     
-    def __init__(self, config: VectorStoreConfig):
+    def __init__(self, config: VectorStoreConfig, compaction_ratio: float = 0.25,
+                 embedder: Optional[Embedder] = None):
         """Initialize a new in-memory vector store.
         
         Args:
             config: Vector store configuration
+            compaction_ratio: Fraction of tombstoned rows that triggers compaction
+            embedder: Embedder for text queries (created from the config if None)
         """
         self.config = config
+        self.compaction_ratio = compaction_ratio
+        self.embedder = embedder or create_embedder(
+            config.embedding_model, config.dimension, config.embedding_cache_path
+        )
         self.items: Dict[str, VectorStoreItem] = {}
+        self._reset_matrix()
+    
+    def _reset_matrix(self, dimension: Optional[int] = None) -> None:
+        """Drop all rows; the dimension is fixed by the first vector added."""
+        self._dimension = dimension
+        self._matrix = np.zeros((0, dimension or 0), dtype=np.float32)
+        self._sq_norms = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._row_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0          # Rows in use, including tombstones
+        self._tombstones = 0
+        # (metadata key, value) -> rows holding that value
+        self._metadata_rows: Dict[Tuple[str, Any], List[int]] = defaultdict(list)
+    
+    def _prepare_vector(self, vector: np.ndarray) -> np.ndarray:
+        """Convert a vector to a float32 row, normalized for the cosine metric."""
+        row = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if self.config.distance_metric == "cosine":
+            norm = np.linalg.norm(row)
+            if norm > 0:
+                row = row / norm
+        return row
+    
+    def _ensure_capacity(self, rows_needed: int) -> None:
+        capacity = self._matrix.shape[0]
+        if rows_needed <= capacity:
+            return
+        new_capacity = max(self.INITIAL_CAPACITY, capacity * 2, rows_needed)
+        matrix = np.zeros((new_capacity, self._dimension), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        sq_norms = np.zeros(new_capacity, dtype=np.float32)
+        sq_norms[:self._size] = self._sq_norms[:self._size]
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        self._matrix, self._sq_norms, self._alive = matrix, sq_norms, alive
+    
+    def _append_rows(self, items: List[VectorStoreItem]) -> None:
+        """Write items into new rows at the end of the matrix."""
+        if not items:
+            return
+        rows = np.stack([self._prepare_vector(item.vector) for item in items])
+        if self._dimension is None:
+            self._reset_matrix(rows.shape[1])
+        if rows.shape[1] != self._dimension:
+            raise ValueError(f"Vector dimension {rows.shape[1]} does not match store dimension {self._dimension}")
+        
+        start = self._size
+        end = start + len(items)
+        self._ensure_capacity(end)
+        self._matrix[start:end] = rows
+        self._sq_norms[start:end] = np.einsum("ij,ij->i", rows, rows)
+        self._alive[start:end] = True
+        for row, item in enumerate(items, start):
+            self._row_ids.append(item.id)
+            self._rows[item.id] = row
+            self._index_metadata(item, row)
+        self._size = end
+    
+    def _index_metadata(self, item: VectorStoreItem, row: int) -> None:
+        for key, value in item.metadata.items():
+            try:
+                self._metadata_rows[(key, value)].append(row)
+            except TypeError:
+                pass  # Unhashable values are matched by scanning instead
     
     def add_item(self, item: VectorStoreItem) -> str:
         """Add an item to the vector store.
@@ -257,8 +418,7 @@ class MemoryVectorStore(VectorStoreBase):
         Returns:
             str: The ID of the added item
         """
-        self.items[item.id] = item
-        return item.id
+        return self.add_items([item])[0]
     
     def add_items(self, items: List[VectorStoreItem]) -> List[str]:
         """Add multiple items to the vector store.
@@ -269,11 +429,16 @@ class MemoryVectorStore(VectorStoreBase):
         Returns:
             List[str]: The IDs of the added items
         """
-        item_ids = []
-        for item in items:
-            item_id = self.add_item(item)
-            item_ids.append(item_id)
-        return item_ids
+        # Re-added ids replace their earlier vectors; within the batch the last one wins
+        unique_items = list({item.id: item for item in items}.values())
+        for item in unique_items:
+            if item.id in self.items:
+                self._tombstone(item.id)
+        self._append_rows(unique_items)
+        for item in unique_items:
+            self.items[item.id] = item
+        self._maybe_compact()
+        return [item.id for item in items]
     
     def get_item(self, item_id: str) -> Optional[VectorStoreItem]:
         """Get an item by ID.
@@ -296,10 +461,127 @@ class MemoryVectorStore(VectorStoreBase):
             bool: True if the item was deleted, False if not found
         """
         if item_id in self.items:
+            self._tombstone(item_id)
             del self.items[item_id]
+            self._maybe_compact()
             return True
         return False
     
+    def _tombstone(self, item_id: str) -> None:
+        row = self._rows.pop(item_id)
+        self._alive[row] = False
+        self._row_ids[row] = None
+        self._tombstones += 1
+    
+    def _maybe_compact(self) -> None:
+        if self._tombstones and self._tombstones >= self.compaction_ratio * self._size:
+            self.compact()
+    
+    def compact(self) -> None:
+        """Rebuild the matrix without tombstoned rows."""
+        keep = np.flatnonzero(self._alive[:self._size])
+        self._matrix = self._matrix[keep]
+        self._sq_norms = self._sq_norms[keep]
+        self._alive = np.ones(len(keep), dtype=bool)
+        self._row_ids = [self._row_ids[row] for row in keep]
+        self._rows = {item_id: row for row, item_id in enumerate(self._row_ids)}
+        self._size = len(keep)
+        self._tombstones = 0
+        self._metadata_rows = defaultdict(list)
+        for row, item_id in enumerate(self._row_ids):
+            self._index_metadata(self.items[item_id], row)
+    
+    def _filter_rows(self, filter_metadata: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Rows of live items matching the filter (None means all rows).
+        
+        Plain values match by equality. A dict value applies comparison
+        operators, e.g. ``{"importance": {"$gte": 0.5}}``; supported operators
+        are $eq, $ne, $gt, $gte, $lt, $lte and $in.
+        """
+        if not filter_metadata:
+            return None
+        
+        mask = self._alive[:self._size].copy()
+        scanned = {}
+        for key, condition in filter_metadata.items():
+            if isinstance(condition, dict):
+                scanned[key] = condition
+                continue
+            try:
+                rows = self._metadata_rows.get((key, condition), ())
+            except TypeError:
+                scanned[key] = {"$eq": condition}
+                continue
+            key_mask = np.zeros(self._size, dtype=bool)
+            key_mask[list(rows)] = True
+            mask &= key_mask
+        
+        if scanned:
+            for row in np.flatnonzero(mask):
+                metadata = self.items[self._row_ids[row]].metadata
+                if not all(_matches_condition(metadata, key, condition) for key, condition in scanned.items()):
+                    mask[row] = False
+        return np.flatnonzero(mask)
+    
+    def _scores(self, queries: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Similarity of each query (rows of ``queries``) to each candidate row."""
+        matrix = self._matrix[:self._size] if rows is None else self._matrix[rows]
+        scores = queries @ matrix.T
+        if self.config.distance_metric == "euclidean":
+            sq_norms = self._sq_norms[:self._size] if rows is None else self._sq_norms[rows]
+            query_sq = np.einsum("ij,ij->i", queries, queries)[:, None]
+            distances = np.sqrt(np.maximum(query_sq + sq_norms[None, :] - 2.0 * scores, 0.0))
+            scores = 1.0 / (1.0 + distances)
+        if rows is None and self._tombstones:
+            scores[:, ~self._alive[:self._size]] = -np.inf
+        return scores
+    
+    def search_by_vectors(
+        self,
+        query_vectors: Union[np.ndarray, List[np.ndarray]],
+        limit: int = 10,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[VectorStoreItem, float]]]:
+        """Search for the items most similar to each of several query vectors.
+        
+        All queries are scored with one matrix product, so a batch of queries
+        (e.g. one per senator) costs little more than a single search.
+        
+        Args:
+            query_vectors: Query vectors, one per row
+            limit: Maximum number of results per query
+            filter_metadata: Filter results by metadata
+            
+        Returns:
+            List[List[Tuple[VectorStoreItem, float]]]: (item, similarity) tuples for each query
+        """
+        queries = np.stack([self._prepare_vector(vector) for vector in query_vectors]) \
+            if len(query_vectors) else np.zeros((0, self._dimension or 0), dtype=np.float32)
+        if not self.items or limit <= 0 or queries.shape[0] == 0:
+            return [[] for _ in range(queries.shape[0])]
+        
+        rows = self._filter_rows(filter_metadata)
+        candidates = len(self.items) if rows is None else len(rows)
+        k = min(limit, candidates)
+        if k == 0:
+            return [[] for _ in range(queries.shape[0])]
+        
+        scores = self._scores(queries, rows)
+        if k < scores.shape[1]:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(scores.shape[1]), (scores.shape[0], scores.shape[1]))
+        
+        results = []
+        for query_scores, query_top in zip(scores, top):
+            ordered = query_top[np.argsort(-query_scores[query_top], kind="stable")]
+            row_numbers = ordered if rows is None else rows[ordered]
+            results.append([
+                (self.items[self._row_ids[row]], float(query_scores[column]))
+                for row, column in zip(row_numbers, ordered)
+            ])
+        return results
+    
     def search_by_vector(
         self,
         query_vector: np.ndarray,
@@ -316,25 +598,7 @@ class MemoryVectorStore(VectorStoreBase):
         Returns:
             List[Tuple[VectorStoreItem, float]]: List of (item, similarity) tuples
         """
-        results = []
-        
-        # Apply metadata filter if provided
-        filtered_items = self.items.values()
-        if filter_metadata:
-            filtered_items = [
-                item for item in filtered_items
-                if all(item.metadata.get(k) == v for k, v in filter_metadata.items())
-            ]
-        
-        # Calculate similarities
-        for item in filtered_items:
-            similarity = self._calculate_similarity(query_vector, item.vector)
-            results.append((item, similarity))
-        
-        # Sort by similarity (higher is better)
-        results.sort(key=lambda x: x[1], reverse=True)
-        
-        return results[:limit]
+        return self.search_by_vectors([query_vector], limit, filter_metadata)[0]
     
     def search_by_text(
         self,
@@ -361,10 +625,17 @@ class MemoryVectorStore(VectorStoreBase):
     def clear(self) -> None:
         """Clear all items from the vector store."""
         self.items.clear()
+        self._reset_matrix()
     
     def save(self, path: Optional[str] = None) -> bool:
         """Save the vector store to disk.
         
+        Writes the columnar format: live rows of the float32 matrix as a raw
+        ``.npy`` file next to ``path`` (see ``vectors_path``), and a compact
+        JSON sidecar at ``path`` holding ids, contents and metadata in row
+        order. Both files are written to temporaries and renamed into place,
+        the sidecar last, so readers never see a half-written store.
+        
         Args:
             path: Path to save to (uses config.storage_path if None)
             
@@ -377,14 +648,39 @@ class MemoryVectorStore(VectorStoreBase):
         
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
             
-            # Convert items to dictionaries
-            items_dict = {item_id: item.to_dict() for item_id, item in self.items.items()}
+            if self._tombstones:
+                rows = np.flatnonzero(self._alive[:self._size])
+                matrix = self._matrix[rows]
+                row_ids = [self._row_ids[row] for row in rows]
+            else:
+                matrix = self._matrix[:self._size]
+                row_ids = list(self._row_ids)
             
-            # Save to file
-            with open(save_path, 'w') as f:
-                json.dump(items_dict, f, indent=2)
+            dimension = self._dimension or self.config.dimension
+            if not row_ids:
+                # An empty store may hold a (0, 0) matrix; save the shape the sidecar records
+                matrix = np.zeros((0, dimension), dtype=np.float32)
+            
+            sidecar = {
+                "format": COLUMNAR_FORMAT,
+                "dimension": dimension,
+                "distance_metric": self.config.distance_metric,
+                "rows": len(row_ids),
+                "ids": row_ids,
+                "contents": [self.items[item_id].content for item_id in row_ids],
+                "metadata": [self.items[item_id].metadata for item_id in row_ids]
+            }
+            
+            matrix_path = vectors_path(save_path)
+            with open(matrix_path + ".tmp", 'wb') as f:
+                np.save(f, np.ascontiguousarray(matrix, dtype=np.float32))
+            with open(save_path + ".tmp", 'w') as f:
+                # json.dumps uses the C encoder; json.dump streams through the Python one
+                f.write(json.dumps(sidecar, separators=(",", ":")))
+            os.replace(matrix_path + ".tmp", matrix_path)
+            os.replace(save_path + ".tmp", save_path)
                 
             return True
         except Exception as e:
@@ -394,6 +690,13 @@ class MemoryVectorStore(VectorStoreBase):
     def load(self, path: Optional[str] = None) -> bool:
         """Load the vector store from disk.
         
+        Columnar stores are opened with ``np.load(mmap_mode='r')`` when
+        ``config.mmap_vectors`` is set: nothing is copied, and processes
+        loading the same file share it through the page cache. The mapping is
+        read-only; the first insert or compaction copies the matrix into
+        memory. Item vectors are views of matrix rows (unit length for the
+        cosine metric). Stores saved in the older JSON format still load.
+        
         Args:
             path: Path to load from (uses config.storage_path if None)
             
@@ -407,19 +710,60 @@ class MemoryVectorStore(VectorStoreBase):
         try:
             # Load from file
             with open(load_path, 'r') as f:
-                items_dict = json.load(f)
+                data = json.load(f)
+            
+            if data.get("format") == COLUMNAR_FORMAT:
+                self._load_columnar(load_path, data)
+                return True
                 
-            # Convert dictionaries to items
-            self.items = {
-                item_id: VectorStoreItem.from_dict(item_data)
-                for item_id, item_data in items_dict.items()
-            }
+            # Older format: a JSON object of item dictionaries
+            items = [VectorStoreItem.from_dict(item_data) for item_data in data.values()]
+            self.clear()
+            self.add_items(items)
             
             return True
         except Exception as e:
             print(f"Error loading vector store: {e}")
             return False
     
+    def _load_columnar(self, path: str, sidecar: Dict[str, Any]) -> None:
+        """Adopt a saved matrix and rebuild the id, row and metadata maps."""
+        if (sidecar["distance_metric"] == "cosine") != (self.config.distance_metric == "cosine"):
+            raise ValueError(f"Store was saved with the {sidecar['distance_metric']} metric, "
+                             f"not {self.config.distance_metric}")
+        
+        matrix = np.load(vectors_path(path), mmap_mode="r" if self.config.mmap_vectors else None)
+        rows = sidecar["rows"]
+        if rows == 0 and matrix.size == 0:
+            # Like a cleared store, an empty one leaves the dimension to the first vector added
+            self.items.clear()
+            self._reset_matrix()
+            return
+        if matrix.dtype != np.float32 or matrix.shape != (rows, sidecar["dimension"]):
+            raise ValueError(f"Vector file holds a {matrix.dtype} {matrix.shape} matrix, "
+                             f"expected float32 ({rows}, {sidecar['dimension']})")
+        
+        self.items.clear()
+        self._reset_matrix(sidecar["dimension"])
+        self._matrix = matrix
+        self._alive = np.ones(rows, dtype=bool)
+        if self.config.distance_metric == "euclidean":
+            self._sq_norms = np.einsum("ij,ij->i", matrix, matrix)
+        else:
+            self._sq_norms = np.zeros(rows, dtype=np.float32)
+        self._row_ids = list(sidecar["ids"])
+        self._size = rows
+        
+        # Plain ndarray row views of the mapping (memmap indexing is slow per row)
+        vectors = np.asarray(matrix)
+        for row, (item_id, content, metadata, vector) in enumerate(
+            zip(self._row_ids, sidecar["contents"], sidecar["metadata"], vectors)
+        ):
+            item = VectorStoreItem(vector, content, metadata, item_id)
+            self.items[item_id] = item
+            self._rows[item_id] = row
+            self._index_metadata(item, row)
+    
     def _calculate_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """Calculate similarity between two vectors.
         
@@ -454,25 +798,7 @@ class MemoryVectorStore(VectorStoreBase):
         Returns:
             np.ndarray: The embedding vector
         """
-        # In a real implementation, this would use an actual embedding model
-        # For now, we'll use a simple hash-based approach for demonstration
-        import hashlib
-        
-        # Create a deterministic but simple embedding based on text hash
-        hash_obj = hashlib.md5(text.encode())
-        hash_bytes = hash_obj.digest()
-        
-        # Convert hash to a vector of the configured dimension
-        vector = np.zeros(self.config.dimension)
-        for i in range(min(16, self.config.dimension)):
-            vector[i] = float(hash_bytes[i]) / 255.0
-        
-        # Normalize the vector
-        norm = np.linalg.norm(vector)
-        if norm > 0:
-            vector = vector / norm
-            
-        return vector
+        return self.embedder.embed_one(text)
 
 class VectorStore:
     """
@@ -482,36 +808,51 @@ class VectorStore:
     and provides a consistent interface for working with them.
     """
     
-    def __init__(self, config: Optional[VectorStoreConfig] = None):
+    def __init__(self, config: Optional[VectorStoreConfig] = None, embedder: Optional[Embedder] = None):
         """Initialize a new vector store.
         
         Args:
             config: Vector store configuration (uses default if None)
+            embedder: Embedder for texts (created from the config if None)
         """
         self.config = config or VectorStoreConfig()
+        self.embedder = embedder or create_embedder(
+            self.config.embedding_model, self.config.dimension, self.config.embedding_cache_path
+        )
         
         # Create the appropriate backend
         if self.config.backend == VectorStoreBackend.FAISS:
             if not FAISS_AVAILABLE:
                 raise ImportError("FAISS is not installed. Install it with 'pip install faiss-cpu' or 'pip install faiss-gpu'.")
             self._store = self._create_faiss_store()
+        elif self.config.backend == VectorStoreBackend.LSH:
+            self._store = self._create_lsh_store()
+        elif self.config.backend == VectorStoreBackend.ANN:
+            self._store = self._create_faiss_store() if FAISS_AVAILABLE else self._create_lsh_store()
         elif self.config.backend == VectorStoreBackend.CHROMA:
             if not CHROMA_AVAILABLE:
                 raise ImportError("ChromaDB is not installed. Install it with 'pip install chromadb'.")
             self._store = self._create_chroma_store()
         else:  # Memory
-            self._store = MemoryVectorStore(self.config)
+            self._store = MemoryVectorStore(self.config, embedder=self.embedder)
     
     def _create_faiss_store(self):
         """Create a FAISS vector store.
         
         Returns:
-            VectorStoreBase: A FAISS vector store
+            VectorStoreBase: A FAISS HNSW vector store
         """
-        # This would be implemented with the FAISSVectorStore class
-        # For now, we'll use the memory store as a fallback
-        print("FAISS backend requested but not fully implemented. Using in-memory store instead.")
-        return MemoryVectorStore(self.config)
+        from .ann_store import FAISSVectorStore
+        return FAISSVectorStore(self.config, embedder=self.embedder)
+    
+    def _create_lsh_store(self):
+        """Create a random-projection LSH vector store.
+        
+        Returns:
+            VectorStoreBase: An LSH vector store
+        """
+        from .ann_store import LSHVectorStore
+        return LSHVectorStore(self.config, embedder=self.embedder)
     
     def _create_chroma_store(self):
         """Create a ChromaDB vector store.
@@ -522,7 +863,7 @@ class VectorStore:
         # This would be implemented with the ChromaVectorStore class
         # For now, we'll use the memory store as a fallback
         print("ChromaDB backend requested but not fully implemented. Using in-memory store instead.")
-        return MemoryVectorStore(self.config)
+        return MemoryVectorStore(self.config, embedder=self.embedder)
     
     def add_item(self, vector: np.ndarray, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Add an item to the vector store.
@@ -551,21 +892,7 @@ class VectorStore:
             str: The ID of the added item
         """
         # Generate embedding
-        if isinstance(self._store, MemoryVectorStore):
-            vector = self._store._get_embedding(text)
-        else:
-            # Fallback for other backends
-            import hashlib
-            hash_obj = hashlib.md5(text.encode())
-            hash_bytes = hash_obj.digest()
-            
-            vector = np.zeros(self.config.dimension)
-            for i in range(min(16, self.config.dimension)):
-                vector[i] = float(hash_bytes[i]) / 255.0
-            
-            norm = np.linalg.norm(vector)
-            if norm > 0:
-                vector = vector / norm
+        vector = self.embedder.embed_one(text)
         
         # Add to store
         return self.add_item(vector=vector, content=text, metadata=metadata)
@@ -585,26 +912,12 @@ class VectorStore:
         elif len(metadatas) != len(texts):
             raise ValueError("Length of metadatas must match length of texts")
         
-        items = []
-        for text, metadata in zip(texts, metadatas):
-            # Generate embedding
-            if isinstance(self._store, MemoryVectorStore):
-                vector = self._store._get_embedding(text)
-            else:
-                # Fallback for other backends
-                import hashlib
-                hash_obj = hashlib.md5(text.encode())
-                hash_bytes = hash_obj.digest()
-                
-                vector = np.zeros(self.config.dimension)
-                for i in range(min(16, self.config.dimension)):
-                    vector[i] = float(hash_bytes[i]) / 255.0
-                
-                norm = np.linalg.norm(vector)
-                if norm > 0:
-                    vector = vector / norm
-            
-            items.append(VectorStoreItem(vector=vector, content=text, metadata=metadata))
+        # One embedding call for the whole batch
+        vectors = self.embedder.embed(texts)
+        items = [
+            VectorStoreItem(vector=vector, content=text, metadata=metadata)
+            for vector, text, metadata in zip(vectors, texts, metadatas)
+        ]
         
         return self._store.add_items(items)
     
@@ -624,9 +937,31 @@ class VectorStore:
         Returns:
             List[Tuple[str, float]]: List of (content, similarity) tuples
         """
-        results = self._store.search_by_text(query, limit, filter_metadata)
+        results = self._store.search_by_vector(self.embedder.embed_one(query), limit, filter_metadata)
         return [(item.content, similarity) for item, similarity in results]
     
+    def search_many(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """Search for similar items for several text queries at once.
+        
+        The queries are embedded in one batch and scored together.
+        
+        Args:
+            queries: The query texts
+            limit: Maximum number of results per query
+            filter_metadata: Filter results by metadata
+            
+        Returns:
+            List[List[Tuple[str, float]]]: (content, similarity) tuples for each query
+        """
+        if not queries:
+            return []
+        return self.search_by_vectors(self.embedder.embed(queries), limit, filter_metadata)
+    
     def search_by_vector(
         self,
         query_vector: np.ndarray,
@@ -646,6 +981,49 @@ class VectorStore:
         results = self._store.search_by_vector(query_vector, limit, filter_metadata)
         return [(item.content, similarity) for item, similarity in results]
     
+    def search_by_vectors(
+        self,
+        query_vectors: Union[np.ndarray, List[np.ndarray]],
+        limit: int = 10,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """Search for similar items for each of several query vectors at once.
+        
+        Args:
+            query_vectors: Query vectors, one per row
+            limit: Maximum number of results per query
+            filter_metadata: Filter results by metadata
+            
+        Returns:
+            List[List[Tuple[str, float]]]: (content, similarity) tuples for each query
+        """
+        results = self._store.search_by_vectors(query_vectors, limit, filter_metadata)
+        return [[(item.content, similarity) for item, similarity in query_results]
+                for query_results in results]
+    
+    def search_items(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[VectorStoreItem, float]]]:
+        """Search for the stored items most similar to each of several text queries.
+        
+        Unlike search(), results carry the item (id and metadata), so callers
+        can map hits back to their own records without comparing content.
+        
+        Args:
+            queries: The query texts
+            limit: Maximum number of results per query
+            filter_metadata: Filter results by metadata
+            
+        Returns:
+            List[List[Tuple[VectorStoreItem, float]]]: (item, similarity) tuples for each query
+        """
+        if not queries:
+            return []
+        return self._store.search_by_vectors(self.embedder.embed(queries), limit, filter_metadata)
+    
     def get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
         """Get an item by ID.
         
@@ -688,6 +1066,8 @@ class VectorStore:
         Returns:
             bool: True if successful, False otherwise
         """
+        if isinstance(self.embedder, CachedEmbedder) and self.embedder.cache_path:
+            self.embedder.save()
         return self._store.save(path)
     
     def load(self, path: Optional[str] = None) -> bool:
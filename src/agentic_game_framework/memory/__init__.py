@@ -1,4 +1,6 @@
 
+from .consolidation import MemoryConsolidator
+from .text_search import InvertedIndex
 from .vectorized_memory import VectorizedMemory
 
 __all__ = [
@@ -8,5 +10,8 @@ __all__ = [
     "MemoryIndex",
     "MemoryPersistenceManager",
     "MemoryStore",
+    "SQLitePersistenceManager",
     "VectorizedMemory",
+    "MemoryConsolidator",
+    "InvertedIndex",
 ]
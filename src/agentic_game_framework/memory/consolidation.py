@@ -0,0 +1,316 @@
+"""
+Memory Consolidation for Agentic Game Framework.
+
+This module provides the incremental consolidation engine behind
+VectorizedMemory.consolidate_memories(). Near-duplicate memories are found by
+batched vector search and merged into summary memories. A retention heap that
+is kept up to date as memories change decides which memories to evict once the
+store is over its limit. Both steps can run in small slices under a time
+budget, so a simulation can consolidate a little on every tick.
+"""
+
+import heapq
+import time
+import uuid
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
+
+from .memory_interface import MemoryItem
+
+if TYPE_CHECKING:
+    from .vectorized_memory import VectorizedMemory
+
+RETENTION_POLICIES = ("importance", "recency", "both")
+
+
+class MemoryConsolidator:
+    """
+    Incremental consolidation engine for a VectorizedMemory.
+
+    The memory reports every added, updated and forgotten memory. Added and
+    updated memories wait in a queue until they are checked for
+    near-duplicates. Each check embeds a batch of them, searches the vector
+    store once for the whole batch, and merges every cluster whose similarity
+    reaches ``threshold``; without a threshold nothing is merged and the queue
+    waits until one is set. The retention heap holds one entry per memory, keyed
+    by the retention policy. Entries of updated or forgotten memories are
+    skipped when popped rather than removed from the heap.
+    """
+
+    # Rebuild the heap and pending queue once stale entries outnumber live ones by this factor
+    HEAP_SLACK = 2
+
+    def __init__(
+        self,
+        memory: "VectorizedMemory",
+        threshold: Optional[float] = None,
+        max_memories: int = 100,
+        retention_policy: str = "importance",
+        recency_horizon: float = 86400.0,
+        batch_size: int = 32,
+        cluster_limit: int = 8
+    ):
+        """
+        Initialize a consolidator with nothing tracked.
+
+        Args:
+            memory: The memory to consolidate
+            threshold: Similarity at which memories are merged (0.0-1.0),
+                or None to only evict
+            max_memories: Number of memories to keep after eviction
+            retention_policy: "importance", "recency", or "both"
+            recency_horizon: Seconds of age worth 0.3 importance with the "both" policy
+            batch_size: Memories checked for near-duplicates per vector search
+            cluster_limit: Most neighbours merged into one memory at a time
+        """
+        self.memory = memory
+        self.threshold = threshold
+        self.max_memories = max_memories
+        self.recency_horizon = recency_horizon
+        self.batch_size = batch_size
+        self.cluster_limit = cluster_limit
+        self._policy = retention_policy
+
+        # Retention heap of (key, seq, memory_id); the lowest key is evicted first
+        self._heap: List[Tuple[float, int, str]] = []
+        self._live: Dict[str, int] = {}  # memory_id -> seq of its current heap entry
+        self._seq = 0
+
+        # Memories not yet checked for near-duplicates
+        self._pending: Deque[str] = deque()
+        self._queued: Dict[str, bool] = {}
+
+        self._stats = {
+            "merged": 0,
+            "summaries": 0,
+            "evicted": 0,
+            "checked": 0
+        }
+
+    @property
+    def retention_policy(self) -> str:
+        """The policy that orders the retention heap."""
+        return self._policy
+
+    @retention_policy.setter
+    def retention_policy(self, policy: str) -> None:
+        if policy not in RETENTION_POLICIES:
+            raise ValueError(f"Unknown retention policy: {policy}")
+        if policy != self._policy:
+            self._policy = policy
+            self._rebuild_heap()
+
+    @property
+    def pending(self) -> int:
+        """Number of memories still waiting for the near-duplicate check."""
+        return len(self._pending)
+
+    def retention_key(self, memory_item: MemoryItem) -> float:
+        """
+        Retention score of a memory; lower scores are evicted first.
+
+        With the "both" policy the score is 0.7 * importance plus 0.3 per
+        ``recency_horizon`` of timestamp. It is linear in the timestamp, so the
+        order does not change as time passes and keys never go stale.
+
+        Args:
+            memory_item: The memory to score
+
+        Returns:
+            float: The retention score
+        """
+        if self._policy == "importance":
+            return memory_item.importance
+        if self._policy == "recency":
+            return memory_item.timestamp
+        return 0.7 * memory_item.importance + 0.3 * memory_item.timestamp / self.recency_horizon
+
+    def track(self, memory_item: MemoryItem) -> None:
+        """
+        Record an added or updated memory.
+
+        Args:
+            memory_item: The memory as it is now
+        """
+        self._push(memory_item)
+        if memory_item.id not in self._queued:
+            self._queued[memory_item.id] = True
+            self._pending.append(memory_item.id)
+
+    def untrack(self, memory_id: str) -> None:
+        """
+        Record a forgotten memory.
+
+        Args:
+            memory_id: ID of the forgotten memory
+        """
+        self._live.pop(memory_id, None)
+        self._queued.pop(memory_id, None)
+        if len(self._pending) > self.HEAP_SLACK * len(self._queued) + 64:
+            # Nothing drains the queue while merging is off
+            self._pending = deque(self.pending_ids())
+
+    def reset(self) -> None:
+        """Forget everything tracked (the memory was cleared)."""
+        self._heap.clear()
+        self._live.clear()
+        self._pending.clear()
+        self._queued.clear()
+
+    def pending_ids(self) -> List[str]:
+        """
+        IDs of the memories still waiting for the near-duplicate check.
+
+        Returns:
+            List[str]: The IDs, oldest first
+        """
+        return [memory_id for memory_id in dict.fromkeys(self._pending) if memory_id in self._queued]
+
+    def restore(self, pending: List[str]) -> None:
+        """
+        Track every memory of a freshly loaded store.
+
+        Args:
+            pending: IDs that were waiting for the near-duplicate check when saved
+        """
+        self.reset()
+        self._live = {memory_item.id: 0 for memory_item in self.memory.index.get_all_memories()}
+        self._rebuild_heap()
+        for memory_id in pending:
+            if memory_id in self._live and memory_id not in self._queued:
+                self._queued[memory_id] = True
+                self._pending.append(memory_id)
+
+    def _push(self, memory_item: MemoryItem) -> None:
+        self._seq += 1
+        self._live[memory_item.id] = self._seq
+        heapq.heappush(self._heap, (self.retention_key(memory_item), self._seq, memory_item.id))
+        if len(self._heap) > self.HEAP_SLACK * len(self._live) + 64:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        """Re-key every live memory and drop stale entries (O(n))."""
+        self._heap = []
+        for memory_id in self._live:
+            memory_item = self.memory.get_memory(memory_id)
+            if memory_item is not None:
+                self._seq += 1
+                self._live[memory_id] = self._seq
+                self._heap.append((self.retention_key(memory_item), self._seq, memory_id))
+        heapq.heapify(self._heap)
+
+    def step(self, time_budget: Optional[float] = None) -> int:
+        """
+        Run one slice of consolidation.
+
+        Merges near-duplicates among the pending memories if a threshold is
+        set, then evicts the lowest-scoring memories until at most
+        ``max_memories`` remain. With a time budget, the slice stops once the budget is spent and the rest is
+        done by later calls. Each call checks at least one batch or evicts at
+        least one memory, so repeated calls always make progress.
+
+        Args:
+            time_budget: Seconds to spend (None runs until there is no work left)
+
+        Returns:
+            int: Number of memories removed (merged members count, net of the
+                summaries that replace them)
+        """
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        removed = 0
+
+        while self._pending and self.threshold is not None:
+            removed += self._merge_batch()
+            if deadline is not None and time.perf_counter() >= deadline:
+                return removed
+
+        while len(self._live) > self.max_memories and self._heap:
+            _, seq, memory_id = heapq.heappop(self._heap)
+            if self._live.get(memory_id) != seq:
+                continue  # Stale entry of an updated or forgotten memory
+            self.memory.forget(memory_id)
+            self._stats["evicted"] += 1
+            removed += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        return removed
+
+    def _merge_batch(self) -> int:
+        """Check one batch of pending memories for near-duplicates and merge them."""
+        batch = []
+        while self._pending and len(batch) < self.batch_size:
+            memory_id = self._pending.popleft()
+            if self._queued.pop(memory_id, False):
+                memory_item = self.memory.get_memory(memory_id)
+                if memory_item is not None:
+                    batch.append(memory_item)
+        if not batch:
+            return 0
+        self._stats["checked"] += len(batch)
+
+        contents = [self.memory._get_memory_content(memory_item) for memory_item in batch]
+        results = self.memory.vector_store.search_items(contents, self.cluster_limit + 1)
+
+        removed = 0
+        merged = set()
+        for memory_item, hits in zip(batch, results):
+            if memory_item.id in merged:
+                continue
+            cluster = [memory_item]
+            for item, similarity in hits:
+                if similarity < self.threshold:
+                    break  # Hits come most similar first
+                neighbour_id = self.memory._vector_to_memory_id.get(item.id)
+                if neighbour_id is None or neighbour_id == memory_item.id or neighbour_id in merged:
+                    continue
+                neighbour = self.memory.get_memory(neighbour_id)
+                if neighbour is not None:
+                    cluster.append(neighbour)
+            if len(cluster) > 1:
+                merged.update(member.id for member in cluster)
+                self._merge(cluster)
+                removed += len(cluster) - 1
+        return removed
+
+    def _merge(self, cluster: List[MemoryItem]) -> MemoryItem:
+        """Replace a cluster of near-duplicates with one summary memory."""
+        representative = max(cluster, key=lambda m: (m.importance, m.timestamp))
+        associations = {}
+        for member in sorted(cluster, key=lambda m: m.importance):
+            associations.update(member.associations)
+        sources = []
+        for member in cluster:
+            sources.extend(member.associations.get("consolidated_from", [member.id]))
+        associations["consolidated_from"] = sources
+        associations["consolidated_count"] = len(sources)
+
+        # Built from the representative's class so event memories keep their event fields
+        data = representative.to_dict()
+        data.update(
+            id=f"summary_{str(uuid.uuid4())}",
+            timestamp=max(member.timestamp for member in cluster),
+            importance=max(member.importance for member in cluster),
+            associations=associations
+        )
+        summary = type(representative).from_dict(data)
+        for member in cluster:
+            self.memory.forget(member.id)
+        self.memory.add_memory(summary)
+
+        self._stats["merged"] += len(cluster)
+        self._stats["summaries"] += 1
+        return summary
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get consolidation counters.
+
+        Returns:
+            Dictionary with merged, summary, eviction and check counts,
+            plus the current pending and heap sizes
+        """
+        stats = dict(self._stats)
+        stats["pending"] = len(self._pending)
+        stats["heap_size"] = len(self._heap)
+        return stats
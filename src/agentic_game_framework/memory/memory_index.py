@@ -5,17 +5,174 @@ This module provides an efficient indexing and retrieval system for agent memori
 allowing for fast querying based on various criteria.
 """
 
+import heapq
 import logging
+from bisect import bisect_left, insort
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Set, Tuple, FrozenSet, Hashable
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, FrozenSet, Hashable
 
 from .memory_interface import MemoryItem
+from .text_search import InvertedIndex, analyze
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
+# (timestamp, memory_id)
+TimestampEntry = Tuple[float, str]
+
+# What a memory was indexed under: timestamp, importance bucket, association keys
+IndexedFields = Tuple[float, int, Tuple[Tuple[str, Hashable], ...]]
+
+# Cached search: (time cached, results, partitions it depends on, (min, max) timestamp)
+CacheEntry = Tuple[float, List[MemoryItem], FrozenSet[Hashable], Tuple[float, float]]
+
+# The partition of queries that no index narrows down; every write touches it
+ALL_MEMORIES = ("all",)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Make a query value hashable, ignoring dict order.
+    
+    Args:
+        value: The value to freeze
+        
+    Returns:
+        Hashable: An equivalent hashable value
+        
+    Raises:
+        TypeError: If the value cannot be made hashable
+    """
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return ("list", tuple(_freeze(item) for item in value))
+    hash(value)
+    return value
+
+
+class _TimestampIndex:
+    """
+    Sorted (timestamp, memory_id) entries kept in blocks.
+    
+    Each block is a sorted list of at most twice BLOCK_SIZE entries, and the
+    last entry of every block is kept in a separate list. Finding an entry
+    is a binary search over the block maxima and then within one block, and
+    inserting or removing it only shifts that block, so both stay fast
+    however many memories are indexed.
+    """
+    
+    BLOCK_SIZE = 512
+    
+    def __init__(self):
+        self._blocks: List[List[TimestampEntry]] = []
+        self._maxes: List[TimestampEntry] = []
+        self._length = 0
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self) -> Iterator[TimestampEntry]:
+        for block in self._blocks:
+            yield from block
+    
+    def add(self, entry: TimestampEntry) -> None:
+        """
+        Insert an entry.
+        
+        Args:
+            entry: The (timestamp, memory_id) entry
+        """
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            self._length = 1
+            return
+        
+        position = min(bisect_left(self._maxes, entry), len(self._blocks) - 1)
+        block = self._blocks[position]
+        insort(block, entry)
+        self._maxes[position] = block[-1]
+        self._length += 1
+        
+        if len(block) > 2 * self.BLOCK_SIZE:
+            self._blocks.insert(position + 1, block[self.BLOCK_SIZE:])
+            del block[self.BLOCK_SIZE:]
+            self._maxes.insert(position, block[-1])
+    
+    def remove(self, entry: TimestampEntry) -> bool:
+        """
+        Remove an entry.
+        
+        Args:
+            entry: The (timestamp, memory_id) entry
+            
+        Returns:
+            bool: True if the entry was removed, False if not found
+        """
+        position = bisect_left(self._maxes, entry)
+        if position == len(self._blocks):
+            return False
+        block = self._blocks[position]
+        i = bisect_left(block, entry)
+        if i == len(block) or block[i] != entry:
+            return False
+        
+        del block[i]
+        self._length -= 1
+        if block:
+            self._maxes[position] = block[-1]
+        else:
+            del self._blocks[position]
+            del self._maxes[position]
+        return True
+    
+    def irange(self, min_time: float, max_time: float) -> Iterator[TimestampEntry]:
+        """
+        Iterate over the entries with min_time <= timestamp <= max_time.
+        
+        Args:
+            min_time: Minimum timestamp
+            max_time: Maximum timestamp
+            
+        Returns:
+            Iterator[TimestampEntry]: The entries, oldest first
+        """
+        # A 1-tuple sorts before every entry with the same timestamp
+        for position in range(bisect_left(self._maxes, (min_time,)), len(self._blocks)):
+            block = self._blocks[position]
+            start = bisect_left(block, (min_time,))
+            if block[-1][0] <= max_time:
+                yield from block[start:]
+                continue
+            for entry in block[start:]:
+                if entry[0] > max_time:
+                    return
+                yield entry
+            return
+    
+    def extend_sorted(self, entries: List[TimestampEntry]) -> None:
+        """
+        Replace the contents with entries that are already sorted.
+        
+        Args:
+            entries: The sorted entries
+        """
+        self._blocks = [entries[i:i + self.BLOCK_SIZE] for i in range(0, len(entries), self.BLOCK_SIZE)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._length = len(entries)
+    
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        self._blocks.clear()
+        self._maxes.clear()
+        self._length = 0
+
+
 class MemoryIndex:
     """
     Efficient memory retrieval system.
@@ -25,9 +182,11 @@ class MemoryIndex:
     1. Indexing by timestamp
     2. Indexing by importance
     3. Indexing by associations
-    4. Full-text search (basic implementation)
+    4. Full-text search with stemming and BM25 ranking
     
     This enables efficient memory retrieval without scanning all memories.
+    search_relevant() returns the memories that best match a text, so
+    callers need not filter and sort everything to find the top few.
     """
     
     def __init__(self, enable_caching: bool = True, cache_size: int = 128):
@@ -41,8 +200,8 @@ class MemoryIndex:
         # Primary storage: memory_id -> memory_item
         self._memories: Dict[str, MemoryItem] = {}
         
-        # Timestamp index: sorted list of (timestamp, memory_id) tuples
-        self._timestamp_index: List[Tuple[float, str]] = []
+        # Timestamp index: sorted (timestamp, memory_id) entries
+        self._timestamp_index = _TimestampIndex()
         
         # Importance index: importance_level -> set of memory_ids
         # We bucket importance into 10 levels (0.0-0.1, 0.1-0.2, etc.)
@@ -51,14 +210,22 @@ class MemoryIndex:
         # Association index: (key, value) -> set of memory_ids
         self._association_index: Dict[Tuple[str, Hashable], Set[str]] = defaultdict(set)
         
-        # Text index: word -> set of memory_ids
-        self._text_index: Dict[str, Set[str]] = defaultdict(set)
+        # Text index: stemmed term -> {memory_id: term frequency}
+        self._text_index = InvertedIndex()
+        
+        # Forward index: memory_id -> what the memory is indexed under, so
+        # removals and updates only visit its own entries even if the memory
+        # item was changed in place since it was indexed
+        self._forward_index: Dict[str, IndexedFields] = {}
         
         # Performance metrics
         self._metrics = {
             "index_operations": 0,
             "search_operations": 0,
             "cache_hits": 0,
+            "cache_misses": 0,
+            "cache_evictions": 0,
+            "cache_invalidations": 0,
             "total_memories": 0,
             "last_search_time": 0.0
         }
@@ -67,9 +234,13 @@ class MemoryIndex:
         self._enable_caching = enable_caching
         self._cache_size = cache_size
         
-        # Query cache for faster repeated searches
-        self._query_cache: Dict[str, Tuple[float, List[MemoryItem]]] = {}
+        # Query cache for faster repeated searches, least recently used first
+        self._query_cache: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
         self._cache_ttl = 5.0  # seconds
+        
+        # Partition (term, importance bucket or association) -> cache keys
+        # of the searches that a write to it could change
+        self._cache_dependents: Dict[Hashable, Set[Hashable]] = defaultdict(set)
             
         logger.info(f"Initialized MemoryIndex with caching={'enabled' if enable_caching else 'disabled'}")
     
@@ -83,84 +254,95 @@ class MemoryIndex:
         start_time = time.time()
         memory_id = memory_item.id
         
+        # Re-indexing a known memory only moves the entries that changed
+        if memory_id in self._memories:
+            self.update_memory(memory_item)
+            return
+        
         # Store in primary storage
         self._memories[memory_id] = memory_item
+        timestamp, importance_bucket, association_keys = self._forward_index[memory_id] = \
+            self._indexed_fields(memory_item)
         
         # Index by timestamp
-        timestamp_entry = (memory_item.timestamp, memory_id)
-        self._insert_sorted(self._timestamp_index, timestamp_entry)
+        self._timestamp_index.add((timestamp, memory_id))
         
         # Index by importance
-        importance_bucket = int(memory_item.importance * 10)
         self._importance_index[importance_bucket].add(memory_id)
         
         # Index by associations
-        for key, value in memory_item.associations.items():
-            if isinstance(value, (str, int, float, bool)):
-                self._association_index[(key, value)].add(memory_id)
+        for association_key in association_keys:
+            self._association_index[association_key].add(memory_id)
         
         # Index by text content
-        if isinstance(memory_item.content, str):
-            self._index_text(memory_id, memory_item.content)
-        elif isinstance(memory_item.content, dict):
-            # For dictionaries (like event data), index string values
-            for key, value in memory_item.content.items():
-                if isinstance(value, str):
-                    # Index with key context for better search results
-                    self._index_text(memory_id, f"{key}: {value}")
+        terms = self._memory_terms(memory_item)
+        self._text_index.add(memory_id, terms)
         
         # Update metrics
         self._metrics["index_operations"] += 1
         self._metrics["total_memories"] = len(self._memories)
         
-        # Clear query cache since indices have changed
-        if self._enable_caching:
-            self._query_cache.clear()
-            logger.debug(f"Cache cleared due to indexing of memory {memory_id}")
+        # Drop cached searches the new memory could now match
+        if self._query_cache:
+            self._invalidate(
+                self._memory_partitions(importance_bucket, association_keys, terms), (timestamp,)
+            )
             
         indexing_time = time.time() - start_time
         if indexing_time > 0.01:  # Log slow indexing operations
             logger.debug(f"Slow memory indexing: {memory_id} took {indexing_time:.4f}s")
     
-    def _index_text(self, memory_id: str, text: str) -> None:
+    def _memory_terms(self, memory_item: MemoryItem) -> List[str]:
         """
-        Index the text content of a memory.
+        Get the text index terms of a memory.
         
         Args:
-            memory_id: ID of the memory
-            text: Text content to index
+            memory_item: The memory item
+            
+        Returns:
+            List[str]: Stemmed terms, with repeats
         """
-        # Simple tokenization (split by whitespace and remove punctuation)
-        words = text.lower().split()
-        words = [word.strip('.,;:!?()[]{}"\'-') for word in words]
+        if isinstance(memory_item.content, str):
+            return analyze(memory_item.content)
+        terms: List[str] = []
+        if isinstance(memory_item.content, dict):
+            # For dictionaries (like event data), index string values
+            for key, value in memory_item.content.items():
+                if isinstance(value, str):
+                    # Index with key context for better search results
+                    terms.extend(analyze(f"{key}: {value}"))
+        return terms
+    
+    def _indexed_fields(self, memory_item: MemoryItem) -> IndexedFields:
+        """
+        Get the timestamp, importance bucket and association keys of a memory.
         
-        # Add to text index
-        for word in words:
-            if word and len(word) > 2:  # Skip short words
-                self._text_index[word].add(memory_id)
+        Args:
+            memory_item: The memory item
+            
+        Returns:
+            IndexedFields: The fields the memory is indexed under
+        """
+        association_keys = tuple(
+            (key, value) for key, value in memory_item.associations.items()
+            if isinstance(value, (str, int, float, bool))
+        )
+        # We bucket importance into 10 levels (0.0-0.1, 0.1-0.2, etc.)
+        return memory_item.timestamp, int(memory_item.importance * 10), association_keys
     
-    def _insert_sorted(
-        self, 
-        index: List[Tuple[float, str]], 
-        entry: Tuple[float, str]
-    ) -> None:
+    def _discard_association(self, association_key: Tuple[str, Hashable], memory_id: str) -> None:
         """
-        Insert an entry into a sorted index.
+        Remove a memory from one association posting set.
         
         Args:
-            index: The sorted index to insert into
-            entry: The entry to insert
-        """
-        # Binary search to find insertion point
-        low, high = 0, len(index)
-        while low < high:
-            mid = (low + high) // 2
-            if index[mid][0] < entry[0]:
-                low = mid + 1
-            else:
-                high = mid
-                
-        index.insert(low, entry)
+            association_key: The (key, value) pair
+            memory_id: ID of the memory
+        """
+        memory_ids = self._association_index.get(association_key)
+        if memory_ids is not None:
+            memory_ids.discard(memory_id)
+            if not memory_ids:
+                del self._association_index[association_key]
     
     def remove_memory(self, memory_id: str) -> bool:
         """
@@ -175,32 +357,30 @@ class MemoryIndex:
         if memory_id not in self._memories:
             return False
             
-        memory_item = self._memories.pop(memory_id)
+        del self._memories[memory_id]
+        timestamp, importance_bucket, association_keys = self._forward_index.pop(memory_id)
+        
+        # Drop cached searches the memory could be part of
+        if self._query_cache:
+            self._invalidate(
+                self._memory_partitions(importance_bucket, association_keys, self._text_index.terms(memory_id)),
+                (timestamp,)
+            )
         
         # Remove from timestamp index
-        for i, (_, mid) in enumerate(self._timestamp_index):
-            if mid == memory_id:
-                self._timestamp_index.pop(i)
-                break
+        self._timestamp_index.remove((timestamp, memory_id))
         
         # Remove from importance index
-        importance_bucket = int(memory_item.importance * 10)
-        if memory_id in self._importance_index[importance_bucket]:
-            self._importance_index[importance_bucket].remove(memory_id)
+        self._importance_index[importance_bucket].discard(memory_id)
             
         # Remove from association index
-        for key, value in memory_item.associations.items():
-            if isinstance(value, (str, int, float, bool)):
-                index_key = (key, value)
-                if index_key in self._association_index and memory_id in self._association_index[index_key]:
-                    self._association_index[index_key].remove(memory_id)
+        for association_key in association_keys:
+            self._discard_association(association_key, memory_id)
                     
         # Remove from text index
-        for word, memory_ids in list(self._text_index.items()):
-            if memory_id in memory_ids:
-                memory_ids.remove(memory_id)
-                if not memory_ids:
-                    del self._text_index[word]
+        self._text_index.remove(memory_id)
+        
+        self._metrics["total_memories"] = len(self._memories)
                     
         return True
     
@@ -208,7 +388,7 @@ class MemoryIndex:
         """
         Update a memory in all indices.
         
-        This removes the old indices and adds new ones.
+        Only the index entries whose fields changed are moved.
         
         Args:
             memory_item: The updated memory item
@@ -219,12 +399,36 @@ class MemoryIndex:
         memory_id = memory_item.id
         if memory_id not in self._memories:
             return False
-            
-        # Remove old indices
-        self.remove_memory(memory_id)
         
-        # Add new indices
-        self.index_memory(memory_item)
+        self._memories[memory_id] = memory_item
+        old_timestamp, old_bucket, old_keys = self._forward_index[memory_id]
+        timestamp, importance_bucket, association_keys = self._forward_index[memory_id] = \
+            self._indexed_fields(memory_item)
+        
+        if timestamp != old_timestamp:
+            self._timestamp_index.remove((old_timestamp, memory_id))
+            self._timestamp_index.add((timestamp, memory_id))
+        
+        if importance_bucket != old_bucket:
+            self._importance_index[old_bucket].discard(memory_id)
+            self._importance_index[importance_bucket].add(memory_id)
+        
+        if association_keys != old_keys:
+            for association_key in set(old_keys).difference(association_keys):
+                self._discard_association(association_key, memory_id)
+            for association_key in association_keys:
+                self._association_index[association_key].add(memory_id)
+        
+        terms = self._memory_terms(memory_item)
+        if self._query_cache:
+            old_partitions = self._memory_partitions(old_bucket, old_keys, self._text_index.terms(memory_id))
+            self._invalidate(
+                old_partitions | self._memory_partitions(importance_bucket, association_keys, terms),
+                (old_timestamp, timestamp)
+            )
+        self._text_index.replace(memory_id, terms)
+        
+        self._metrics["index_operations"] += 1
         
         return True
     
@@ -249,30 +453,215 @@ class MemoryIndex:
         self._metrics["search_operations"] += 1
         
         # Create a cache key from the query parameters
+        cache_key: Optional[Hashable] = None
         if self._enable_caching:
-            # Convert query to a hashable representation
             try:
-                cache_parts = []
-                for k, v in sorted(query.items()):
-                    if isinstance(v, (str, int, float, bool)):
-                        cache_parts.append(f"{k}:{v}")
-                    elif isinstance(v, dict):
-                        cache_parts.append(f"{k}:{hash(frozenset(v.items()))}")
-                
-                cache_key = f"query({'|'.join(cache_parts)})|limit:{limit}|importance:{importance_threshold}"
-                
-                # Check cache
-                if cache_key in self._query_cache:
-                    cache_time, cached_results = self._query_cache[cache_key]
-                    if time.time() - cache_time < self._cache_ttl:
-                        self._metrics["cache_hits"] += 1
-                        self._metrics["last_search_time"] = time.time() - start_time
-                        logger.debug(f"Cache hit for query: {cache_key[:50]}...")
-                        return cached_results
-            except (TypeError, ValueError):
+                cache_key = (_freeze(query), limit, importance_threshold)
+            except TypeError:
                 # If cache key creation fails, proceed without caching
                 logger.debug("Failed to create cache key, proceeding without caching")
         
+        if cache_key is not None:
+            entry = self._query_cache.get(cache_key)
+            if entry is not None and time.time() - entry[0] < self._cache_ttl:
+                self._query_cache.move_to_end(cache_key)
+                self._metrics["cache_hits"] += 1
+                self._metrics["last_search_time"] = time.time() - start_time
+                return entry[1]
+            self._metrics["cache_misses"] += 1
+        
+        result_ids = self._filter(query, importance_threshold)
+        
+        # Convert IDs to memory items (all of them if no filters applied)
+        if result_ids is None:
+            results = list(self._memories.values())
+        else:
+            results = [self._memories[memory_id] for memory_id in result_ids]
+        
+        # Sort by recency (newest first)
+        results.sort(key=lambda memory: memory.timestamp, reverse=True)
+        
+        # Apply limit if specified
+        if limit is not None:
+            results = results[:limit]
+        
+        # Store in cache if caching is enabled
+        if cache_key is not None:
+            self._cache_results(cache_key, query, results)
+        
+        # Record metrics
+        self._metrics["last_search_time"] = time.time() - start_time
+        if time.time() - start_time > 0.1:  # Log slow search operations
+            logger.warning(f"Slow search operation: {time.time() - start_time:.4f}s for {len(results)} results")
+            
+        return results
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get index and query cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Counters plus the cache size and hit rate
+        """
+        metrics = dict(self._metrics)
+        lookups = metrics["cache_hits"] + metrics["cache_misses"]
+        metrics["cache_entries"] = len(self._query_cache)
+        metrics["cache_hit_rate"] = metrics["cache_hits"] / lookups if lookups else 0.0
+        return metrics
+    
+    def _query_partitions(self, query: Dict[str, Any]) -> FrozenSet[Hashable]:
+        """
+        Get the partitions a memory must be in for a query to match it.
+        
+        One filter is enough, since a match has to pass all of them. A write
+        outside these partitions cannot change the query's results. Text and
+        association filters ignore words and pairs that are in no memory, so
+        they depend on every word and pair of the query.
+        
+        Args:
+            query: Dictionary of search criteria
+            
+        Returns:
+            FrozenSet[Hashable]: The partitions
+        """
+        if "text" in query:
+            return frozenset(("term", term) for term in analyze(query["text"]))
+        if "associations" in query:
+            return frozenset(("association", pair) for pair in query["associations"].items())
+        if "importance_min" in query:
+            return frozenset(("importance", bucket) for bucket in range(int(query["importance_min"] * 10), 11))
+        return frozenset((ALL_MEMORIES,))
+    
+    def _memory_partitions(
+        self,
+        importance_bucket: int,
+        association_keys: Tuple[Tuple[str, Hashable], ...],
+        terms: Iterable[str]
+    ) -> Set[Hashable]:
+        """
+        Get the partitions a memory is in.
+        
+        Args:
+            importance_bucket: The memory's importance bucket
+            association_keys: The memory's (key, value) pairs
+            terms: The memory's text index terms
+            
+        Returns:
+            Set[Hashable]: The partitions
+        """
+        partitions: Set[Hashable] = {("term", term) for term in terms}
+        partitions.update(("association", pair) for pair in association_keys)
+        partitions.add(("importance", importance_bucket))
+        partitions.add(ALL_MEMORIES)
+        return partitions
+    
+    def _cache_results(self, cache_key: Hashable, query: Dict[str, Any], results: List[MemoryItem]) -> None:
+        """
+        Cache search results, evicting the least recently used entries.
+        
+        Args:
+            cache_key: The search's cache key
+            query: Dictionary of search criteria
+            results: The results to cache
+        """
+        self._drop_cached(cache_key)
+        partitions = self._query_partitions(query)
+        time_range = (query.get("timestamp_min", float("-inf")), query.get("timestamp_max", float("inf")))
+        self._query_cache[cache_key] = (time.time(), results, partitions, time_range)
+        for partition in partitions:
+            self._cache_dependents[partition].add(cache_key)
+        
+        while len(self._query_cache) > self._cache_size:
+            self._drop_cached(next(iter(self._query_cache)))
+            self._metrics["cache_evictions"] += 1
+    
+    def _drop_cached(self, cache_key: Hashable) -> None:
+        """
+        Remove a search from the cache.
+        
+        Args:
+            cache_key: The search's cache key
+        """
+        entry = self._query_cache.pop(cache_key, None)
+        if entry is None:
+            return
+        for partition in entry[2]:
+            dependents = self._cache_dependents[partition]
+            dependents.discard(cache_key)
+            if not dependents:
+                del self._cache_dependents[partition]
+    
+    def _invalidate(self, partitions: Iterable[Hashable], timestamps: Tuple[float, ...]) -> None:
+        """
+        Drop the cached searches a write to a memory could change.
+        
+        Args:
+            partitions: Partitions the memory is or was in
+            timestamps: The memory's timestamps before and after the write
+        """
+        for partition in partitions:
+            for cache_key in list(self._cache_dependents.get(partition, ())):
+                min_time, max_time = self._query_cache[cache_key][3]
+                if any(min_time <= timestamp <= max_time for timestamp in timestamps):
+                    self._drop_cached(cache_key)
+                    self._metrics["cache_invalidations"] += 1
+    
+    def search_relevant(
+        self,
+        text: str,
+        limit: int = 10,
+        query: Optional[Dict[str, Any]] = None,
+        importance_threshold: Optional[float] = None
+    ) -> List[Tuple[MemoryItem, float]]:
+        """
+        Find the memories most relevant to a text.
+        
+        Memories containing any of the text's stemmed words are ranked with
+        BM25, and the best are selected with a heap rather than by sorting
+        every match. Ties go to the newer memory.
+        
+        Args:
+            text: Text to rank memories against
+            limit: Maximum number of memories to return
+            query: Dictionary of search criteria that memories must also match
+                (its "text" entry, if any, is ignored)
+            importance_threshold: Minimum importance score
+            
+        Returns:
+            List[Tuple[MemoryItem, float]]: (memory, score) pairs, most relevant first
+        """
+        start_time = time.time()
+        self._metrics["search_operations"] += 1
+        
+        filters = {key: value for key, value in (query or {}).items() if key != "text"}
+        candidates = self._filter(filters, importance_threshold)
+        if candidates is not None and not candidates:
+            return []
+        
+        scores = self._text_index.score(analyze(text), candidates)
+        best = heapq.nlargest(
+            limit, scores.items(),
+            key=lambda pair: (pair[1], self._memories[pair[0]].timestamp)
+        )
+        
+        self._metrics["last_search_time"] = time.time() - start_time
+        return [(self._memories[memory_id], score) for memory_id, score in best]
+    
+    def _filter(
+        self,
+        query: Dict[str, Any],
+        importance_threshold: Optional[float] = None
+    ) -> Optional[Set[str]]:
+        """
+        Find the memories that pass every filter of a query.
+        
+        Args:
+            query: Dictionary of search criteria
+            importance_threshold: Minimum importance score
+            
+        Returns:
+            Optional[Set[str]]: Matching memory IDs, or None if nothing was filtered
+        """
         # Start with all memory IDs
         result_ids: Optional[Set[str]] = None
         
@@ -285,7 +674,7 @@ class MemoryIndex:
             result_ids = timestamp_ids if result_ids is None else result_ids.intersection(timestamp_ids)
             
             if result_ids is not None and len(result_ids) == 0:
-                return []
+                return result_ids
         
         # Filter by importance
         if "importance_min" in query:
@@ -294,7 +683,7 @@ class MemoryIndex:
             result_ids = importance_ids if result_ids is None else result_ids.intersection(importance_ids)
             
             if result_ids is not None and len(result_ids) == 0:
-                return []
+                return result_ids
         
         # Filter by associations
         if "associations" in query:
@@ -303,7 +692,7 @@ class MemoryIndex:
             result_ids = association_ids if result_ids is None else result_ids.intersection(association_ids)
             
             if result_ids is not None and len(result_ids) == 0:
-                return []
+                return result_ids
         
         # Filter by text search
         if "text" in query:
@@ -312,10 +701,12 @@ class MemoryIndex:
             result_ids = text_ids if result_ids is None else result_ids.intersection(text_ids)
             
             if result_ids is not None and len(result_ids) == 0:
-                return []
+                return result_ids
         
         # If no filters applied, use all memories
         if result_ids is None:
+            if importance_threshold is None:
+                return None
             result_ids = set(self._memories.keys())
         
         # Apply importance threshold if specified
@@ -325,41 +716,7 @@ class MemoryIndex:
                 if self._memories[memory_id].importance >= importance_threshold
             }
         
-        # Convert IDs to memory items
-        results = [self._memories[memory_id] for memory_id in result_ids]
-        
-        # Sort by recency (newest first)
-        results.sort(key=lambda memory: memory.timestamp, reverse=True)
-        
-        # Apply limit if specified
-        if limit is not None:
-            results = results[:limit]
-        
-        # Store in cache if caching is enabled
-        if self._enable_caching:
-            try:
-                # Check if we created a cache key earlier
-                if 'cache_key' in locals():
-                    # Store limited results in cache
-                    self._query_cache[cache_key] = (time.time(), results)
-                    
-                    # Limit cache size
-                    if len(self._query_cache) > self._cache_size:
-                        # Remove oldest entries
-                        oldest_keys = sorted(self._query_cache.keys(),
-                                          key=lambda k: self._query_cache[k][0])[:len(self._query_cache) - self._cache_size]
-                        for key in oldest_keys:
-                            del self._query_cache[key]
-            except (NameError, TypeError):
-                # Cache key wasn't created earlier, skip caching
-                pass
-        
-        # Record metrics
-        self._metrics["last_search_time"] = time.time() - start_time
-        if time.time() - start_time > 0.1:  # Log slow search operations
-            logger.warning(f"Slow search operation: {time.time() - start_time:.4f}s for {len(results)} results")
-            
-        return results
+        return result_ids
     
     def _search_timestamp_range(self, min_time: float, max_time: float) -> Set[str]:
         """
@@ -372,26 +729,7 @@ class MemoryIndex:
         Returns:
             Set[str]: Set of matching memory IDs
         """
-        result_ids = set()
-        
-        # Binary search for start index
-        start_idx = 0
-        end_idx = len(self._timestamp_index)
-        while start_idx < end_idx:
-            mid = (start_idx + end_idx) // 2
-            if self._timestamp_index[mid][0] < min_time:
-                start_idx = mid + 1
-            else:
-                end_idx = mid
-        
-        # Collect all memories in range
-        for i in range(start_idx, len(self._timestamp_index)):
-            timestamp, memory_id = self._timestamp_index[i]
-            if timestamp > max_time:
-                break
-            result_ids.add(memory_id)
-            
-        return result_ids
+        return {memory_id for _, memory_id in self._timestamp_index.irange(min_time, max_time)}
     
     def _search_importance(self, min_importance: float) -> Set[str]:
         """
@@ -445,26 +783,8 @@ class MemoryIndex:
         Returns:
             Set[str]: Set of matching memory IDs
         """
-        # Simple tokenization
-        words = text.lower().split()
-        words = [word.strip('.,;:!?()[]{}"\'-') for word in words]
-        words = [word for word in words if word and len(word) > 2]
-        
-        if not words:
-            return set()
-        
-        # Find memories containing all words
-        result_ids: Optional[Set[str]] = None
-        
-        for word in words:
-            if word in self._text_index:
-                matching_ids = self._text_index[word]
-                result_ids = matching_ids if result_ids is None else result_ids.intersection(matching_ids)
-                
-                if result_ids is not None and len(result_ids) == 0:
-                    break
-        
-        return result_ids or set()
+        # Find memories containing all known (stemmed) words
+        return self._text_index.match_all(analyze(text))
     
     def get_memory(self, memory_id: str) -> Optional[MemoryItem]:
         """
@@ -487,6 +807,67 @@ class MemoryIndex:
         """
         return list(self._memories.values())
     
+    def to_snapshot(self) -> Dict[str, Any]:
+        """
+        Export the indices for a snapshot.
+        
+        Memories are referred to by their position in get_all_memories(),
+        so the memories must be saved in that order. The result is JSON
+        serializable.
+        
+        Returns:
+            Dict[str, Any]: The timestamp, importance, association and text indices
+        """
+        rows = {memory_id: row for row, memory_id in enumerate(self._memories)}
+        return {
+            "timestamp_index": [rows[memory_id] for _, memory_id in self._timestamp_index],
+            "importance_index": {
+                str(bucket): [rows[memory_id] for memory_id in memory_ids]
+                for bucket, memory_ids in self._importance_index.items() if memory_ids
+            },
+            "association_index": [
+                [key, value, [rows[memory_id] for memory_id in memory_ids]]
+                for (key, value), memory_ids in self._association_index.items() if memory_ids
+            ],
+            "text_index": self._text_index.to_snapshot(rows)
+        }
+    
+    def restore_snapshot(self, memories: List[MemoryItem], snapshot: Dict[str, Any]) -> None:
+        """
+        Replace the index contents with a snapshot from to_snapshot().
+        
+        Nothing is re-tokenized. The timestamp entries are saved in order,
+        so sorting them again takes linear time.
+        
+        Args:
+            memories: The memories, in the order they had when the snapshot was taken
+            snapshot: The exported indices
+        """
+        self.clear()
+        ids = [memory_item.id for memory_item in memories]
+        self._memories.update(zip(ids, memories))
+        self._timestamp_index.extend_sorted(sorted(
+            (memories[row].timestamp, ids[row]) for row in snapshot["timestamp_index"]
+        ))
+        
+        buckets: Dict[str, int] = {}
+        for bucket, rows in snapshot["importance_index"].items():
+            self._importance_index[int(bucket)] = {ids[row] for row in rows}
+            buckets.update((ids[row], int(bucket)) for row in rows)
+        association_keys: Dict[str, List[Tuple[str, Hashable]]] = defaultdict(list)
+        for key, value, rows in snapshot["association_index"]:
+            self._association_index[(key, value)] = {ids[row] for row in rows}
+            for row in rows:
+                association_keys[ids[row]].append((key, value))
+        self._forward_index.update(
+            (memory_item.id, (memory_item.timestamp, buckets[memory_item.id],
+                              tuple(association_keys.get(memory_item.id, ()))))
+            for memory_item in memories
+        )
+        
+        self._text_index.restore_snapshot(ids, snapshot["text_index"])
+        self._metrics["total_memories"] = len(self._memories)
+    
     def clear(self) -> None:
         """
         Clear all memories from the index.
@@ -495,4 +876,7 @@ class MemoryIndex:
         self._timestamp_index.clear()
         self._importance_index.clear()
         self._association_index.clear()
-        self._text_index.clear()
\ No newline at end of file
+        self._text_index.clear()
+        self._forward_index.clear()
+        self._query_cache.clear()
+        self._cache_dependents.clear()
\ No newline at end of file
@@ -176,7 +176,9 @@ class EventMemoryItem(MemoryItem):
         Raises:
             ValueError: If the dictionary is missing required fields
         """
-        memory_item = super().from_dict(data)
+        # __init__ takes the event object, so build the base fields directly
+        memory_item = cls.__new__(cls)
+        vars(memory_item).update(vars(MemoryItem.from_dict(data)))
         
         # Extract event-specific fields
         event_data = memory_item.content
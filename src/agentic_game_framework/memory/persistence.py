@@ -2,15 +2,20 @@
 Memory Persistence for Agentic Game Framework.
 
 This module provides functionality for saving and loading agent memories
-to and from persistent storage.
+to and from persistent storage, either as one JSON file per agent or in a
+single SQLite database shared by all agents.
 """
 
 import json
+import logging
 import os
-from typing import Any, Dict, List, Optional, Type
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from .memory_interface import MemoryItem
 
+logger = logging.getLogger(__name__)
+
 
 class MemoryPersistenceManager:
     """
@@ -182,6 +187,349 @@ class MemoryPersistenceManager:
             return []
 
 
+class SQLitePersistenceManager:
+    """
+    Handles saving and loading memories in a single SQLite database.
+    
+    All agents share one database file, opened in WAL mode. Each memory is a
+    row holding its serialized form, with indexed columns for the agent,
+    timestamp, importance and event type. On top of the interface of
+    MemoryPersistenceManager it can:
+    1. Write and delete individual memories in batched transactions
+    2. Answer timestamp, importance and event type filters in SQL
+    
+    so stores and queries never rewrite or read an agent's whole memory.
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS memories (
+            agent_id TEXT NOT NULL,
+            memory_id TEXT NOT NULL,
+            timestamp REAL NOT NULL,
+            importance REAL NOT NULL,
+            event_type TEXT,
+            data TEXT NOT NULL,
+            PRIMARY KEY (agent_id, memory_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS memories_by_time ON memories (agent_id, timestamp);
+        CREATE INDEX IF NOT EXISTS memories_by_importance ON memories (agent_id, importance);
+        CREATE INDEX IF NOT EXISTS memories_by_type ON memories (agent_id, event_type, timestamp);
+        CREATE TABLE IF NOT EXISTS memory_backups (
+            backup_name TEXT NOT NULL,
+            agent_id TEXT NOT NULL,
+            memory_id TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (backup_name, agent_id, memory_id)
+        ) WITHOUT ROWID;
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        memory_class: Type[MemoryItem] = MemoryItem,
+        create_dir: bool = True
+    ):
+        """
+        Initialize a new SQLite persistence manager.
+        
+        Args:
+            db_path: Path of the database file, or ":memory:"
+            memory_class: Class to use for memory instantiation
+            create_dir: Whether to create the database's directory if it doesn't exist
+        """
+        self.db_path = db_path
+        self.memory_class = memory_class
+        
+        directory = os.path.dirname(db_path)
+        if create_dir and directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        self._connection = sqlite3.connect(db_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self._SCHEMA)
+    
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
+    
+    @staticmethod
+    def _row(agent_id: str, memory: MemoryItem) -> Tuple[str, str, float, float, Optional[str], str]:
+        """
+        Convert a memory into a database row.
+        
+        Args:
+            agent_id: ID of the agent the memory belongs to
+            memory: The memory item
+            
+        Returns:
+            Tuple: (agent_id, memory_id, timestamp, importance, event_type, data)
+        """
+        # The same association a MemoryStore event_type query compares against
+        event_type = memory.associations.get("event_type")
+        return (
+            agent_id,
+            memory.id,
+            memory.timestamp,
+            memory.importance,
+            event_type if isinstance(event_type, str) else None,
+            json.dumps(memory.to_dict())
+        )
+    
+    def save_memories(self, agent_id: str, memories: List[MemoryItem]) -> bool:
+        """
+        Replace all of an agent's memories in one transaction.
+        
+        Args:
+            agent_id: ID of the agent these memories belong to
+            memories: List of memory items to save
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._connection:
+                self._connection.execute("DELETE FROM memories WHERE agent_id = ?", (agent_id,))
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO memories VALUES (?, ?, ?, ?, ?, ?)",
+                    (self._row(agent_id, memory) for memory in memories)
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error saving memories for agent {agent_id}: {e}")
+            return False
+    
+    def put_memories(self, agent_id: str, memories: Iterable[MemoryItem]) -> bool:
+        """
+        Insert or replace some of an agent's memories in one transaction.
+        
+        Args:
+            agent_id: ID of the agent these memories belong to
+            memories: Memory items to write
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO memories VALUES (?, ?, ?, ?, ?, ?)",
+                    (self._row(agent_id, memory) for memory in memories)
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error writing memories for agent {agent_id}: {e}")
+            return False
+    
+    def remove_memories(self, agent_id: str, memory_ids: Iterable[str]) -> bool:
+        """
+        Delete some of an agent's memories in one transaction.
+        
+        Args:
+            agent_id: ID of the agent these memories belong to
+            memory_ids: IDs of the memories to delete
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "DELETE FROM memories WHERE agent_id = ? AND memory_id = ?",
+                    ((agent_id, memory_id) for memory_id in memory_ids)
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting memories for agent {agent_id}: {e}")
+            return False
+    
+    def load_memories(self, agent_id: str) -> List[MemoryItem]:
+        """
+        Load all of an agent's memories.
+        
+        Args:
+            agent_id: ID of the agent to load memories for
+            
+        Returns:
+            List[MemoryItem]: List of loaded memory items, oldest first
+        """
+        try:
+            rows = self._connection.execute(
+                "SELECT data FROM memories WHERE agent_id = ? ORDER BY timestamp", (agent_id,)
+            )
+            return [self.memory_class.from_dict(json.loads(data)) for data, in rows]
+        except Exception as e:
+            logger.error(f"Error loading memories for agent {agent_id}: {e}")
+            return []
+    
+    @staticmethod
+    def pushdown(query: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Split a MemoryStore query into the filters answered in SQL and the rest.
+        
+        Args:
+            query: Dictionary of search criteria
+            
+        Returns:
+            Tuple: (filters answered in SQL, remaining query)
+        """
+        pushed, rest = {}, dict(query)
+        for key in ("timestamp_min", "timestamp_max", "importance_min"):
+            if key in rest:
+                pushed[key] = rest.pop(key)
+        associations = dict(rest.get("associations", {}))
+        if isinstance(associations.get("event_type"), str):
+            pushed["event_type"] = associations.pop("event_type")
+            if associations:
+                rest["associations"] = associations
+            else:
+                del rest["associations"]
+        return pushed, rest
+    
+    def _select(
+        self,
+        column: str,
+        agent_id: str,
+        query: Dict[str, Any],
+        limit: Optional[int],
+        importance_threshold: Optional[float]
+    ) -> sqlite3.Cursor:
+        """
+        Select a column of an agent's memories matching pushed down filters.
+        
+        Args:
+            column: Column to select
+            agent_id: ID of the agent to search
+            query: Filters from pushdown()
+            limit: Maximum number of rows
+            importance_threshold: Minimum importance score
+            
+        Returns:
+            sqlite3.Cursor: The rows, newest first
+        """
+        conditions, parameters = ["agent_id = ?"], [agent_id]
+        for key, condition in (("timestamp_min", "timestamp >= ?"), ("timestamp_max", "timestamp <= ?"),
+                               ("importance_min", "importance >= ?"), ("event_type", "event_type = ?")):
+            if key in query:
+                conditions.append(condition)
+                parameters.append(query[key])
+        if importance_threshold is not None:
+            conditions.append("importance >= ?")
+            parameters.append(importance_threshold)
+        
+        sql = f"SELECT {column} FROM memories WHERE {' AND '.join(conditions)} ORDER BY timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        return self._connection.execute(sql, parameters)
+    
+    def query_memory_ids(
+        self,
+        agent_id: str,
+        query: Dict[str, Any],
+        limit: Optional[int] = None,
+        importance_threshold: Optional[float] = None
+    ) -> List[str]:
+        """
+        Find an agent's memories matching filters answered in SQL.
+        
+        Args:
+            agent_id: ID of the agent to search
+            query: Filters from pushdown(): timestamp_min, timestamp_max,
+                importance_min and event_type
+            limit: Maximum number of memory IDs to return
+            importance_threshold: Minimum importance score
+            
+        Returns:
+            List[str]: Matching memory IDs, newest first
+        """
+        return [memory_id for memory_id, in self._select("memory_id", agent_id, query, limit, importance_threshold)]
+    
+    def query_memories(
+        self,
+        agent_id: str,
+        query: Dict[str, Any],
+        limit: Optional[int] = None,
+        importance_threshold: Optional[float] = None
+    ) -> List[MemoryItem]:
+        """
+        Load an agent's memories matching filters answered in SQL.
+        
+        Args:
+            agent_id: ID of the agent to search
+            query: Filters from pushdown()
+            limit: Maximum number of memories to return
+            importance_threshold: Minimum importance score
+            
+        Returns:
+            List[MemoryItem]: Matching memory items, newest first
+        """
+        rows = self._select("data", agent_id, query, limit, importance_threshold)
+        return [self.memory_class.from_dict(json.loads(data)) for data, in rows]
+    
+    def delete_memories(self, agent_id: str) -> bool:
+        """
+        Delete all memories for an agent.
+        
+        Args:
+            agent_id: ID of the agent to delete memories for
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._connection:
+                self._connection.execute("DELETE FROM memories WHERE agent_id = ?", (agent_id,))
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting memories for agent {agent_id}: {e}")
+            return False
+    
+    def backup_memories(self, agent_id: str, backup_suffix: str = "backup") -> bool:
+        """
+        Create a backup of an agent's memories.
+        
+        Args:
+            agent_id: ID of the agent to backup memories for
+            backup_suffix: Name of the backup, replacing any with the same name
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._connection:
+                if not self._connection.execute(
+                    "SELECT 1 FROM memories WHERE agent_id = ? LIMIT 1", (agent_id,)
+                ).fetchone():
+                    return False
+                self._connection.execute(
+                    "DELETE FROM memory_backups WHERE backup_name = ? AND agent_id = ?", (backup_suffix, agent_id)
+                )
+                self._connection.execute(
+                    "INSERT INTO memory_backups SELECT ?, agent_id, memory_id, data FROM memories WHERE agent_id = ?",
+                    (backup_suffix, agent_id)
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error backing up memories for agent {agent_id}: {e}")
+            return False
+    
+    def list_agent_ids(self) -> List[str]:
+        """
+        List all agent IDs with saved memories.
+        
+        Returns:
+            List[str]: List of agent IDs
+        """
+        try:
+            return [agent_id for agent_id, in self._connection.execute("SELECT DISTINCT agent_id FROM memories")]
+        except Exception as e:
+            logger.error(f"Error listing agent IDs: {e}")
+            return []
+
+
 class MemoryStore:
     """
     In-memory implementation of the MemoryInterface with persistence support.
@@ -189,12 +537,19 @@ class MemoryStore:
     The MemoryStore combines the MemoryInterface with persistence capabilities,
     allowing memories to be stored in memory during runtime and saved/loaded
     to/from disk as needed.
+    
+    With a SQLitePersistenceManager, auto-saves write only the memories that
+    changed, and while the database mirrors the store, retrieval narrows
+    timestamp, importance and event type filters in SQL. A failed write
+    falls back to scanning until the next successful save(). Memories
+    changed in place rather than through update_memory() are only seen
+    by those filters after save().
     """
     
     def __init__(
         self,
         agent_id: str,
-        persistence_manager: Optional[MemoryPersistenceManager] = None,
+        persistence_manager: Optional[Union[MemoryPersistenceManager, SQLitePersistenceManager]] = None,
         auto_save: bool = False
     ):
         """
@@ -212,6 +567,9 @@ class MemoryStore:
         # Map of memory_id -> memory_item
         self._memories: Dict[str, MemoryItem] = {}
         
+        # Whether an auto-saved SQLite database holds every change
+        self._synced = True
+        
         # Load memories if persistence manager is provided
         if persistence_manager:
             self._load_memories()
@@ -230,10 +588,28 @@ class MemoryStore:
         self._memories[memory_id] = memory_item
         
         if self.auto_save and self.persistence_manager:
-            self._save_memories()
+            self._save_changes([memory_item])
             
         return memory_id
     
+    def add_memories(self, memory_items: List[MemoryItem]) -> List[str]:
+        """
+        Add several memory items to the store, auto-saving them as one batch.
+        
+        Args:
+            memory_items: The memory items to add
+            
+        Returns:
+            List[str]: The IDs of the added memory items
+        """
+        for memory_item in memory_items:
+            self._memories[memory_item.id] = memory_item
+        
+        if self.auto_save and self.persistence_manager:
+            self._save_changes(memory_items)
+            
+        return [memory_item.id for memory_item in memory_items]
+    
     def get_memory(self, memory_id: str) -> Optional[MemoryItem]:
         """
         Get a specific memory by ID.
@@ -276,7 +652,7 @@ class MemoryStore:
             memory.content = updates["content"]
             
         if self.auto_save and self.persistence_manager:
-            self._save_memories()
+            self._save_changes([memory])
             
         return True
     
@@ -296,7 +672,10 @@ class MemoryStore:
         del self._memories[memory_id]
         
         if self.auto_save and self.persistence_manager:
-            self._save_memories()
+            if isinstance(self.persistence_manager, SQLitePersistenceManager):
+                self._track_write(self.persistence_manager.remove_memories(self.agent_id, [memory_id]))
+            else:
+                self._save_memories()
             
         return True
     
@@ -309,8 +688,9 @@ class MemoryStore:
         """
         Retrieve memories that match the given query.
         
-        This is a simple implementation that scans all memories.
-        For more efficient retrieval, use a MemoryIndex.
+        This is a simple implementation that scans all memories, unless an
+        auto-saved SQLite database in sync with the store can narrow the
+        common filters. For more efficient retrieval, use a MemoryIndex.
         
         Args:
             query: Dictionary of search criteria
@@ -320,6 +700,9 @@ class MemoryStore:
         Returns:
             List[MemoryItem]: List of matching memory items
         """
+        if self.auto_save and self._synced and isinstance(self.persistence_manager, SQLitePersistenceManager):
+            return self._retrieve_pushed_down(query, limit, importance_threshold)
+        
         results = []
         
         for memory in self._memories.values():
@@ -340,6 +723,42 @@ class MemoryStore:
             
         return results
     
+    def _retrieve_pushed_down(
+        self,
+        query: Dict[str, Any],
+        limit: Optional[int],
+        importance_threshold: Optional[float]
+    ) -> List[MemoryItem]:
+        """
+        Retrieve memories with candidates narrowed by the database.
+        
+        The candidates are checked against the whole query again, since a
+        memory changed in place may no longer match its indexed columns.
+        
+        Args:
+            query: Dictionary of search criteria
+            limit: Maximum number of memories to return
+            importance_threshold: Minimum importance score for returned memories
+            
+        Returns:
+            List[MemoryItem]: List of matching memory items, newest first
+        """
+        pushed, _ = self.persistence_manager.pushdown(query)
+        memory_ids = self.persistence_manager.query_memory_ids(
+            self.agent_id, pushed, None, importance_threshold
+        )
+        
+        results = []
+        for memory_id in memory_ids:
+            memory = self._memories.get(memory_id)
+            if memory is None or (importance_threshold is not None and memory.importance < importance_threshold):
+                continue
+            if self._matches_query(memory, query):
+                results.append(memory)
+                if limit is not None and len(results) >= limit:
+                    break
+        return results
+    
     def _matches_query(self, memory: MemoryItem, query: Dict[str, Any]) -> bool:
         """
         Check if a memory matches a query.
@@ -394,7 +813,10 @@ class MemoryStore:
         self._memories.clear()
         
         if self.auto_save and self.persistence_manager:
-            self._save_memories()
+            if isinstance(self.persistence_manager, SQLitePersistenceManager):
+                self._track_write(self.persistence_manager.delete_memories(self.agent_id))
+            else:
+                self._save_memories()
     
     def get_all_memories(self) -> List[MemoryItem]:
         """
@@ -424,10 +846,47 @@ class MemoryStore:
         if not self.persistence_manager:
             return False
             
-        return self.persistence_manager.save_memories(
+        saved = self.persistence_manager.save_memories(
             self.agent_id,
             list(self._memories.values())
         )
+        if isinstance(self.persistence_manager, SQLitePersistenceManager):
+            self._synced = saved
+        return saved
+    
+    def _save_changes(self, memories: List[MemoryItem]) -> bool:
+        """
+        Save changed memories to persistent storage.
+        
+        A SQLite database writes just these memories; otherwise all memories
+        are saved.
+        
+        Args:
+            memories: The memory items that were added or updated
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if isinstance(self.persistence_manager, SQLitePersistenceManager):
+            return self._track_write(self.persistence_manager.put_memories(self.agent_id, memories))
+        return self._save_memories()
+    
+    def _track_write(self, written: bool) -> bool:
+        """
+        Note whether a write reached the SQLite database.
+        
+        After a failed write the database no longer mirrors the store, so
+        retrieval scans the store until save() succeeds.
+        
+        Args:
+            written: Whether the write succeeded
+            
+        Returns:
+            bool: The same value
+        """
+        if not written:
+            self._synced = False
+        return written
     
     def _load_memories(self) -> None:
         """
@@ -0,0 +1,305 @@
+"""
+Text Search for Agentic Game Framework.
+
+This module provides the full-text search behind MemoryIndex: a tokenizer, a
+lightweight suffix-stripping stemmer for English and Latin, and an inverted
+index with per-term frequencies that ranks documents with BM25.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# Words of this length or shorter are not indexed
+MIN_WORD_LENGTH = 2
+
+# Stems are never cut shorter than this
+MIN_STEM_LENGTH = 3
+
+# Checked longest first; the first suffix that leaves a long enough stem is removed
+_SUFFIXES = sorted({
+    # English derivational and inflectional endings
+    "ational", "ization", "fulness", "iveness", "ousness", "ations", "ation",
+    "ments", "ment", "nesses", "ness", "ingly", "ings", "ing", "edly", "ed",
+    "ers", "er", "es", "ly", "s",
+    # Latin case and verb endings
+    "ibus", "orum", "arum", "ius", "ae", "am", "as", "em", "is", "os", "um", "us",
+    "a", "e", "i", "o"
+}, key=len, reverse=True)
+
+
+def stem(word: str) -> str:
+    """
+    Reduce a lowercase word to its stem.
+
+    A single suffix is stripped, so "debates", "debated" and "debate" all
+    become "debat" and "provinciae" and "provincia" become "provinci". A
+    trailing "y" becomes "i" so that "city" and "cities" agree.
+
+    Args:
+        word: The word to stem
+
+    Returns:
+        str: The stem
+    """
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            word = word[:-len(suffix)]
+            break
+    if word.endswith("y") and len(word) > MIN_STEM_LENGTH:
+        word = word[:-1] + "i"
+    return word
+
+
+def analyze(text: str) -> List[str]:
+    """
+    Split text into the stemmed terms that are indexed.
+
+    Args:
+        text: The text to analyze
+
+    Returns:
+        List[str]: The terms in order of appearance, with repeats
+    """
+    return [
+        stem(word) for word in _TOKEN_PATTERN.findall(text.lower())
+        if len(word) > MIN_WORD_LENGTH
+    ]
+
+
+class InvertedIndex:
+    """
+    Inverted index with BM25 ranking.
+
+    Every term maps to the documents that contain it and how often. Each
+    document also keeps its own term counts, so it can be removed without
+    scanning the postings of terms it does not contain.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization (0.0-1.0)
+        """
+        self.k1 = k1
+        self.b = b
+
+        # term -> {doc_id: term frequency}
+        self._postings: Dict[str, Dict[str, int]] = {}
+
+        # doc_id -> {term: term frequency}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+
+        # doc_id -> number of terms
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._postings
+
+    def add(self, doc_id: str, terms: Iterable[str]) -> None:
+        """
+        Add terms to a document, creating it if needed.
+
+        Args:
+            doc_id: ID of the document
+            terms: Analyzed terms, with repeats
+        """
+        counts = Counter(terms)
+        if not counts:
+            return
+        doc_terms = self._doc_terms.setdefault(doc_id, {})
+        for term, count in counts.items():
+            doc_terms[term] = doc_terms.get(term, 0) + count
+            postings = self._postings.setdefault(term, {})
+            postings[doc_id] = postings.get(doc_id, 0) + count
+        added = sum(counts.values())
+        self._doc_lengths[doc_id] = self._doc_lengths.get(doc_id, 0) + added
+        self._total_length += added
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id: ID of the document
+
+        Returns:
+            bool: True if the document was removed, False if not found
+        """
+        doc_terms = self._doc_terms.pop(doc_id, None)
+        if doc_terms is None:
+            return False
+        for term in doc_terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        return True
+
+    def replace(self, doc_id: str, terms: Iterable[str]) -> None:
+        """
+        Replace the terms of a document.
+
+        Only the postings of terms whose frequency changed are touched.
+
+        Args:
+            doc_id: ID of the document
+            terms: Analyzed terms, with repeats
+        """
+        counts = dict(Counter(terms))
+        old_counts = self._doc_terms.pop(doc_id, {})
+        for term in old_counts.keys() - counts.keys():
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        for term, count in counts.items():
+            if old_counts.get(term) != count:
+                self._postings.setdefault(term, {})[doc_id] = count
+
+        length = sum(counts.values())
+        self._total_length += length - self._doc_lengths.pop(doc_id, 0)
+        if counts:
+            self._doc_terms[doc_id] = counts
+            self._doc_lengths[doc_id] = length
+
+    def terms(self, doc_id: str) -> Dict[str, int]:
+        """
+        Get the term frequencies of a document.
+
+        Args:
+            doc_id: ID of the document
+
+        Returns:
+            Dict[str, int]: term -> frequency (empty if not found)
+        """
+        return dict(self._doc_terms.get(doc_id, {}))
+
+    def match_all(self, terms: Iterable[str]) -> Set[str]:
+        """
+        Find documents containing every known term.
+
+        Terms that are in no document are ignored.
+
+        Args:
+            terms: Analyzed query terms
+
+        Returns:
+            Set[str]: Matching document IDs
+        """
+        postings = [self._postings[term] for term in set(terms) if term in self._postings]
+        if not postings:
+            return set()
+        postings.sort(key=len)
+        result_ids = set(postings[0])
+        for other in postings[1:]:
+            result_ids.intersection_update(other)
+            if not result_ids:
+                break
+        return result_ids
+
+    def top_k(
+        self,
+        terms: Iterable[str],
+        k: int,
+        candidates: Optional[Set[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents against query terms with BM25.
+
+        Scores are accumulated term by term over the postings of the query
+        terms only, and the best k are selected with a heap.
+
+        Args:
+            terms: Analyzed query terms
+            k: Number of documents to return
+            candidates: If given, only these documents are ranked
+
+        Returns:
+            List[Tuple[str, float]]: (doc_id, score) pairs, best first
+        """
+        scores = self.score(terms, candidates)
+        return heapq.nlargest(k, scores.items(), key=lambda pair: pair[1])
+
+    def score(self, terms: Iterable[str], candidates: Optional[Set[str]] = None) -> Dict[str, float]:
+        """
+        BM25 scores of every document that contains a query term.
+
+        Args:
+            terms: Analyzed query terms
+            candidates: If given, only these documents are scored
+
+        Returns:
+            Dict[str, float]: doc_id -> score
+        """
+        scores: Dict[str, float] = {}
+        doc_count = len(self._doc_terms)
+        if not doc_count:
+            return scores
+        average_length = self._total_length / doc_count
+        k1, b = self.k1, self.b
+        for term in set(terms):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1.0 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                norm = k1 * (1.0 - b + b * self._doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (k1 + 1.0) / (frequency + norm)
+        return scores
+
+    def to_snapshot(self, rows: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Export the postings with documents replaced by row numbers.
+
+        Args:
+            rows: doc_id -> row number
+
+        Returns:
+            Dict[str, Any]: term -> [rows, frequencies], JSON serializable
+        """
+        return {
+            term: [[rows[doc_id] for doc_id in postings], list(postings.values())]
+            for term, postings in self._postings.items()
+        }
+
+    def restore_snapshot(self, ids: List[str], snapshot: Dict[str, Any]) -> None:
+        """
+        Replace the contents with postings from to_snapshot().
+
+        Args:
+            ids: Document IDs by row number
+            snapshot: The exported postings
+        """
+        self.clear()
+        for term, (doc_rows, frequencies) in snapshot.items():
+            postings = self._postings[term] = {}
+            for row, frequency in zip(doc_rows, frequencies):
+                doc_id = ids[row]
+                postings[doc_id] = frequency
+                self._doc_terms.setdefault(doc_id, {})[term] = frequency
+                self._doc_lengths[doc_id] = self._doc_lengths.get(doc_id, 0) + frequency
+                self._total_length += frequency
+
+    def clear(self) -> None:
+        """
+        Remove all documents.
+        """
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_lengths.clear()
+        self._total_length = 0
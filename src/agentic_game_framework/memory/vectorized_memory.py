@@ -5,15 +5,24 @@ This module extends the memory system with vector storage capabilities,
 allowing for semantic retrieval of memories.
 """
 
-import time
+import glob
+import json
+import logging
+import os
+import uuid
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 from ..knowledge.vector_store import VectorStore, VectorStoreConfig
-from .memory_interface import MemoryItem, MemoryInterface
+from .consolidation import MemoryConsolidator
+from .memory_interface import EventMemoryItem, MemoryItem, MemoryInterface
 from .memory_index import MemoryIndex
 
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = "vectorized-memory-v2"
+
 
 class VectorizedMemory(MemoryInterface):
     """
@@ -26,6 +35,7 @@ class VectorizedMemory(MemoryInterface):
     Attributes:
         index: Memory index for efficient retrieval
         vector_store: Vector store for semantic search
+        consolidator: Incremental engine behind consolidate_memories()
     """
     
     def __init__(
@@ -42,6 +52,8 @@ class VectorizedMemory(MemoryInterface):
         self.index = MemoryIndex()
         self.vector_store = vector_store or VectorStore(vector_store_config)
         self._memory_to_vector_id: Dict[str, str] = {}  # Maps memory IDs to vector store IDs
+        self._vector_to_memory_id: Dict[str, str] = {}  # Reverse map for search hits
+        self.consolidator = MemoryConsolidator(self)
     
     def add_memory(self, memory_item: MemoryItem) -> str:
         """Add a new memory item to the memory store.
@@ -59,18 +71,36 @@ class VectorizedMemory(MemoryInterface):
         
         # Add to vector store
         content = self._get_memory_content(memory_item)
-        metadata = {
-            "memory_id": memory_item.id,
-            "timestamp": memory_item.timestamp,
-            "importance": memory_item.importance
-        }
-        metadata.update(memory_item.associations)
-        
-        vector_id = self.vector_store.add_text(content, metadata)
+        vector_id = self.vector_store.add_text(content, self._vector_metadata(memory_item))
         self._memory_to_vector_id[memory_item.id] = vector_id
+        self._vector_to_memory_id[vector_id] = memory_item.id
+        self.consolidator.track(memory_item)
         
         return memory_item.id
     
+    def add_memories(self, memory_items: List[MemoryItem]) -> List[str]:
+        """Add several memory items, embedding their contents in one batch.
+        
+        Args:
+            memory_items: The memory items to add
+            
+        Returns:
+            List[str]: The IDs of the added memory items
+        """
+        for memory_item in memory_items:
+            self.index.index_memory(memory_item)
+        
+        vector_ids = self.vector_store.add_texts(
+            [self._get_memory_content(memory_item) for memory_item in memory_items],
+            [self._vector_metadata(memory_item) for memory_item in memory_items]
+        )
+        for memory_item, vector_id in zip(memory_items, vector_ids):
+            self._memory_to_vector_id[memory_item.id] = vector_id
+            self._vector_to_memory_id[vector_id] = memory_item.id
+            self.consolidator.track(memory_item)
+        
+        return [memory_item.id for memory_item in memory_items]
+    
     def retrieve_memories(
         self,
         query: Dict[str, Any],
@@ -106,22 +136,46 @@ class VectorizedMemory(MemoryInterface):
         Returns:
             List[Tuple[MemoryItem, float]]: List of (memory, similarity) tuples
         """
+        return self.retrieve_semantic_many([text_query], limit, importance_threshold)[0]
+    
+    def retrieve_semantic_many(
+        self,
+        text_queries: List[str],
+        limit: int = 5,
+        importance_threshold: Optional[float] = None
+    ) -> List[List[Tuple[MemoryItem, float]]]:
+        """Retrieve memories for several queries at once (e.g. one per agent).
+        
+        The queries are embedded and scored in one batch, and each hit is
+        mapped back to its memory through the vector id -> memory id index.
+        
+        Args:
+            text_queries: The text queries to search for
+            limit: Maximum number of memories to return per query
+            importance_threshold: Minimum importance score for returned memories
+            
+        Returns:
+            List[List[Tuple[MemoryItem, float]]]: (memory, similarity) tuples for each query
+        """
         # Apply importance filter if specified
         filter_metadata = None
         if importance_threshold is not None:
             filter_metadata = {"importance": {"$gte": importance_threshold}}
         
         # Search in vector store
-        results = self.vector_store.search(text_query, limit, filter_metadata)
+        results = self.vector_store.search_items(text_queries, limit, filter_metadata)
         
         # Convert to memory items
         memory_results = []
-        for content, similarity in results:
-            memory_id = self._get_memory_id_from_result(content)
-            if memory_id:
-                memory_item = self.get_memory(memory_id)
+        for query_results in results:
+            memories = []
+            for item, similarity in query_results:
+                # Items restored by load() carry their memory id in metadata
+                memory_id = self._vector_to_memory_id.get(item.id) or item.metadata.get("memory_id")
+                memory_item = self.get_memory(memory_id) if memory_id else None
                 if memory_item:
-                    memory_results.append((memory_item, similarity))
+                    memories.append((memory_item, similarity))
+            memory_results.append(memories)
         
         return memory_results
     
@@ -167,19 +221,17 @@ class VectorizedMemory(MemoryInterface):
         if memory_id in self._memory_to_vector_id:
             vector_id = self._memory_to_vector_id[memory_id]
             content = self._get_memory_content(memory_item)
-            metadata = {
-                "memory_id": memory_item.id,
-                "timestamp": memory_item.timestamp,
-                "importance": memory_item.importance
-            }
-            metadata.update(memory_item.associations)
+            metadata = self._vector_metadata(memory_item)
             
             # Since we can't directly update in most vector stores,
             # we delete and re-add
             self.vector_store.delete_item(vector_id)
+            self._vector_to_memory_id.pop(vector_id, None)
             new_vector_id = self.vector_store.add_text(content, metadata)
             self._memory_to_vector_id[memory_id] = new_vector_id
+            self._vector_to_memory_id[new_vector_id] = memory_id
         
+        self.consolidator.track(memory_item)
         return True
     
     def forget(self, memory_id: str) -> bool:
@@ -199,7 +251,9 @@ class VectorizedMemory(MemoryInterface):
             vector_id = self._memory_to_vector_id[memory_id]
             self.vector_store.delete_item(vector_id)
             del self._memory_to_vector_id[memory_id]
+            self._vector_to_memory_id.pop(vector_id, None)
         
+        self.consolidator.untrack(memory_id)
         return result
     
     def clear(self) -> None:
@@ -207,61 +261,53 @@ class VectorizedMemory(MemoryInterface):
         self.index.clear()
         self.vector_store.clear()
         self._memory_to_vector_id.clear()
+        self._vector_to_memory_id.clear()
+        self.consolidator.reset()
     
     def consolidate_memories(
         self,
-        threshold: float = 0.8,
+        threshold: Optional[float] = None,
         max_memories: int = 100,
-        retention_policy: str = "importance"
+        retention_policy: str = "importance",
+        time_budget: Optional[float] = None
     ) -> int:
         """Consolidate similar memories to prevent memory overload.
         
+        With a ``threshold``, memories whose vectors are at least that similar
+        are merged into summary memories of the most important member's class.
+        Merging is opt-in: similar vectors can still disagree (e.g. "voted for"
+        and "voted against" a bill), so by default only the lowest-ranked
+        memories are evicted until ``max_memories`` remain. Only memories added
+        or updated since the last call with a threshold are checked for
+        duplicates. With a time budget the work is
+        spread over several calls, e.g. one per simulation tick.
+        
         Args:
-            threshold: Similarity threshold for consolidation (0.0-1.0)
+            threshold: Similarity at which memories are merged (0.0-1.0),
+                or None to only evict
             max_memories: Maximum number of memories to keep
             retention_policy: Policy for deciding which memories to keep
                 ("importance", "recency", or "both")
+            time_budget: Seconds this call may spend (None finishes all work)
             
         Returns:
             int: Number of memories removed
         """
-        # Get all memories
-        all_memories = self.index.get_all_memories()
-        
-        # If we're under the limit, no need to consolidate
-        if len(all_memories) <= max_memories:
-            return 0
-        
-        # Sort memories based on retention policy
-        if retention_policy == "importance":
-            all_memories.sort(key=lambda m: m.importance, reverse=True)
-        elif retention_policy == "recency":
-            all_memories.sort(key=lambda m: m.timestamp, reverse=True)
-        else:  # "both"
-            # Combine importance and recency
-            current_time = time.time()
-            max_age = current_time - min(m.timestamp for m in all_memories)
-            if max_age == 0:
-                max_age = 1  # Avoid division by zero
-            
-            # Score = 0.7 * importance + 0.3 * recency
-            all_memories.sort(key=lambda m: (
-                0.7 * m.importance + 
-                0.3 * (1 - (current_time - m.timestamp) / max_age)
-            ), reverse=True)
-        
-        # Keep the top memories based on the policy
-        memories_to_keep = all_memories[:max_memories]
-        memories_to_remove = all_memories[max_memories:]
-        
-        # Remove the excess memories
-        for memory in memories_to_remove:
-            self.forget(memory.id)
-        
-        return len(memories_to_remove)
+        self.consolidator.threshold = threshold
+        self.consolidator.max_memories = max_memories
+        self.consolidator.retention_policy = retention_policy
+        return self.consolidator.step(time_budget)
     
     def save(self, path: str) -> bool:
-        """Save the memory store to disk.
+        """Save a snapshot of the memory store to disk.
+        
+        The snapshot holds the memories, the MemoryIndex indices, the memory
+        id -> vector id mapping and the consolidation queue in a JSON
+        manifest at ``path``. The vector store is saved next to it as
+        ``<path>.<generation>.json`` plus its ``.vectors.npy`` matrix. Each
+        save writes a new generation and then replaces the manifest, so a
+        crash at any point leaves the previous snapshot loadable. Files of
+        the replaced generation are deleted afterwards.
         
         Args:
             path: Path to save to
@@ -269,15 +315,48 @@ class VectorizedMemory(MemoryInterface):
         Returns:
             bool: True if successful, False otherwise
         """
-        # Save vector store
-        vector_result = self.vector_store.save(f"{path}_vectors")
-        
-        # We would also save the index and mapping here
-        # For now, we'll just return the vector store result
-        return vector_result
+        try:
+            previous = self._read_manifest(path)
+            generation = uuid.uuid4().hex[:12]
+            vectors_file = f"{os.path.basename(path)}.{generation}.json"
+            if not self.vector_store.save(os.path.join(os.path.dirname(path), vectors_file)):
+                return False
+            
+            memories = self.index.get_all_memories()
+            manifest = {
+                "format": SNAPSHOT_FORMAT,
+                "generation": generation,
+                "vectors": vectors_file,
+                "ids": [memory_item.id for memory_item in memories],
+                "timestamps": [memory_item.timestamp for memory_item in memories],
+                "contents": [memory_item.content for memory_item in memories],
+                "importances": [memory_item.importance for memory_item in memories],
+                "associations": [memory_item.associations for memory_item in memories],
+                "events": [row for row, memory_item in enumerate(memories)
+                           if isinstance(memory_item, EventMemoryItem)],
+                "vector_ids": [self._memory_to_vector_id.get(memory_item.id) for memory_item in memories],
+                "index": self.index.to_snapshot(),
+                "pending": self.consolidator.pending_ids()
+            }
+            with open(path + ".tmp", "w") as f:
+                f.write(json.dumps(manifest, separators=(",", ":")))
+            os.replace(path + ".tmp", path)
+            
+            if previous is not None:
+                old_prefix = os.path.join(os.path.dirname(path), f"{os.path.basename(path)}.{previous['generation']}.")
+                for old_file in glob.glob(glob.escape(old_prefix) + "*"):
+                    os.remove(old_file)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving vectorized memory: {e}")
+            return False
     
     def load(self, path: str) -> bool:
-        """Load the memory store from disk.
+        """Load a snapshot written by save().
+        
+        Memories, indices and mappings are restored as saved; nothing is
+        re-embedded or re-indexed. For files written before snapshots
+        existed, only the vector store at ``<path>_vectors`` is loaded.
         
         Args:
             path: Path to load from
@@ -285,12 +364,55 @@ class VectorizedMemory(MemoryInterface):
         Returns:
             bool: True if successful, False otherwise
         """
-        # Load vector store
-        vector_result = self.vector_store.load(f"{path}_vectors")
+        try:
+            manifest = self._read_manifest(path)
+        except Exception as e:
+            logger.error(f"Error loading vectorized memory: {e}")
+            return False
+        if manifest is None:
+            return self.vector_store.load(f"{path}_vectors")
         
-        # We would also load the index and mapping here
-        # For now, we'll just return the vector store result
-        return vector_result
+        if not self.vector_store.load(os.path.join(os.path.dirname(path), manifest["vectors"])):
+            return False
+        
+        memories = [
+            MemoryItem(memory_id, timestamp, content, importance, associations)
+            for memory_id, timestamp, content, importance, associations in zip(
+                manifest["ids"], manifest["timestamps"], manifest["contents"],
+                manifest["importances"], manifest["associations"]
+            )
+        ]
+        for row in manifest["events"]:
+            memories[row] = EventMemoryItem.from_dict(memories[row].to_dict())
+        
+        self.index.restore_snapshot(memories, manifest["index"])
+        self._memory_to_vector_id = {
+            memory_id: vector_id for memory_id, vector_id in zip(manifest["ids"], manifest["vector_ids"])
+            if vector_id is not None
+        }
+        self._vector_to_memory_id = {vector_id: memory_id for memory_id, vector_id in self._memory_to_vector_id.items()}
+        self.consolidator.restore(manifest["pending"])
+        return True
+    
+    def _read_manifest(self, path: str) -> Optional[Dict[str, Any]]:
+        """The snapshot manifest at path, or None if there is none."""
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a {SNAPSHOT_FORMAT} snapshot")
+        return manifest
+    
+    def _vector_metadata(self, memory_item: MemoryItem) -> Dict[str, Any]:
+        """Metadata stored with a memory's vector (filterable in searches)."""
+        metadata = {
+            "memory_id": memory_item.id,
+            "timestamp": memory_item.timestamp,
+            "importance": memory_item.importance
+        }
+        metadata.update(memory_item.associations)
+        return metadata
     
     def _get_memory_content(self, memory_item: MemoryItem) -> str:
         """Extract textual content from a memory item for vectorization.
@@ -309,20 +431,3 @@ class VectorizedMemory(MemoryInterface):
         else:
             # Fallback for other types
             return str(memory_item.content)
-    
-    def _get_memory_id_from_result(self, content: str) -> Optional[str]:
-        """Extract memory ID from a vector search result.
-        
-        Args:
-            content: Content from the search result
-            
-        Returns:
-            Optional[str]: Memory ID, or None if not found
-        """
-        # In a real implementation, we would use the metadata
-        # For now, we'll search through our mapping
-        for memory_id, vector_id in self._memory_to_vector_id.items():
-            memory = self.get_memory(memory_id)
-            if memory and self._get_memory_content(memory) == content:
-                return memory_id
-        return None
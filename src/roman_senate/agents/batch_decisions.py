@@ -0,0 +1,259 @@
+"""
+Roman Senate AI Game
+Batched Senator Decisions Module
+
+This module packs the stance and vote decisions of many senators into a few
+multi-senator prompts and parses each senator's result back out, so a vote of
+the whole Senate takes a handful of LLM round-trips instead of one per senator.
+Senators whose result is missing or unreadable fall back to their own
+per-senator decision.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..utils.llm.base import LLMProvider
+from .senator_agent import SenatorAgent
+
+logger = logging.getLogger(__name__)
+
+STANCE_OPTIONS = ("support", "oppose", "neutral")
+VOTE_OPTIONS = ("support", "oppose")
+
+# Completion budget per senator in a batch (1-2 sentences of reasoning plus JSON)
+TOKENS_PER_DECISION = 80
+
+# Accepted spellings of each decision
+_DECISION_ALIASES = {
+    "support": "support",
+    "for": "support",
+    "oppose": "oppose",
+    "against": "oppose",
+    "neutral": "neutral",
+}
+
+
+def normalize_decision(text: str, options: Sequence[str]) -> Optional[str]:
+    """
+    Map a decision word from the LLM to one of the allowed options.
+
+    Args:
+        text: Decision text, e.g. "For" or "oppose"
+        options: Allowed decisions
+
+    Returns:
+        The matching option, or None if the text is not an allowed decision
+    """
+    decision = _DECISION_ALIASES.get(str(text).strip().strip('."\'').lower())
+    return decision if decision in options else None
+
+
+def _describe_senator(agent: SenatorAgent) -> str:
+    traits = agent.senator.get("traits") or {}
+    trait_text = ", ".join(
+        f"{name} {value:.1f}" for name, value in traits.items() if isinstance(value, (int, float))
+    )
+    return f"{agent.name} ({agent.faction} faction{'; ' + trait_text if trait_text else ''})"
+
+
+def build_batch_prompt(agents: Sequence[SenatorAgent], topic: str, question: str, options: Sequence[str]) -> str:
+    """
+    Build one prompt asking for a decision from each of several senators.
+
+    Args:
+        agents: Senators to decide for (numbered from 1 in the prompt)
+        topic: The topic under consideration
+        question: What each senator must decide
+        options: Allowed decisions
+
+    Returns:
+        Prompt text requesting a JSON array with one entry per senator
+    """
+    senators = "\n".join(
+        f"        {index}. {_describe_senator(agent)}" for index, agent in enumerate(agents, 1)
+    )
+    choices = " or ".join(f'"{option}"' for option in options)
+    return f"""
+        You are simulating senators of the Roman Senate.
+        Topic: {topic}
+
+        {question}
+        Decide separately for each senator below, in character for their faction and personality:
+{senators}
+
+        Return ONLY a JSON array with one object per senator, in the same order:
+        [{{"id": 1, "reasoning": "1-2 sentences", "decision": {choices}}}]
+        """
+
+
+def parse_batch_response(response: str, count: int, options: Sequence[str]) -> Dict[int, Tuple[str, str]]:
+    """
+    Extract per-senator decisions from a batched response.
+
+    Reads the JSON array requested by build_batch_prompt(), and falls back to
+    lines such as "3. oppose - reasoning" when the model ignores the format.
+
+    Args:
+        response: Raw LLM response
+        count: Number of senators in the batch
+        options: Allowed decisions
+
+    Returns:
+        Dictionary mapping 1-based senator ids to (decision, reasoning);
+        senators without a readable decision are left out
+    """
+    results: Dict[int, Tuple[str, str]] = {}
+
+    start, end = response.find("["), response.rfind("]")
+    if start != -1 and end > start:
+        try:
+            entries = json.loads(response[start:end + 1])
+        except json.JSONDecodeError:
+            entries = []
+        for position, entry in enumerate(entries, 1):
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("id", position))
+            except (TypeError, ValueError):
+                index = position
+            decision = normalize_decision(entry.get("decision", ""), options)
+            if decision and 1 <= index <= count:
+                results[index] = (decision, str(entry.get("reasoning", "")).strip())
+
+    if not results:
+        for match in re.finditer(r"^\W*(\d+)\W+(\w+)\W*(.*)$", response, re.MULTILINE):
+            index = int(match.group(1))
+            decision = normalize_decision(match.group(2), options)
+            if decision and 1 <= index <= count and index not in results:
+                results[index] = (decision, match.group(3).strip())
+
+    return results
+
+
+async def _decide_in_batches(
+    llm: LLMProvider,
+    agents: List[SenatorAgent],
+    topic: str,
+    question: str,
+    options: Sequence[str],
+    batch_size: int
+) -> List[Optional[Tuple[str, str]]]:
+    """Run the batched prompts and return a decision (or None) per agent."""
+    batches = [agents[i:i + batch_size] for i in range(0, len(agents), batch_size)]
+    prompts = [build_batch_prompt(batch, topic, question, options) for batch in batches]
+
+    try:
+        responses = await llm.generate_batch(
+            prompts, max_tokens=TOKENS_PER_DECISION * batch_size + 50
+        )
+    except Exception as e:
+        logger.error(f"Batched senator decisions failed, deciding individually: {e}")
+        return [None] * len(agents)
+
+    decisions: List[Optional[Tuple[str, str]]] = []
+    for batch, response in zip(batches, responses):
+        parsed = parse_batch_response(response or "", len(batch), options)
+        if len(parsed) < len(batch):
+            logger.warning(f"Batched response covered {len(parsed)} of {len(batch)} senators")
+        decisions.extend(parsed.get(index) for index in range(1, len(batch) + 1))
+    return decisions
+
+
+async def decide_stances_batch(
+    agents: List[SenatorAgent],
+    topic: str,
+    context: Dict,
+    llm: LLMProvider,
+    batch_size: int = 25
+) -> List[Tuple[str, str]]:
+    """
+    Decide the debate stance of many senators with a few batched prompts.
+
+    Args:
+        agents: Senators who need a stance
+        topic: The topic being debated
+        context: Additional context about the topic
+        llm: The LLM provider to use
+        batch_size: Senators per prompt
+
+    Returns:
+        List of (stance, reasoning) in the same order as the agents
+    """
+    decisions = await _decide_in_batches(
+        llm, agents, topic,
+        "What stance does each senator take on this topic: support, oppose, or neutral?",
+        STANCE_OPTIONS, batch_size
+    )
+
+    for agent, decision in zip(agents, decisions):
+        if decision is not None:
+            agent.adopt_stance(topic, *decision)
+
+    # Anyone the batch could not place decides on their own
+    missing = [i for i, decision in enumerate(decisions) if decision is None]
+    if missing:
+        fallbacks = await asyncio.gather(*[agents[i].decide_stance(topic, context) for i in missing])
+        for i, decision in zip(missing, fallbacks):
+            decisions[i] = decision
+
+    return decisions
+
+
+async def decide_votes_batch(
+    agents: List[SenatorAgent],
+    topic: str,
+    context: Dict,
+    llm: LLMProvider,
+    batch_size: int = 25
+) -> List[Tuple[str, str]]:
+    """
+    Decide the votes of many senators with a few batched prompts.
+
+    Follows SenatorAgent.vote(): senators vote their debate stance, and only
+    neutral senators (and those without a stance yet) need the LLM.
+
+    Args:
+        agents: Senators who are voting
+        topic: The topic being voted on
+        context: Additional context about the vote
+        llm: The LLM provider to use
+        batch_size: Senators per prompt
+
+    Returns:
+        List of (vote_decision, reasoning) in the same order as the agents
+    """
+    undecided = [agent for agent in agents if not agent.current_stance]
+    if undecided:
+        await decide_stances_batch(undecided, topic, context, llm, batch_size)
+
+    neutral = [agent for agent in agents if agent.current_stance == "neutral"]
+    neutral_votes = {}
+    if neutral:
+        decisions = await _decide_in_batches(
+            llm, neutral, topic,
+            "Each senator was neutral during the debate but must now vote either to support or oppose, "
+            "considering faction interests, political allies, and personal ambitions.",
+            VOTE_OPTIONS, batch_size
+        )
+        for agent, decision in zip(neutral, decisions):
+            neutral_votes[id(agent)] = decision
+
+    votes = []
+    for agent in agents:
+        if agent.current_stance != "neutral":
+            decision = (agent.current_stance, f"Consistent with my {agent.current_stance} stance on this issue.")
+        else:
+            decision = neutral_votes.get(id(agent))
+
+        if decision is None:
+            # The batch could not place this senator; vote() records the vote itself
+            votes.append(await agent.vote(topic, context))
+        else:
+            agent.cast_vote(topic, *decision)
+            votes.append(decision)
+
+    return votes
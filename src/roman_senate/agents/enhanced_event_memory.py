@@ -40,6 +40,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# The log is compacted into the snapshot once it holds more records than
+# memories, but never before it holds this many
+MIN_LOG_RECORDS_TO_COMPACT = 1000
+
 
 class EnhancedEventMemory(EventMemory, MemoryInterface):
     """
@@ -49,7 +53,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
     - Memory importance weighting
     - Time-based memory decay
     - Efficient memory indexing and retrieval
-    - Persistence to disk
+    - Persistence to disk, as a snapshot plus an append-only log
     - Memory consolidation
     
     Additionally, it implements the MemoryInterface from the agentic game framework
@@ -84,6 +88,13 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         # Optional vectorized memory for semantic search
         self.use_vectorization = use_vectorization
         self.vector_memory = VectorizedMemory() if use_vectorization else None
+        
+        # Changes not yet saved, as log records, and the saved snapshot and
+        # log they follow (no directory until a snapshot is written)
+        self._journal: List[Dict[str, Any]] = []
+        self._saved_path: Optional[str] = None
+        self._log_generation = 0
+        self._log_records = 0
     
     def _create_memory_index(self) -> MemoryIndex:
         """Create a new memory index."""
@@ -135,6 +146,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         
         # Add to memory index
         self.memory_index.add_memory(event_memory)
+        self._log("add", event_memory)
         
         # Add to vector memory if enabled
         if self.use_vectorization and self.vector_memory:
@@ -179,6 +191,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         
         # Add to memory index
         self.memory_index.add_memory(reaction_memory)
+        self._log("add", reaction_memory)
         
         # Add to vector memory if enabled
         if self.use_vectorization and self.vector_memory:
@@ -229,6 +242,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         
         # Add to memory index
         self.memory_index.add_memory(stance_memory)
+        self._log("add", stance_memory)
         
         # Add to vector memory if enabled
         if self.use_vectorization and self.vector_memory:
@@ -274,6 +288,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         
         # Add to memory index
         self.memory_index.add_memory(relationship_memory)
+        self._log("add", relationship_memory)
         
         # Add to vector memory if enabled
         if self.use_vectorization and self.vector_memory:
@@ -285,18 +300,23 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         """
         Update memory strengths based on time decay.
         
-        This should be called periodically to ensure memory strengths are current.
+        This should be called periodically, such as once per simulated day,
+        to ensure memory strengths are current. The strengths of all memories
+        are computed in one vectorized pass and reused until the next update.
         """
         current_time = datetime.datetime.now()
         self.last_update_time = current_time
         
         # Update memory index to reflect any category changes
         self.memory_index.update_indices()
+        self.memory_index.strength_store.refresh(current_time)
     
     def prune_weak_memories(self, threshold: float = 0.1) -> int:
         """
         Remove memories with strength below the threshold.
         
+        Core memories are never removed.
+        
         Args:
             threshold: Minimum strength to keep
             
@@ -304,64 +324,32 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
             Number of memories removed
         """
         current_time = datetime.datetime.now()
-        removed_count = 0
-        
-        # Prune event memories
-        old_count = len(self.enhanced_event_history)
-        self.enhanced_event_history = [
-            memory for memory in self.enhanced_event_history
-            if memory.get_current_strength(current_time) >= threshold or memory.is_core_memory()
-        ]
-        removed_count += old_count - len(self.enhanced_event_history)
-        
-        # Prune reaction memories
-        old_count = len(self.enhanced_reaction_history)
-        self.enhanced_reaction_history = [
-            memory for memory in self.enhanced_reaction_history
-            if memory.get_current_strength(current_time) >= threshold or memory.is_core_memory()
-        ]
-        removed_count += old_count - len(self.enhanced_reaction_history)
-        
-        # Prune stance change memories
-        for topic in list(self.enhanced_stance_changes.keys()):
-            old_count = len(self.enhanced_stance_changes[topic])
-            self.enhanced_stance_changes[topic] = [
-                memory for memory in self.enhanced_stance_changes[topic]
-                if memory.get_current_strength(current_time) >= threshold or memory.is_core_memory()
+        weak_ids = set(self.memory_index.strength_store.weak(threshold, current_time))
+        
+        if weak_ids:
+            # Prune event and reaction memories
+            self.enhanced_event_history = [
+                memory for memory in self.enhanced_event_history if memory.id not in weak_ids
             ]
-            removed_count += old_count - len(self.enhanced_stance_changes[topic])
-            if not self.enhanced_stance_changes[topic]:
-                del self.enhanced_stance_changes[topic]
-        
-        # Prune relationship impact memories
-        for senator in list(self.enhanced_event_relationships.keys()):
-            old_count = len(self.enhanced_event_relationships[senator])
-            self.enhanced_event_relationships[senator] = [
-                memory for memory in self.enhanced_event_relationships[senator]
-                if memory.get_current_strength(current_time) >= threshold or memory.is_core_memory()
+            self.enhanced_reaction_history = [
+                memory for memory in self.enhanced_reaction_history if memory.id not in weak_ids
             ]
-            removed_count += old_count - len(self.enhanced_event_relationships[senator])
-            if not self.enhanced_event_relationships[senator]:
-                del self.enhanced_event_relationships[senator]
-        
-        # Recreate the memory index
-        old_index = self.memory_index
-        self.memory_index = self._create_memory_index()
-        
-        # Re-index all remaining memories
-        for memory in self.enhanced_event_history:
-            self.memory_index.add_memory(memory)
-        for memory in self.enhanced_reaction_history:
-            self.memory_index.add_memory(memory)
-        for topic_memories in self.enhanced_stance_changes.values():
-            for memory in topic_memories:
-                self.memory_index.add_memory(memory)
-        for senator_memories in self.enhanced_event_relationships.values():
-            for memory in senator_memories:
-                self.memory_index.add_memory(memory)
-        
-        logger.info(f"Pruned {removed_count} weak memories with threshold {threshold}")
-        return removed_count
+            
+            # Prune stance change and relationship impact memories
+            for grouped in (self.enhanced_stance_changes, self.enhanced_event_relationships):
+                for key in list(grouped.keys()):
+                    grouped[key] = [memory for memory in grouped[key] if memory.id not in weak_ids]
+                    if not grouped[key]:
+                        del grouped[key]
+            
+            # Remove them from the memory index
+            for memory_id in weak_ids:
+                memory = self.memory_index.get_memory(memory_id)
+                self.memory_index.remove_memory(memory)
+                self._log("forget", memory)
+        
+        logger.info(f"Pruned {len(weak_ids)} weak memories with threshold {threshold}")
+        return len(weak_ids)
     
     def get_relevant_memories(self, context: Dict[str, Any], limit: int = 10) -> List[MemoryBase]:
         """
@@ -429,15 +417,21 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         
         return "\n".join(narrative_parts)
     
-    def save_to_disk(self, path: Optional[str] = None) -> str:
+    def save_to_disk(self, path: Optional[str] = None, compact: bool = False) -> str:
         """
         Save memory to disk.
         
+        Changes since the last save are appended to the senator's log, so a
+        save costs as much as the changes since the previous one. A full
+        snapshot is written instead, and the log started afresh, on the
+        first save to a directory, when compaction is due or when asked.
+        
         Args:
             path: Optional directory path to save in
+            compact: Whether to write a snapshot even if compaction is not due
             
         Returns:
-            Path to the saved file
+            Path to the snapshot file
         """
         # Default path
         if path is None:
@@ -450,14 +444,80 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         if not self.senator_id:
             self.senator_id = f"senator_{uuid.uuid4().hex[:8]}"
         
-        # Create the file path
-        filename = f"{self.senator_id}_memory.json"
-        file_path = os.path.join(path, filename)
+        # Create the file paths
+        file_path, log_path = self._memory_file_paths(path)
+        
+        if compact or self.snapshot_due(path):
+            self._write_snapshot(file_path, log_path)
+            self._saved_path = os.path.abspath(path)
+            logger.info(f"Saved memory to {file_path}")
+        elif self._journal:
+            # A new log replaces any stale one and starts with the generation of its snapshot
+            with open(log_path, 'a' if self._log_records else 'w') as f:
+                if self._log_records == 0:
+                    f.write(json.dumps({"generation": self._log_generation}) + "\n")
+                for record in self._journal:
+                    f.write(json.dumps(record) + "\n")
+            self._log_records += len(self._journal)
+            logger.debug(f"Appended {len(self._journal)} records to {log_path}")
+            self._journal.clear()
+        
+        return file_path
+    
+    def snapshot_due(self, path: Optional[str] = None) -> bool:
+        """
+        Check whether the next save to a directory writes a full snapshot.
+        
+        Args:
+            path: Optional directory path to save in
+            
+        Returns:
+            True if a snapshot is due, False if changes would be appended to the log
+        """
+        if path is None:
+            path = "saves/memories"
+        if self._saved_path != os.path.abspath(path) or not self.senator_id:
+            return True
+        if not os.path.exists(self._memory_file_paths(path)[0]):
+            return True
+        return self._compaction_due()
+    
+    def _compaction_due(self) -> bool:
+        """Check whether the log, with the unsaved changes, has outgrown the snapshot."""
+        pending = self._log_records + len(self._journal)
+        return pending > max(MIN_LOG_RECORDS_TO_COMPACT, len(self.memory_index))
+    
+    def _memory_file_paths(self, path: str) -> Tuple[str, str]:
+        """
+        Get the snapshot and log file paths of this senator.
+        
+        Args:
+            path: Directory path
+            
+        Returns:
+            Tuple of (snapshot path, log path)
+        """
+        base = os.path.join(path, f"{self.senator_id}_memory")
+        return f"{base}.json", f"{base}.log"
+    
+    def _write_snapshot(self, file_path: str, log_path: str) -> None:
+        """
+        Write all memories to a snapshot that supersedes the current log.
+        
+        The snapshot names the next log generation, so if the old log
+        cannot be removed it is ignored on load rather than replayed.
+        
+        Args:
+            file_path: Snapshot path
+            log_path: Log path
+        """
+        generation = self._log_generation + 1
         
         # Prepare memory data
         memory_data = {
             "senator_id": self.senator_id,
             "timestamp": datetime.datetime.now().isoformat(),
+            "log_generation": generation,
             "event_history": [memory.to_dict() for memory in self.enhanced_event_history],
             "reaction_history": [memory.to_dict() for memory in self.enhanced_reaction_history],
             "stance_changes": {
@@ -470,12 +530,89 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
             }
         }
         
-        # Save to file
-        with open(file_path, 'w') as f:
+        # Save to a temporary file, then swap it in
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'w') as f:
             json.dump(memory_data, f, indent=2)
+        os.replace(temp_path, file_path)
         
-        logger.info(f"Saved memory to {file_path}")
-        return file_path
+        if os.path.exists(log_path):
+            os.remove(log_path)
+        self._log_generation = generation
+        self._log_records = 0
+        self._journal.clear()
+    
+    def _log(self, op: str, memory: MemoryBase) -> None:
+        """
+        Record a change to be appended to the log by the next save.
+        
+        Nothing is recorded while the next save writes a snapshot anyway,
+        that is before the first save and once compaction is due.
+        
+        Args:
+            op: "add", "update" or "forget"
+            memory: The memory that changed
+        """
+        if self._saved_path is None:
+            return
+        if op == "forget":
+            self._journal.append({"op": op, "id": memory.id})
+        else:
+            self._journal.append({"op": op, "memory": memory.to_dict()})
+        
+        if self._compaction_due():
+            # The next save compacts, so the journal is not needed
+            self._journal.clear()
+            self._saved_path = None
+    
+    def _replay_log(self, log_path: str, generation: int) -> int:
+        """
+        Apply the records of a log to the loaded memories.
+        
+        A log from another generation than the snapshot is ignored, and
+        replay stops at a record that was only partly written, in which case
+        the next save writes a snapshot.
+        
+        Args:
+            log_path: Log path
+            generation: Log generation named by the snapshot
+            
+        Returns:
+            Number of records applied
+        """
+        if not os.path.exists(log_path):
+            return 0
+        
+        applied = 0
+        with open(log_path, 'r') as f:
+            header = f.readline()
+            try:
+                if json.loads(header).get("generation") != generation:
+                    logger.warning(f"Ignoring memory log from another snapshot: {log_path}")
+                    return 0
+            except ValueError:
+                return 0
+            
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Memory log {log_path} ends with an incomplete record")
+                    self._saved_path = None
+                    break
+                
+                # An update replaces the memory with the same ID
+                if record["op"] in ("update", "forget"):
+                    memory = self.memory_index.get_memory(record.get("id") or record["memory"]["id"])
+                    if memory:
+                        self._unstore(memory)
+                        self.memory_index.remove_memory(memory)
+                if record["op"] in ("add", "update"):
+                    memory = create_memory_from_dict(record["memory"])
+                    self._store(memory)
+                    self.memory_index.add_memory(memory)
+                applied += 1
+        return applied
     
     def load_from_disk(self, path: Optional[str] = None) -> bool:
         """
@@ -559,6 +696,12 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
                 for memory in senator_memories:
                     self.memory_index.add_memory(memory)
             
+            # Apply the changes logged since the snapshot
+            self._journal.clear()
+            self._saved_path = os.path.abspath(path)
+            self._log_generation = memory_data.get("log_generation", 0)
+            self._log_records = self._replay_log(self._memory_file_paths(path)[1], self._log_generation)
+            
             # If using vectorization, add to vector memory
             if self.use_vectorization and self.vector_memory:
                 for memory in self.enhanced_event_history:
@@ -592,6 +735,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
             if event.event_id not in existing_event_ids:
                 self.enhanced_event_history.append(event)
                 self.memory_index.add_memory(event)
+                self._log("add", event)
                 existing_event_ids.add(event.event_id)
         
         # Merge reaction histories, avoiding exact duplicates
@@ -602,6 +746,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
             if key not in existing_reactions:
                 self.enhanced_reaction_history.append(reaction)
                 self.memory_index.add_memory(reaction)
+                self._log("add", reaction)
                 existing_reactions.add(key)
         
         # Merge stance changes
@@ -619,6 +764,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
                 if key not in existing_stance_changes:
                     self.enhanced_stance_changes[topic].append(stance)
                     self.memory_index.add_memory(stance)
+                    self._log("add", stance)
                     existing_stance_changes.add(key)
         
         # Merge relationship impacts
@@ -636,6 +782,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
                 if key not in existing_impacts:
                     self.enhanced_event_relationships[senator].append(impact)
                     self.memory_index.add_memory(impact)
+                    self._log("add", impact)
                     existing_impacts.add(key)
     
     def _calculate_event_importance(self, event: RomanEvent) -> float:
@@ -903,6 +1050,29 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
                 memory_item = MemoryBase.from_framework_memory_item(memory_item)
         
         # Add to our memory based on type
+        self._store(memory_item)
+        
+        # Add to memory index
+        self.memory_index.add_memory(memory_item)
+        self._log("add", memory_item)
+        
+        # Add to vector memory if enabled
+        if self.use_vectorization and self.vector_memory:
+            if hasattr(memory_item, 'to_framework_memory_item'):
+                framework_item = memory_item.to_framework_memory_item()
+            else:
+                framework_item = memory_item
+            self.vector_memory.add_memory(framework_item)
+        
+        return memory_item.id
+    
+    def _store(self, memory_item: MemoryBase) -> None:
+        """
+        Add a memory item to the collection for its type.
+        
+        Args:
+            memory_item: The memory item
+        """
         if hasattr(memory_item, 'event_type'):
             self.enhanced_event_history.append(memory_item)
         elif hasattr(memory_item, 'reaction_type'):
@@ -917,19 +1087,34 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
             if senator not in self.enhanced_event_relationships:
                 self.enhanced_event_relationships[senator] = []
             self.enhanced_event_relationships[senator].append(memory_item)
+    
+    def _unstore(self, memory: MemoryBase) -> None:
+        """
+        Remove a memory item from the collection for its type.
         
-        # Add to memory index
-        self.memory_index.add_memory(memory_item)
-        
-        # Add to vector memory if enabled
-        if self.use_vectorization and self.vector_memory:
-            if hasattr(memory_item, 'to_framework_memory_item'):
-                framework_item = memory_item.to_framework_memory_item()
-            else:
-                framework_item = memory_item
-            self.vector_memory.add_memory(framework_item)
-        
-        return memory_item.id
+        Args:
+            memory: The memory item
+        """
+        if hasattr(memory, 'event_type'):
+            if memory in self.enhanced_event_history:
+                self.enhanced_event_history.remove(memory)
+        elif hasattr(memory, 'reaction_type'):
+            if memory in self.enhanced_reaction_history:
+                self.enhanced_reaction_history.remove(memory)
+        elif hasattr(memory, 'topic') and hasattr(memory, 'old_stance'):
+            topic = memory.topic
+            if topic in self.enhanced_stance_changes:
+                if memory in self.enhanced_stance_changes[topic]:
+                    self.enhanced_stance_changes[topic].remove(memory)
+                if not self.enhanced_stance_changes[topic]:
+                    del self.enhanced_stance_changes[topic]
+        elif hasattr(memory, 'senator_name') and hasattr(memory, 'impact'):
+            senator = memory.senator_name
+            if senator in self.enhanced_event_relationships:
+                if memory in self.enhanced_event_relationships[senator]:
+                    self.enhanced_event_relationships[senator].remove(memory)
+                if not self.enhanced_event_relationships[senator]:
+                    del self.enhanced_event_relationships[senator]
     
     def retrieve_memories(
         self, 
@@ -995,6 +1180,7 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         
         # Update in memory index
         self.memory_index.update_memory(memory)
+        self._log("update", memory)
         
         # Update in vector memory if enabled
         if self.use_vectorization and self.vector_memory:
@@ -1019,29 +1205,11 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
             return False
         
         # Remove from the appropriate collection
-        if hasattr(memory, 'event_type'):
-            if memory in self.enhanced_event_history:
-                self.enhanced_event_history.remove(memory)
-        elif hasattr(memory, 'reaction_type'):
-            if memory in self.enhanced_reaction_history:
-                self.enhanced_reaction_history.remove(memory)
-        elif hasattr(memory, 'topic') and hasattr(memory, 'old_stance'):
-            topic = memory.topic
-            if topic in self.enhanced_stance_changes:
-                if memory in self.enhanced_stance_changes[topic]:
-                    self.enhanced_stance_changes[topic].remove(memory)
-                if not self.enhanced_stance_changes[topic]:
-                    del self.enhanced_stance_changes[topic]
-        elif hasattr(memory, 'senator_name') and hasattr(memory, 'impact'):
-            senator = memory.senator_name
-            if senator in self.enhanced_event_relationships:
-                if memory in self.enhanced_event_relationships[senator]:
-                    self.enhanced_event_relationships[senator].remove(memory)
-                if not self.enhanced_event_relationships[senator]:
-                    del self.enhanced_event_relationships[senator]
+        self._unstore(memory)
         
         # Remove from memory index
         self.memory_index.remove_memory(memory)
+        self._log("forget", memory)
         
         # Remove from vector memory if enabled
         if self.use_vectorization and self.vector_memory:
@@ -1061,6 +1229,10 @@ class EnhancedEventMemory(EventMemory, MemoryInterface):
         # Clear memory index
         self.memory_index = self._create_memory_index()
         
+        # The next save writes an empty snapshot
+        self._journal.clear()
+        self._saved_path = None
+        
         # Clear vector memory if enabled
         if self.use_vectorization and self.vector_memory:
             self.vector_memory.clear()
\ No newline at end of file
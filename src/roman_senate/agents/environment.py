@@ -12,6 +12,7 @@ from rich.console import Console
 from ..utils.llm.base import LLMProvider
 from ..core.interjection import Interjection, InterjectionType
 from .senator_agent import SenatorAgent
+from .batch_decisions import decide_stances_batch, decide_votes_batch
 
 console = Console()
 
@@ -23,15 +24,23 @@ class SenateEnvironment:
     the senate environment, including debates and voting procedures.
     """
     
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(self, llm_provider: LLMProvider, decision_batch_size: Optional[int] = None):
         """
         Initialize the senate environment.
         
         Args:
             llm_provider: The LLM provider to use for simulation
+            decision_batch_size: Senators per batched stance/vote prompt; 0 or 1 asks
+                each senator separately (defaults to AGENT_DECISION_BATCH_SIZE)
         """
+        if decision_batch_size is None:
+            # Import here to avoid circular imports
+            from ..utils.config import AGENT_DECISION_BATCH_SIZE
+            decision_batch_size = AGENT_DECISION_BATCH_SIZE
+        
         self.agents: List[SenatorAgent] = []
         self.llm_provider = llm_provider
+        self.decision_batch_size = decision_batch_size
         self.topics = []
         self.current_topic = None
         self.year = -100  # Default to 100 BCE
@@ -115,8 +124,15 @@ class SenateEnvironment:
         
         # Gather stances with reasoning for all agents
         stance_reasoning = {}
-        for agent in self.agents:
-            stance, reasoning = await agent.decide_stance(topic_text, context)
+        if self.decision_batch_size > 1:
+            # Pack many senators into each prompt rather than one round-trip per senator
+            decisions = await decide_stances_batch(
+                self.agents, topic_text, context, self.llm_provider, self.decision_batch_size
+            )
+        else:
+            decisions = [await agent.decide_stance(topic_text, context) for agent in self.agents]
+        
+        for agent, (stance, reasoning) in zip(self.agents, decisions):
             stances[agent.name] = stance
             stance_reasoning[agent.name] = reasoning
             console.print(f"[dim]• {agent.name} ({agent.faction}) takes a {stance} position:[/]")
@@ -190,6 +206,13 @@ class SenateEnvironment:
         # Display the vote panel with category context
         console.print(Panel(introduction, title="[bold magenta]SENATE VOTE BEGINS[/]", border_style="magenta", width=100))
         
+        # Decide the votes in a few batched prompts up front
+        batched_votes = None
+        if self.decision_batch_size > 1:
+            batched_votes = await decide_votes_batch(
+                self.agents, topic_text, context, self.llm_provider, self.decision_batch_size
+            )
+        
         # Show progress of senators casting votes
         with Progress(
             SpinnerColumn(),
@@ -199,8 +222,11 @@ class SenateEnvironment:
             task = progress.add_task("Voting...", total=len(self.agents))
             
             # Process votes for each senator
-            for agent in self.agents:
-                vote, reasoning = await agent.vote(topic_text, context)
+            for index, agent in enumerate(self.agents):
+                if batched_votes is not None:
+                    vote, reasoning = batched_votes[index]
+                else:
+                    vote, reasoning = await agent.vote(topic_text, context)
                 
                 # Map the vote values from "support"/"oppose" to "for"/"against"
                 vote_mapping = {
@@ -15,6 +15,7 @@ from roman_senate.core.game_state import GameState
 from roman_senate.core.narrative_context import NarrativeContext, NarrativeEvent
 from roman_senate.core.event_manager import EventGenerator
 from roman_senate.utils.llm.base import LLMProvider
+from roman_senate.utils.llm.rate_limiter import RequestPriority
 
 logger = logging.getLogger(__name__)
 
@@ -128,7 +129,7 @@ class MilitaryEventGenerator(EventGenerator):
         
         try:
             # Generate the military event description - properly await the async method
-            response = await self.llm_provider.generate_text(prompt)
+            response = await self.llm_provider.generate_text(prompt, priority=RequestPriority.BACKGROUND)
             
             # Parse the response
             lines = response.strip().split('\n')
@@ -15,6 +15,9 @@ import json
 
 from agentic_game_framework.memory.memory_interface import MemoryItem as FrameworkMemoryItem
 
+# Weight of memory strength in relevance; the rest is context match
+RELEVANCE_STRENGTH_WEIGHT = 0.3
+
 
 class MemoryBase:
     """
@@ -113,12 +116,13 @@ class MemoryBase:
         else:
             return "short_term"
     
-    def calculate_relevance(self, context: Dict[str, Any]) -> float:
+    def calculate_relevance(self, context: Dict[str, Any], current_strength: Optional[float] = None) -> float:
         """
         Calculate how relevant this memory is to a given context.
         
         Args:
             context: Dictionary of context information
+            current_strength: Precomputed current strength (calculated now if not given)
             
         Returns:
             A value between 0.0 and 1.0 representing relevance
@@ -142,8 +146,9 @@ class MemoryBase:
                 relevance += 0.4
         
         # Add strength as a factor
-        current_strength = self.get_current_strength()
-        relevance = (relevance * 0.7) + (current_strength * 0.3)
+        if current_strength is None:
+            current_strength = self.get_current_strength()
+        relevance = (relevance * (1.0 - RELEVANCE_STRENGTH_WEIGHT)) + (current_strength * RELEVANCE_STRENGTH_WEIGHT)
         
         return max(0.0, min(1.0, relevance))
     
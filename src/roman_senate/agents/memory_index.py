@@ -8,12 +8,32 @@ efficient retrieval based on various criteria.
 Part of the Phase 3 Migration: Memory System - Adapting or extending agentic_game_framework.memory
 """
 
-from typing import Dict, List, Any, Set, Optional, Union, Tuple
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, Iterator, List, Any, NamedTuple, Set, Optional, Union, Tuple
 import datetime
+import heapq
 from collections import defaultdict
 
+import numpy as np
+
 from agentic_game_framework.memory.memory_index import MemoryIndex as FrameworkMemoryIndex
-from .memory_base import MemoryBase
+from .memory_base import MemoryBase, RELEVANCE_STRENGTH_WEIGHT
+from .memory_strength import StrengthStore
+
+IMPORTANCE_CATEGORIES = ("core", "long_term", "medium_term", "short_term")
+
+
+class IndexKeys(NamedTuple):
+    """The index keys a memory was filed under when it was last indexed."""
+    timestamp: datetime.datetime
+    importance: float
+    tags: Tuple[str, ...]
+    senators: Tuple[str, ...]
+    senator_name: Optional[str]
+    event_type: Optional[str]
+    time_key: str
+    category: str
+    topic: Optional[str]
 
 
 class MemoryIndex:
@@ -28,6 +48,14 @@ class MemoryIndex:
     - By importance
     - By topic
     
+    Memories are stored by ID, and every index maps a key to the set of IDs
+    filed under it. Timestamps are also kept in one sorted list, which
+    answers time range queries and recency ordering by binary search. The
+    keys each memory was filed under are remembered, so removing or
+    re-filing a memory only touches its own postings. Memory strengths come
+    from a StrengthStore, which computes them all at once and caches them
+    for a simulated day.
+    
     This class adapts the functionality of agentic_game_framework.memory.MemoryIndex
     while maintaining the specialized functionality needed for the Roman Senate simulation.
     """
@@ -39,73 +67,118 @@ class MemoryIndex:
         Args:
             use_framework_index: Whether to use the framework's memory index as well
         """
+        # Primary storage: memory ID -> memory, in insertion order
+        self.memories: Dict[str, MemoryBase] = {}
+        
         # Index by tag
-        self.tag_index: Dict[str, List[MemoryBase]] = defaultdict(list)
+        self.tag_index: Dict[str, Set[str]] = defaultdict(set)
         
         # Index by senator name
-        self.senator_index: Dict[str, List[MemoryBase]] = defaultdict(list)
+        self.senator_index: Dict[str, Set[str]] = defaultdict(set)
+        
+        # Index by the senator_name attribute alone, which relevance scoring uses
+        self._senator_name_index: Dict[str, Set[str]] = defaultdict(set)
         
         # Index by event type
-        self.event_type_index: Dict[str, List[MemoryBase]] = defaultdict(list)
+        self.event_type_index: Dict[str, Set[str]] = defaultdict(set)
         
         # Index by time period (year-month)
-        self.time_index: Dict[str, List[MemoryBase]] = defaultdict(list)
+        self.time_index: Dict[str, Set[str]] = defaultdict(set)
         
         # Index by importance category
-        self.importance_index: Dict[str, List[MemoryBase]] = {
-            "core": [],
-            "long_term": [],
-            "medium_term": [],
-            "short_term": []
-        }
+        self.importance_index: Dict[str, Set[str]] = {category: set() for category in IMPORTANCE_CATEGORIES}
         
         # Index by topic
-        self.topic_index: Dict[str, List[MemoryBase]] = defaultdict(list)
+        self.topic_index: Dict[str, Set[str]] = defaultdict(set)
         
-        # Track all memories for full scans when needed
-        self.all_memories: List[MemoryBase] = []
+        # Sorted (timestamp, memory ID) entries, oldest first
+        self.timeline: List[Tuple[datetime.datetime, str]] = []
+        
+        # Memory ID -> the keys it is filed under
+        self._index_keys: Dict[str, IndexKeys] = {}
+        
+        # Importance, decay rate and timestamp columns for strength calculations
+        self.strength_store = StrengthStore()
         
         # Optional framework memory index for advanced searching
         self.use_framework_index = use_framework_index
         self.framework_index = FrameworkMemoryIndex() if use_framework_index else None
     
-    def add_memory(self, memory: MemoryBase) -> None:
+    @property
+    def all_memories(self) -> List[MemoryBase]:
+        """All indexed memories, in the order they were added."""
+        return list(self.memories.values())
+    
+    def __len__(self) -> int:
+        return len(self.memories)
+    
+    def _keys_for(self, memory: MemoryBase) -> IndexKeys:
         """
-        Add a memory item to all relevant indices.
+        Work out the index keys of a memory from its current state.
         
         Args:
-            memory: The memory item to index
+            memory: The memory item
+            
+        Returns:
+            The keys to file it under
         """
-        # Add to all memories list
-        self.all_memories.append(memory)
-        
-        # Index by tags
-        for tag in memory.tags:
-            self.tag_index[tag].append(memory)
-        
-        # Index by senator if applicable
+        senators = []
         if hasattr(memory, "senator_name"):
-            self.senator_index[getattr(memory, "senator_name")].append(memory)
-        
+            senators.append(getattr(memory, "senator_name"))
         # Index by source if it's an event memory
-        if hasattr(memory, "source"):
-            self.senator_index[getattr(memory, "source")].append(memory)
+        if hasattr(memory, "source") and getattr(memory, "source") not in senators:
+            senators.append(getattr(memory, "source"))
+        
+        return IndexKeys(
+            timestamp=memory.timestamp,
+            importance=memory.importance,
+            tags=tuple(dict.fromkeys(memory.tags)),
+            senators=tuple(senators),
+            senator_name=getattr(memory, "senator_name", None),
+            event_type=getattr(memory, "event_type", None),
+            time_key=memory.timestamp.strftime("%Y-%m"),
+            category=memory.memory_category(),
+            topic=getattr(memory, "topic", None)
+        )
+    
+    def _postings(self, keys: IndexKeys) -> Iterable[Set[str]]:
+        """
+        Get the postings a memory with these keys belongs to.
         
-        # Index by event type if applicable
-        if hasattr(memory, "event_type"):
-            self.event_type_index[getattr(memory, "event_type")].append(memory)
+        Args:
+            keys: The memory's index keys
+            
+        Returns:
+            The postings
+        """
+        for tag in keys.tags:
+            yield self.tag_index[tag]
+        for senator in keys.senators:
+            yield self.senator_index[senator]
+        if keys.senator_name is not None:
+            yield self._senator_name_index[keys.senator_name]
+        if keys.event_type is not None:
+            yield self.event_type_index[keys.event_type]
+        yield self.time_index[keys.time_key]
+        yield self.importance_index[keys.category]
+        if keys.topic is not None:
+            yield self.topic_index[keys.topic]
+    
+    def add_memory(self, memory: MemoryBase) -> None:
+        """
+        Add a memory item to all relevant indices.
         
-        # Index by time period (year-month)
-        time_key = memory.timestamp.strftime("%Y-%m")
-        self.time_index[time_key].append(memory)
+        A memory with the ID of one already indexed replaces it.
         
-        # Index by importance category
-        category = memory.memory_category()
-        self.importance_index[category].append(memory)
+        Args:
+            memory: The memory item to index
+        """
+        if memory.id in self.memories:
+            self._unindex(memory.id)
         
-        # Index by topic if applicable
-        if hasattr(memory, "topic"):
-            self.topic_index[getattr(memory, "topic")].append(memory)
+        self.memories[memory.id] = memory
+        self._file(memory)
+        self.strength_store.add(memory)
         
         # Add to framework index if using it
         if self.use_framework_index and self.framework_index:
@@ -113,6 +186,47 @@ class MemoryIndex:
             framework_item = memory.to_framework_memory_item()
             self.framework_index.index_memory(framework_item)
     
+    def _file(self, memory: MemoryBase) -> None:
+        """
+        File a stored memory under its current keys and timestamp.
+        
+        Args:
+            memory: The memory item
+        """
+        keys = self._index_keys[memory.id] = self._keys_for(memory)
+        for postings in self._postings(keys):
+            postings.add(memory.id)
+        insort(self.timeline, (keys.timestamp, memory.id))
+    
+    def _unindex(self, memory_id: str) -> MemoryBase:
+        """
+        Take a memory out of the specialized indices and primary storage.
+        
+        Args:
+            memory_id: ID of the memory
+            
+        Returns:
+            The removed memory
+        """
+        memory = self.memories.pop(memory_id)
+        self._unfile(memory)
+        self.strength_store.remove(memory_id)
+        return memory
+    
+    def _unfile(self, memory: MemoryBase) -> None:
+        """
+        Remove a memory from the keys it was filed under.
+        
+        Args:
+            memory: The memory item
+        """
+        keys = self._index_keys.pop(memory.id)
+        for postings in self._postings(keys):
+            postings.discard(memory.id)
+        
+        position = bisect_left(self.timeline, (keys.timestamp, memory.id))
+        del self.timeline[position]
+    
     def remove_memory(self, memory: MemoryBase) -> None:
         """
         Remove a memory item from all indices.
@@ -120,48 +234,9 @@ class MemoryIndex:
         Args:
             memory: The memory item to remove
         """
-        # Remove from all memories list
-        if memory in self.all_memories:
-            self.all_memories.remove(memory)
-        
-        # Remove from tag index
-        for tag in memory.tags:
-            if memory in self.tag_index[tag]:
-                self.tag_index[tag].remove(memory)
-        
-        # Remove from senator index if applicable
-        if hasattr(memory, "senator_name"):
-            senator_name = getattr(memory, "senator_name")
-            if memory in self.senator_index[senator_name]:
-                self.senator_index[senator_name].remove(memory)
-        
-        # Remove from source index if it's an event memory
-        if hasattr(memory, "source"):
-            source = getattr(memory, "source")
-            if memory in self.senator_index[source]:
-                self.senator_index[source].remove(memory)
-        
-        # Remove from event type index if applicable
-        if hasattr(memory, "event_type"):
-            event_type = getattr(memory, "event_type")
-            if memory in self.event_type_index[event_type]:
-                self.event_type_index[event_type].remove(memory)
-        
-        # Remove from time index
-        time_key = memory.timestamp.strftime("%Y-%m")
-        if memory in self.time_index[time_key]:
-            self.time_index[time_key].remove(memory)
-        
-        # Remove from importance index
-        category = memory.memory_category()
-        if memory in self.importance_index[category]:
-            self.importance_index[category].remove(memory)
-        
-        # Remove from topic index if applicable
-        if hasattr(memory, "topic"):
-            topic = getattr(memory, "topic")
-            if memory in self.topic_index[topic]:
-                self.topic_index[topic].remove(memory)
+        if memory.id not in self.memories:
+            return
+        self._unindex(memory.id)
         
         # Remove from framework index if using it
         if self.use_framework_index and self.framework_index:
@@ -171,32 +246,20 @@ class MemoryIndex:
         """
         Update all indices based on current memory states.
         
-        This is useful after memory decay has changed categories.
+        This is useful after memory decay has changed categories. Only
+        memories whose importance, timestamp or index keys changed since
+        they were indexed are re-filed, here and in the framework index.
+        The strength store is reloaded from all memories, which drops its
+        cached strengths.
         """
-        # Store all memories
-        all_memories = self.all_memories.copy()
-        
-        # Clear all indices
-        self.tag_index.clear()
-        self.senator_index.clear()
-        self.event_type_index.clear()
-        self.time_index.clear()
-        self.importance_index = {
-            "core": [],
-            "long_term": [],
-            "medium_term": [],
-            "short_term": []
-        }
-        self.topic_index.clear()
-        self.all_memories.clear()
-        
-        # Clear framework index if using it
-        if self.use_framework_index and self.framework_index:
-            self.framework_index.clear()
-        
-        # Re-add all memories
-        for memory in all_memories:
-            self.add_memory(memory)
+        for memory_id, memory in self.memories.items():
+            if self._keys_for(memory) == self._index_keys[memory_id]:
+                continue
+            self._unfile(memory)
+            self._file(memory)
+            if self.use_framework_index and self.framework_index:
+                self.framework_index.update_memory(memory.to_framework_memory_item())
+        self.strength_store.load(self.memories.values())
     
     def query(self, criteria: Dict[str, Any], current_time: Optional[datetime.datetime] = None) -> List[MemoryBase]:
         """
@@ -224,89 +287,218 @@ class MemoryIndex:
             # Simple text query, delegate to framework index
             return self._framework_text_query(criteria)
         
-        # Default to our specialized indexing
-        candidate_sets: List[Set[MemoryBase]] = []
+        # Default to our specialized indexing: intersect the posting sets,
+        # smallest first
+        candidate_sets: List[Set[str]] = []
         
-        # Filter by tags if specified
+        # Filter by tags if specified (all tags that are indexed must match)
         if "tags" in criteria and criteria["tags"]:
-            tag_matches: Set[MemoryBase] = set()
-            for tag in criteria["tags"]:
-                if tag in self.tag_index:
-                    # For the first tag, initialize the set
-                    if not tag_matches:
-                        tag_matches = set(self.tag_index[tag])
-                    # For subsequent tags, take the intersection
-                    else:
-                        tag_matches &= set(self.tag_index[tag])
-            candidate_sets.append(tag_matches)
-        
-        # Filter by senator name if specified
-        if "senator_name" in criteria and criteria["senator_name"]:
-            senator_name = criteria["senator_name"]
-            if senator_name in self.senator_index:
-                candidate_sets.append(set(self.senator_index[senator_name]))
-        
-        # Filter by event type if specified
-        if "event_type" in criteria and criteria["event_type"]:
-            event_type = criteria["event_type"]
-            if event_type in self.event_type_index:
-                candidate_sets.append(set(self.event_type_index[event_type]))
-        
-        # Filter by importance category if specified
-        if "importance_category" in criteria and criteria["importance_category"]:
-            category = criteria["importance_category"]
-            if category in self.importance_index:
-                candidate_sets.append(set(self.importance_index[category]))
-        
-        # Filter by topic if specified
-        if "topic" in criteria and criteria["topic"]:
-            topic = criteria["topic"]
-            if topic in self.topic_index:
-                candidate_sets.append(set(self.topic_index[topic]))
-        
-        # If we have candidate sets, find the intersection
-        if candidate_sets:
-            # Start with the first set
-            result_set = candidate_sets[0]
-            # Take intersection with each subsequent set
-            for s in candidate_sets[1:]:
-                result_set &= s
-            candidates = list(result_set)
-        else:
-            # If no specific criteria matched, use all memories
-            candidates = self.all_memories.copy()
-        
-        # Apply time range filter if specified
+            known_tags = [tag for tag in criteria["tags"] if tag in self.tag_index]
+            if not known_tags:
+                return []
+            candidate_sets.extend(self.tag_index[tag] for tag in known_tags)
+        
+        # Filter by senator name, event type, importance category and topic if specified
+        for key, index in (("senator_name", self.senator_index), ("event_type", self.event_type_index),
+                           ("importance_category", self.importance_index), ("topic", self.topic_index)):
+            if key in criteria and criteria[key]:
+                candidate_sets.append(index.get(criteria[key], set()))
+        
+        # A single posting set is used as is, read-only
+        candidate_ids: Optional[Set[str]] = None
+        if len(candidate_sets) == 1:
+            candidate_ids = candidate_sets[0]
+        elif candidate_sets:
+            candidate_sets.sort(key=len)
+            candidate_ids = candidate_sets[0].intersection(*candidate_sets[1:])
+        
+        # Apply time range filter if specified: the range is a slice of the
+        # timeline, which is used instead if it is shorter than the candidates
+        start, end = 0, len(self.timeline)
+        time_start = time_end = None
         if "time_start" in criteria or "time_end" in criteria:
             time_start = criteria.get("time_start")
             time_end = criteria.get("time_end", datetime.datetime.now())
-            
             if time_start:
-                candidates = [m for m in candidates if m.timestamp >= time_start]
+                start = bisect_left(self.timeline, (time_start,))
             if time_end:
-                candidates = [m for m in candidates if m.timestamp <= time_end]
+                end = bisect_left(self.timeline, (time_end + datetime.timedelta(microseconds=1),))
+            if candidate_ids is None or end - start < len(candidate_ids):
+                in_range = {memory_id for _, memory_id in self.timeline[start:end]}
+                candidate_ids = in_range if candidate_ids is None else in_range.intersection(candidate_ids)
+                time_start = time_end = None
+        
+        limit = criteria.get("limit")
+        min_strength = criteria.get("min_strength")
+        current_time = current_time or datetime.datetime.now()
+        
+        # The newest few of many candidates are found sooner by walking the
+        # timeline back from the newest memory than by collecting them all
+        if "context" not in criteria and limit is not None and (
+            candidate_ids is None or len(candidate_ids) ** 2 > limit * (end - start)
+        ):
+            return self._newest(limit, candidate_ids, min_strength, current_time, start, end)
+        
+        # Likewise the most relevant few of all memories are found without
+        # scoring the memories that have nothing in common with the context
+        if "context" in criteria and limit is not None and candidate_ids is None:
+            return self._most_relevant(criteria["context"], limit, min_strength, current_time)
+        
+        if candidate_ids is None:
+            # If no specific criteria matched, use all memories
+            candidates = self.all_memories
+        elif time_start or time_end:
+            time_start = time_start or datetime.datetime.min
+            time_end = time_end or datetime.datetime.max
+            candidates = [
+                memory for memory in map(self.memories.__getitem__, candidate_ids)
+                if time_start <= memory.timestamp <= time_end
+            ]
+        else:
+            candidates = [self.memories[memory_id] for memory_id in candidate_ids]
         
         # Apply minimum strength filter if specified
-        if "min_strength" in criteria:
-            min_strength = criteria["min_strength"]
-            current_time = current_time or datetime.datetime.now()
-            candidates = [m for m in candidates if m.get_current_strength(current_time) >= min_strength]
+        if min_strength is not None:
+            strengths = self.strength_store.strengths(current_time)
+            candidates = [m for m in candidates if strengths[m.id] >= min_strength]
         
-        # Sort by relevance if context is provided
+        # Sort by relevance if context is provided, otherwise by recency
+        # (newest first); with a limit only the best are selected
         if "context" in criteria:
             context = criteria["context"]
-            candidates.sort(key=lambda m: m.calculate_relevance(context), reverse=True)
-        # Otherwise sort by recency (newest first)
+            strengths = self.strength_store.strengths(current_time)
+            key = lambda m: m.calculate_relevance(context, strengths[m.id])
         else:
-            candidates.sort(key=lambda m: m.timestamp, reverse=True)
-        
-        # Apply limit if specified
-        if "limit" in criteria and criteria["limit"] is not None:
-            limit = criteria["limit"]
-            candidates = candidates[:limit]
+            key = lambda m: m.timestamp
         
+        if limit is not None:
+            return heapq.nlargest(limit, candidates, key=key)
+        candidates.sort(key=key, reverse=True)
         return candidates
     
+    def _newest(
+        self,
+        limit: int,
+        candidate_ids: Optional[Set[str]],
+        min_strength: Optional[float],
+        current_time: datetime.datetime,
+        start: int,
+        end: int
+    ) -> List[MemoryBase]:
+        """
+        Walk part of the timeline from its newest memory, collecting matches.
+        
+        Args:
+            limit: Number of memories to return
+            candidate_ids: IDs allowed, or None for all memories
+            min_strength: Minimum memory strength, if any
+            current_time: Current time for strength calculations
+            start: First timeline position to consider
+            end: Position after the last one to consider
+            
+        Returns:
+            Up to limit matching memories, newest first
+        """
+        strengths = self.strength_store.strengths(current_time) if min_strength is not None else None
+        results: List[MemoryBase] = []
+        for position in range(end - 1, start - 1, -1):
+            if len(results) >= limit:
+                break
+            memory_id = self.timeline[position][1]
+            if candidate_ids is not None and memory_id not in candidate_ids:
+                continue
+            if strengths is None or strengths[memory_id] >= min_strength:
+                results.append(self.memories[memory_id])
+        return results
+    
+    def _most_relevant(
+        self,
+        context: Dict[str, Any],
+        limit: int,
+        min_strength: Optional[float],
+        current_time: datetime.datetime
+    ) -> List[MemoryBase]:
+        """
+        Select the memories most relevant to a context.
+        
+        An upper bound on every memory's relevance is computed at once from
+        the strength store and the postings of the context's tags, topic and
+        senator. Memories are then scored in order of their bounds, stopping
+        once no remaining bound can beat the best found so far. A memory that
+        shares nothing with the context is relevant only through its
+        strength, so its bound is exact and it is rarely scored.
+        
+        Args:
+            context: Dictionary of context information
+            limit: Number of memories to return
+            min_strength: Minimum memory strength, if any
+            current_time: Current time for strength calculations
+            
+        Returns:
+            Up to limit memories, most relevant first
+        """
+        store = self.strength_store
+        strengths = store.strength_array(current_time)
+        if limit <= 0 or not len(strengths):
+            return []
+        
+        # Mirror MemoryBase.calculate_relevance, with every match assumed to count fully
+        match_weight = 1.0 - RELEVANCE_STRENGTH_WEIGHT
+        bounds = RELEVANCE_STRENGTH_WEIGHT * strengths
+        context_tags = context.get("tags", [])
+        for tag in set(context_tags):
+            if tag in self.tag_index:
+                bounds[store.rows(self.tag_index[tag])] += match_weight * 0.3 / len(context_tags)
+        if "topic" in context and context["topic"] in self.topic_index:
+            bounds[store.rows(self.topic_index[context["topic"]])] += match_weight * 0.3
+        if "senator_name" in context and context["senator_name"] in self._senator_name_index:
+            bounds[store.rows(self._senator_name_index[context["senator_name"]])] += match_weight * 0.4
+        np.minimum(bounds, 1.0, out=bounds)
+        if min_strength is not None:
+            bounds[strengths < min_strength] = -np.inf
+        
+        # Min-heap of (relevance, -row, memory) holding the best so far
+        best: List[Tuple[float, int, MemoryBase]] = []
+        for row in self._rows_by_bound(bounds, limit):
+            if len(best) == limit and bounds[row] <= best[0][0]:
+                break
+            memory = self.memories[store.memory_id(row)]
+            entry = (memory.calculate_relevance(context, float(strengths[row])), -row, memory)
+            if len(best) < limit:
+                heapq.heappush(best, entry)
+            elif entry[0] > best[0][0]:
+                heapq.heapreplace(best, entry)
+        
+        return [memory for _, _, memory in sorted(best, key=lambda entry: entry[0], reverse=True)]
+    
+    @staticmethod
+    def _rows_by_bound(bounds: np.ndarray, limit: int) -> Iterator[int]:
+        """
+        Yield rows with a finite bound from the highest bound down.
+        
+        Rows are sorted a few times the limit at a time, so a caller that
+        stops early never sorts them all.
+        
+        Args:
+            bounds: Bound of each row
+            limit: Number of rows the caller expects to need
+            
+        Returns:
+            Rows in descending order of bound
+        """
+        taken, size = 0, min(len(bounds), 4 * limit)
+        while taken < size:
+            if size < len(bounds):
+                rows = np.argpartition(-bounds, size - 1)[:size]
+            else:
+                rows = np.arange(len(bounds))
+            rows = rows[np.argsort(-bounds[rows], kind="stable")]
+            for row in rows[taken:].tolist():
+                if bounds[row] == -np.inf:
+                    return
+                yield row
+            taken, size = size, min(len(bounds), 4 * size)
+    
     def _framework_text_query(self, criteria: Dict[str, Any]) -> List[MemoryBase]:
         """
         Perform a text query using the framework index.
@@ -355,15 +547,10 @@ class MemoryIndex:
         )
         
         # Convert results back to our memory items
-        result_memories = []
-        for framework_memory in framework_results:
-            # Find the corresponding memory in our all_memories list
-            for memory in self.all_memories:
-                if memory.id == framework_memory.id:
-                    result_memories.append(memory)
-                    break
-        
-        return result_memories
+        return [
+            self.memories[framework_memory.id] for framework_memory in framework_results
+            if framework_memory.id in self.memories
+        ]
     
     def get_memories_by_time_period(self, year: int, month: int) -> List[MemoryBase]:
         """
@@ -377,50 +564,39 @@ class MemoryIndex:
             List of memories from that time period
         """
         time_key = f"{year:04d}-{month:02d}"
-        return self.time_index.get(time_key, [])
+        memories = [self.memories[memory_id] for memory_id in self.time_index.get(time_key, ())]
+        memories.sort(key=lambda m: m.timestamp)
+        return memories
     
     def get_recent_memories(self, count: int = 10) -> List[MemoryBase]:
         """Get the most recent memories."""
-        sorted_memories = sorted(
-            self.all_memories,
-            key=lambda m: m.timestamp,
-            reverse=True
-        )
-        return sorted_memories[:count]
+        if count <= 0:
+            return []
+        return [self.memories[memory_id] for _, memory_id in reversed(self.timeline[-count:])]
     
     def get_strongest_memories(self, count: int = 10) -> List[MemoryBase]:
         """Get the strongest memories based on current strength."""
-        sorted_memories = sorted(
-            self.all_memories,
-            key=lambda m: m.get_current_strength(),
-            reverse=True
-        )
-        return sorted_memories[:count]
+        return [self.memories[memory_id] for memory_id in self.strength_store.strongest(count)]
     
-    def prune_weak_memories(self, threshold: float = 0.1) -> int:
+    def prune_weak_memories(self, threshold: float = 0.1, current_time: Optional[datetime.datetime] = None) -> int:
         """
         Remove memories with strength below the threshold.
         
         Args:
             threshold: Minimum strength to keep
+            current_time: Optional current time for strength calculations
             
         Returns:
             Number of memories removed
         """
-        current_time = datetime.datetime.now()
-        
         # Find weak memories
-        weak_memories = [
-            memory for memory in self.all_memories
-            if memory.get_current_strength(current_time) < threshold
-            and not memory.is_core_memory()
-        ]
+        weak_ids = self.strength_store.weak(threshold, current_time)
         
         # Remove weak memories
-        for memory in weak_memories:
-            self.remove_memory(memory)
+        for memory_id in weak_ids:
+            self.remove_memory(self.memories[memory_id])
         
-        return len(weak_memories)
+        return len(weak_ids)
     
     def get_memory(self, memory_id: str) -> Optional[MemoryBase]:
         """
@@ -432,10 +608,7 @@ class MemoryIndex:
         Returns:
             The memory item, or None if not found
         """
-        for memory in self.all_memories:
-            if memory.id == memory_id:
-                return memory
-        return None
+        return self.memories.get(memory_id)
     
     def update_memory(self, memory: MemoryBase) -> bool:
         """
@@ -447,28 +620,24 @@ class MemoryIndex:
         Returns:
             True if updated successfully, False if memory not found
         """
-        # Remove old entry and add updated one
-        old_memory = self.get_memory(memory.id)
-        if old_memory:
-            self.remove_memory(old_memory)
-            self.add_memory(memory)
-            return True
-        return False
+        if memory.id not in self.memories:
+            return False
+        self.add_memory(memory)
+        return True
     
     def clear(self) -> None:
         """Clear all memories and indices."""
+        self.memories.clear()
         self.tag_index.clear()
         self.senator_index.clear()
+        self._senator_name_index.clear()
         self.event_type_index.clear()
         self.time_index.clear()
-        self.importance_index = {
-            "core": [],
-            "long_term": [],
-            "medium_term": [],
-            "short_term": []
-        }
+        self.importance_index = {category: set() for category in IMPORTANCE_CATEGORIES}
         self.topic_index.clear()
-        self.all_memories.clear()
+        self.timeline.clear()
+        self._index_keys.clear()
+        self.strength_store.clear()
         
         if self.use_framework_index and self.framework_index:
-            self.framework_index.clear()
\ No newline at end of file
+            self.framework_index.clear()
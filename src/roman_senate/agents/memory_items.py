@@ -13,7 +13,7 @@ import datetime
 import uuid
 
 from agentic_game_framework.memory.memory_interface import EventMemoryItem as FrameworkEventMemoryItem
-from ..core.events import Event
+from ..core.events import RomanEvent as Event
 from .memory_base import MemoryBase
 
 
@@ -25,6 +25,9 @@ from .memory_items import create_memory_from_dict
 
 logger = logging.getLogger(__name__)
 
+# A senator's memory is a snapshot plus a log of changes since it was written
+MEMORY_FILE_SUFFIXES = (".json", ".log")
+
 
 class MemoryPersistenceManager:
     """
@@ -74,6 +77,13 @@ class MemoryPersistenceManager:
         """
         Save a senator's memory to disk.
         
+        Most saves only append new changes to the senator's memory log. The
+        snapshot is backed up and the framework copy rewritten only when the
+        log is compacted into a new snapshot, so the framework copy can lag
+        behind by up to max(MIN_LOG_RECORDS_TO_COMPACT, number of memories)
+        changes. Loading falls back to that copy only when the native files
+        are missing or unreadable.
+        
         Args:
             senator_id: ID of the senator
             memory: The memory to save
@@ -85,14 +95,17 @@ class MemoryPersistenceManager:
         if not memory.senator_id:
             memory.senator_id = senator_id
         
-        # Create a backup of the existing memory file if it exists
-        self._backup_memory_file(senator_id)
+        compacting = memory.snapshot_due(self.base_path)
+        
+        # Create a backup of the existing memory files before they are replaced
+        if compacting:
+            self._backup_memory_file(senator_id)
         
         # Save both to our format and to framework format if enabled
         path = memory.save_to_disk(self.base_path)
         
         # Save to framework persistence if enabled
-        if self.use_framework_persistence and self.framework_persistence:
+        if compacting and self.use_framework_persistence and self.framework_persistence:
             self._save_to_framework(senator_id, memory)
         
         return path
@@ -101,6 +114,9 @@ class MemoryPersistenceManager:
         """
         Load a senator's memory from disk.
         
+        The framework copy is used only if the native files cannot be loaded,
+        and may be missing the changes made since the last compaction.
+        
         Args:
             senator_id: ID of the senator
             memory: The memory object to load into
@@ -229,6 +245,9 @@ class MemoryPersistenceManager:
             os.remove(full_path)
             native_deleted = True
             logger.info(f"Deleted memory file for senator {senator_id}")
+        log_path = os.path.join(self.base_path, f"{senator_id}_memory.log")
+        if os.path.exists(log_path):
+            os.remove(log_path)
         
         # Delete from framework persistence if enabled
         if self.use_framework_persistence and self.framework_persistence:
@@ -257,7 +276,7 @@ class MemoryPersistenceManager:
         
         # Copy all memory files to the backup directory
         for filename in os.listdir(self.base_path):
-            if filename.endswith(".json"):  # Copy all JSON files to include both formats
+            if filename.endswith(MEMORY_FILE_SUFFIXES):  # Copy snapshots, logs and framework files
                 src_path = os.path.join(self.base_path, filename)
                 dst_path = os.path.join(backup_dir, filename)
                 shutil.copy2(src_path, dst_path)
@@ -285,11 +304,19 @@ class MemoryPersistenceManager:
         self.create_backup("pre_restore_backup")
         
         # Copy all memory files from the backup directory
-        for filename in os.listdir(backup_dir):
-            if filename.endswith(".json"):  # Copy all JSON files to handle both formats
+        backup_files = os.listdir(backup_dir)
+        for filename in backup_files:
+            if filename.endswith(MEMORY_FILE_SUFFIXES):  # Copy snapshots, logs and framework files
                 src_path = os.path.join(backup_dir, filename)
                 dst_path = os.path.join(self.base_path, filename)
                 shutil.copy2(src_path, dst_path)
+            
+            # A live log written after the backup would be replayed over the restored snapshot
+            if filename.endswith("_memory.json"):
+                log_filename = filename[:-len(".json")] + ".log"
+                log_path = os.path.join(self.base_path, log_filename)
+                if log_filename not in backup_files and os.path.exists(log_path):
+                    os.remove(log_path)
         
         logger.info(f"Restored backup from {backup_dir}")
         return True
@@ -307,7 +334,7 @@ class MemoryPersistenceManager:
             backup_dir = os.path.join(self.backup_path, dirname)
             if os.path.isdir(backup_dir):
                 # Count memory files in the backup
-                memory_files = [f for f in os.listdir(backup_dir) if f.endswith(".json")]
+                memory_files = [f for f in os.listdir(backup_dir) if f.endswith(MEMORY_FILE_SUFFIXES)]
                 
                 # Get creation time
                 created = datetime.datetime.fromtimestamp(os.path.getctime(backup_dir))
@@ -326,7 +353,7 @@ class MemoryPersistenceManager:
     
     def _backup_memory_file(self, senator_id: str) -> Optional[str]:
         """
-        Create a backup of a specific senator's memory file.
+        Create a backup of a specific senator's memory file and its log.
         
         Args:
             senator_id: ID of the senator
@@ -350,8 +377,11 @@ class MemoryPersistenceManager:
         # Create the backup path
         backup_path = os.path.join(self.backup_path, backup_filename)
         
-        # Copy the file
+        # Copy the file, and the log that goes with it
         shutil.copy2(full_path, backup_path)
+        log_path = os.path.join(self.base_path, f"{senator_id}_memory.log")
+        if os.path.exists(log_path):
+            shutil.copy2(log_path, backup_path[:-len(".json")] + ".log")
         logger.debug(f"Created backup of memory file for senator {senator_id} at {backup_path}")
         
         return backup_path
@@ -0,0 +1,273 @@
+"""
+Roman Senate AI Game
+Memory Strength Module
+
+This module provides a columnar store of the fields memory strength depends on,
+so the strengths of all of a senator's memories are computed in one vectorized
+pass instead of one memory at a time.
+
+Part of the Phase 3 Migration: Memory System - Adapting or extending agentic_game_framework.memory
+"""
+
+import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .memory_base import MemoryBase
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class StrengthStore:
+    """
+    Columnar store of memory importance, decay rate and timestamp.
+
+    Each memory is a row of NumPy arrays. Strengths follow the same formula as
+    MemoryBase.get_current_strength, but are computed for every row at once
+    and cached. The cache is reused until the requested time is a full
+    resolution (one simulated day by default) away from when it was computed,
+    so strengths are refreshed once per day rather than on every query.
+    """
+
+    def __init__(self, resolution: datetime.timedelta = datetime.timedelta(days=1), capacity: int = 64):
+        """
+        Initialize an empty store.
+
+        Args:
+            resolution: How long cached strengths stay valid
+            capacity: Initial number of rows to allocate
+        """
+        self.resolution = resolution
+
+        # Row -> memory ID, and memory ID -> row
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+        self._importance = np.zeros(capacity)
+        self._decay_rate = np.zeros(capacity)
+        self._modifier = np.zeros(capacity)  # Emotional impact modifier
+        self._timestamp = np.zeros(capacity)  # POSIX seconds
+
+        # Cached strengths by row and by ID, and when they were computed
+        self._strength = np.zeros(capacity)
+        self._strengths: Dict[str, float] = {}
+        self.computed_at: Optional[datetime.datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+
+    def add(self, memory: MemoryBase) -> None:
+        """
+        Add a memory, or overwrite its row if it is already stored.
+
+        Args:
+            memory: The memory item
+        """
+        row = self._rows.get(memory.id)
+        if row is None:
+            row = len(self._ids)
+            if row == len(self._importance):
+                self._grow(2 * row)
+            self._ids.append(memory.id)
+            self._rows[memory.id] = row
+
+        self._importance[row] = memory.importance
+        self._decay_rate[row] = memory.decay_rate
+        self._modifier[row] = 1.0 + abs(memory.emotional_impact) * 0.5
+        self._timestamp[row] = memory.timestamp.timestamp()
+
+        # Keep the cache current for this row
+        if self.computed_at is not None:
+            strength = memory.get_current_strength(self.computed_at)
+            self._strengths[memory.id] = strength
+            self._strength[row] = strength
+
+    def remove(self, memory_id: str) -> bool:
+        """
+        Remove a memory, moving the last row into its place.
+
+        Args:
+            memory_id: ID of the memory
+
+        Returns:
+            True if the memory was removed, False if not found
+        """
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return False
+
+        last = len(self._ids) - 1
+        last_id = self._ids.pop()
+        if row != last:
+            self._ids[row] = last_id
+            self._rows[last_id] = row
+            for column in self._columns():
+                column[row] = column[last]
+        self._strengths.pop(memory_id, None)
+        return True
+
+    def load(self, memories: Iterable[MemoryBase]) -> None:
+        """
+        Replace the contents with the current fields of the given memories.
+
+        Args:
+            memories: The memory items
+        """
+        memories = list(memories)
+        self._ids = [memory.id for memory in memories]
+        self._rows = {memory_id: row for row, memory_id in enumerate(self._ids)}
+
+        size = len(memories)
+        self._grow(max(64, 2 * size), keep=False)
+        self._importance[:size] = np.fromiter((m.importance for m in memories), float, size)
+        self._decay_rate[:size] = np.fromiter((m.decay_rate for m in memories), float, size)
+        self._modifier[:size] = 1.0 + 0.5 * np.abs(np.fromiter((m.emotional_impact for m in memories), float, size))
+        self._timestamp[:size] = np.fromiter((m.timestamp.timestamp() for m in memories), float, size)
+        self._invalidate()
+
+    def refresh(self, current_time: Optional[datetime.datetime] = None) -> None:
+        """
+        Compute the strength of every memory at the given time.
+
+        Args:
+            current_time: The current time (defaults to now)
+        """
+        current_time = current_time or datetime.datetime.now()
+        size = len(self._ids)
+
+        # strength = importance * e^(-decay_rate * days) * emotional modifier, clamped to [0, 1]
+        days_elapsed = (current_time.timestamp() - self._timestamp[:size]) / SECONDS_PER_DAY
+        strengths = self._importance[:size] * np.exp(-self._decay_rate[:size] * days_elapsed)
+        strengths *= self._modifier[:size]
+        np.clip(strengths, 0.0, 1.0, out=strengths)
+
+        self._strength[:size] = strengths
+        self._strengths = dict(zip(self._ids, strengths.tolist()))
+        self.computed_at = current_time
+
+    def strength_array(self, current_time: Optional[datetime.datetime] = None) -> np.ndarray:
+        """
+        Get the strength of every row, refreshing the cache if it is stale.
+
+        Args:
+            current_time: The current time (defaults to now)
+
+        Returns:
+            Strength of each row; the array must not be modified
+        """
+        current_time = current_time or datetime.datetime.now()
+        if self.computed_at is None or abs(current_time - self.computed_at) >= self.resolution:
+            self.refresh(current_time)
+        return self._strength[:len(self._ids)]
+
+    def rows(self, memory_ids: Iterable[str]) -> np.ndarray:
+        """
+        Get the rows of stored memories.
+
+        Args:
+            memory_ids: IDs of stored memories
+
+        Returns:
+            Their rows, in the same order
+        """
+        return np.fromiter(map(self._rows.__getitem__, memory_ids), dtype=np.intp)
+
+    def memory_id(self, row: int) -> str:
+        """
+        Get the ID of the memory in a row.
+
+        Args:
+            row: The row
+
+        Returns:
+            The memory ID
+        """
+        return self._ids[row]
+
+    def strengths(self, current_time: Optional[datetime.datetime] = None) -> Dict[str, float]:
+        """
+        Get the strength of every memory.
+
+        Args:
+            current_time: The current time (defaults to now)
+
+        Returns:
+            Memory ID -> strength; the dictionary must not be modified
+        """
+        self.strength_array(current_time)
+        return self._strengths
+
+    def strongest(self, count: int, current_time: Optional[datetime.datetime] = None) -> List[str]:
+        """
+        Get the IDs of the strongest memories.
+
+        Args:
+            count: Number of memories to return
+            current_time: The current time (defaults to now)
+
+        Returns:
+            Up to count memory IDs, strongest first
+        """
+        strengths = self.strength_array(current_time)
+        if count <= 0 or not len(strengths):
+            return []
+        if count < len(strengths):
+            rows = np.argpartition(-strengths, count - 1)[:count]
+        else:
+            rows = np.arange(len(strengths))
+        rows = rows[np.argsort(-strengths[rows], kind="stable")]
+        return [self._ids[row] for row in rows.tolist()]
+
+    def weak(self, threshold: float, current_time: Optional[datetime.datetime] = None) -> List[str]:
+        """
+        Get the IDs of memories weaker than a threshold, except core memories.
+
+        Args:
+            threshold: Minimum strength to keep
+            current_time: The current time (defaults to now)
+
+        Returns:
+            Memory IDs
+        """
+        strengths = self.strength_array(current_time)
+        size = len(strengths)
+        # Same test as MemoryBase.is_core_memory
+        core = (self._decay_rate[:size] == 0.0) & (self._importance[:size] >= 0.9)
+        rows = np.flatnonzero((strengths < threshold) & ~core)
+        return [self._ids[row] for row in rows.tolist()]
+
+    def clear(self) -> None:
+        """Remove all memories."""
+        self._ids = []
+        self._rows = {}
+        self._grow(64, keep=False)
+        self._invalidate()
+
+    def _grow(self, capacity: int, keep: bool = True) -> None:
+        """
+        Reallocate the columns.
+
+        Args:
+            capacity: New number of rows
+            keep: Whether to copy the current rows
+        """
+        size = len(self._ids) if keep else 0
+        columns = []
+        for column in self._columns():
+            grown = np.zeros(capacity)
+            grown[:size] = column[:size]
+            columns.append(grown)
+        self._importance, self._decay_rate, self._modifier, self._timestamp, self._strength = columns
+
+    def _columns(self) -> List[np.ndarray]:
+        """The per-row arrays."""
+        return [self._importance, self._decay_rate, self._modifier, self._timestamp, self._strength]
+
+    def _invalidate(self) -> None:
+        """Drop the cached strengths."""
+        self._strengths = {}
+        self.computed_at = None
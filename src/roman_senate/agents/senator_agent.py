@@ -96,13 +96,25 @@ class SenatorAgent:
         elif "against" in stance_text or "oppose" in stance_text:
             final_stance = "oppose"
         
+        self.adopt_stance(topic, final_stance, reasoning)
+        
+        return final_stance, reasoning
+    
+    def adopt_stance(self, topic: str, stance: str, reasoning: str):
+        """
+        Take a stance decided here or by a batched decision for the whole Senate.
+        
+        Args:
+            topic: The topic being debated
+            stance: "support", "oppose", or "neutral"
+            reasoning: Explanation of the decision
+        """
         # Save stance for later use
-        self.current_stance = final_stance
+        self.current_stance = stance
         
         # Record the reasoning in memory
-        self.memory.add_observation(f"Took {final_stance} position on '{topic}' because: {reasoning}")
-        
-        return final_stance, reasoning
+        self.memory.add_observation(f"Took {stance} position on '{topic}' because: {reasoning}")
+    
     async def generate_speech(self, topic: str, context: Dict) -> Tuple[str, str, str, str]:
         """
         Generate a speech for the current debate topic, with separate Latin and English versions.
@@ -543,8 +555,19 @@ class SenatorAgent:
             vote_decision = self.current_stance
             reasoning = f"Consistent with my {self.current_stance} stance on this issue."
             
+        self.cast_vote(topic, vote_decision, reasoning)
+        
+        return vote_decision, reasoning
+    
+    def cast_vote(self, topic: str, vote_decision: str, reasoning: str):
+        """
+        Record a vote decided here or by a batched decision for the whole Senate.
+        
+        Args:
+            topic: The topic being voted on
+            vote_decision: "support" or "oppose"
+            reasoning: Explanation of the decision
+        """
         # Record the vote in memory
         self.memory.record_vote(topic, vote_decision)
-        self.memory.add_observation(f"Voted {vote_decision} on '{topic}' because: {reasoning}")
-        
-        return vote_decision, reasoning
\ No newline at end of file
+        self.memory.add_observation(f"Voted {vote_decision} on '{topic}' because: {reasoning}")
\ No newline at end of file
@@ -49,10 +49,12 @@ get_save_files = None
 auto_save = None
 setup_logging = None
 get_logger = None
+close_shared_connections = None
 
 # Initialize the necessary modules
 def init_imports():
     global LLM_PROVIDER, LLM_MODEL, save_game, load_game, get_save_files, auto_save, setup_logging, get_logger
+    global close_shared_connections
     
     # Use dynamic import to handle both direct execution and module import
     if is_running_directly:
@@ -75,10 +77,26 @@ def init_imports():
     auto_save = persistence_module.auto_save
     setup_logging = utils_module.setup_logging
     get_logger = utils_module.get_logger
+    close_shared_connections = utils_module.llm.close_shared_connections
 
 # Initialize imports
 init_imports()
 
+def run_async(coroutine):
+    """
+    Run a coroutine to completion, then close the pooled LLM connections.
+    
+    LLM providers share their async HTTP connections per event loop, so they
+    are closed here, inside the loop, before asyncio.run() shuts it down.
+    """
+    async def run_and_close():
+        try:
+            return await coroutine
+        finally:
+            await close_shared_connections()
+    
+    return asyncio.run(run_and_close())
+
 app = typer.Typer(help="Roman Senate AI Simulation Game")
 console = Console()
 logger = None  # Will be initialized in main()
@@ -221,7 +239,7 @@ def play(
                 console.print("[bold green]Using Agentic Game Framework architecture[/]")
                 
                 # Run the framework simulation
-                asyncio.run(run_simulation(
+                run_async(run_simulation(
                     num_senators=senators_int,
                     topics=selected_topics,
                     rounds_per_topic=debate_rounds_int,
@@ -232,7 +250,7 @@ def play(
                 logger.error(f"Failed to import framework components: {e}")
                 console.print("[bold red]Failed to load framework components. Falling back to legacy mode.[/]")
                 # Fall back to legacy mode
-                asyncio.run(play_async(senators_int, debate_rounds_int, topics_int, year_int))
+                run_async(play_async(senators_int, debate_rounds_int, topics_int, year_int))
         else:
             # Run the legacy async play function
             import warnings
@@ -243,7 +261,7 @@ def play(
             )
             console.print("[bold yellow]DEPRECATED:[/] [dim]Using legacy architecture which will be removed in a future version.[/]")
             console.print("[dim]Please use --use-framework flag to use the new Agentic Game Framework.[/]")
-            asyncio.run(play_async(senators_int, debate_rounds_int, topics_int, year_int))
+            run_async(play_async(senators_int, debate_rounds_int, topics_int, year_int))
     except Exception as e:
         error_msg = f"Fatal game error: {str(e)}"
         logger.error(error_msg)
@@ -425,7 +443,7 @@ def play_as_senator(
                 )
                 
                 # Run the interactive player session
-                asyncio.run(player_session.start())
+                run_async(player_session.start())
                 
             except ImportError as e:
                 logger.error(f"Failed to import framework player components: {e}")
@@ -437,7 +455,7 @@ def play_as_senator(
                     from .player.game_loop import PlayerGameLoop
                 
                 player_loop = PlayerGameLoop()
-                asyncio.run(player_loop.start_game(senators_int, topics_int, year_int))
+                run_async(player_loop.start_game(senators_int, topics_int, year_int))
         else:
             # Use the legacy player game loop
             import warnings
@@ -457,7 +475,7 @@ def play_as_senator(
             
             # Create and start the player game loop
             player_loop = PlayerGameLoop()
-            asyncio.run(player_loop.start_game(senators_int, topics_int, year_int))
+            run_async(player_loop.start_game(senators_int, topics_int, year_int))
         
     except Exception as e:
         error_msg = f"Fatal game error: {str(e)}"
@@ -528,7 +546,7 @@ def simulate(
             # Run simulation with the new framework
             console.print("[bold cyan]Using new Agentic Game Framework[/]")
             logger.info("Using new Agentic Game Framework for simulation")
-            asyncio.run(run_framework_simulation(senators_int, debate_rounds_int, topics_int, year_int, provider, model))
+            run_async(run_framework_simulation(senators_int, debate_rounds_int, topics_int, year_int, provider, model))
         else:
             # Run simulation with the traditional system
             import warnings
@@ -539,7 +557,7 @@ def simulate(
             )
             console.print("[bold yellow]DEPRECATED:[/] [dim]Using legacy architecture for simulation which will be removed in a future version.[/]")
             console.print("[dim]Please use --use-framework flag to use the new Agentic Game Framework.[/]")
-            asyncio.run(run_simulation_async(senators_int, debate_rounds_int, topics_int, year_int, provider, model))
+            run_async(run_simulation_async(senators_int, debate_rounds_int, topics_int, year_int, provider, model))
         
     except Exception as e:
         error_msg = f"Simulation error: {str(e)}"
@@ -11,11 +11,13 @@ during senate deliberations.
 """
 
 import random
+import re
 import asyncio
 import time
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 import logging
 from collections import defaultdict
+from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 from rich.console import Console
@@ -26,7 +28,8 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from ..utils.llm import factory as llm_factory
-from ..utils.config import LLM_PROVIDER, LLM_MODEL
+from ..utils.llm.rate_limiter import RequestPriority
+from ..utils.config import LLM_PROVIDER, LLM_MODEL, STREAM_SPEECHES
 
 console = Console()
 
@@ -250,7 +253,8 @@ async def generate_latin_from_english(english_text: str, llm) -> str:
         latin_text = await translation_provider.generate_text(
             prompt=prompt,
             temperature=0.7,
-            max_tokens=len(english_text.split()) * 2  # Latin might need more tokens
+            max_tokens=len(english_text.split()) * 2,  # Latin might need more tokens
+            priority=RequestPriority.SPEECH
         )
         
         return latin_text.strip()
@@ -261,6 +265,108 @@ async def generate_latin_from_english(english_text: str, llm) -> str:
         return f"Oratio latina non confecta est propter errorem technicum. Initium orationis anglicae: {english_text[:30]}..."
 
 
+class SpeechStream:
+    """
+    Buffer for the English text of a speech as it streams from the LLM.
+    
+    generate_speech() feeds chunks as they arrive and closes the stream when
+    the speech is complete; readers iterate from the beginning and wait for
+    new text until then, so display can start before generation finishes.
+    """
+    
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.closed = False
+        self._changed = asyncio.Event()
+    
+    @property
+    def text(self) -> str:
+        """The English text received so far."""
+        return "".join(self.chunks)
+    
+    def feed(self, chunk: str):
+        """Append a chunk of text and wake any readers."""
+        self.chunks.append(chunk)
+        self._changed.set()
+    
+    def close(self):
+        """Mark the speech as complete."""
+        self.closed = True
+        self._changed.set()
+    
+    def close_when_done(self, task: asyncio.Future):
+        """Close the stream once the task generating the speech ends, however it ends."""
+        task.add_done_callback(lambda _: self.close())
+    
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._read()
+    
+    async def _read(self) -> AsyncIterator[str]:
+        index = 0
+        while True:
+            while index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            if self.closed:
+                return
+            self._changed.clear()
+            # Re-check after clearing so a chunk fed in between is not missed
+            if index == len(self.chunks) and not self.closed:
+                await self._changed.wait()
+
+
+def split_completed_paragraphs(text: str) -> Tuple[List[str], str]:
+    """
+    Split streamed text into finished paragraphs and the unfinished remainder.
+    
+    Args:
+        text: Text received so far
+        
+    Returns:
+        Tuple of (completed non-empty paragraphs, trailing partial paragraph)
+    """
+    parts = re.split(r"\n\s*\n", text)
+    remainder = parts.pop()
+    return [part.strip() for part in parts if part.strip()], remainder
+
+
+async def stream_speech_with_latin(llm, prompt: str, speech_stream: SpeechStream) -> Tuple[str, str]:
+    """
+    Stream an English speech while translating its paragraphs to Latin.
+    
+    Each paragraph is sent for translation as soon as it is complete, so the
+    Latin is mostly ready by the time the last English paragraph arrives.
+    
+    Args:
+        llm: The LLM provider instance to stream from
+        prompt: The speech prompt
+        speech_stream: Stream that receives the English chunks (always closed on return)
+        
+    Returns:
+        Tuple of (english_text, latin_text)
+    """
+    translations = []
+    pending = ""
+    try:
+        async for chunk in llm.stream_text(prompt, priority=RequestPriority.SPEECH):
+            speech_stream.feed(chunk)
+            paragraphs, pending = split_completed_paragraphs(pending + chunk)
+            for paragraph in paragraphs:
+                translations.append(asyncio.create_task(generate_latin_from_english(paragraph, llm)))
+    except BaseException:
+        for task in translations:
+            task.cancel()
+        raise
+    finally:
+        speech_stream.close()
+    
+    if pending.strip():
+        translations.append(asyncio.create_task(generate_latin_from_english(pending.strip(), llm)))
+    
+    latin_paragraphs = await asyncio.gather(*translations)
+    return speech_stream.text.strip(), "\n\n".join(latin_paragraphs)
+
+
 async def generate_speech(
     senator: Dict,
     topic: str,
@@ -268,6 +374,7 @@ async def generate_speech(
     year: int = None,
     responding_to: Optional[Dict] = None,
     previous_speeches: Optional[List[Dict]] = None,
+    speech_stream: Optional[SpeechStream] = None,
 ) -> Dict:
     """
     Generate an AI-powered speech for a senator based on their identity, the debate topic,
@@ -280,6 +387,8 @@ async def generate_speech(
         year (int, optional): The year in Roman history (negative for BCE)
         responding_to (Dict, optional): Senator/speech being directly responded to
         previous_speeches (List[Dict], optional): Previous speeches in this debate
+        speech_stream (SpeechStream, optional): If given, the English text is streamed
+            into it as it is generated and translated to Latin paragraph by paragraph
         
     Returns:
         Dict: Speech data including the full text, key points, stance, and other metadata
@@ -504,31 +613,36 @@ async def generate_speech(
         # Get the LLM provider
         llm = llm_factory.get_provider()
         
-        # Display progress message
-        console.print(f"[cyan]Senator {senator['name']} is formulating an argument...[/]")
-        
-        # Generate English speech using the configured LLM provider
-        english_text = await llm.generate_text(prompt)
-        
-        # Display generation time
-        generation_time = time.time() - start_time
-        console.print(f"[dim]English speech generated in {generation_time:.1f} seconds[/]")
-        
-        # Now generate the Latin version using the English text
-        console.print(f"[cyan]Translating speech to Classical Latin...[/]")
-        latin_generation_start = time.time()
-        
-        try:
-            # Use the dedicated translation function
-            latin_text = await generate_latin_from_english(english_text, llm)
-            latin_generation_time = time.time() - latin_generation_start
-            console.print(f"[dim]Latin translation completed in {latin_generation_time:.1f} seconds[/]")
-        except Exception as e:
-            # Handle any translation errors
-            logger.error(f"Error generating Latin translation: {e}")
-            console.print(f"[bold yellow]Warning: Latin translation failed, using fallback Latin.[/]")
-            # Use a more authentic Latin placeholder
-            latin_text = f"Patres conscripti, oratio latina non potuit confici propter difficultates technicas. {english_text[:30]}..."
+        if speech_stream is not None:
+            # Stream the English to the reader and translate paragraphs as they complete
+            english_text, latin_text = await stream_speech_with_latin(llm, prompt, speech_stream)
+            logger.debug(f"Streamed speech for {senator['name']} in {time.time() - start_time:.1f} seconds")
+        else:
+            # Display progress message
+            console.print(f"[cyan]Senator {senator['name']} is formulating an argument...[/]")
+            
+            # Generate English speech using the configured LLM provider
+            english_text = await llm.generate_text(prompt, priority=RequestPriority.SPEECH)
+            
+            # Display generation time
+            generation_time = time.time() - start_time
+            console.print(f"[dim]English speech generated in {generation_time:.1f} seconds[/]")
+            
+            # Now generate the Latin version using the English text
+            console.print(f"[cyan]Translating speech to Classical Latin...[/]")
+            latin_generation_start = time.time()
+            
+            try:
+                # Use the dedicated translation function
+                latin_text = await generate_latin_from_english(english_text, llm)
+                latin_generation_time = time.time() - latin_generation_start
+                console.print(f"[dim]Latin translation completed in {latin_generation_time:.1f} seconds[/]")
+            except Exception as e:
+                # Handle any translation errors
+                logger.error(f"Error generating Latin translation: {e}")
+                console.print(f"[bold yellow]Warning: Latin translation failed, using fallback Latin.[/]")
+                # Use a more authentic Latin placeholder
+                latin_text = f"Patres conscripti, oratio latina non potuit confici propter difficultates technicas. {english_text[:30]}..."
     
     except Exception as e:
         console.print(f"[bold red]Error generating English speech: {e}[/]")
@@ -625,6 +739,14 @@ async def generate_speech(
             f"Dum {latin_interest_phrase} consideramus, sapienter agere debemus."
         )
         latin_text = f"{latin_opening} {latin_main} {latin_interest} {random.choice(latin_stance[stance])}"
+        
+        # A reader may be waiting on a stream that never started; show it the fallback
+        if speech_stream is not None and not speech_stream.closed:
+            speech_stream.feed(english_text)
+    finally:
+        # Readers wait until the stream is closed, so close it on every path
+        if speech_stream is not None:
+            speech_stream.close()
 
     # Analyze the speech to find mentioned senators
     mentioned_senators = []
@@ -691,7 +813,7 @@ async def generate_speech(
 
 async def conduct_debate(
     topic: str, senators_list: List[Dict], rounds: int = 3, topic_category: str = None,
-    year: int = None, environment = None
+    year: int = None, environment = None, stream: Optional[bool] = None
 ):
     """
     Conduct a debate on the given topic with interactive responses between senators.
@@ -702,12 +824,17 @@ async def conduct_debate(
         rounds (int): Number of debate rounds
         topic_category (str, optional): Category of the topic (e.g., Military funding)
         year (int, optional): The year in Roman history
+        stream (bool, optional): Render each speech as it is generated
+            (defaults to the STREAM_SPEECHES setting)
         
     Returns:
         List[Dict]: Summary of the debate including all speeches
     """
     # Reset debate state for a new debate
     reset_debate_state()
+    
+    if stream is None:
+        stream = STREAM_SPEECHES
 
     # Handle case where topic might be None
     topic_display = topic if topic else "Unknown Topic"
@@ -753,6 +880,7 @@ async def conduct_debate(
 
         # Create speech generation tasks for all speakers in this round
         speech_tasks = []
+        speech_streams = []
         
         # Show which senators are preparing their speeches
         for senator in speakers:
@@ -795,21 +923,28 @@ async def conduct_debate(
                         break
             
             # Create a task for each senator's speech generation
-            speech_tasks.append(generate_speech(
+            speech_stream = SpeechStream() if stream else None
+            speech_streams.append(speech_stream)
+            speech_task = asyncio.ensure_future(generate_speech(
                 senator,
                 topic,
                 faction_stance=faction_stances,
                 year=year,
                 responding_to=responding_to,
-                previous_speeches=previous_speeches
+                previous_speeches=previous_speeches,
+                speech_stream=speech_stream
             ))
+            if speech_stream is not None:
+                speech_stream.close_when_done(speech_task)
+            speech_tasks.append(speech_task)
         
-        # Process all speakers in parallel
-        speech_results = await asyncio.gather(*speech_tasks)
-        
-        # Display speeches in order
-        for i, speech in enumerate(speech_results):
+        # Display speeches in order while all speakers generate in parallel
+        for i, speech_task in enumerate(speech_tasks):
             senator = speakers[i]
+            if speech_streams[i] is not None:
+                # Show the English as it arrives; later speakers keep generating meanwhile
+                await display_speech_stream(senator, speech_streams[i])
+            speech = await speech_task
             
             # Generate interjections if environment is provided
             interjections = []
@@ -833,7 +968,7 @@ async def conduct_debate(
                 )
             
             # Display the speech in an immersive format with interjections
-            display_speech(senator, speech, topic, interjections)
+            display_speech(senator, speech, topic, interjections, streamed=speech_streams[i] is not None)
             
             # Update relationships based on interjections
             if environment and interjections:
@@ -888,7 +1023,33 @@ async def conduct_debate(
     return debate_summary
 
 
-def display_speech(senator: Dict, speech: Dict, topic: str = "", interjections: List[Interjection] = None):
+async def display_speech_stream(senator: Dict, speech_stream: SpeechStream) -> str:
+    """
+    Render a senator's English speech incrementally as it streams in.
+    
+    Args:
+        senator: Senator data
+        speech_stream: Stream fed by generate_speech()
+        
+    Returns:
+        The complete English text
+    """
+    console.print("\n" + f"[bold]{senator['name']}[/] ([italic]{senator['faction']}[/]) addresses the Senate:")
+    
+    text = Text(style="italic white")
+    with Live(Panel(text, title="English", border_style="blue"), console=console, refresh_per_second=12) as live:
+        async for chunk in speech_stream:
+            # Append as plain text so model output cannot inject console markup
+            text.append(chunk)
+            live.update(Panel(text, title="English", border_style="blue"))
+    
+    return text.plain
+
+
+def display_speech(
+    senator: Dict, speech: Dict, topic: str = "", interjections: List[Interjection] = None,
+    streamed: bool = False
+):
     """
     Display a senator's speech with Latin and English versions, including any interjections.
     
@@ -897,6 +1058,8 @@ def display_speech(senator: Dict, speech: Dict, topic: str = "", interjections:
         speech: Speech data including latin_text and english_text
         topic: The debate topic (optional)
         interjections: List of interjections to display during the speech
+        streamed: The header and English text were already shown by
+            display_speech_stream(), so only the Latin and position follow
     """
     # Get the speech text in both languages
     latin = speech.get("latin_text", "")
@@ -925,11 +1088,14 @@ def display_speech(senator: Dict, speech: Dict, topic: str = "", interjections:
     stance_text = f"{senator['name']} {stance_tag} the proposal."
     
     # Display the full speech with interjections
-    console.print("\n" + header)
+    if not streamed:
+        console.print("\n" + header)
     
     # Process and display the speech with interjections
     if interjections:
-        _display_speech_with_interjections(latin, english, interjections)
+        _display_speech_with_interjections(latin, english, interjections, include_english=not streamed)
+    elif streamed:
+        console.print(Panel(f"[italic yellow]{latin}[/]", title="Latin", border_style="blue"))
     else:
         # Display without interjections (standard format)
         latin_panel = Panel(
@@ -950,7 +1116,9 @@ def display_speech(senator: Dict, speech: Dict, topic: str = "", interjections:
     console.print(f"\n[bold]Position:[/] {stance_text}")
 
 
-def _display_speech_with_interjections(latin_text: str, english_text: str, interjections: List[Interjection]):
+def _display_speech_with_interjections(
+    latin_text: str, english_text: str, interjections: List[Interjection], include_english: bool = True
+):
     """
     Display a speech with interjections at appropriate points.
     
@@ -958,6 +1126,7 @@ def _display_speech_with_interjections(latin_text: str, english_text: str, inter
         latin_text: Latin version of the speech
         english_text: English version of the speech
         interjections: List of interjections to include
+        include_english: Also show the English version (False when it was streamed)
     """
     # Split speech into sections for inserting interjections
     latin_paragraphs = latin_text.split('\n')
@@ -1014,6 +1183,9 @@ def _display_speech_with_interjections(latin_text: str, english_text: str, inter
         for interjection in end_interjections:
             _display_interjection(interjection, "latin")
     
+    if not include_english:
+        return
+    
     # Display English panel header
     console.print(Panel("", title="English", border_style="blue"))
     
@@ -26,6 +26,7 @@ from . import senators, debate, vote, topic_generator
 from .game_state import game_state
 from ..core.persistence import auto_save
 from .roman_calendar import DateFormat
+from ..utils.llm.coalescing import get_request_coalescer
 
 # Initialize console
 console = Console()
@@ -332,6 +333,9 @@ class SenateSession:
             width=100
         ))
         
+        # Count coalesced LLM requests per session
+        get_request_coalescer().reset_stats()
+        
         # Take attendance and arrange seating
         self.conduct_attendance_and_seating()
         
@@ -382,6 +386,14 @@ class SenateSession:
                     console.print("[yellow]The Senate adjourns early at the discretion of the presiding magistrate.[/]")
                     break
         
+        # Record how many identical LLM requests were shared this session
+        llm_stats = get_request_coalescer().get_stats()
+        if llm_stats["calls"]:
+            self._log_event(
+                "LLM Requests",
+                f"{llm_stats['calls']} calls, {llm_stats['deduplicated']} deduplicated"
+            )
+        
         # Conclude the session formally
         self.conclude_session(results)
         
@@ -625,6 +625,7 @@ class PlayerSenateSession(senate_session.SenateSession):
             
             # Process NPC speeches
             npc_speech_tasks = []
+            npc_speech_streams = []
             for senator in speakers:
                 # Determine if this senator should respond to a previous speaker
                 responding_to = None
@@ -633,25 +634,33 @@ class PlayerSenateSession(senate_session.SenateSession):
                     if random.random() < 0.3:
                         responding_to = random.choice(all_speeches)
                 
-                # Create task for speech generation
-                npc_speech_tasks.append(debate.generate_speech(
+                # Create task for speech generation, streaming the text as it is written
+                speech_stream = debate.SpeechStream()
+                npc_speech_streams.append(speech_stream)
+                speech_task = asyncio.ensure_future(debate.generate_speech(
                     senator,
                     topic,
                     year=self.year,
                     responding_to=responding_to,
-                    previous_speeches=all_speeches
+                    previous_speeches=all_speeches,
+                    speech_stream=speech_stream
                 ))
-            
-            # Process all NPC speakers in parallel
-            npc_speech_results = await asyncio.gather(*npc_speech_tasks)
+                speech_stream.close_when_done(speech_task)
+                npc_speech_tasks.append(speech_task)
             
             # Iterate through speeches and allow player to interject
-            for speech in npc_speech_results:
-                # Display the speech
+            # (all NPC speakers keep generating in parallel while earlier ones are shown)
+            for senator, speech_stream, speech_task in zip(speakers, npc_speech_streams, npc_speech_tasks):
+                # Display the speech as it arrives, then its Latin and position
+                await self.player_ui.display_streaming_speech(
+                    senator["name"], senator["faction"], speech_stream
+                )
+                speech = await speech_task
                 debate.display_speech(
                     {"name": speech["senator_name"], "faction": speech["faction"]}, 
                     speech, 
-                    topic
+                    topic,
+                    streamed=True
                 )
                 
                 # Record the speech
@@ -9,8 +9,9 @@ This module provides user interface for player interactions.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import AsyncIterable, Dict, List, Any, Optional, Union, Tuple
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm, IntPrompt
@@ -498,6 +499,38 @@ class PlayerUI:
         # Return the index (0-based) of the selected action or -1 for cancel
         return choice - 1 if choice > 0 else -1
     
+    async def display_streaming_speech(
+        self,
+        speaker_name: str,
+        faction: str,
+        chunks: AsyncIterable[str]
+    ) -> str:
+        """
+        Render a speech incrementally while it is still being generated.
+        
+        Args:
+            speaker_name: Name of the speaking senator
+            faction: The speaker's faction
+            chunks: Async iterable of text chunks (e.g. a debate.SpeechStream)
+            
+        Returns:
+            The complete speech text
+        """
+        self.console.print()
+        self.console.print(f"[bold]{speaker_name}[/bold] ([italic]{faction}[/italic]) rises to address the Senate:")
+        
+        text = Text(style="italic white")
+        
+        def render() -> Panel:
+            return Panel(text, title="[bold]Oratio[/bold]", border_style="blue", box=ROUNDED)
+        
+        with Live(render(), console=self.console, refresh_per_second=12) as live:
+            async for chunk in chunks:
+                text.append(chunk)
+                live.update(render())
+        
+        return text.plain
+    
     def display_loading(self, message: str = "Processing..."):
         """
         Display a loading spinner with a message.
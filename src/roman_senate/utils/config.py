@@ -41,6 +41,21 @@ LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai").lower()  # Force OpenAI as th
 
 # OpenAI configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_API_BASE = os.getenv("OPENAI_API_BASE") or None  # None uses the official endpoint
+
+# Async client pool settings (shared by every OpenAIProvider in a process)
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "16"))  # In-flight requests
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "32"))  # Pooled HTTP connections
+OPENAI_REQUEST_TIMEOUT = float(os.getenv("OPENAI_REQUEST_TIMEOUT", "60"))  # Seconds
+
+# Shared rate limits for OpenAI (0 disables a limit; see utils/llm/rate_limiter.py)
+OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+OPENAI_TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "0"))
+
+# Retry schedule for 429/5xx and connection errors (all providers)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))  # Seconds, doubled per attempt
+LLM_RETRY_MAX_DELAY = float(os.getenv("LLM_RETRY_MAX_DELAY", "30"))  # Seconds
 
 # Development mode flag (set to False for production)
 # This controls which GPT model is used by default
@@ -62,6 +77,9 @@ DEFAULT_GPT_MODEL = GPT_MODEL_DEV if DEV_MODE else GPT_MODEL_PROD
 # Ollama Configuration
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mistral:7b-instruct-v0.2-q4_K_M")
 OLLAMA_API_BASE = os.getenv("OLLAMA_API_BASE", "http://localhost:11434")
+OLLAMA_POOL_SIZE = int(os.getenv("OLLAMA_POOL_SIZE", "8"))  # Keep-alive connections per session
+OLLAMA_REQUEST_TIMEOUT = float(os.getenv("OLLAMA_REQUEST_TIMEOUT", "120"))  # Seconds
+OLLAMA_REQUESTS_PER_MINUTE = int(os.getenv("OLLAMA_REQUESTS_PER_MINUTE", "0"))  # 0 = unlimited
 
 # Configure model based on provider
 if LLM_PROVIDER == "openai":
@@ -78,6 +96,24 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 DATA_DIR = os.path.join(BASE_DIR, "data")
 CACHE_DIR = os.path.join(BASE_DIR, "cache")
 
+# LLM response cache (see utils/llm/response_cache.py)
+LLM_RESPONSE_CACHE_ENABLED = os.getenv("LLM_RESPONSE_CACHE", "False").lower() in ("true", "1", "t")
+LLM_RESPONSE_CACHE_PATH = os.getenv("LLM_RESPONSE_CACHE_PATH", os.path.join(CACHE_DIR, "llm_responses.sqlite3"))
+LLM_RESPONSE_CACHE_TTL = int(os.getenv("LLM_RESPONSE_CACHE_TTL", str(CACHE_DURATION)))  # Seconds
+LLM_RESPONSE_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_RESPONSE_CACHE_MEMORY_ENTRIES", "1024"))
+LLM_RESPONSE_CACHE_DISK_ENTRIES = int(os.getenv("LLM_RESPONSE_CACHE_DISK_ENTRIES", "100000"))
+# Also cache sampled (temperature > 0) requests, e.g. for reproducible regression runs
+LLM_RESPONSE_CACHE_NONDETERMINISTIC = os.getenv("LLM_RESPONSE_CACHE_NONDETERMINISTIC", "False").lower() in ("true", "1", "t")
+
+# Senators per batched stance/vote prompt in SenateEnvironment (0 or 1 = one prompt per senator)
+AGENT_DECISION_BATCH_SIZE = int(os.getenv("AGENT_DECISION_BATCH_SIZE", "25"))
+
+# Render speeches incrementally as the LLM streams them (see core/debate.py)
+STREAM_SPEECHES = os.getenv("STREAM_SPEECHES", "False").lower() in ("true", "1", "t")
+
+# Share one request between identical concurrent generate_text calls (see utils/llm/coalescing.py)
+LLM_COALESCE_REQUESTS = os.getenv("LLM_COALESCE_REQUESTS", "False").lower() in ("true", "1", "t")
+
 # Create directories if they don't exist
 for directory in [LOG_DIR, DATA_DIR, CACHE_DIR]:
     os.makedirs(directory, exist_ok=True)
\ No newline at end of file
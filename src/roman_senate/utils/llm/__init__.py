@@ -9,13 +9,23 @@ This package provides the interface and implementations for LLM providers.
 """
 
 from .base import LLMProvider
-from .openai_provider import OpenAIProvider
-from .ollama_provider import OllamaProvider
-from .factory import get_llm_provider
+from .openai_provider import OpenAIProvider, close_shared_clients
+from .ollama_provider import OllamaProvider, close_shared_sessions
+from .response_cache import ResponseCache, CachedLLMProvider
+from .coalescing import CoalescingLLMProvider, RequestCoalescer, get_request_coalescer
+from .factory import get_llm_provider, close_shared_connections
 
 __all__ = [
     'LLMProvider',
     'OpenAIProvider',
     'OllamaProvider',
+    'ResponseCache',
+    'CachedLLMProvider',
+    'CoalescingLLMProvider',
+    'RequestCoalescer',
+    'get_request_coalescer',
     'get_llm_provider',
+    'close_shared_clients',
+    'close_shared_sessions',
+    'close_shared_connections',
 ]
\ No newline at end of file
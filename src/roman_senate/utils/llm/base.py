@@ -8,8 +8,9 @@ LLM Provider Base Class
 This module defines the base abstract class for LLM providers.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional
 
 class LLMProvider(ABC):
     """Base class for LLM providers."""
@@ -48,4 +49,38 @@ class LLMProvider(ABC):
         Returns:
             Generated text response
         """
-        pass
\ No newline at end of file
+        pass
+    
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Streams generated text as it is produced.
+        
+        Providers without native streaming yield the complete
+        generate_text() result as a single chunk.
+        
+        Args:
+            prompt: The text prompt to generate from
+            **kwargs: Additional arguments for the generation
+            
+        Yields:
+            Successive pieces of the generated text
+        """
+        yield await self.generate_text(prompt, **kwargs)
+    
+    async def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generates text for several prompts at once.
+        
+        The default sends the prompts concurrently through generate_text(),
+        so wrappers such as the response cache apply to each prompt.
+        
+        Args:
+            prompts: The text prompts to generate from
+            **kwargs: Additional arguments applied to every generation
+            
+        Returns:
+            Generated text responses, in the same order as the prompts
+        """
+        return list(await asyncio.gather(*[
+            self.generate_text(prompt, **kwargs) for prompt in prompts
+        ]))
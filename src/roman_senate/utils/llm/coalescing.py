@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Roman Senate AI Game
+LLM Request Coalescing
+
+This module provides a single-flight layer for the LLM provider stack.
+Concurrent ``generate_text`` calls with byte-identical arguments (for example
+the stance, Latin-translation and interjection prompts that senators of the
+same faction build at the same moment) share one underlying request.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCoalescer:
+    """
+    Tracks in-flight requests so identical concurrent calls share one result.
+
+    In-flight requests are keyed per event loop; the first caller starts the
+    request as a task and later callers with the same key await that task.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Tuple[int, str], asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "executed": 0, "deduplicated": 0}
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call, or join an identical one that is already in flight.
+
+        Args:
+            key: Identity of the request (identical arguments give identical keys)
+            call: Zero-argument coroutine function that performs the request
+
+        Returns:
+            The result of the shared request
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+
+        with self._lock:
+            self.stats["calls"] += 1
+            task = self._in_flight.get(loop_key)
+            if task is not None and not task.done():
+                self.stats["deduplicated"] += 1
+                logger.debug("Joined an identical in-flight LLM request")
+            else:
+                task = loop.create_task(call())
+                self._in_flight[loop_key] = task
+                self.stats["executed"] += 1
+                task.add_done_callback(lambda t, k=loop_key: self._forget(k, t))
+
+        # Shield so one caller being cancelled does not cancel the shared request
+        return await asyncio.shield(task)
+
+    def _forget(self, loop_key: Tuple[int, str], task: asyncio.Task) -> None:
+        with self._lock:
+            if self._in_flight.get(loop_key) is task:
+                del self._in_flight[loop_key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics since the last reset.
+
+        Returns:
+            Dictionary of call, executed and deduplicated counts
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["in_flight"] = len(self._in_flight)
+        stats["dedup_rate"] = stats["deduplicated"] / stats["calls"] if stats["calls"] else 0.0
+        return stats
+
+    def reset_stats(self) -> Dict[str, Any]:
+        """
+        Reset the counters, e.g. at the start of a new senate session.
+
+        Returns:
+            The statistics collected before the reset
+        """
+        stats = self.get_stats()
+        with self._lock:
+            self.stats = {"calls": 0, "executed": 0, "deduplicated": 0}
+        return stats
+
+
+# Shared coalescer, so providers created per request still dedupe against each other
+_shared_coalescer = RequestCoalescer()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Get the process-wide RequestCoalescer."""
+    return _shared_coalescer
+
+
+class CoalescingLLMProvider(LLMProvider):
+    """
+    LLM provider wrapper that coalesces identical concurrent generate_text calls.
+
+    The sync methods block their caller and streams are consumed
+    incrementally, so both are passed straight through.
+    """
+
+    def __init__(self, provider: LLMProvider, coalescer: Optional[RequestCoalescer] = None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            provider: The provider whose requests are coalesced
+            coalescer: In-flight registry to use (the shared one if None)
+        """
+        self.provider = provider
+        self.coalescer = coalescer if coalescer is not None else get_request_coalescer()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped provider's attributes (model_name, provider_name, ...)
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def _key(self, prompt: str, kwargs: Dict[str, Any]) -> str:
+        # Identify the endpoint as well as the arguments: two providers only
+        # share a request if they would send it to the same model
+        target = self.provider
+        while hasattr(target, "provider") and isinstance(getattr(target, "provider"), LLMProvider):
+            target = target.provider
+        return json.dumps(
+            {
+                "provider": type(target).__name__,
+                "model": getattr(target, "model_name", None),
+                "endpoint": getattr(target, "api_base", None) or getattr(target, "base_url", None),
+                "prompt": prompt,
+                # Scheduling priority does not change the response
+                "kwargs": {k: v for k, v in kwargs.items() if k != "priority"},
+            },
+            sort_keys=True,
+            default=repr
+        )
+
+    def generate_completion(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        **kwargs
+    ) -> str:
+        """Generate text completion using the wrapped provider."""
+        return self.provider.generate_completion(
+            prompt, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+
+    def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate chat completion using the wrapped provider."""
+        return self.provider.generate_chat_completion(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+
+    async def generate_text(self, prompt: str, **kwargs) -> str:
+        """
+        Generates text, sharing the request with identical in-flight calls.
+
+        Args:
+            prompt: The text prompt to generate from
+            **kwargs: Additional arguments for the generation
+
+        Returns:
+            Generated text response
+        """
+        return await self.coalescer.run(
+            self._key(prompt, kwargs),
+            lambda: self.provider.generate_text(prompt, **kwargs)
+        )
+
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream text using the wrapped provider (streams are not coalesced)."""
+        async for chunk in self.provider.stream_text(prompt, **kwargs):
+            yield chunk
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """Get deduplication statistics for the underlying coalescer."""
+        return self.coalescer.get_stats()
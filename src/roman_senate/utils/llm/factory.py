@@ -12,19 +12,72 @@ import logging
 import os
 from typing import Optional, Dict, Any
 from .base import LLMProvider
-from .openai_provider import OpenAIProvider
-from .ollama_provider import OllamaProvider
+from .openai_provider import OpenAIProvider, close_shared_clients
+from .ollama_provider import OllamaProvider, close_shared_sessions
 from .mock_provider import MockProvider
+from .response_cache import CachedLLMProvider, get_response_cache
+from .coalescing import CoalescingLLMProvider
 
 logger = logging.getLogger(__name__)
 
-def get_llm_provider(provider_type: str = "openai", task_type: str = None, **kwargs) -> LLMProvider:
+def _wrap_provider(provider: LLMProvider, cache: Optional[bool], coalesce: Optional[bool]) -> LLMProvider:
+    """
+    Wrap a provider in the optional response cache and request coalescing layers.
+    
+    Coalescing sits outermost so identical concurrent calls are merged before
+    they reach the cache, and the cache is filled only once per request.
+    
+    Args:
+        provider: The provider to wrap
+        cache: True/False to force caching on/off, None to use the config setting
+        coalesce: True/False to force coalescing on/off, None to use the config setting
+        
+    Returns:
+        The provider, wrapped according to the settings
+    """
+    # Import here to avoid circular imports
+    from ..config import (
+        LLM_RESPONSE_CACHE_ENABLED, LLM_RESPONSE_CACHE_PATH, LLM_RESPONSE_CACHE_TTL,
+        LLM_RESPONSE_CACHE_MEMORY_ENTRIES, LLM_RESPONSE_CACHE_DISK_ENTRIES,
+        LLM_RESPONSE_CACHE_NONDETERMINISTIC, LLM_COALESCE_REQUESTS
+    )
+    
+    if cache is None:
+        cache = LLM_RESPONSE_CACHE_ENABLED
+    if coalesce is None:
+        coalesce = LLM_COALESCE_REQUESTS
+    
+    if cache:
+        response_cache = get_response_cache(
+            LLM_RESPONSE_CACHE_PATH,
+            ttl=LLM_RESPONSE_CACHE_TTL,
+            max_memory_entries=LLM_RESPONSE_CACHE_MEMORY_ENTRIES,
+            max_disk_entries=LLM_RESPONSE_CACHE_DISK_ENTRIES
+        )
+        provider = CachedLLMProvider(
+            provider,
+            cache=response_cache,
+            cache_nondeterministic=LLM_RESPONSE_CACHE_NONDETERMINISTIC
+        )
+    if coalesce:
+        provider = CoalescingLLMProvider(provider)
+    return provider
+
+def get_llm_provider(
+    provider_type: str = "openai",
+    task_type: str = None,
+    cache: Optional[bool] = None,
+    coalesce: Optional[bool] = None,
+    **kwargs
+) -> LLMProvider:
     """
     Factory function to get the appropriate LLM provider.
     
     Args:
         provider_type: Type of provider ("openai", "ollama", or "mock")
         task_type: Type of task ("speech", "reasoning", "simple", or None for default)
+        cache: Wrap the provider in the response cache (None uses LLM_RESPONSE_CACHE)
+        coalesce: Share identical in-flight requests (None uses LLM_COALESCE_REQUESTS)
         **kwargs: Additional arguments to pass to the provider constructor
         
     Returns:
@@ -40,12 +93,12 @@ def get_llm_provider(provider_type: str = "openai", task_type: str = None, **kwa
     # If ROMAN_SENATE_MOCK_PROVIDER is explicitly set, it takes precedence
     if mock_provider:
         logger.info("Mock provider explicitly requested via environment variable")
-        return MockProvider(**kwargs)
+        return _wrap_provider(MockProvider(**kwargs), cache, coalesce)
     
     # If we're in test mode and no explicit provider choice was made, use mock by default
     if test_mode and os.environ.get("ROMAN_SENATE_MOCK_PROVIDER", "").lower() != "false":
         logger.info("Test mode enabled, using MockProvider as default for tests")
-        return MockProvider(**kwargs)
+        return _wrap_provider(MockProvider(**kwargs), cache, coalesce)
     
     logger.info(f"Creating LLM provider of type: {provider_type}" + (f" for task: {task_type}" if task_type else ""))
     
@@ -72,11 +125,11 @@ def get_llm_provider(provider_type: str = "openai", task_type: str = None, **kwa
         if 'api_key' not in kwargs and OPENAI_API_KEY:
             kwargs['api_key'] = OPENAI_API_KEY
         
-        return OpenAIProvider(**kwargs)
+        return _wrap_provider(OpenAIProvider(**kwargs), cache, coalesce)
     elif provider_type.lower() == "ollama":
-        return OllamaProvider(**kwargs)
+        return _wrap_provider(OllamaProvider(**kwargs), cache, coalesce)
     elif provider_type.lower() == "mock":
-        return MockProvider(**kwargs)
+        return _wrap_provider(MockProvider(**kwargs), cache, coalesce)
     else:
         error_msg = f"Unknown provider type: {provider_type}"
         logger.error(error_msg)
@@ -105,4 +158,14 @@ def get_provider(task_type: str = None, **kwargs) -> LLMProvider:
         kwargs['model_name'] = LLM_MODEL
     
     # Pass the task_type to get_llm_provider
-    return get_llm_provider(task_type=task_type, **kwargs)
\ No newline at end of file
+    return get_llm_provider(task_type=task_type, **kwargs)
+
+async def close_shared_connections() -> None:
+    """
+    Close the pooled OpenAI clients and Ollama sessions of the running event loop.
+    
+    Providers share their async connections process-wide, so call this once
+    before the event loop shuts down rather than closing each provider.
+    """
+    await close_shared_clients()
+    await close_shared_sessions()
@@ -3,12 +3,13 @@ Mock LLM provider for testing purposes.
 This provider returns predefined responses instead of making actual API calls.
 """
 
+import asyncio
 import json
 import logging
 import os
 import random
 import re
-from typing import Dict, List, Optional, Union, Any
+from typing import AsyncIterator, Dict, List, Optional, Union, Any
 
 from ...mock_speeches import MOCK_SPEECHES
 
@@ -245,6 +246,15 @@ class MockProvider(LLMProvider):
         """Generate text asynchronously (mock implementation)."""
         logger.info(f"Mock async text generation requested for prompt: {prompt[:50]}...")
         return self.generate_completion(prompt, **kwargs)
+    
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream a mock response word by word (mock implementation)."""
+        logger.info(f"Mock streaming requested for prompt: {prompt[:50]}...")
+        text = self.generate_completion(prompt, **kwargs)
+        for piece in re.findall(r"\S+\s*|\s+", text):
+            # Yield control so readers can render between chunks, like a real stream
+            await asyncio.sleep(0)
+            yield piece
         
     def _detect_prompt_type(self, prompt: str) -> str:
         """
@@ -6,26 +6,243 @@ Roman Senate AI Game
 Ollama LLM Provider Implementation
 
 This module implements the LLM provider interface for Ollama.
+
+The sync methods use a long-lived ``requests.Session`` owned by the provider.
+The async methods use ``aiohttp.ClientSession`` objects shared process-wide,
+so consecutive speeches, stances and votes reuse keep-alive connections even
+though providers are created per call.
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from .base import LLMProvider
+from .rate_limiter import RateLimiter, RequestPriority, estimate_tokens, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+
+class _SessionPool:
+    """
+    Process-wide registry of keep-alive aiohttp sessions for Ollama servers.
+
+    Providers are created freely, so the connection pool cannot live on the
+    provider itself. Sessions are keyed by server settings and by event loop,
+    because an aiohttp session is bound to the loop that created it.
+    Connection counts are recorded per request into the dictionary passed as
+    ``trace_request_ctx``, so each provider keeps its own statistics.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[asyncio.AbstractEventLoop, Any]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, api_base: str, pool_size: int, timeout: float):
+        """
+        Get the shared session for a server on the running loop.
+
+        Args:
+            api_base: Base URL of the Ollama server
+            pool_size: Maximum number of connections to the server
+            timeout: Request timeout in seconds
+
+        Returns:
+            The shared aiohttp.ClientSession
+        """
+        # Import here to avoid adding aiohttp as a global dependency for sync-only code
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), api_base, pool_size, timeout)
+
+        with self._lock:
+            # Drop sessions that belonged to loops which have since been closed
+            stale = [k for k, entry in self._entries.items() if entry[0].is_closed()]
+            for k in stale:
+                del self._entries[k]
+
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not loop or entry[1].closed:
+                trace_config = aiohttp.TraceConfig()
+                trace_config.on_connection_create_end.append(self._count("opened"))
+                trace_config.on_connection_reuseconn.append(self._count("reused"))
+
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=pool_size, limit_per_host=pool_size),
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    trace_configs=[trace_config]
+                )
+                entry = (loop, session)
+                self._entries[key] = entry
+                logger.debug(f"Opened shared Ollama session for {api_base} (pool size {pool_size})")
+
+        return entry[1]
+
+    @staticmethod
+    def _count(counter: str):
+        """Build a trace callback that increments a counter of the request's stats."""
+        async def on_connection(session, context, params) -> None:
+            stats = context.trace_request_ctx
+            if stats is not None:
+                stats[counter] += 1
+        return on_connection
+
+    async def close(self) -> None:
+        """Close every session owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            owned = [k for k, entry in self._entries.items() if entry[0] is loop]
+            sessions = [self._entries.pop(k)[1] for k in owned]
+        for session in sessions:
+            await session.close()
+
+
+_shared_sessions = _SessionPool()
+
+
+async def close_shared_sessions() -> None:
+    """
+    Close the shared Ollama sessions created on the running event loop.
+
+    Call this before the loop shuts down (e.g. at the end of a simulation)
+    to release pooled connections cleanly.
+    """
+    await _shared_sessions.close()
+
+
 class OllamaProvider(LLMProvider):
     """Ollama-based LLM provider for local model inference."""
     
-    def __init__(self, model_name: str = "mistral:7b-instruct-v0.2-q4_K_M", api_base: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model_name: str = "mistral:7b-instruct-v0.2-q4_K_M",
+        api_base: str = "http://localhost:11434",
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None
+    ):
+        # Import here to avoid circular imports
+        from ..config import OLLAMA_POOL_SIZE, OLLAMA_REQUEST_TIMEOUT
+        
         self.model_name = model_name
         self.api_base = api_base
         self.generate_endpoint = f"{self.api_base}/api/generate"
         self.chat_endpoint = f"{self.api_base}/api/chat"
+        self.pool_size = pool_size or OLLAMA_POOL_SIZE
+        self.timeout = timeout or OLLAMA_REQUEST_TIMEOUT
+        
+        # The sync session is created lazily and kept until close()
+        self._session: Optional[requests.Session] = None
+        self._async_stats = {"opened": 0, "reused": 0}
+        self._retired_sync_stats = {"opened": 0, "reused": 0}
         logger.info(f"Initialized Ollama provider with model: {model_name}")
     
+    # --- Session lifecycle ---
+    
+    def _get_session(self) -> requests.Session:
+        """Get the keep-alive session used by the sync methods."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.pool_size,
+                pool_block=True
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+            logger.debug(f"Opened Ollama sync session (pool size {self.pool_size})")
+        return self._session
+    
+    def _get_async_session(self):
+        """Get the shared keep-alive aiohttp session for this server and event loop."""
+        return _shared_sessions.acquire(self.api_base, self.pool_size, self.timeout)
+    
+    def _sync_connection_counts(self) -> Dict[str, int]:
+        """Read opened/reused connection counts from the sync session's pools."""
+        counts = dict(self._retired_sync_stats)
+        if self._session is None:
+            return counts
+        
+        seen = set()
+        for adapter in self._session.adapters.values():
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                counts["opened"] += pool.num_connections
+                counts["reused"] += max(0, pool.num_requests - pool.num_connections)
+        return counts
+    
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        Get counters for connections opened versus reused.
+        
+        Returns:
+            Dictionary with sync and async opened/reused connection counts
+        """
+        sync_counts = self._sync_connection_counts()
+        return {
+            "sync_opened": sync_counts["opened"],
+            "sync_reused": sync_counts["reused"],
+            "async_opened": self._async_stats["opened"],
+            "async_reused": self._async_stats["reused"],
+        }
+    
+    def close(self) -> None:
+        """
+        Close the sync session.
+        
+        The async sessions are shared by every provider and are closed with
+        ``close_shared_sessions()`` from inside their event loop.
+        """
+        if self._session is not None:
+            # Keep the totals so stats survive a close/reopen cycle
+            self._retired_sync_stats = self._sync_connection_counts()
+            self._session.close()
+            self._session = None
+    
+    async def aclose(self) -> None:
+        """Close the sync session; the shared async sessions stay open for other providers."""
+        self.close()
+    
+    def __enter__(self) -> "OllamaProvider":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "OllamaProvider":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _get_rate_limiter(self) -> RateLimiter:
+        """Get the rate limiter shared by every provider using this server."""
+        # Import here to avoid circular imports
+        from ..config import (
+            OLLAMA_REQUESTS_PER_MINUTE, LLM_MAX_RETRIES,
+            LLM_RETRY_BASE_DELAY, LLM_RETRY_MAX_DELAY
+        )
+        
+        return get_rate_limiter(
+            f"ollama:{self.api_base}",
+            requests_per_minute=OLLAMA_REQUESTS_PER_MINUTE or None,
+            max_retries=LLM_MAX_RETRIES,
+            base_delay=LLM_RETRY_BASE_DELAY,
+            max_delay=LLM_RETRY_MAX_DELAY
+        )
+    
+    # --- Generation ---
+    
     def generate_completion(
         self, 
         prompt: str, 
@@ -44,9 +261,10 @@ class OllamaProvider(LLMProvider):
                 **kwargs
             }
             
-            response = requests.post(
+            response = self._get_session().post(
                 self.generate_endpoint,
-                json=payload
+                json=payload,
+                timeout=self.timeout
             )
             response.raise_for_status()
             
@@ -79,9 +297,10 @@ class OllamaProvider(LLMProvider):
                 **kwargs
             }
             
-            response = requests.post(
+            response = self._get_session().post(
                 self.chat_endpoint,
-                json=payload
+                json=payload,
+                timeout=self.timeout
             )
             response.raise_for_status()
             
@@ -118,18 +337,21 @@ class OllamaProvider(LLMProvider):
                     }
                 ]
             }
+    
     async def generate_text(self, prompt: str, **kwargs) -> str:
         """
         Generates text based on a prompt asynchronously.
         
         Args:
             prompt: The text prompt to generate from
-            **kwargs: Additional arguments for the generation
+            **kwargs: Additional arguments for the generation; ``priority``
+                (a RequestPriority) orders the request in the shared queue
             
         Returns:
             Generated text response
         """
         logger.debug("Using async generate_text() with Ollama provider")
+        priority = kwargs.pop('priority', RequestPriority.DEFAULT)
         try:
             logger.debug(f"Generating async completion with Ollama model {self.model_name}")
             temperature = kwargs.get('temperature', 0.7)
@@ -143,18 +365,85 @@ class OllamaProvider(LLMProvider):
                 **{k:v for k,v in kwargs.items() if k not in ['temperature', 'max_tokens']}
             }
             
-            # Import here to avoid adding asyncio as a global dependency for non-async code
-            import aiohttp
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.generate_endpoint, json=payload) as response:
+            async def request():
+                session = self._get_async_session()
+                async with session.post(
+                    self.generate_endpoint, json=payload, trace_request_ctx=self._async_stats
+                ) as response:
                     response.raise_for_status()
-                    result = await response.json()
-                    generated_text = result.get("response", "")
-                    logger.debug(f"Generated {len(generated_text)} characters of text")
-                    return generated_text
+                    return await response.json()
+            
+            result = await self._get_rate_limiter().run(
+                request,
+                tokens=estimate_tokens(prompt, max_tokens),
+                priority=priority
+            )
+            generated_text = result.get("response", "")
+            logger.debug(f"Generated {len(generated_text)} characters of text")
+            return generated_text
                     
         except Exception as e:
             logger.error(f"Error with Ollama async completion: {e}")
             return f"[Error generating text: {str(e)}]"
-        return self.generate_completion(prompt, **kwargs)
\ No newline at end of file
+    
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Streams generated text from Ollama as it is produced.
+        
+        Ollama streams newline-delimited JSON objects, each carrying the
+        next piece of text in ``response`` until one reports ``done``.
+        
+        Args:
+            prompt: The text prompt to generate from
+            **kwargs: Additional arguments for the generation; ``priority``
+                (a RequestPriority) orders the request in the shared queue
+            
+        Yields:
+            Successive pieces of the generated text
+        """
+        priority = kwargs.pop('priority', RequestPriority.DEFAULT)
+        max_tokens = kwargs.get('max_tokens', 500)
+        payload = {
+            "model": self.model_name,
+            "prompt": prompt,
+            "temperature": kwargs.get('temperature', 0.7),
+            "max_tokens": max_tokens,
+            "stream": True,
+            **{k:v for k,v in kwargs.items() if k not in ['temperature', 'max_tokens']}
+        }
+        
+        response = None
+        try:
+            logger.debug(f"Streaming completion with Ollama model {self.model_name}")
+            
+            async def open_stream():
+                session = self._get_async_session()
+                opened = await session.post(
+                    self.generate_endpoint, json=payload, trace_request_ctx=self._async_stats
+                )
+                try:
+                    opened.raise_for_status()
+                except Exception:
+                    opened.release()
+                    raise
+                return opened
+            
+            response = await self._get_rate_limiter().run(
+                open_stream,
+                tokens=estimate_tokens(prompt, max_tokens),
+                priority=priority
+            )
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    break
+        except Exception as e:
+            logger.error(f"Error with Ollama streaming completion: {e}")
+            yield f"[Error generating text: {str(e)}]"
+        finally:
+            if response is not None:
+                response.release()
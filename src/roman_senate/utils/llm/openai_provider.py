@@ -6,24 +6,179 @@ Roman Senate AI Game
 OpenAI LLM Provider Implementation
 
 This module implements the LLM provider interface for OpenAI.
+
+Async generation goes through a shared ``openai.AsyncOpenAI`` client with a
+pooled HTTP transport, so the ``asyncio.gather`` calls in the debate and vote
+flows genuinely overlap their requests instead of running one after another.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 import openai
 from .base import LLMProvider
+from .rate_limiter import RateLimiter, RequestPriority, estimate_tokens, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+
+class _AsyncClientPool:
+    """
+    Process-wide registry of async OpenAI clients.
+
+    Providers are created freely (``debate.generate_speech`` builds one per
+    speech), so the HTTP connection pool cannot live on the provider itself.
+    Clients are keyed by endpoint settings and by event loop, because an
+    async HTTP transport must not be reused across ``asyncio.run`` calls.
+    Each client is paired with a semaphore that caps in-flight requests.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[asyncio.AbstractEventLoop, Any, asyncio.Semaphore]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        api_key: Optional[str],
+        base_url: Optional[str],
+        max_connections: int,
+        max_concurrency: int,
+        timeout: float
+    ) -> Tuple[Any, asyncio.Semaphore]:
+        """
+        Get the shared client and concurrency semaphore for the running loop.
+
+        Args:
+            api_key: API key for the endpoint (None reads OPENAI_API_KEY)
+            base_url: Endpoint base URL (None uses the official API)
+            max_connections: Size of the HTTP connection pool
+            max_concurrency: Maximum number of in-flight requests
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (AsyncOpenAI client, semaphore)
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), api_key, base_url, max_connections, max_concurrency, timeout)
+
+        with self._lock:
+            # Drop clients that belonged to loops which have since been closed
+            stale = [k for k, entry in self._entries.items() if entry[0].is_closed()]
+            for k in stale:
+                del self._entries[k]
+
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not loop:
+                limits = type(openai.DEFAULT_CONNECTION_LIMITS)(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections
+                )
+                client = openai.AsyncOpenAI(
+                    api_key=api_key,
+                    base_url=base_url,
+                    timeout=timeout,
+                    max_retries=0,  # Retries are scheduled by the shared RateLimiter
+                    http_client=openai.DefaultAsyncHttpxClient(limits=limits, timeout=timeout)
+                )
+                entry = (loop, client, asyncio.Semaphore(max_concurrency))
+                self._entries[key] = entry
+                logger.debug(
+                    f"Created shared async OpenAI client (connections={max_connections}, "
+                    f"concurrency={max_concurrency}, base_url={base_url or 'default'})"
+                )
+
+        return entry[1], entry[2]
+
+    async def close(self) -> None:
+        """Close every client owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            owned = [k for k, entry in self._entries.items() if entry[0] is loop]
+            clients = [self._entries.pop(k)[1] for k in owned]
+        for client in clients:
+            await client.close()
+
+
+_shared_async_clients = _AsyncClientPool()
+
+
+async def close_shared_clients() -> None:
+    """
+    Close the pooled async OpenAI clients created on the running event loop.
+
+    Call this before the loop shuts down (e.g. at the end of a simulation)
+    to release pooled connections cleanly.
+    """
+    await _shared_async_clients.close()
+
+
 class OpenAIProvider(LLMProvider):
     """OpenAI-based LLM provider."""
     
-    def __init__(self, model_name: str = "gpt-4", api_key: Optional[str] = None):
+    def __init__(
+        self,
+        model_name: str = "gpt-4",
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        timeout: Optional[float] = None
+    ):
+        # Import here to avoid circular imports
+        from ..config import (
+            OPENAI_API_BASE, OPENAI_MAX_CONCURRENCY,
+            OPENAI_MAX_CONNECTIONS, OPENAI_REQUEST_TIMEOUT
+        )
+        
         self.model_name = model_name
+        self.api_key = api_key
+        self.base_url = base_url or OPENAI_API_BASE
+        self.max_concurrency = max_concurrency or OPENAI_MAX_CONCURRENCY
+        self.max_connections = max_connections or OPENAI_MAX_CONNECTIONS
+        self.timeout = timeout or OPENAI_REQUEST_TIMEOUT
+        self._sync_client = None
         if api_key:
             openai.api_key = api_key
         logger.info(f"Initialized OpenAI provider with model: {model_name}")
     
+    def _get_sync_client(self):
+        """Lazily create the blocking client used by the sync methods."""
+        if self._sync_client is None:
+            self._sync_client = openai.OpenAI(
+                api_key=self.api_key or openai.api_key,
+                base_url=self.base_url,
+                timeout=self.timeout
+            )
+        return self._sync_client
+    
+    def _get_async_client(self) -> Tuple[Any, asyncio.Semaphore]:
+        """Get the pooled async client and concurrency limit for this provider."""
+        return _shared_async_clients.acquire(
+            self.api_key or openai.api_key,
+            self.base_url,
+            self.max_connections,
+            self.max_concurrency,
+            self.timeout
+        )
+    
+    def _get_rate_limiter(self) -> RateLimiter:
+        """Get the rate limiter shared by every provider using this endpoint."""
+        # Import here to avoid circular imports
+        from ..config import (
+            OPENAI_REQUESTS_PER_MINUTE, OPENAI_TOKENS_PER_MINUTE,
+            LLM_MAX_RETRIES, LLM_RETRY_BASE_DELAY, LLM_RETRY_MAX_DELAY
+        )
+        
+        return get_rate_limiter(
+            f"openai:{self.base_url or 'default'}",
+            requests_per_minute=OPENAI_REQUESTS_PER_MINUTE or None,
+            tokens_per_minute=OPENAI_TOKENS_PER_MINUTE or None,
+            max_retries=LLM_MAX_RETRIES,
+            base_delay=LLM_RETRY_BASE_DELAY,
+            max_delay=LLM_RETRY_MAX_DELAY
+        )
+    
     def generate_completion(
         self, 
         prompt: str, 
@@ -34,7 +189,7 @@ class OpenAIProvider(LLMProvider):
         """Generate text completion using OpenAI."""
         try:
             logger.debug(f"Generating completion with OpenAI model {self.model_name}")
-            response = openai.chat.completions.create(
+            response = self._get_sync_client().chat.completions.create(
                 model=self.model_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=temperature,
@@ -58,7 +213,7 @@ class OpenAIProvider(LLMProvider):
         """Generate chat completion using OpenAI."""
         try:
             logger.debug(f"Generating chat completion with OpenAI model {self.model_name}")
-            response = openai.chat.completions.create(
+            response = self._get_sync_client().chat.completions.create(
                 model=self.model_name,
                 messages=messages,
                 temperature=temperature,
@@ -81,26 +236,40 @@ class OpenAIProvider(LLMProvider):
                     }
                 ]
             }
+    
     async def generate_text(self, prompt: str, **kwargs) -> str:
         """
         Generates text based on a prompt asynchronously.
         
         Args:
             prompt: The text prompt to generate from
-            **kwargs: Additional arguments for the generation
+            **kwargs: Additional arguments for the generation; ``priority``
+                (a RequestPriority) orders the request in the shared queue
             
         Returns:
             Generated text response
         """
         logger.debug("Using async generate_text() with OpenAI provider")
+        priority = kwargs.pop('priority', RequestPriority.DEFAULT)
+        max_tokens = kwargs.get('max_tokens', 500)
         try:
             logger.debug(f"Generating async completion with OpenAI model {self.model_name}")
-            response = openai.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=kwargs.get('temperature', 0.7),
-                max_tokens=kwargs.get('max_tokens', 500),
-                **{k:v for k,v in kwargs.items() if k not in ['temperature', 'max_tokens']}
+            client, semaphore = self._get_async_client()
+            
+            async def request():
+                async with semaphore:
+                    return await client.chat.completions.create(
+                        model=self.model_name,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=kwargs.get('temperature', 0.7),
+                        max_tokens=max_tokens,
+                        **{k:v for k,v in kwargs.items() if k not in ['temperature', 'max_tokens']}
+                    )
+            
+            response = await self._get_rate_limiter().run(
+                request,
+                tokens=estimate_tokens(prompt, max_tokens),
+                priority=priority
             )
             generated_text = response.choices[0].message.content
             logger.debug(f"Generated {len(generated_text)} characters of text")
@@ -108,4 +277,58 @@ class OpenAIProvider(LLMProvider):
         except Exception as e:
             logger.error(f"Error with OpenAI async completion: {e}")
             return f"[Error generating text: {str(e)}]"
-        # The following line would never be reached - removing it
\ No newline at end of file
+    
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Streams generated text from OpenAI as it is produced.
+        
+        Only opening the stream is retried by the rate limiter; once text
+        has been yielded a failure ends the stream with an error marker.
+        
+        Args:
+            prompt: The text prompt to generate from
+            **kwargs: Additional arguments for the generation; ``priority``
+                (a RequestPriority) orders the request in the shared queue
+            
+        Yields:
+            Successive pieces of the generated text
+        """
+        priority = kwargs.pop('priority', RequestPriority.DEFAULT)
+        max_tokens = kwargs.get('max_tokens', 500)
+        client, semaphore = self._get_async_client()
+        acquired = False
+        try:
+            logger.debug(f"Streaming completion with OpenAI model {self.model_name}")
+            
+            async def open_stream():
+                nonlocal acquired
+                await semaphore.acquire()
+                acquired = True
+                try:
+                    return await client.chat.completions.create(
+                        model=self.model_name,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=kwargs.get('temperature', 0.7),
+                        max_tokens=max_tokens,
+                        stream=True,
+                        **{k:v for k,v in kwargs.items() if k not in ['temperature', 'max_tokens']}
+                    )
+                except BaseException:
+                    semaphore.release()
+                    acquired = False
+                    raise
+            
+            stream = await self._get_rate_limiter().run(
+                open_stream,
+                tokens=estimate_tokens(prompt, max_tokens),
+                priority=priority
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error(f"Error with OpenAI streaming completion: {e}")
+            yield f"[Error generating text: {str(e)}]"
+        finally:
+            if acquired:
+                semaphore.release()
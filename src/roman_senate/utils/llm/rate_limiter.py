@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Roman Senate AI Game
+LLM Rate Limiter and Retry Scheduler
+
+This module provides a shared, adaptive token-bucket rate limiter for LLM
+providers. Requests wait in a priority queue (debate speeches ahead of
+background narrative generation), are admitted against requests-per-minute and
+tokens-per-minute budgets, and are retried with exponential backoff plus
+jitter on rate-limit (429) and server (5xx) errors.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Scheduling priority of an LLM request (lower values go first)."""
+    SPEECH = 1       # Senator speeches shown in the debate
+    DEFAULT = 5      # Stances, votes, interjections and anything unlabelled
+    BACKGROUND = 9   # Narrative and event generation
+
+
+# Errors whose status code is worth retrying
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Extract an HTTP status code from OpenAI, aiohttp or requests errors."""
+    for attr in ("status_code", "status"):
+        code = getattr(error, attr, None)
+        if isinstance(code, int):
+            return code
+    response = getattr(error, "response", None)
+    code = getattr(response, "status_code", None) or getattr(response, "status", None)
+    return code if isinstance(code, int) else None
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    """Check for transient transport failures (timeouts, refused connections)."""
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError, TimeoutError)):
+        return True
+    # Provider libraries have their own hierarchies; match by name to avoid importing them
+    names = {cls.__name__ for cls in type(error).__mro__}
+    return bool(names & {
+        "APIConnectionError", "APITimeoutError",            # openai
+        "ClientConnectionError", "ServerTimeoutError",      # aiohttp
+        "ConnectionError", "Timeout",                       # requests
+    })
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Decide whether a failed LLM request should be retried.
+
+    Args:
+        error: The exception raised by the request
+
+    Returns:
+        True for 429/5xx responses and transient connection errors
+    """
+    code = _status_code(error)
+    if code is not None:
+        return code in RETRYABLE_STATUS_CODES
+    return _is_connection_error(error)
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Read a Retry-After header (in seconds) from the error's response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or getattr(error, "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate_per_minute``.
+
+    A rate of None means the bucket is unlimited.
+    """
+
+    def __init__(self, rate_per_minute: Optional[float], capacity: Optional[float] = None):
+        self.rate_per_minute = rate_per_minute
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.rate_per_minute is None:
+            return
+        elapsed = now - self.updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_minute / 60.0)
+        self.updated = now
+
+    def delay_for(self, amount: float, now: float) -> float:
+        """
+        Get how long to wait until ``amount`` tokens are available.
+
+        Args:
+            amount: Tokens needed (clamped to the bucket capacity)
+            now: Current monotonic time
+
+        Returns:
+            Seconds to wait, 0 if the tokens are available now
+        """
+        if self.rate_per_minute is None:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) * 60.0 / self.rate_per_minute
+
+    def consume(self, amount: float) -> None:
+        """Take tokens from the bucket (call after delay_for returned 0)."""
+        if self.rate_per_minute is not None:
+            self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    Adaptive, priority-ordered rate limiter with retries.
+
+    Requests are admitted in priority order against a requests-per-minute
+    and a tokens-per-minute bucket. A 429 halves the effective request rate
+    (down to ``min_rate_fraction`` of the configured rate); each success
+    restores a little of it, so sustained throughput settles at the
+    provider's actual limit instead of oscillating into error storms.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        min_rate_fraction: float = 0.1
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request budget, or None for unlimited
+            tokens_per_minute: Token budget, or None for unlimited
+            max_retries: Retries after the first attempt for retryable errors
+            base_delay: First backoff delay in seconds
+            max_delay: Upper bound on a single backoff delay
+            min_rate_fraction: Lowest fraction of the request rate adaptation may reach
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_rate_fraction = min_rate_fraction
+
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._waiters: List[list] = []  # heap of [priority, seq, future]
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.stats = {
+            "admitted": 0,
+            "retries": 0,
+            "throttled": 0,
+            "failed": 0,
+            "wait_time": 0.0,
+        }
+
+    # --- Admission ---
+
+    def _try_reserve(self, tokens: float) -> float:
+        """Consume budget for a request if possible; otherwise return the wait."""
+        now = time.monotonic()
+        delay = max(self._requests.delay_for(1, now), self._tokens.delay_for(tokens, now))
+        if delay == 0.0:
+            self._requests.consume(1)
+            self._tokens.consume(tokens)
+        return delay
+
+    def _wake_head(self) -> None:
+        """Wake the highest-priority waiter so it can re-check the buckets."""
+        if self._waiters:
+            future = self._waiters[0][2]
+            if not future.done():
+                future.set_result(None)
+
+    async def acquire(self, tokens: float = 0, priority: int = RequestPriority.DEFAULT) -> None:
+        """
+        Wait until a request may be sent.
+
+        Args:
+            tokens: Estimated tokens the request will use
+            priority: Scheduling priority (lower goes first)
+        """
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        entry = [int(priority), next(self._seq), loop.create_future()]
+
+        with self._lock:
+            heapq.heappush(self._waiters, entry)
+        try:
+            while True:
+                with self._lock:
+                    delay = None
+                    if self._waiters[0] is entry:
+                        delay = self._try_reserve(tokens)
+                        if delay == 0.0:
+                            heapq.heappop(self._waiters)
+                            self._wake_head()
+                            self.stats["admitted"] += 1
+                            self.stats["wait_time"] += time.monotonic() - start
+                            return
+                    entry[2] = loop.create_future()
+
+                # The head sleeps until the buckets refill; everyone else waits to become head.
+                # Either way a newly queued higher-priority request can wake and overtake us.
+                try:
+                    await asyncio.wait_for(asyncio.shield(entry[2]), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    self._wake_head()
+
+    # --- Adaptation ---
+
+    def _record_throttle(self) -> None:
+        """Multiplicative decrease of the request rate after a 429."""
+        with self._lock:
+            self.stats["throttled"] += 1
+            if self.requests_per_minute is None:
+                return
+            floor = self.requests_per_minute * self.min_rate_fraction
+            self._requests.rate_per_minute = max(floor, self._requests.rate_per_minute / 2)
+            logger.warning(
+                f"LLM rate limited; lowering request rate to {self._requests.rate_per_minute:.0f}/min"
+            )
+
+    def _record_success(self) -> None:
+        """Additive increase of the request rate back toward the configured limit."""
+        with self._lock:
+            if self.requests_per_minute is None:
+                return
+            step = self.requests_per_minute * 0.05
+            self._requests.rate_per_minute = min(
+                self.requests_per_minute, self._requests.rate_per_minute + step
+            )
+
+    def backoff_delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Get the wait before a retry: exponential backoff with full jitter.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            error: The error, consulted for a Retry-After header
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        retry_after = _retry_after(error) if error is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    # --- Execution ---
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        tokens: float = 0,
+        priority: int = RequestPriority.DEFAULT
+    ) -> Any:
+        """
+        Run a request under the rate limit, retrying transient failures.
+
+        Args:
+            call: Zero-argument coroutine function that performs the request
+            tokens: Estimated tokens the request will use
+            priority: Scheduling priority (lower goes first)
+
+        Returns:
+            The request's result
+
+        Raises:
+            Exception: The last error if it is not retryable or retries run out
+        """
+        attempt = 0
+        while True:
+            await self.acquire(tokens, priority)
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if _status_code(e) == 429:
+                    self._record_throttle()
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    self.stats["failed"] += 1
+                    raise
+                delay = self.backoff_delay(attempt, e)
+                self.stats["retries"] += 1
+                logger.info(f"Retrying LLM request in {delay:.1f}s after error: {e}")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self._record_success()
+            return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduling statistics.
+
+        Returns:
+            Dictionary of admitted/retry/throttle counts, queue depth and current rate
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["queued"] = len(self._waiters)
+            stats["current_requests_per_minute"] = self._requests.rate_per_minute
+        return stats
+
+
+# Shared limiters by endpoint, so every provider talking to one API shares its budget
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, **kwargs) -> RateLimiter:
+    """
+    Get the process-wide RateLimiter for an endpoint.
+
+    Args:
+        name: Endpoint identity, e.g. "openai:https://api.openai.com/v1"
+        **kwargs: RateLimiter settings used when the limiter is first created
+
+    Returns:
+        The shared RateLimiter instance
+    """
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(**kwargs)
+            _shared_limiters[name] = limiter
+        return limiter
+
+
+def estimate_tokens(prompt: str, max_tokens: int = 500) -> int:
+    """
+    Roughly estimate the tokens a request will consume.
+
+    Args:
+        prompt: Prompt text (about four characters per token)
+        max_tokens: Completion budget requested
+
+    Returns:
+        Estimated prompt plus completion tokens
+    """
+    return len(prompt) // 4 + int(max_tokens or 0)
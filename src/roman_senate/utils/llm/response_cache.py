@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Roman Senate AI Game
+LLM Response Cache
+
+This module provides a content-addressed cache for LLM responses and a
+provider wrapper that consults it. Responses are keyed on a hash of the
+model, prompt or messages, temperature and max_tokens, held in an in-memory
+LRU in front of an on-disk SQLite tier, so re-running the same seed, year and
+topic set does not re-bill every prompt. The async provider methods run the
+SQLite reads and writes in a worker thread so the event loop is never blocked.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+
+from .base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+# Responses that report a provider failure are never cached
+ERROR_PREFIXES = ("[Error generating text:", "[Error generating response:")
+
+
+class ResponseCache:
+    """
+    Two-tier LLM response cache: an in-memory LRU backed by SQLite.
+
+    Entries expire after ``ttl`` seconds. The memory tier holds at most
+    ``max_memory_entries`` items and the disk tier at most
+    ``max_disk_entries``; the least recently used entries are evicted first.
+    ``aget()`` and ``aset()`` answer from memory directly and move any SQLite
+    work to a worker thread.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        max_memory_entries: int = 1024,
+        max_disk_entries: int = 100000
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database path, or None for a memory-only cache
+            ttl: Entry lifetime in seconds, or None for no expiry
+            max_memory_entries: Maximum entries kept in the in-memory LRU
+            max_disk_entries: Maximum entries kept in the SQLite tier
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_entries = 0  # Running row count, so stores need no COUNT(*)
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expired": 0,
+        }
+
+        if path:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_access "
+                "ON responses(last_access)"
+            )
+            self._conn.commit()
+            self._disk_entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            logger.info(f"Opened LLM response cache at {path}")
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build a content-addressed key from the request parameters.
+
+        Args:
+            **parts: Request parameters (model, prompt/messages, temperature, ...)
+
+        Returns:
+            Hex SHA-256 digest of the canonical JSON encoding
+        """
+        canonical = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at > self.ttl
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            value = self._get_memory(key, now)
+            if value is None and self._conn is not None:
+                value = self._get_disk(key, now)
+            if value is None:
+                self.stats["misses"] += 1
+            return value
+
+    async def aget(self, key: str) -> Optional[str]:
+        """
+        Look up a cached value without blocking the event loop.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            value = self._get_memory(key, now)
+            if value is not None:
+                return value
+            if self._conn is None:
+                self.stats["misses"] += 1
+                return None
+        return await asyncio.to_thread(self._get_disk_or_miss, key, now)
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value in both tiers.
+
+        Args:
+            key: Cache key from make_key()
+            value: Serialized response text
+        """
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self._set_disk(key, value, now)
+            self.stats["stores"] += 1
+
+    async def aset(self, key: str, value: str) -> None:
+        """
+        Store a value in both tiers without blocking the event loop.
+
+        Args:
+            key: Cache key from make_key()
+            value: Serialized response text
+        """
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self.stats["stores"] += 1
+            if self._conn is None:
+                return
+        await asyncio.to_thread(self._set_disk_locked, key, value, now)
+
+    def _get_memory(self, key: str, now: float) -> Optional[str]:
+        """Look up the memory tier; the lock must be held."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        value, created_at = entry
+        if not self._is_expired(created_at, now):
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return value
+        del self._memory[key]
+        self.stats["expired"] += 1
+        return None
+
+    def _get_disk(self, key: str, now: float) -> Optional[str]:
+        """Look up the SQLite tier, promoting hits to memory; the lock must be held."""
+        row = self._conn.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        if not self._is_expired(created_at, now):
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self._remember(key, value, created_at)
+            self.stats["disk_hits"] += 1
+            return value
+        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._conn.commit()
+        self._disk_entries -= 1
+        self.stats["expired"] += 1
+        return None
+
+    def _get_disk_or_miss(self, key: str, now: float) -> Optional[str]:
+        """Look up the SQLite tier from a worker thread, counting a miss."""
+        with self._lock:
+            value = self._get_disk(key, now) if self._conn is not None else None
+            if value is None:
+                self.stats["misses"] += 1
+            return value
+
+    def _set_disk(self, key: str, value: str, now: float) -> None:
+        """Write an entry to the SQLite tier; the lock must be held."""
+        if self._conn is None:
+            return
+        inserted = self._conn.execute(
+            "INSERT OR IGNORE INTO responses (key, value, created_at, last_access) "
+            "VALUES (?, ?, ?, ?)",
+            (key, value, now, now)
+        ).rowcount
+        if inserted:
+            self._disk_entries += 1
+            self._evict_disk()
+        else:
+            self._conn.execute(
+                "UPDATE responses SET value = ?, created_at = ?, last_access = ? WHERE key = ?",
+                (value, now, now, key)
+            )
+        self._conn.commit()
+
+    def _set_disk_locked(self, key: str, value: str, now: float) -> None:
+        """Write an entry to the SQLite tier from a worker thread."""
+        with self._lock:
+            self._set_disk(key, value, now)
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        """Insert into the memory LRU, evicting the least recently used entries."""
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _evict_disk(self) -> None:
+        """Trim the SQLite tier to max_disk_entries by last access time."""
+        excess = self._disk_entries - self.max_disk_entries
+        if excess > 0:
+            deleted = self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+                (excess,)
+            ).rowcount
+            self._disk_entries -= deleted
+            self.stats["evictions"] += deleted
+
+    def record_bypass(self) -> None:
+        """Count a request that skipped the cache."""
+        with self._lock:
+            self.stats["bypassed"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics.
+
+        Returns:
+            Dictionary of counters plus the overall hit rate
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["memory_entries"] = len(self._memory)
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        stats["hits"] = hits
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+                self._disk_entries = 0
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Shared caches by database path, so providers created per request share one store
+_shared_caches: Dict[Optional[str], ResponseCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_response_cache(path: Optional[str] = None, **kwargs) -> ResponseCache:
+    """
+    Get the process-wide ResponseCache for a database path.
+
+    Args:
+        path: SQLite database path, or None for a memory-only cache
+        **kwargs: ResponseCache settings used when the cache is first created
+
+    Returns:
+        The shared ResponseCache instance
+    """
+    with _shared_caches_lock:
+        cache = _shared_caches.get(path)
+        if cache is None:
+            cache = ResponseCache(path, **kwargs)
+            _shared_caches[path] = cache
+        return cache
+
+
+class CachedLLMProvider(LLMProvider):
+    """
+    LLM provider wrapper that serves repeated requests from a ResponseCache.
+
+    Requests with a temperature above zero are sampled, so they bypass the
+    cache unless ``cache_nondeterministic`` is set (useful for reproducible
+    regression runs and demos).
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: Optional[ResponseCache] = None,
+        cache_nondeterministic: bool = False
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            provider: The provider whose responses are cached
+            cache: Cache store to use (a memory-only cache if None)
+            cache_nondeterministic: Also cache requests with temperature > 0
+        """
+        self.provider = provider
+        self.cache = cache if cache is not None else ResponseCache()
+        self.cache_nondeterministic = cache_nondeterministic
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped provider's attributes (model_name, provider_name, ...)
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def _should_cache(self, temperature: Any) -> bool:
+        try:
+            sampled = float(temperature) > 0
+        except (TypeError, ValueError):
+            sampled = True
+        if sampled and not self.cache_nondeterministic:
+            self.cache.record_bypass()
+            return False
+        return True
+
+    def _key(self, method: str, temperature: Any, max_tokens: Any, **parts: Any) -> str:
+        return self.cache.make_key(
+            method=method,
+            provider=type(self.provider).__name__,
+            model=getattr(self.provider, "model_name", None),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **parts
+        )
+
+    def generate_completion(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        **kwargs
+    ) -> str:
+        """Generate text completion, serving repeats from the cache."""
+        if not self._should_cache(temperature):
+            return self.provider.generate_completion(
+                prompt, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
+
+        key = self._key("completion", temperature, max_tokens, prompt=prompt, options=kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self.provider.generate_completion(
+            prompt, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        if isinstance(result, str) and not result.startswith(ERROR_PREFIXES):
+            self.cache.set(key, result)
+        return result
+
+    def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate chat completion, serving repeats from the cache.
+
+        Only plain dictionary responses are cached; provider-specific
+        response objects are passed through untouched.
+        """
+        if not self._should_cache(temperature):
+            return self.provider.generate_chat_completion(
+                messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
+
+        key = self._key("chat", temperature, max_tokens, messages=messages, options=kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        result = self.provider.generate_chat_completion(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        if isinstance(result, dict):
+            try:
+                content = result["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                content = ""
+            if not str(content).startswith(ERROR_PREFIXES):
+                self.cache.set(key, json.dumps(result, default=str))
+        return result
+
+    async def generate_text(self, prompt: str, **kwargs) -> str:
+        """
+        Generates text based on a prompt asynchronously, using the cache.
+
+        Args:
+            prompt: The text prompt to generate from
+            **kwargs: Additional arguments for the generation
+
+        Returns:
+            Generated text response
+        """
+        temperature = kwargs.get("temperature", 0.7)
+        if not self._should_cache(temperature):
+            return await self.provider.generate_text(prompt, **kwargs)
+
+        options = {k: v for k, v in kwargs.items() if k not in ("temperature", "max_tokens", "priority")}
+        key = self._key("text", temperature, kwargs.get("max_tokens", 500), prompt=prompt, options=options)
+        cached = await self.cache.aget(key)
+        if cached is not None:
+            return cached
+
+        result = await self.provider.generate_text(prompt, **kwargs)
+        if isinstance(result, str) and not result.startswith(ERROR_PREFIXES):
+            await self.cache.aset(key, result)
+        return result
+
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Streams generated text, replaying cached responses as a single chunk.
+        
+        Streamed and non-streamed requests share cache entries; a streamed
+        miss is stored once the whole response has arrived.
+        
+        Args:
+            prompt: The text prompt to generate from
+            **kwargs: Additional arguments for the generation
+            
+        Yields:
+            Successive pieces of the generated text
+        """
+        temperature = kwargs.get("temperature", 0.7)
+        if not self._should_cache(temperature):
+            async for chunk in self.provider.stream_text(prompt, **kwargs):
+                yield chunk
+            return
+
+        options = {k: v for k, v in kwargs.items() if k not in ("temperature", "max_tokens", "priority")}
+        key = self._key("text", temperature, kwargs.get("max_tokens", 500), prompt=prompt, options=options)
+        cached = await self.cache.aget(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        async for chunk in self.provider.stream_text(prompt, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        result = "".join(chunks)
+        # An error marker can arrive mid-stream, so check the whole text
+        if result and not any(prefix in result for prefix in ERROR_PREFIXES):
+            await self.cache.aset(key, result)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for the underlying cache."""
+        return self.cache.get_stats()
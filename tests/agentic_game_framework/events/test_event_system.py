@@ -1,15 +1,20 @@
 """
 Unit tests for the event system components.
 
-This module contains tests for the BaseEvent and EventBus classes.
+This module contains tests for the BaseEvent, EventBus, PriorityEventQueue and
+AsyncEventBus classes.
 """
 
 import pytest
 from datetime import datetime
+import asyncio
+import time
 from typing import List
 
+from src.agentic_game_framework.events.async_event_bus import AsyncEventBus
 from src.agentic_game_framework.events.base import BaseEvent, EventHandler
 from src.agentic_game_framework.events.event_bus import EventBus
+from src.agentic_game_framework.events.event_queue import OverflowPolicy, PriorityEventQueue
 
 
 class MockEvent(BaseEvent):
@@ -104,10 +109,10 @@ def test_event_missing_event_type():
 
 # --- EventBus Tests ---
 
-@pytest.fixture
-def event_bus_setup():
-    """Fixture providing an EventBus and handlers for testing."""
-    event_bus = EventBus()
+@pytest.fixture(params=[False, True], ids=["locked_dispatch", "compiled_dispatch"])
+def event_bus_setup(request):
+    """Fixture providing an EventBus (in each dispatch mode) and handlers for testing."""
+    event_bus = EventBus(compiled_dispatch=request.param)
     handler1 = MockEventHandler()
     handler2 = MockEventHandler()
     handler3 = MockEventHandler()
@@ -273,4 +278,292 @@ def test_event_filter(event_bus_setup):
     # Remove the filter and check that events are no longer blocked
     event_bus.remove_filter(filter_func)
     event_bus.publish(MockEvent(event_type="test", source="blocked_source"))
-    assert len(handler1.handled_events) == 2
\ No newline at end of file
+    assert len(handler1.handled_events) == 2
+
+
+def test_compiled_dispatch_snapshot():
+    """Test that subscription changes during dispatch apply from the next event."""
+    event_bus = EventBus(compiled_dispatch=True)
+    late_handler = MockEventHandler()
+    
+    class SubscribingHandler(EventHandler):
+        def handle_event(self, event):
+            event_bus.subscribe("test", late_handler, priority=-1)
+    
+    event_bus.subscribe("test", SubscribingHandler(), priority=1)
+    
+    event_bus.publish(MockEvent(event_type="test"))
+    assert late_handler.handled_events == []
+    
+    event_bus.publish(MockEvent(event_type="test"))
+    assert len(late_handler.handled_events) == 1
+
+
+def test_compiled_dispatch_priority_change():
+    """Test that re-subscribing with a new priority reorders every compiled type."""
+    event_bus = EventBus(compiled_dispatch=True)
+    first = MockEventHandler()
+    second = MockEventHandler()
+    
+    event_bus.subscribe("type1", first, priority=2)
+    event_bus.subscribe("type1", second, priority=1)
+    event_bus.subscribe("type2", first, priority=0)
+    
+    assert event_bus.get_handlers("type1") == [second, first]
+
+
+def test_compiled_dispatch_timing_sampling():
+    """Test that handler timings are only collected for sampled events."""
+    unsampled_bus = EventBus(compiled_dispatch=True)
+    sampled_bus = EventBus(compiled_dispatch=True, timing_sample_rate=0.5)
+    handler = MockEventHandler()
+    unsampled_bus.subscribe("test", handler)
+    sampled_bus.subscribe("test", handler)
+    
+    for _ in range(10):
+        unsampled_bus.publish(MockEvent(event_type="test"))
+        sampled_bus.publish(MockEvent(event_type="test"))
+    
+    assert len(handler.handled_events) == 20
+    assert unsampled_bus._handler_metrics == {}
+    assert sampled_bus._handler_metrics[handler]["calls"] == 5
+    assert sampled_bus._metrics["handler_calls"] == 10
+
+
+# --- PriorityEventQueue Tests ---
+
+def test_queue_priority_order():
+    """Test that higher priorities are dispatched first and ties keep publish order."""
+    queue = PriorityEventQueue(maxsize=10)
+    events = [MockEvent(event_type=f"e{i}") for i in range(4)]
+    queue.put(events[0], priority=0)
+    queue.put(events[1], priority=5)
+    queue.put(events[2], priority=0)
+    queue.put(events[3], priority=5)
+    
+    assert queue.get_batch(10, timeout=0) == [events[1], events[3], events[0], events[2]]
+    assert queue.get_batch(10, timeout=0) == []
+
+
+def test_queue_drop_policies():
+    """Test the drop-oldest and drop-lowest-priority overflow policies."""
+    oldest_queue = PriorityEventQueue(maxsize=2, policy="drop_oldest")
+    lowest_queue = PriorityEventQueue(maxsize=2, policy=OverflowPolicy.DROP_LOWEST_PRIORITY)
+    events = [MockEvent(event_type=f"e{i}") for i in range(4)]
+    for queue in (oldest_queue, lowest_queue):
+        queue.put(events[0], priority=1)
+        queue.put(events[1], priority=0)
+    
+    assert oldest_queue.put(events[2], priority=0)
+    assert oldest_queue.get_batch(10, timeout=0) == [events[1], events[2]]
+    
+    # An event less important than everything queued is the one dropped
+    assert not lowest_queue.put(events[3], priority=-1)
+    assert lowest_queue.put(events[2], priority=0)
+    assert lowest_queue.get_batch(10, timeout=0) == [events[0], events[2]]
+    assert lowest_queue.get_stats()["dropped"] == 2
+
+
+def test_queue_coalesce():
+    """Test that coalescing replaces a queued event with the same key in place."""
+    queue = PriorityEventQueue(maxsize=10, policy="coalesce",
+                               coalesce_key=lambda event: event.data.get("market"))
+    first = MockEvent(event_type="price", data={"market": "forum", "price": 1})
+    other = MockEvent(event_type="price", data={"market": "ostia", "price": 2})
+    latest = MockEvent(event_type="price", data={"market": "forum", "price": 3})
+    
+    queue.put(first)
+    queue.put(other)
+    queue.put(latest)
+    
+    assert queue.get_batch(10, timeout=0) == [latest, other]
+    assert queue.get_stats()["coalesced"] == 1
+
+
+def test_queue_coalesce_priority_changes_stay_bounded():
+    """Test that coalesced events changing priority do not pile up behind a stalled head."""
+    queue = PriorityEventQueue(maxsize=10, policy="coalesce",
+                               coalesce_key=lambda event: event.data.get("market"))
+    head = MockEvent(event_type="price", data={"market": "ostia"})
+    queue.put(head)
+    for i in range(1000):
+        queue.put(MockEvent(event_type="price", data={"market": "forum", "price": i}), priority=i % 2)
+    
+    assert len(queue) == 2
+    assert all(len(level) <= 2 for level in queue._levels.values())
+    batch = queue.get_batch(10, timeout=0)
+    assert [event.data.get("price") for event in batch] == [999, None]
+
+
+def test_queue_block_timeout():
+    """Test that a full blocking queue waits for space and gives up after the timeout."""
+    queue = PriorityEventQueue(maxsize=1)
+    assert queue.put(MockEvent())
+    assert not queue.put(MockEvent(), timeout=0.01)
+    assert not queue.put(MockEvent(), block=False)
+    
+    stats = queue.get_stats()
+    assert stats["depth"] == 1
+    assert stats["dropped"] == 2
+
+
+def test_async_bus_bounded_queue():
+    """Test the threaded bus dispatching urgent events first from a bounded queue."""
+    event_bus = EventBus(enable_async=True, batch_size=10, max_queue_size=3,
+                         overflow_policy="drop_lowest_priority")
+    handler = MockEventHandler()
+    event_bus.subscribe_to_all(handler)
+    event_bus.set_event_priority("urgent", 10)
+    
+    # Hold the worker so the published events pile up in the queue
+    with event_bus._lock:
+        blocker = MockEvent(event_type="blocker")
+        event_bus.publish(blocker)
+        deadline = time.time() + 1.0
+        while len(event_bus._event_queue) and time.time() < deadline:
+            time.sleep(0.001)
+        for i in range(4):
+            event_bus.publish(MockEvent(event_type="rumor", data={"n": i}))
+        event_bus.publish(MockEvent(event_type="urgent"))
+    event_bus.stop()
+    
+    types = [event.event_type for event in handler.handled_events]
+    assert types[:2] == ["blocker", "urgent"]
+    assert len(types) == 4
+    metrics = event_bus.get_metrics()
+    assert metrics["queue"]["dropped"] == 2
+    assert metrics["queue"]["high_water_mark"] == 3
+    assert metrics["events_processed"] == 4
+
+
+# --- AsyncEventBus Tests ---
+
+@pytest.mark.asyncio
+async def test_async_bus_mixed_handlers():
+    """Test that the async bus runs EventHandlers, sync functions and coroutines."""
+    handler = MockEventHandler()
+    seen = []
+
+    async def coroutine_handler(event):
+        await asyncio.sleep(0)
+        seen.append(("async", event.event_type))
+
+    async with AsyncEventBus() as event_bus:
+        event_bus.subscribe("test", handler)
+        event_bus.subscribe("test", coroutine_handler)
+        event_bus.subscribe_to_all(lambda event: seen.append(("sync", event.event_type)))
+
+        await event_bus.publish(MockEvent(event_type="test"))
+        await event_bus.publish(MockEvent(event_type="other"))
+        await event_bus.drain()
+
+    assert len(handler.handled_events) == 1
+    assert sorted(seen) == [("async", "test"), ("sync", "other"), ("sync", "test")]
+    assert event_bus.get_metrics()["events_processed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_bus_concurrency_per_type():
+    """Test that handlers overlap up to the per-type concurrency limit."""
+    event_bus = AsyncEventBus(max_concurrency_per_type=3)
+    running = 0
+    peak = 0
+
+    async def slow_handler(event):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    event_bus.subscribe("interjection", slow_handler)
+    for _ in range(10):
+        await event_bus.publish(MockEvent(event_type="interjection"))
+    await event_bus.drain()
+    await event_bus.stop()
+
+    assert peak == 3
+    assert event_bus.get_metrics()["handler_calls"] == 10
+
+
+@pytest.mark.asyncio
+async def test_async_bus_backpressure():
+    """Test that publish waits while the bounded queue is full."""
+    event_bus = AsyncEventBus(max_queue_size=2, max_concurrency_per_type=1, max_in_flight=1)
+    release = asyncio.Event()
+
+    async def blocked_handler(event):
+        await release.wait()
+
+    event_bus.subscribe("test", blocked_handler)
+    # One event is being handled, two wait for their type's slot, one is held by
+    # the dispatcher and two fill the queue
+    for _ in range(6):
+        await event_bus.publish(MockEvent(event_type="test"))
+        await asyncio.sleep(0)
+
+    publisher = asyncio.ensure_future(event_bus.publish(MockEvent(event_type="test")))
+    await asyncio.sleep(0.01)
+    assert not publisher.done()
+    with pytest.raises(asyncio.QueueFull):
+        event_bus.publish_nowait(MockEvent(event_type="test"))
+
+    release.set()
+    assert await publisher
+    await event_bus.drain()
+    await event_bus.stop()
+    assert event_bus.get_metrics()["events_processed"] == 7
+
+
+@pytest.mark.asyncio
+async def test_async_bus_slow_type_does_not_starve_others():
+    """Test that events queued behind a saturated type hold no global slot."""
+    event_bus = AsyncEventBus(max_concurrency_per_type=2, max_in_flight=8)
+    release = asyncio.Event()
+    fast_done = asyncio.Event()
+
+    async def slow_handler(event):
+        await release.wait()
+
+    async def fast_handler(event):
+        fast_done.set()
+
+    event_bus.subscribe("slow", slow_handler)
+    event_bus.subscribe("fast", fast_handler)
+    for _ in range(20):
+        await event_bus.publish(MockEvent(event_type="slow"))
+    await event_bus.publish(MockEvent(event_type="fast"))
+
+    # The fast event runs while every slow event is still blocked
+    await asyncio.wait_for(fast_done.wait(), timeout=1)
+    metrics = event_bus.get_metrics()
+    assert metrics["in_flight"] == 2
+    assert metrics["waiting"] == 18
+
+    release.set()
+    await event_bus.drain()
+    await event_bus.stop()
+    assert event_bus.get_metrics()["events_processed"] == 21
+
+
+@pytest.mark.asyncio
+async def test_async_bus_errors_and_filters():
+    """Test that handler errors are counted and filtered events never queue."""
+    event_bus = AsyncEventBus()
+    handler = MockEventHandler()
+
+    async def failing_handler(event):
+        raise ValueError("boom")
+
+    event_bus.subscribe("test", failing_handler, priority=1)
+    event_bus.subscribe("test", handler)
+    event_bus.add_filter(lambda event: event.source != "blocked")
+
+    assert not await event_bus.publish(MockEvent(event_type="test", source="blocked"))
+    assert await event_bus.publish(MockEvent(event_type="test"))
+    await event_bus.stop()
+
+    metrics = event_bus.get_metrics()
+    assert len(handler.handled_events) == 1
+    assert metrics["events_filtered"] == 1
+    assert metrics["handler_errors"] == 1
@@ -0,0 +1,95 @@
+"""
+Unit tests for the embedding pipeline.
+
+This module covers the hashing TF-IDF embedder, the persistent embedding
+cache, and batched embedding through VectorStore and RAGClient.
+"""
+
+import numpy as np
+
+from src.agentic_game_framework.knowledge.embeddings import CachedEmbedder, Embedder, HashingEmbedder
+from src.agentic_game_framework.knowledge.rag_client import RAGClient
+from src.agentic_game_framework.knowledge.vector_store import VectorStore, VectorStoreConfig
+
+
+class CountingEmbedder(Embedder):
+    """Embedder that records every batch it is asked to embed."""
+
+    def __init__(self):
+        self.inner = HashingEmbedder(64)
+        self.batches = []
+
+    @property
+    def dimension(self):
+        return self.inner.dimension
+
+    def embed(self, texts):
+        self.batches.append(list(texts))
+        return self.inner.embed(texts)
+
+
+def test_hashing_embedder_similarity():
+    """Test that texts sharing vocabulary are closer than unrelated texts."""
+    embedder = HashingEmbedder(256)
+    vectors = embedder.embed([
+        "The grain supply from Egypt is failing",
+        "Egypt grain shipments failing this winter",
+        "Legions march north against the Gauls"
+    ])
+
+    assert vectors.shape == (3, 256)
+    assert vectors.dtype == np.float32
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert vectors[0] @ vectors[1] > 0.3 > vectors[0] @ vectors[2]
+    # Deterministic across instances (and processes)
+    assert np.array_equal(HashingEmbedder(256).embed_one("Carthago delenda est"),
+                          embedder.embed_one("Carthago delenda est"))
+
+
+def test_hashing_embedder_idf():
+    """Test that fitting IDF weights down words common to the corpus."""
+    corpus = [f"senate debate about topic {word}" for word in ("grain", "war", "roads", "taxes")]
+    embedder = HashingEmbedder(512, ngram_range=(1, 1)).fit(corpus)
+    plain = HashingEmbedder(512, ngram_range=(1, 1))
+
+    query, match = "senate debate grain", "grain"
+    assert embedder.embed_one(query) @ embedder.embed_one(match) > plain.embed_one(query) @ plain.embed_one(match)
+    assert embedder.name != plain.name
+
+
+def test_cached_embedder_batches_and_persists(tmp_path):
+    """Test that only unseen texts are embedded, once per batch, and the cache survives a restart."""
+    counting = CountingEmbedder()
+    path = str(tmp_path / "cache" / "embeddings.json")
+    cached = CachedEmbedder(counting, cache_path=path)
+
+    first = cached.embed(["Vote on the lex agraria", "Vote on the lex agraria", "Pompey returns"])
+    cached.embed(["Pompey returns", "Crassus funds the games"])
+
+    assert counting.batches == [["Vote on the lex agraria", "Pompey returns"], ["Crassus funds the games"]]
+    assert (cached.hits, cached.misses) == (2, 3)
+    assert np.array_equal(first[0], first[1])
+
+    assert cached.save()
+    restarted = CachedEmbedder(CountingEmbedder(), cache_path=path)
+    assert len(restarted) == 3
+    assert np.array_equal(restarted.embed(["Pompey returns"])[0], first[2])
+    assert restarted.embedder.batches == []
+
+
+def test_store_embeds_once_per_batch():
+    """Test that add_texts and search_many make one embedding call each."""
+    counting = CountingEmbedder()
+    client = RAGClient(VectorStore(VectorStoreConfig(dimension=64), embedder=counting))
+
+    client.add_knowledge_batch([
+        "Grain prices rise in the forum",
+        "The fleet sails for Sicily",
+        "Grain ships arrive at Ostia"
+    ])
+    results = client.vector_store.search_many(["grain prices", "fleet Sicily"], limit=1)
+
+    assert len(counting.batches) == 2
+    assert results[0][0][0] == "Grain prices rise in the forum"
+    assert results[1][0][0] == "The fleet sails for Sicily"
+    assert client.search("ships at Ostia", limit=1)[0][0] == "Grain ships arrive at Ostia"
@@ -0,0 +1,261 @@
+"""
+Unit tests for the in-memory vector store.
+
+This module checks the matrix-backed MemoryVectorStore against brute-force
+similarity ranking, and covers filtering, batched search, tombstones and the
+on-disk format. The approximate LSH and FAISS stores are checked for recall
+against the exact store.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src.agentic_game_framework.knowledge.ann_store import FAISSVectorStore, LSHVectorStore
+from src.agentic_game_framework.knowledge.vector_store import (
+    COLUMNAR_FORMAT, FAISS_AVAILABLE, MemoryVectorStore, VectorStore, VectorStoreBackend,
+    VectorStoreConfig, VectorStoreItem, vectors_path
+)
+
+
+@pytest.fixture
+def store_factory():
+    """Fixture providing a factory for stores of random vectors tagged by faction."""
+    def create(metric="cosine", count=200, dimension=16, seed=0):
+        rng = np.random.default_rng(seed)
+        store = MemoryVectorStore(VectorStoreConfig(dimension=dimension, distance_metric=metric))
+        factions = ["Optimates", "Populares"]
+        items = [
+            VectorStoreItem(vector, f"memory {i}", {"faction": factions[i % 2], "importance": i / count})
+            for i, vector in enumerate(rng.normal(size=(count, dimension)))
+        ]
+        store.add_items(items)
+        return store, items, rng
+    return create
+
+
+@pytest.fixture
+def clustered_factory():
+    """Fixture providing a factory for clustered vectors, which LSH separates well."""
+    def create(count, dimension=32, seed=1):
+        rng = np.random.default_rng(seed)
+        centers = rng.normal(size=(50, dimension))
+        return centers[rng.integers(0, 50, count)] + 0.2 * rng.normal(size=(count, dimension)), rng
+    return create
+
+
+def brute_force(store, query, limit, keep=lambda item: True):
+    """Rank items the way the original per-item loop did."""
+    scored = [(item, store._calculate_similarity(query, item.vector)) for item in store.items.values() if keep(item)]
+    scored.sort(key=lambda pair: pair[1], reverse=True)
+    return scored[:limit]
+
+
+@pytest.mark.parametrize("metric", ["cosine", "euclidean", "dot_product"])
+def test_search_matches_brute_force(metric, store_factory):
+    """Test that matrix search returns the same ranking as scoring item by item."""
+    store, _, rng = store_factory(metric)
+    query = rng.normal(size=16)
+
+    results = store.search_by_vector(query, limit=5)
+    expected = brute_force(store, query, 5)
+
+    assert [item.id for item, _ in results] == [item.id for item, _ in expected]
+    assert np.allclose([score for _, score in results], [score for _, score in expected], atol=1e-4)
+
+
+def test_metadata_filters(store_factory):
+    """Test equality and comparison filters."""
+    store, _, rng = store_factory()
+    query = rng.normal(size=16)
+
+    results = store.search_by_vector(query, limit=10, filter_metadata={"faction": "Populares"})
+    expected = brute_force(store, query, 10, lambda item: item.metadata["faction"] == "Populares")
+    assert [item.id for item, _ in results] == [item.id for item, _ in expected]
+
+    results = store.search_by_vector(
+        query, limit=100, filter_metadata={"faction": "Optimates", "importance": {"$gte": 0.9}}
+    )
+    assert len(results) == 10
+    assert all(item.metadata["importance"] >= 0.9 for item, _ in results)
+    assert store.search_by_vector(query, filter_metadata={"faction": "Equites"}) == []
+
+
+def test_batched_search(store_factory):
+    """Test that a batch of queries gives the same results as single searches."""
+    store, _, rng = store_factory()
+    queries = rng.normal(size=(8, 16))
+
+    batched = store.search_by_vectors(queries, limit=3)
+
+    assert len(batched) == 8
+    for query, results in zip(queries, batched):
+        assert [item.id for item, _ in results] == [item.id for item, _ in store.search_by_vector(query, limit=3)]
+
+
+def test_delete_tombstones_and_compaction(store_factory):
+    """Test that deleted items disappear from results and tombstones get compacted."""
+    store, items, rng = store_factory(count=100)
+    store.compaction_ratio = 0.5
+
+    for item in items[:40]:
+        assert store.delete_item(item.id)
+    assert store._tombstones == 40
+    results = store.search_by_vector(rng.normal(size=16), limit=100)
+    assert {item.id for item, _ in results} == {item.id for item in items[40:]}
+
+    for item in items[40:60]:
+        store.delete_item(item.id)
+    # The matrix was rebuilt when half of its 100 rows were dead
+    assert store._size == 50
+    assert store._tombstones == 10
+    assert store.search_by_vector(items[70].vector, limit=1)[0][0] is items[70]
+    assert not store.delete_item(items[0].id)
+
+
+def test_replace_item_and_reload(tmp_path):
+    """Test re-adding an id replaces its vector, and save/load rebuilds the matrix."""
+    store = VectorStore(VectorStoreConfig(dimension=4))
+    item_id = store._store.add_item(VectorStoreItem(np.array([1.0, 0, 0, 0]), "old", item_id="senator"))
+    store._store.add_item(VectorStoreItem(np.array([0, 1.0, 0, 0]), "new", item_id=item_id))
+    store.add_item(np.array([0, 0, 1.0, 0]), "other")
+
+    assert store.search_by_vector(np.array([0, 1.0, 0, 0]), limit=1) == [("new", pytest.approx(1.0))]
+
+    path = str(tmp_path / "store.json")
+    assert store.save(path)
+    restored = VectorStore(VectorStoreConfig(dimension=4))
+    assert restored.load(path)
+    assert restored.search_by_vectors([np.array([0, 1.0, 0, 0])], limit=2)[0][0] == ("new", pytest.approx(1.0))
+
+
+# --- Approximate stores ---
+
+def test_lsh_recall_with_incremental_inserts_and_deletes(clustered_factory):
+    """Test LSH recall against the exact store while rows are added and deleted."""
+    vectors, rng = clustered_factory(6000)
+    config = VectorStoreConfig(dimension=32)
+    exact, lsh = MemoryVectorStore(config), LSHVectorStore(config)
+    items = [VectorStoreItem(vector, f"memory {i}", item_id=str(i)) for i, vector in enumerate(vectors)]
+    # Bulk load, then single inserts that stay in the unsorted tail
+    for store in (exact, lsh):
+        store.add_items(items[:5000])
+        for item in items[5000:5100]:
+            store.add_item(item)
+        for item in items[:500]:
+            store.delete_item(item.id)
+    assert lsh._sorted_upto < lsh._size
+
+    queries = vectors[rng.integers(500, 5100, 50)] + 0.05 * rng.normal(size=(50, 32))
+    recall = np.mean([
+        len({item.id for item, _ in lsh.search_by_vector(query, 10)} &
+            {item.id for item, _ in exact.search_by_vector(query, 10)}) / 10
+        for query in queries
+    ])
+    assert recall >= 0.9
+    found = {item.id for query in queries for item, _ in lsh.search_by_vector(query, 10)}
+    assert not found & {str(i) for i in range(500)}
+
+
+def test_lsh_persistence(tmp_path, clustered_factory):
+    """Test that a reloaded LSH store answers queries like the original."""
+    vectors, rng = clustered_factory(3000)
+    store = VectorStore(VectorStoreConfig(dimension=32, backend=VectorStoreBackend.LSH))
+    for i, vector in enumerate(vectors):
+        store.add_item(vector, f"memory {i}", {"faction": i % 2})
+    queries = vectors[:5]
+
+    path = str(tmp_path / "lsh.json")
+    assert store.save(path)
+    restored = VectorStore(VectorStoreConfig(dimension=32, backend=VectorStoreBackend.LSH))
+    assert restored.load(path)
+
+    assert restored.search_by_vectors(queries, limit=5) == store.search_by_vectors(queries, limit=5)
+    assert restored.search_by_vector(queries[0], 3, {"faction": 1}) == \
+        store.search_by_vector(queries[0], 3, {"faction": 1})
+
+
+def test_ann_backend_selection():
+    """Test that the ANN backend uses FAISS when installed and LSH otherwise."""
+    store = VectorStore(VectorStoreConfig(dimension=8, backend=VectorStoreBackend.ANN))
+    expected = FAISSVectorStore if FAISS_AVAILABLE else LSHVectorStore
+    assert type(store._store) is expected
+
+
+@pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS is not installed")
+def test_faiss_store(tmp_path, clustered_factory):
+    """Test FAISS HNSW search, deletes and index persistence."""
+    vectors, rng = clustered_factory(3000)
+    store = FAISSVectorStore(VectorStoreConfig(dimension=32))
+    items = [VectorStoreItem(vector, f"memory {i}", item_id=str(i)) for i, vector in enumerate(vectors)]
+    store.add_items(items)
+    store.delete_item("0")
+
+    assert store.search_by_vector(vectors[1], 1)[0][0].id == "1"
+    assert "0" not in {item.id for item, _ in store.search_by_vector(vectors[0], 10)}
+
+    path = str(tmp_path / "faiss.json")
+    assert store.save(path)
+    restored = FAISSVectorStore(VectorStoreConfig(dimension=32))
+    assert restored.load(path)
+    assert restored._index.ntotal == len(restored.items)
+    assert restored.search_by_vector(vectors[1], 1)[0][0].id == "1"
+
+
+# --- Persistence format ---
+
+def test_columnar_save_and_mmap_load(tmp_path, store_factory):
+    """Test the .npy + sidecar format, memory-mapped loading and writes after load."""
+    store, items, rng = store_factory("euclidean", count=50)
+    store.delete_item(items[0].id)
+    path = str(tmp_path / "knowledge" / "store.json")
+    assert store.save(path)
+
+    assert os.path.exists(vectors_path(path))
+    with open(path) as f:
+        sidecar = json.load(f)
+    assert sidecar["format"] == COLUMNAR_FORMAT
+    assert sidecar["rows"] == 49
+
+    restored = MemoryVectorStore(VectorStoreConfig(dimension=16, distance_metric="euclidean"))
+    assert restored.load(path)
+    assert isinstance(restored._matrix, np.memmap)
+    assert restored.get_item(items[0].id) is None
+    assert restored.get_item(items[1].id).metadata == items[1].metadata
+    query = rng.normal(size=16)
+    assert [(item.id, pytest.approx(score)) for item, score in restored.search_by_vector(query, 5)] == \
+        [(item.id, score) for item, score in store.search_by_vector(query, 5)]
+
+    # The read-only mapping is copied on the first insert
+    new_id = restored.add_item(VectorStoreItem(query, "new"))
+    assert not isinstance(restored._matrix, np.memmap)
+    assert restored.search_by_vector(query, 1)[0][0].id == new_id
+
+
+@pytest.mark.parametrize("backend", [VectorStoreBackend.MEMORY, VectorStoreBackend.LSH])
+def test_empty_save_and_load(tmp_path, backend):
+    """Test that an empty store round-trips and takes vectors afterwards."""
+    path = str(tmp_path / "empty.json")
+    assert VectorStore(VectorStoreConfig(dimension=8, backend=backend)).save(path)
+    assert np.load(vectors_path(path)).shape == (0, 8)
+
+    restored = VectorStore(VectorStoreConfig(dimension=8, backend=backend))
+    assert restored.load(path)
+    assert restored.search_by_vector(np.ones(8), 3) == []
+    restored.add_item(np.ones(8), "first")
+    assert restored.search_by_vector(np.ones(8), 1)[0][0] == "first"
+
+
+def test_load_legacy_json(tmp_path):
+    """Test that stores saved as a JSON object of items still load."""
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps({
+        "a": {"id": "a", "vector": [1.0, 0.0], "content": "Carthago", "metadata": {"topic": "war"}},
+        "b": {"id": "b", "vector": [0.0, 1.0], "content": "Annona", "metadata": {}}
+    }, indent=2))
+
+    store = MemoryVectorStore(VectorStoreConfig(dimension=2))
+    assert store.load(str(path))
+    assert store.search_by_vector(np.array([0.9, 0.1]), 1, {"topic": "war"})[0][0].content == "Carthago"
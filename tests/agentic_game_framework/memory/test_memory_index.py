@@ -0,0 +1,138 @@
+"""
+Unit tests for MemoryIndex.
+
+This module covers stemmed full-text search, BM25 top-k retrieval, and
+removing and updating memories through the forward index, and the
+query cache.
+"""
+
+import pytest
+
+from src.agentic_game_framework.memory.memory_index import MemoryIndex
+from src.agentic_game_framework.memory.memory_interface import MemoryItem
+from src.agentic_game_framework.memory.text_search import analyze, stem
+
+
+@pytest.fixture
+def index():
+    """Fixture providing a MemoryIndex holding four senate memories."""
+    index = MemoryIndex()
+    contents = [
+        "The senate debated the grain law",
+        "Grain ships from Egypt were delayed, grain prices rose and the grain dole shrank",
+        "Pirates raided Ostia while the senators debated",
+        "A long speech about the provinciae, the legions and the aqueducts of the city"
+    ]
+    for i, content in enumerate(contents):
+        index.index_memory(MemoryItem(f"m{i}", 1000.0 + i, content, importance=0.1 + 0.2 * i,
+                                      associations={"speaker": "cato" if i % 2 else "cicero"}))
+    return index
+
+
+def test_stemmer_conflates_english_and_latin_forms():
+    """Test that inflected forms share a stem."""
+    assert stem("debates") == stem("debated") == stem("debate")
+    assert stem("provinciae") == stem("provincia")
+    assert stem("legions") == stem("legion")
+    assert stem("cities") == stem("city")
+    assert analyze("It is the Senate's law!") == ["the", "senat", "law"]
+
+
+def test_text_filter_matches_stemmed_words(index):
+    """Test that the text filter matches other forms of the query words."""
+    assert [m.id for m in index.search({"text": "debates"})] == ["m2", "m0"]
+    assert [m.id for m in index.search({"text": "senate debating"})] == ["m0"]
+
+
+def test_search_relevant_ranks_with_bm25(index):
+    """Test that the most relevant memories come first, not the newest."""
+    results = index.search_relevant("grain debate", limit=2)
+
+    assert [memory.id for memory, _ in results] == ["m0", "m1"]
+    assert results[0][1] > results[1][1] > 0
+    assert [m.id for m, _ in index.search_relevant("grain", query={"associations": {"speaker": "cato"}})] == ["m1"]
+    assert index.search_relevant("aqueduct", importance_threshold=0.9) == []
+
+
+def test_removed_memories_leave_the_text_index(index):
+    """Test that removed and updated memories are no longer found under old words."""
+    index.remove_memory("m2")
+    index.update_memory(MemoryItem("m0", 1000.0, "The consul spoke", importance=0.1))
+
+    assert index.search({"text": "pirates"}) == []
+    assert {m.id for m, _ in index.search_relevant("debate grain consul")} == {"m0", "m1"}
+    assert "raid" not in index._text_index
+
+
+def test_update_in_place_moves_only_changed_entries(index):
+    """Test that a memory changed in place is unindexed under its old fields."""
+    memory = index.get_memory("m1")
+
+    memory.timestamp = 500.0
+    memory.importance = 0.95
+    memory.associations = {"speaker": "cicero"}
+    memory.content = "The consul spoke"
+    index.update_memory(memory)
+
+    assert [m.id for m in index.search({"timestamp_max": 999})] == ["m1"]
+    assert [m.id for m in index.search({"importance_min": 0.9})] == ["m1"]
+    assert [m.id for m in index.search({"associations": {"speaker": "cato"}})] == ["m3"]
+    assert index.search({"text": "egypt"}) == []
+    assert index.remove_memory("m1")
+    assert index.search({"timestamp_max": 999}) == []
+
+
+def test_timestamp_index_survives_many_removals():
+    """Test range search across timestamp blocks while half the memories are removed."""
+    index = MemoryIndex()
+    for i in range(3000):
+        index.index_memory(MemoryItem(f"m{i}", float(i % 1500), f"memory {i}"))
+    for i in range(0, 3000, 2):
+        assert index.remove_memory(f"m{i}")
+
+    found = index._search_timestamp_range(100, 200)
+
+    assert found == {f"m{i}" for i in range(1, 3000, 2) if 100 <= i % 1500 <= 200}
+    assert len(index._timestamp_index) == 1500
+    assert list(index._timestamp_index) == sorted(index._timestamp_index)
+
+
+def test_query_cache_survives_unrelated_writes(index):
+    """Test that a write only drops the cached searches it could change."""
+    grain = index.search({"text": "grain"})
+    cato = index.search({"associations": {"speaker": "cato"}})
+    early = index.search({"timestamp_max": 1001})
+
+    index.index_memory(MemoryItem("m4", 2000.0, "Pirates seen near Ostia", associations={"speaker": "cicero"}))
+
+    assert index.search({"text": "grain"}) is grain
+    assert index.search({"associations": {"speaker": "cato"}}) is cato
+    assert index.search({"timestamp_max": 1001}) is early
+
+    index.index_memory(MemoryItem("m5", 2001.0, "More grain from Sicily", associations={"speaker": "cato"}))
+    index.remove_memory("m0")
+
+    assert [m.id for m in index.search({"text": "grain"})] == ["m5", "m1"]
+    assert [m.id for m in index.search({"associations": {"speaker": "cato"}})] == ["m5", "m3", "m1"]
+    assert [m.id for m in index.search({"timestamp_max": 1001})] == ["m1"]
+
+    metrics = index.get_metrics()
+    assert metrics["cache_hits"] == 3
+    assert metrics["cache_invalidations"] == 3
+    assert metrics["cache_hit_rate"] == 3 / 9
+
+
+def test_query_cache_evicts_least_recently_used():
+    """Test that a cache hit protects an entry from eviction."""
+    index = MemoryIndex(cache_size=2)
+    index.index_memory(MemoryItem("m0", 1.0, "grain and pirates and legions"))
+    index.search({"text": "grain"})
+    index.search({"text": "pirates"})
+    index.search({"text": "grain"})
+
+    index.search({"text": "legions"})
+
+    assert index.get_metrics()["cache_evictions"] == 1
+    index.search({"text": "grain"})
+    index.search({"text": "pirates"})
+    assert index.get_metrics()["cache_hits"] == 2
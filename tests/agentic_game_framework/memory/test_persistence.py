@@ -0,0 +1,104 @@
+"""
+Unit tests for memory persistence.
+
+This module covers the SQLite persistence manager and a MemoryStore that
+auto-saves single memories to it and answers filters in SQL.
+"""
+
+import pytest
+
+from src.agentic_game_framework.memory.memory_interface import MemoryItem
+from src.agentic_game_framework.memory.persistence import MemoryStore, SQLitePersistenceManager
+
+EVENT_TYPES = ("speech", "vote", "debate")
+
+
+@pytest.fixture
+def memories():
+    """Fixture providing thirty memories of speeches, votes and debates."""
+    return [
+        MemoryItem(f"m{i}", 1000.0 + i, f"memory {i}", importance=(i % 10) / 10,
+                   associations={"event_type": EVENT_TYPES[i % 3], "speaker": "cato" if i % 2 else "cicero"})
+        for i in range(30)
+    ]
+
+
+def test_save_load_and_backup(tmp_path, memories):
+    """Test a round trip, per-agent replacement, backups and agent listing."""
+    manager = SQLitePersistenceManager(str(tmp_path / "db" / "memories.db"))
+    assert manager.save_memories("cato", memories)
+    assert manager.save_memories("cicero", memories[:5])
+    assert manager.save_memories("cicero", memories[5:7])
+
+    loaded = manager.load_memories("cato")
+    assert [m.to_dict() for m in loaded] == [m.to_dict() for m in memories]
+    assert [m.id for m in manager.load_memories("cicero")] == ["m5", "m6"]
+    assert sorted(manager.list_agent_ids()) == ["cato", "cicero"]
+
+    assert manager.backup_memories("cicero")
+    assert not manager.backup_memories("brutus")
+    assert manager.delete_memories("cicero")
+    assert manager.list_agent_ids() == ["cato"]
+    manager.close()
+
+
+def test_store_auto_saves_changed_memories(tmp_path, memories):
+    """Test that adds, updates and forgets reach the database."""
+    db_path = str(tmp_path / "memories.db")
+    manager = SQLitePersistenceManager(db_path)
+    store = MemoryStore("cato", manager, auto_save=True)
+    store.add_memories(memories[:5])
+    store.add_memory(MemoryItem("extra", 2000.0, "late news"))
+    store.update_memory("m1", {"importance": 0.95, "content": "revised"})
+    store.forget("m0")
+
+    reopened = MemoryStore("cato", SQLitePersistenceManager(db_path))
+    assert sorted(m.id for m in reopened.get_all_memories()) == ["extra", "m1", "m2", "m3", "m4"]
+    assert reopened.get_memory("m1").importance == 0.95
+    assert reopened.get_memory("m1").content == "revised"
+
+    store.clear()
+    assert reopened.persistence_manager.load_memories("cato") == []
+
+
+def test_pushed_down_retrieval_matches_scan(memories):
+    """Test that SQL filters return the same memories as the in-memory scan."""
+    scanning = MemoryStore("cato")
+    pushing = MemoryStore("cato", SQLitePersistenceManager(":memory:"), auto_save=True)
+    for memory in memories:
+        scanning.add_memory(memory)
+    pushing.add_memories(memories)
+
+    queries = [
+        ({}, None, None),
+        ({"timestamp_min": 1005.0, "timestamp_max": 1020.0}, None, None),
+        ({"associations": {"event_type": "vote"}}, 3, None),
+        ({"associations": {"event_type": "speech", "speaker": "cato"}}, 2, None),
+        ({"importance_min": 0.5, "text": "memory 2"}, None, 0.6),
+    ]
+    for query, limit, threshold in queries:
+        expected = [m.id for m in scanning.retrieve_memories(query, limit, threshold)]
+        assert [m.id for m in pushing.retrieve_memories(query, limit, threshold)] == expected
+
+    pushed, rest = SQLitePersistenceManager.pushdown(
+        {"timestamp_min": 1.0, "associations": {"event_type": "vote", "speaker": "cato"}, "text": "grain"}
+    )
+    assert pushed == {"timestamp_min": 1.0, "event_type": "vote"}
+    assert rest == {"associations": {"speaker": "cato"}, "text": "grain"}
+
+
+def test_retrieval_survives_failed_writes_and_in_place_changes(caplog, memories):
+    """Test that retrieval falls back to a scan after a failed write and re-checks stale rows."""
+    store = MemoryStore("cato", SQLitePersistenceManager(":memory:"), auto_save=True)
+    store.add_memories(memories[:3])
+    store.get_memory("m2").importance = 0.05
+    assert [m.id for m in store.retrieve_memories({"importance_min": 0.1})] == ["m1"]
+    store.get_memory("m0").importance = 0.9
+    assert store.save()
+    assert [m.id for m in store.retrieve_memories({"importance_min": 0.5})] == ["m0"]
+
+    with caplog.at_level("ERROR"):
+        store.add_memory(MemoryItem("x", 2000.0, "unsaved", associations={"tags": {"grain"}}))
+    assert "Error writing memories" in caplog.text
+    assert store.get_memory("x") is not None
+    assert [m.id for m in store.retrieve_memories({}, limit=2)] == ["x", "m2"]
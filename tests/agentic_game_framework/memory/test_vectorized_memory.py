@@ -0,0 +1,147 @@
+"""
+Unit tests for VectorizedMemory.
+
+This module covers semantic retrieval through the vector id -> memory id
+index, batched retrieval, keeping the index in step with updates,
+incremental consolidation, opt-in merging, and snapshot save/load, including empty snapshots.
+"""
+
+import os
+
+import pytest
+
+from src.agentic_game_framework.events.base import BaseEvent
+from src.agentic_game_framework.knowledge.embeddings import HashingEmbedder
+from src.agentic_game_framework.knowledge.vector_store import VectorStore, VectorStoreConfig
+from src.agentic_game_framework.memory.memory_interface import EventMemoryItem, MemoryItem
+from src.agentic_game_framework.memory.vectorized_memory import VectorizedMemory
+
+
+@pytest.fixture
+def store_factory():
+    """Fixture providing a factory for empty vector stores with a hashing embedder."""
+    return lambda: VectorStore(VectorStoreConfig(dimension=256), embedder=HashingEmbedder(256))
+
+
+@pytest.fixture
+def memory(store_factory):
+    """Fixture providing a VectorizedMemory holding three senate memories."""
+    memory = VectorizedMemory(vector_store=store_factory())
+    contents = [
+        "The grain supply from Egypt is failing",
+        "Legions march north against the Gauls",
+        "Pirates raid the ports of Ostia"
+    ]
+    for i, content in enumerate(contents):
+        memory.add_memory(MemoryItem(f"m{i}", 1000.0 + i, content, importance=0.2 + 0.3 * i))
+    return memory
+
+
+def test_retrieve_semantic_many(memory):
+    """Test that each query in a batch maps back to its memory item."""
+    results = memory.retrieve_semantic_many(["Egypt grain supply", "pirates raid Ostia"], limit=1)
+
+    assert [[item.id for item, _ in hits] for hits in results] == [["m0"], ["m2"]]
+    assert memory.retrieve_semantic("legions march north", limit=1)[0][0].id == "m1"
+    assert memory.retrieve_semantic("Egypt grain supply", importance_threshold=0.5)[0][0].id != "m0"
+
+
+def test_reverse_index_follows_updates(memory):
+    """Test that updated and forgotten memories are found under their new vectors only."""
+    memory.update_memory("m0", {"content": "The senate debates the new aqueduct"})
+    memory.forget("m2")
+
+    assert memory.retrieve_semantic("senate debates aqueduct", limit=1)[0][0].id == "m0"
+    assert "m2" not in [item.id for item, _ in memory.retrieve_semantic("pirates raid Ostia")]
+    assert len(memory._vector_to_memory_id) == 2
+
+
+def test_consolidation_merges_near_duplicates(memory):
+    """Test that near-duplicate memories are merged into one summary memory."""
+    memory.add_memory(MemoryItem("m3", 2000.0, "The grain supply from Egypt is failing!", importance=0.9))
+
+    removed = memory.consolidate_memories(threshold=0.9, max_memories=100)
+
+    assert removed == 1
+    summaries = [m for m in memory.index.get_all_memories() if "consolidated_from" in m.associations]
+    assert len(summaries) == 1
+    assert sorted(summaries[0].associations["consolidated_from"]) == ["m0", "m3"]
+    assert summaries[0].importance == 0.9
+    assert memory.retrieve_semantic("Egypt grain supply", limit=1)[0][0].id == summaries[0].id
+
+
+def test_consolidation_merges_only_on_request(memory):
+    """Test that merging is opt-in and a merged event memory keeps its event fields."""
+    for i, vote in enumerate(("for", "against")):
+        text = f"Caesar voted {vote} the land reform bill"
+        event = BaseEvent("vote", source="caesar", target="senate", data={"text": text})
+        memory.add_memory(EventMemoryItem(f"v{i}", 2000.0 + i, event, importance=0.5 + 0.1 * i))
+
+    assert memory.consolidate_memories(max_memories=100) == 0
+    assert len(memory.index.get_all_memories()) == 5
+
+    assert memory.consolidate_memories(threshold=0.5, max_memories=100) == 1
+    summary = next(m for m in memory.index.get_all_memories() if "consolidated_from" in m.associations)
+    assert isinstance(summary, EventMemoryItem)
+    assert (summary.event_type, summary.source, summary.target) == ("vote", "caesar", "senate")
+    assert summary.content["data"]["text"] == "Caesar voted against the land reform bill"
+
+
+def test_consolidation_evicts_within_time_budget(memory):
+    """Test that eviction follows the retention heap and resumes across calls."""
+    for i in range(3, 200):
+        memory.add_memory(MemoryItem(f"m{i}", 1000.0 + i, f"distinct memory number {i}", importance=(i % 10) / 10))
+    memory.update_memory("m5", {"importance": 1.0})
+
+    # A threshold above 1.0 disables merging, leaving only eviction
+    removed = memory.consolidate_memories(threshold=1.1, max_memories=150, time_budget=0.0)
+    while memory.consolidator.pending or len(memory.index.get_all_memories()) > 150:
+        removed += memory.consolidate_memories(threshold=1.1, max_memories=150, time_budget=0.0)
+
+    kept = {m.id for m in memory.index.get_all_memories()}
+    assert removed == 50
+    assert len(kept) == 150
+    assert "m5" in kept
+    # The 38 memories below importance 0.2 went first, then 12 of the 20 at 0.2
+    importances = [memory.get_memory(memory_id).importance for memory_id in kept]
+    assert min(importances) == 0.2
+    assert importances.count(0.2) == 8
+
+
+def test_snapshot_round_trip(tmp_path, memory, store_factory):
+    """Test that a loaded snapshot answers like the saved memory, without re-embedding."""
+    event = BaseEvent("speech", source="cicero", target="senate", data={"topic": "grain"})
+    memory.add_memory(EventMemoryItem("e1", 1500.0, event, importance=0.6))
+    path = str(tmp_path / "senator.json")
+
+    assert memory.save(path)
+    assert memory.save(path)  # The first generation is replaced and deleted
+    assert len(os.listdir(tmp_path)) == 3
+
+    store = store_factory()
+    embedded = []
+    store.embedder.embed = lambda texts: embedded.append(texts)
+    restored = VectorizedMemory(vector_store=store)
+    assert restored.load(path)
+
+    assert not embedded
+    assert {m.id for m in restored.index.get_all_memories()} == {"m0", "m1", "m2", "e1"}
+    assert isinstance(restored.get_memory("e1"), EventMemoryItem)
+    assert restored.get_memory("e1").source == "cicero"
+    assert [m.id for m in restored.retrieve_memories({"text": "legions"})] == ["m1"]
+    assert [m.id for m in restored.retrieve_memories({"associations": {"source": "cicero"}})] == ["e1"]
+    assert [m.id for m in restored.retrieve_memories({"timestamp_min": 1001, "timestamp_max": 1600})] == ["e1", "m2", "m1"]
+    assert restored._memory_to_vector_id == memory._memory_to_vector_id
+    assert restored._vector_to_memory_id == memory._vector_to_memory_id
+
+
+def test_empty_snapshot_round_trip(tmp_path, store_factory):
+    """Test that an empty memory saves and loads, then accepts memories."""
+    path = str(tmp_path / "senator.json")
+    assert VectorizedMemory(vector_store=store_factory()).save(path)
+
+    restored = VectorizedMemory(vector_store=store_factory())
+    assert restored.load(path)
+    assert restored.index.get_all_memories() == []
+    restored.add_memory(MemoryItem("m0", 1000.0, "The grain supply from Egypt is failing"))
+    assert [m.id for m in restored.retrieve_memories({"text": "grain"})] == ["m0"]
@@ -0,0 +1,122 @@
+import json
+import re
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from roman_senate.agents.batch_decisions import (
+    decide_stances_batch, decide_votes_batch, parse_batch_response, STANCE_OPTIONS, VOTE_OPTIONS
+)
+from roman_senate.agents.environment import SenateEnvironment
+from roman_senate.agents.senator_agent import SenatorAgent
+from roman_senate.utils.llm.base import LLMProvider
+
+
+class BatchAnsweringProvider(LLMProvider):
+    """Provider stub that answers batched decision prompts and counts round-trips."""
+
+    def __init__(self, stances=("support", "oppose", "neutral"), skip_ids=()):
+        self.stances = stances
+        self.skip_ids = set(skip_ids)
+        self.prompts = []
+
+    def generate_completion(self, prompt, temperature=0.7, max_tokens=500, **kwargs):
+        return ""
+
+    def generate_chat_completion(self, messages, temperature=0.7, max_tokens=500, **kwargs):
+        return {}
+
+    async def generate_text(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        if "JSON array" not in prompt:
+            # A per-senator fallback prompt
+            return "I weigh the matter carefully.\noppose"
+        ids = [int(i) for i in re.findall(r"^\s*(\d+)\. ", prompt, re.MULTILINE)]
+        vote = "must now vote" in prompt
+        return "Here are the decisions:\n" + json.dumps([
+            {
+                "id": i,
+                "reasoning": f"Reason {i}",
+                "decision": "for" if vote else self.stances[i % len(self.stances)]
+            }
+            for i in ids if i not in self.skip_ids
+        ])
+
+
+@pytest.fixture
+def senator_factory():
+    """Fixture providing a factory for Optimate senator agents sharing one provider."""
+    def create(provider, count):
+        return [
+            SenatorAgent({"name": f"Senator {i}", "faction": "Optimates", "traits": {"eloquence": 0.5}}, provider)
+            for i in range(count)
+        ]
+    return create
+
+
+class TestBatchDecisions:
+    """Test suite for batched stance and vote decisions."""
+
+    def test_parse_json_array(self):
+        """Test reading per-senator decisions from a JSON array with surrounding text."""
+        response = 'Decisions:\n[{"id": 2, "reasoning": "Costly.", "decision": "Against"},' \
+                   ' {"id": 1, "reasoning": "Glory.", "decision": "for"},' \
+                   ' {"id": 3, "reasoning": "?", "decision": "maybe"}]'
+
+        parsed = parse_batch_response(response, 3, STANCE_OPTIONS)
+
+        assert parsed == {1: ("support", "Glory."), 2: ("oppose", "Costly.")}
+
+    def test_parse_numbered_lines(self):
+        """Test the fallback for numbered lines when no JSON is returned."""
+        response = "1. support - Rome needs grain\n2) neutral: unsure\n3. oppose"
+
+        parsed = parse_batch_response(response, 3, VOTE_OPTIONS)
+
+        # Neutral is not a valid vote, so senator 2 is left out
+        assert parsed == {1: ("support", "Rome needs grain"), 3: ("oppose", "")}
+
+    @pytest.mark.asyncio
+    async def test_hundred_senator_vote_round_trips(self, senator_factory):
+        """Test that a 100-senator vote needs a few prompts rather than one per senator."""
+        provider = BatchAnsweringProvider()
+        agents = senator_factory(provider, 100)
+
+        votes = await decide_votes_batch(agents, "Lex agraria", {}, provider, batch_size=25)
+
+        # 4 stance batches plus 2 batches for the 32 neutral senators
+        assert len(provider.prompts) == 6
+        assert len(votes) == 100
+        assert all(vote in VOTE_OPTIONS for vote, _ in votes)
+        # Decided senators vote their stance; neutral ones were asked again
+        assert agents[0].current_stance == "oppose"
+        assert agents[0].memory.voting_history["Lex agraria"] == "oppose"
+        assert agents[1].current_stance == "neutral"
+        assert votes[1] == ("support", "Reason 1")
+
+    @pytest.mark.asyncio
+    async def test_missing_senators_decide_individually(self, senator_factory):
+        """Test that senators left out of a batched response fall back to their own prompt."""
+        provider = BatchAnsweringProvider(stances=("support",), skip_ids={2})
+        agents = senator_factory(provider, 3)
+
+        stances = await decide_stances_batch(agents, "Lex agraria", {}, provider, batch_size=25)
+
+        assert [stance for stance, _ in stances] == ["support", "oppose", "support"]
+        assert len(provider.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_environment_uses_batches(self):
+        """Test that run_vote takes votes from the batched path."""
+        provider = BatchAnsweringProvider(stances=("support", "oppose"))
+        environment = SenateEnvironment(provider, decision_batch_size=10)
+        environment.initialize_agents([{"name": f"Senator {i}", "faction": "Populares"} for i in range(20)])
+        environment.current_topic = {"text": "Lex agraria", "category": "Land"}
+
+        with patch("roman_senate.agents.environment.asyncio.sleep", new=AsyncMock()):
+            result = await environment.run_vote("Lex agraria", {}, testing=True)
+
+        assert len(provider.prompts) == 2
+        assert result["total"] == 20
+        assert result["votes"]["for"] == 10
+        assert result["votes"]["against"] == 10
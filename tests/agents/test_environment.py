@@ -31,7 +31,8 @@ class TestEnvironment:
     @pytest.fixture
     def environment(self, mock_llm_provider):
         """Create a SenateEnvironment instance."""
-        return SenateEnvironment(mock_llm_provider)
+        # These tests mock each senator's own vote, so ask senators one at a time
+        return SenateEnvironment(mock_llm_provider, decision_batch_size=1)
 
     def test_initialize_agents(self, environment, sample_senators):
         """Test agent initialization."""
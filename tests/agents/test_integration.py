@@ -63,7 +63,8 @@ class TestIntegration:
         ]
         
         # Initialize environment
-        environment = SenateEnvironment(mock_llm_provider)
+        # The mocked responses follow the per-senator call order
+        environment = SenateEnvironment(mock_llm_provider, decision_batch_size=1)
         environment.initialize_agents(sample_senators)
         environment.set_topics([sample_topic])
         environment.current_topic = sample_topic
@@ -75,7 +75,8 @@ class TestIntegrationDebug:
         
         # Initialize environment
         logger.info("Initializing environment")
-        environment = SenateEnvironment(mock_llm_provider)
+        # The mocked responses follow the per-senator call order
+        environment = SenateEnvironment(mock_llm_provider, decision_batch_size=1)
         
         # Log the type of environment and agent class being used
         logger.info(f"Environment type: {type(environment).__name__}")
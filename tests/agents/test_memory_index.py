@@ -0,0 +1,90 @@
+"""
+Tests for the Roman Senate MemoryIndex.
+
+This test suite verifies id-keyed lookups, set-based filtering, removal and
+re-filing of memories, and mapping framework text results back to memories.
+"""
+
+import datetime
+
+import pytest
+
+from roman_senate.agents.memory_index import MemoryIndex
+from roman_senate.agents.memory_items import EventMemoryItem, StanceChangeMemoryItem
+
+START = datetime.datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def index(request):
+    """
+    Fixture providing a MemoryIndex holding six event memories and a stance change.
+    
+    Parametrize it indirectly with True to back the index with the framework index.
+    """
+    index = MemoryIndex(use_framework_index=getattr(request, "param", False))
+    for i in range(6):
+        index.add_memory(EventMemoryItem(
+            event_id=f"e{i}", event_type="speech" if i % 2 else "vote", source="Cicero" if i < 3 else "Cato",
+            metadata={"text": f"speech about grain {i}"}, timestamp=START + datetime.timedelta(days=i),
+            importance=0.3 + 0.1 * i, memory_id=f"m{i}"
+        ))
+    index.add_memory(StanceChangeMemoryItem(
+        "grain_law", "neutral", "support", "Cato spoke well",
+        timestamp=START + datetime.timedelta(days=10), memory_id="s0"
+    ))
+    return index
+
+
+def test_query_intersects_postings(index):
+    """Test that filters combine and results come newest first."""
+    assert [m.id for m in index.query({"senator_name": "Cicero", "event_type": "speech"})] == ["m1"]
+    assert [m.id for m in index.query({"tags": ["vote"], "limit": 2})] == ["m4", "m2"]
+    assert [m.id for m in index.query({"topic": "grain_law"})] == ["s0"]
+    assert index.query({"senator_name": "Brutus"}) == []
+    assert [m.id for m in index.query({
+        "event_type": "vote",
+        "time_start": START + datetime.timedelta(days=1),
+        "time_end": START + datetime.timedelta(days=4)
+    })] == ["m4", "m2"]
+
+
+def test_remove_and_refile(index):
+    """Test that removed memories leave every index and changed ones are re-filed."""
+    index.remove_memory(index.get_memory("m1"))
+    memory = index.get_memory("m0")
+    memory.importance = 0.95
+    index.update_indices()
+
+    assert index.get_memory("m1") is None
+    assert "m1" not in index.senator_index["Cicero"]
+    assert [m.id for m in index.query({"importance_category": "long_term"})] == ["s0", "m5", "m4", "m0"]
+    assert [m.id for m in index.get_recent_memories(2)] == ["s0", "m5"]
+    assert len(index.timeline) == len(index) == 6
+
+
+@pytest.mark.parametrize("index", [True], indirect=True)
+def test_framework_text_query_maps_ids(index):
+    """Test that framework text results map back to the same memory objects."""
+    results = index.query({"text": "Cato", "limit": 2})
+
+    assert [m.id for m in results] == ["s0", "m5"]
+    assert results[1] is index.get_memory("m5")
+
+
+def test_relevance_top_k_matches_full_scoring(index):
+    """Test that context queries return the same top memories as scoring every memory."""
+    index.add_memory(StanceChangeMemoryItem(
+        "aqueduct", "oppose", "support", "Cato spoke well", importance=0.9,
+        timestamp=START + datetime.timedelta(days=3), memory_id="s1"
+    ))
+    now = START + datetime.timedelta(days=12)
+
+    for context in ({"tags": ["vote", "Cato"]}, {"topic": "grain_law"}, {"senator_name": "Cicero", "tags": ["speech"]}, {}):
+        strengths = {m.id: m.get_current_strength(now) for m in index.all_memories}
+        expected = sorted(index.all_memories, key=lambda m: m.calculate_relevance(context, strengths[m.id]), reverse=True)
+        for limit in (1, 3, 10):
+            results = index.query({"context": context, "limit": limit}, current_time=now)
+            assert [m.calculate_relevance(context, strengths[m.id]) for m in results] == pytest.approx(
+                [m.calculate_relevance(context, strengths[m.id]) for m in expected[:limit]]
+            )
@@ -0,0 +1,162 @@
+"""
+Tests for Roman Senate memory persistence.
+
+This test suite verifies that saves append changes to a per-senator log, that
+loading replays the log over the snapshot, and that the log is compacted.
+"""
+
+import datetime
+import json
+import os
+
+import pytest
+
+from roman_senate.agents import enhanced_event_memory
+from roman_senate.agents.enhanced_event_memory import EnhancedEventMemory
+from roman_senate.agents.memory_items import EventMemoryItem
+from roman_senate.agents.memory_persistence_manager import MemoryPersistenceManager
+
+START = datetime.datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def events():
+    """Fixture providing five speech memories an hour apart."""
+    return [
+        EventMemoryItem(
+            f"e{i}", "speech", "Cicero", {"text": f"speech {i}"},
+            timestamp=START + datetime.timedelta(hours=i), memory_id=f"m{i}"
+        )
+        for i in range(5)
+    ]
+
+
+def memory_ids(memory):
+    """IDs of every memory in a senator's index, sorted."""
+    return sorted(m.id for m in memory.memory_index.all_memories)
+
+
+def test_saves_append_to_log(tmp_path, events):
+    """Test that saves after the first append records and loading replays them."""
+    memory = EnhancedEventMemory(senator_id="cato")
+    for event in events[:3]:
+        memory.add_memory(event)
+    snapshot_path = memory.save_to_disk(str(tmp_path))
+    snapshot = open(snapshot_path).read()
+
+    memory.add_memory(events[3])
+    memory.record_stance_change("grain_law", "neutral", "support", "famine")
+    memory.update_memory("m1", {"importance": 0.95})
+    memory.forget("m0")
+    assert memory.save_to_disk(str(tmp_path)) == snapshot_path
+    memory.save_to_disk(str(tmp_path))
+
+    # The snapshot is untouched; a generation header and four records are logged
+    assert open(snapshot_path).read() == snapshot
+    log_lines = open(tmp_path / "cato_memory.log").read().splitlines()
+    assert json.loads(log_lines[0]) == {"generation": 1}
+    assert [json.loads(line)["op"] for line in log_lines[1:]] == ["add", "add", "update", "forget"]
+
+    loaded = EnhancedEventMemory(senator_id="cato")
+    assert loaded.load_from_disk(str(tmp_path))
+    assert memory_ids(loaded) == memory_ids(memory)
+    assert loaded.get_memory("m1").importance == 0.95
+    assert list(loaded.enhanced_stance_changes) == ["grain_law"]
+    assert not loaded.snapshot_due(str(tmp_path))
+
+
+def test_log_is_compacted(tmp_path, monkeypatch, events):
+    """Test that a long log is folded into a new snapshot and then ignored."""
+    monkeypatch.setattr(enhanced_event_memory, "MIN_LOG_RECORDS_TO_COMPACT", 2)
+    manager = MemoryPersistenceManager(base_path=str(tmp_path), use_framework_persistence=False)
+    memory = EnhancedEventMemory(senator_id="cato")
+    memory.add_memory(events[0])
+    manager.save_memory("cato", memory)
+
+    memory.add_memory(events[1])
+    manager.save_memory("cato", memory)
+    assert os.path.exists(tmp_path / "cato_memory.log")
+    assert not os.listdir(tmp_path / "backups")
+
+    for event in events[2:]:
+        memory.add_memory(event)
+    memory.forget("m4")
+    assert memory.snapshot_due(str(tmp_path))
+    manager.save_memory("cato", memory)
+    assert not os.path.exists(tmp_path / "cato_memory.log")
+    assert json.load(open(tmp_path / "cato_memory.json"))["log_generation"] == 2
+    assert sorted(os.listdir(tmp_path / "backups"))[0].endswith(".json")
+
+    loaded = EnhancedEventMemory(senator_id="cato")
+    assert manager.load_memory("cato", loaded)
+    assert memory_ids(loaded) == ["m0", "m1", "m2", "m3"]
+
+
+def test_stale_and_torn_logs(tmp_path, events):
+    """Test that a log from an older snapshot is ignored and a torn record ends replay."""
+    memory = EnhancedEventMemory(senator_id="cato")
+    memory.add_memory(events[0])
+    memory.save_to_disk(str(tmp_path))
+    memory.add_memory(events[1])
+    memory.add_memory(events[2])
+    memory.save_to_disk(str(tmp_path))
+
+    log_path = tmp_path / "cato_memory.log"
+    with open(log_path) as f:
+        lines = f.readlines()
+    with open(log_path, "w") as f:
+        f.writelines(lines[:2] + [lines[2][:10]])
+
+    loaded = EnhancedEventMemory(senator_id="cato")
+    assert loaded.load_from_disk(str(tmp_path))
+    assert memory_ids(loaded) == ["m0", "m1"]
+    assert loaded.snapshot_due(str(tmp_path))
+
+    with open(log_path, "w") as f:
+        f.writelines([json.dumps({"generation": 0}) + "\n"] + lines[1:])
+    loaded = EnhancedEventMemory(senator_id="cato")
+    assert loaded.load_from_disk(str(tmp_path))
+    assert memory_ids(loaded) == ["m0"]
+
+
+def test_journal_is_bounded(tmp_path, monkeypatch, events):
+    """Test that unsaved memories journal nothing and a long journal is dropped for compaction."""
+    monkeypatch.setattr(enhanced_event_memory, "MIN_LOG_RECORDS_TO_COMPACT", 3)
+    memory = EnhancedEventMemory(senator_id="cato")
+    for event in events:
+        memory.add_memory(event)
+    memory.forget("m4")
+    assert memory._journal == []
+
+    memory.save_to_disk(str(tmp_path))
+    for i in range(5):
+        memory.update_memory("m1", {"importance": i / 10})
+        assert len(memory._journal) <= 4
+    assert memory._journal == []
+    assert memory.snapshot_due(str(tmp_path))
+
+    memory.save_to_disk(str(tmp_path))
+    assert not os.path.exists(tmp_path / "cato_memory.log")
+    loaded = EnhancedEventMemory(senator_id="cato")
+    assert loaded.load_from_disk(str(tmp_path))
+    assert memory_ids(loaded) == memory_ids(memory)
+
+
+def test_restore_backup_drops_newer_log(tmp_path, events):
+    """Test that restoring a backup is not undone by a log written after it."""
+    manager = MemoryPersistenceManager(base_path=str(tmp_path), use_framework_persistence=False)
+    memory = EnhancedEventMemory(senator_id="cato")
+    memory.add_memory(events[0])
+    manager.save_memory("cato", memory)
+    manager.create_backup("b1")
+
+    memory.add_memory(events[1])
+    memory.add_memory(events[2])
+    manager.save_memory("cato", memory)
+    assert os.path.exists(tmp_path / "cato_memory.log")
+
+    assert manager.restore_backup("b1")
+    assert not os.path.exists(tmp_path / "cato_memory.log")
+    loaded = EnhancedEventMemory(senator_id="cato")
+    assert manager.load_memory("cato", loaded)
+    assert memory_ids(loaded) == ["m0"]
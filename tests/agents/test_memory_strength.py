@@ -0,0 +1,93 @@
+"""
+Tests for the Roman Senate memory StrengthStore.
+
+This test suite verifies vectorized strengths against MemoryBase, cache reuse
+within a simulated day, and strength-driven ranking and pruning.
+"""
+
+import datetime
+
+import pytest
+
+from roman_senate.agents.memory_base import MemoryBase
+from roman_senate.agents.memory_index import MemoryIndex
+from roman_senate.agents.memory_strength import StrengthStore
+
+NOW = datetime.datetime(2026, 3, 15, 12)
+
+
+@pytest.fixture
+def memories():
+    """Fixture providing ten decaying memories and one core memory."""
+    return [
+        MemoryBase(timestamp=NOW - datetime.timedelta(days=i), importance=0.2 + 0.08 * i,
+                   decay_rate=0.05 * (i % 4), emotional_impact=0.25 * (i % 3) - 0.25, memory_id=f"m{i}")
+        for i in range(10)
+    ] + [MemoryBase(timestamp=NOW - datetime.timedelta(days=400), importance=0.95, decay_rate=0.0, memory_id="core")]
+
+
+def test_strengths_match_memory_base(memories):
+    """Test that the vectorized pass agrees with get_current_strength."""
+    store = StrengthStore()
+    for memory in memories[:5]:
+        store.add(memory)
+    store.load(memories)
+
+    strengths = store.strengths(NOW)
+    assert len(store) == len(strengths) == 11
+    for memory in memories:
+        assert strengths[memory.id] == pytest.approx(memory.get_current_strength(NOW))
+
+
+def test_cache_is_kept_current_within_resolution(memories):
+    """Test that adds and removes update cached strengths until they expire."""
+    store = StrengthStore()
+    for memory in memories[:-1]:
+        store.add(memory)
+    store.refresh(NOW)
+
+    store.remove("m0")
+    store.add(memories[-1])
+    memories[3].importance = 1.0
+    store.add(memories[3])
+
+    later = NOW + datetime.timedelta(hours=6)
+    strengths = store.strengths(later)
+    assert store.computed_at == NOW
+    assert "m0" not in strengths and "m0" not in store
+    assert strengths["m3"] == pytest.approx(memories[3].get_current_strength(NOW))
+    assert strengths["m9"] == pytest.approx(memories[9].get_current_strength(NOW))
+
+    next_day = NOW + datetime.timedelta(days=1)
+    assert store.strengths(next_day)["m9"] == pytest.approx(memories[9].get_current_strength(next_day))
+    assert store.computed_at == next_day
+
+
+def test_strongest_and_weak(memories):
+    """Test ranking and pruning against per-memory strengths."""
+    store = StrengthStore(capacity=2)
+    for memory in memories:
+        store.add(memory)
+
+    by_strength = sorted(memories, key=lambda m: m.get_current_strength(NOW), reverse=True)
+    assert store.strongest(3, NOW) == [m.id for m in by_strength[:3]]
+    assert store.strongest(50, NOW) == [m.id for m in by_strength]
+
+    weak = {m.id for m in memories if m.get_current_strength(NOW) < 0.3 and not m.is_core_memory()}
+    assert "core" not in weak
+    assert set(store.weak(0.3, NOW)) == weak
+
+
+def test_index_prunes_with_store(memories):
+    """Test that MemoryIndex pruning and strength filters use the store."""
+    index = MemoryIndex(use_framework_index=False)
+    for memory in memories:
+        index.add_memory(memory)
+    index.strength_store.refresh(NOW)
+
+    strong = [m.id for m in index.query({"min_strength": 0.3}, current_time=NOW)]
+    assert strong == [m.id for m in index.query({}, current_time=NOW) if m.get_current_strength(NOW) >= 0.3]
+
+    removed = index.prune_weak_memories(0.3, current_time=NOW)
+    assert removed == 11 - len(strong) and len(index.timeline) == len(strong)
+    assert sorted(m.id for m in index.all_memories) == sorted(strong)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Roman Senate AI Game - Debate Streaming Tests
+Tests for incremental speech streaming in the debate module using Latin function names.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from roman_senate.core import debate
+from roman_senate.core.debate import SpeechStream, split_completed_paragraphs, stream_speech_with_latin
+from roman_senate.utils.llm.base import LLMProvider
+from roman_senate.utils.llm.mock_provider import MockProvider
+
+
+class ParagraphProvider(LLMProvider):
+    """Provider stub that streams two paragraphs and records translation requests."""
+
+    def __init__(self):
+        self.translated = []
+        self.streaming = False
+
+    def generate_completion(self, prompt, temperature=0.7, max_tokens=500, **kwargs):
+        return ""
+
+    def generate_chat_completion(self, messages, temperature=0.7, max_tokens=500, **kwargs):
+        return {}
+
+    async def generate_text(self, prompt, **kwargs):
+        # Translation prompts end with the English paragraph
+        paragraph = prompt.split("English speech:")[1].split("Return ONLY")[0].strip()
+        self.translated.append((paragraph, self.streaming))
+        return f"Latine: {paragraph}"
+
+    async def stream_text(self, prompt, **kwargs):
+        self.streaming = True
+        for chunk in ["Patres ", "conscripti.\n", "\nSecundum ", "verbum."]:
+            await asyncio.sleep(0)
+            yield chunk
+        self.streaming = False
+
+
+def test_paragraphi_perfecti():
+    """
+    Test splitting streamed text into finished paragraphs and a remainder.
+    (Test completed paragraphs)
+    """
+    paragraphs, remainder = split_completed_paragraphs("Primum.\n\n  \n\nSecundum.\n \nTerti")
+
+    assert paragraphs == ["Primum.", "Secundum."]
+    assert remainder == "Terti"
+
+
+@pytest.mark.asyncio
+async def test_fluxus_orationis_legitur():
+    """
+    Test that a SpeechStream replays earlier chunks and waits for new ones.
+    (Test speech stream reading)
+    """
+    stream = SpeechStream()
+    stream.feed("Quo ")
+
+    async def read():
+        return [chunk async for chunk in stream]
+
+    reader = asyncio.ensure_future(read())
+    await asyncio.sleep(0)
+    stream.feed("usque ")
+    stream.feed("tandem")
+    stream.close()
+
+    assert await reader == ["Quo ", "usque ", "tandem"]
+    assert stream.text == "Quo usque tandem"
+    # A late reader still sees the whole speech
+    assert [chunk async for chunk in stream] == ["Quo ", "usque ", "tandem"]
+
+
+@pytest.mark.asyncio
+async def test_translatio_per_paragraphos():
+    """
+    Test that Latin translation starts on completed paragraphs while the English streams.
+    (Test paragraph-wise translation)
+    """
+    provider = ParagraphProvider()
+    stream = SpeechStream()
+
+    with patch("roman_senate.speech.speech_generator.get_speech_llm_provider", return_value=None):
+        english, latin = await stream_speech_with_latin(provider, "Oratio", stream)
+
+    assert stream.closed
+    assert english == "Patres conscripti.\n\nSecundum verbum."
+    assert latin == "Latine: Patres conscripti.\n\nLatine: Secundum verbum."
+    # The first paragraph was sent for translation before the stream finished
+    assert provider.translated[0] == ("Patres conscripti.", True)
+
+
+@pytest.mark.asyncio
+async def test_generatio_orationis_fluens():
+    """
+    Test generate_speech streaming the English through a SpeechStream.
+    (Test streamed speech generation)
+    """
+    provider = MockProvider()
+    stream = SpeechStream()
+    senator = {"id": 1, "name": "Cicero", "faction": "Optimates", "traits": {"eloquence": 0.9}}
+
+    with patch.object(debate.llm_factory, "get_provider", return_value=provider), \
+         patch("roman_senate.speech.speech_generator.get_speech_llm_provider", return_value=None):
+        speech_task = asyncio.ensure_future(
+            debate.generate_speech(senator, "Lex frumentaria", year=-63, speech_stream=stream)
+        )
+        shown = await debate.display_speech_stream(senator, stream)
+        speech = await speech_task
+
+    assert len(stream.chunks) > 1
+    assert shown.strip() == speech["english_text"]
+    assert speech["latin_text"]
+
+
+@pytest.mark.asyncio
+async def test_fluxus_clauditur_post_errorem():
+    """
+    Test that a failed speech still feeds and closes its SpeechStream.
+    (Test stream closed on failure)
+    """
+    stream = SpeechStream()
+    senator = {"id": 1, "name": "Cato", "faction": "Optimates", "traits": {}}
+
+    with patch.object(debate.llm_factory, "get_provider", side_effect=RuntimeError("no provider")):
+        speech_task = asyncio.ensure_future(
+            debate.generate_speech(senator, "Lex agraria", year=-63, speech_stream=stream)
+        )
+        shown = await asyncio.wait_for(debate.display_speech_stream(senator, stream), timeout=5)
+        speech = await speech_task
+
+    assert stream.closed
+    assert shown.strip() == speech["english_text"]
+
+    # A speech task cancelled before it runs closes its stream too
+    cancelled = SpeechStream()
+    task = asyncio.ensure_future(debate.generate_speech(senator, "Lex agraria", speech_stream=cancelled))
+    cancelled.close_when_done(task)
+    task.cancel()
+    assert await asyncio.wait_for(debate.display_speech_stream(senator, cancelled), timeout=5) == ""
@@ -4,6 +4,11 @@ Pytest fixtures for LLM provider tests.
 This module contains fixtures for testing the LLM providers.
 """
 
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 
@@ -63,4 +68,150 @@ def mock_ollama_provider():
     }
     provider.generate_text = AsyncMock(return_value="Mocked Ollama response content")
     
-    return provider
\ No newline at end of file
+    return provider
+
+class _StandInState:
+    """Shared counters recorded by the stand-in LLM HTTP server."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.connections = 0
+        self.fail_next = 0  # Answer this many requests with 503 before succeeding
+
+
+def _make_stand_in_handler(state):
+    """Build a request handler that answers like an OpenAI chat endpoint."""
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with state.lock:
+                state.connections += 1
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+
+            with state.lock:
+                failing = state.fail_next > 0
+                if failing:
+                    state.fail_next -= 1
+            if failing:
+                body = b'{"error": "overloaded"}'
+                self.send_response(503)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            with state.lock:
+                state.requests += 1
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                time.sleep(state.delay)
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+            if payload.get("messages"):
+                prompt = payload["messages"][-1].get("content", "")
+            else:
+                prompt = payload.get("prompt", "")
+
+            if payload.get("stream"):
+                self._send_stream(payload, f"Echo: {prompt}")
+                return
+
+            body = json.dumps({
+                "id": "chatcmpl-stand-in",
+                "object": "chat.completion",
+                "created": 0,
+                "model": payload.get("model", "stand-in"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": f"Echo: {prompt}"},
+                    "finish_reason": "stop"
+                }],
+                "message": {"role": "assistant", "content": f"Echo: {prompt}"},
+                "response": f"Echo: {prompt}",
+                "done": True
+            }).encode("utf-8")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_stream(self, payload, text):
+            """Answer a streaming request word by word (SSE for OpenAI, NDJSON for Ollama)."""
+            pieces = [word + " " for word in text.split(" ")]
+            pieces[-1] = pieces[-1].rstrip()
+            if "chat/completions" in self.path:
+                events = [
+                    {
+                        "id": "chatcmpl-stand-in",
+                        "object": "chat.completion.chunk",
+                        "created": 0,
+                        "model": payload.get("model", "stand-in"),
+                        "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]
+                    }
+                    for piece in pieces
+                ]
+                body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+                content_type = "text/event-stream"
+            else:
+                events = [{"response": piece, "done": False} for piece in pieces]
+                events.append({"response": "", "done": True})
+                body = "".join(json.dumps(event) + "\n" for event in events)
+                content_type = "application/x-ndjson"
+
+            body = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return StandInHandler
+
+
+class _StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server whose listen backlog admits a burst of concurrent connections."""
+
+    daemon_threads = True
+    request_queue_size = 64  # The default of 5 makes extra SYNs wait for a retransmit
+
+
+@pytest.fixture
+def llm_stand_in_server():
+    """
+    Fixture providing a local HTTP server that imitates an LLM endpoint.
+
+    It answers OpenAI-style ``/v1/chat/completions`` and Ollama-style
+    ``/api/generate`` and ``/api/chat`` requests after a fixed delay and
+    records request, concurrency and connection counts. Requests with
+    ``"stream": true`` are answered as SSE or NDJSON chunks. Setting
+    ``fail_next`` makes it answer that many requests with a 503 first.
+    """
+    state = _StandInState(delay=0.2)
+    server = _StandInServer(("127.0.0.1", 0), _make_stand_in_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Roman Senate AI Game - LLM Request Coalescing Tests
+Tests for the single-flight provider layer using Latin function names.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from roman_senate.utils.llm.base import LLMProvider
+from roman_senate.utils.llm.coalescing import CoalescingLLMProvider, RequestCoalescer
+from roman_senate.utils.llm.factory import get_llm_provider
+from roman_senate.utils.llm.response_cache import CachedLLMProvider
+
+
+class SlowProvider(LLMProvider):
+    """Provider stub that takes a moment to answer and counts its requests."""
+
+    def __init__(self, model_name="slow-model", fail=False):
+        self.model_name = model_name
+        self.fail = fail
+        self.calls = 0
+
+    def generate_completion(self, prompt, temperature=0.7, max_tokens=500, **kwargs):
+        return prompt
+
+    def generate_chat_completion(self, messages, temperature=0.7, max_tokens=500, **kwargs):
+        return {"choices": [{"message": {"role": "assistant", "content": ""}, "index": 0}]}
+
+    async def generate_text(self, prompt, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise RuntimeError("Oraculum silet")
+        return f"{prompt} #{self.calls}"
+
+
+@pytest.mark.asyncio
+async def test_petitiones_identicae_coalescuntur():
+    """
+    Test that identical concurrent calls share one request.
+    (Test identical requests are coalesced)
+    """
+    inner = SlowProvider()
+    coalescer = RequestCoalescer()
+    providers = [CoalescingLLMProvider(inner, coalescer) for _ in range(5)]
+
+    results = await asyncio.gather(*[
+        p.generate_text("Quid de Carthagine?", temperature=0.7) for p in providers
+    ])
+
+    assert inner.calls == 1
+    assert len(set(results)) == 1
+    stats = coalescer.get_stats()
+    assert stats["calls"] == 5
+    assert stats["deduplicated"] == 4
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_argumenta_diversa_non_coalescuntur():
+    """
+    Test that calls differing in any argument, or made sequentially, are not merged.
+    (Test different requests stay separate)
+    """
+    inner = SlowProvider()
+    provider = CoalescingLLMProvider(inner, RequestCoalescer())
+
+    await asyncio.gather(
+        provider.generate_text("Oratio", temperature=0.7),
+        provider.generate_text("Oratio", temperature=0.9),
+        provider.generate_text("Oratio Latina", temperature=0.7),
+    )
+    await provider.generate_text("Oratio", temperature=0.7)
+
+    assert inner.calls == 4
+    assert provider.get_coalescing_stats()["deduplicated"] == 0
+
+
+@pytest.mark.asyncio
+async def test_error_communicatur():
+    """
+    Test that a failed shared request raises for every waiting caller.
+    (Test errors are shared)
+    """
+    coalescer = RequestCoalescer()
+    provider = CoalescingLLMProvider(SlowProvider(fail=True), coalescer)
+
+    results = await asyncio.gather(
+        provider.generate_text("Prompt"),
+        provider.generate_text("Prompt"),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert coalescer.reset_stats()["deduplicated"] == 1
+    assert coalescer.get_stats()["calls"] == 0
+
+
+def test_fabrica_cum_coalescentia(tmp_path):
+    """
+    Test that the factory stacks coalescing outside the response cache.
+    (Test factory coalescing selection)
+    """
+    with patch("roman_senate.utils.config.LLM_RESPONSE_CACHE_PATH", str(tmp_path / "shared.sqlite3")):
+        provider = get_llm_provider(provider_type="mock", coalesce=True, cache=True)
+
+    assert isinstance(provider, CoalescingLLMProvider)
+    assert isinstance(provider.provider, CachedLLMProvider)
+    assert provider.model_name == "mock_model"
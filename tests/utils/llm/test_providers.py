@@ -8,12 +8,13 @@ Tests for OpenAI and Ollama LLM providers using Latin function names.
 
 import pytest
 from unittest.mock import patch, MagicMock
+import asyncio
 import json
 import os
 import pytest
 
-from roman_senate.utils.llm.openai_provider import OpenAIProvider
-from roman_senate.utils.llm.ollama_provider import OllamaProvider
+from roman_senate.utils.llm.openai_provider import OpenAIProvider, close_shared_clients
+from roman_senate.utils.llm.ollama_provider import OllamaProvider, close_shared_sessions
 
 
 # --- Helpers and Fixtures ---
@@ -112,6 +113,77 @@ def test_tractatio_erroris_openai():
         assert "Error generating response" in chat_result["choices"][0]["message"]["content"]
 
 
+@pytest.mark.asyncio
+async def test_concurrentia_vera_openai(llm_stand_in_server):
+    """
+    Test that concurrent generate_text calls overlap on the pooled async client.
+    (Test true concurrency)
+    """
+    provider = OpenAIProvider(
+        model_name="gpt-4",
+        api_key="stand-in-key",
+        base_url=f"{llm_stand_in_server.url}/v1",
+        max_concurrency=10
+    )
+    
+    # Warm up the shared client before the concurrent burst
+    await provider.generate_text("Warm up")
+    
+    results = await asyncio.gather(*[
+        provider.generate_text(f"Senator {i} speaks") for i in range(10)
+    ])
+    
+    # The ten 0.2s requests overlap at the server instead of running one by one
+    assert results == [f"Echo: Senator {i} speaks" for i in range(10)]
+    assert llm_stand_in_server.max_in_flight > 1
+    
+    await close_shared_clients()
+
+
+@pytest.mark.asyncio
+async def test_limes_concurrentiae_openai(llm_stand_in_server):
+    """
+    Test that the configured concurrency limit caps in-flight requests.
+    (Test concurrency limit)
+    """
+    base_url = f"{llm_stand_in_server.url}/v1"
+    providers = [
+        OpenAIProvider(model_name="gpt-4", api_key="stand-in-key", base_url=base_url, max_concurrency=2)
+        for _ in range(3)
+    ]
+    
+    # Separate provider instances share one client and one limit
+    await asyncio.gather(*[
+        providers[i % 3].generate_text(f"Prompt {i}") for i in range(6)
+    ])
+    
+    assert llm_stand_in_server.requests == 6
+    assert llm_stand_in_server.max_in_flight <= 2
+    assert providers[0]._get_async_client() == providers[2]._get_async_client()
+    
+    await close_shared_clients()
+
+
+@pytest.mark.asyncio
+async def test_fluxus_textus_openai(llm_stand_in_server):
+    """
+    Test that stream_text yields the OpenAI response in pieces.
+    (Test text streaming)
+    """
+    provider = OpenAIProvider(
+        model_name="gpt-4",
+        api_key="stand-in-key",
+        base_url=f"{llm_stand_in_server.url}/v1"
+    )
+    
+    chunks = [chunk async for chunk in provider.stream_text("Ave Caesar")]
+    
+    assert len(chunks) == 3
+    assert "".join(chunks) == "Echo: Ave Caesar"
+    
+    await close_shared_clients()
+
+
 # --- Ollama Provider Tests ---
 
 def test_responsio_completionis_ollama(mock_ollama_provider):
@@ -176,7 +248,7 @@ def test_tractatio_erroris_ollama():
     (Test error handling)
     """
     # Create a provider that will raise an error
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         mock_post.side_effect = Exception("Connection error")
         provider = OllamaProvider(model_name="mistral:7b", api_base="http://invalid-url")
         
@@ -189,6 +261,67 @@ def test_tractatio_erroris_ollama():
         assert "Error generating response" in chat_result["choices"][0]["message"]["content"]
 
 
+def test_sessio_perpetua_ollama(llm_stand_in_server):
+    """
+    Test that sync Ollama calls reuse one keep-alive connection.
+    (Test persistent session)
+    """
+    with OllamaProvider(model_name="mistral:7b", api_base=llm_stand_in_server.url) as provider:
+        for i in range(3):
+            assert provider.generate_completion(f"Prompt {i}") == f"Echo: Prompt {i}"
+        chat = provider.generate_chat_completion([{"role": "user", "content": "Salve"}])
+        assert chat["choices"][0]["message"]["content"] == "Echo: Salve"
+        
+        stats = provider.get_connection_stats()
+        assert stats["sync_opened"] == 1
+        assert stats["sync_reused"] == 3
+    
+    # Leaving the context closes the session but keeps the counters
+    assert provider._session is None
+    assert provider.get_connection_stats()["sync_opened"] == 1
+    assert llm_stand_in_server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_sessio_perpetua_async_ollama(llm_stand_in_server):
+    """
+    Test that async Ollama calls from separate providers share a pooled aiohttp session.
+    (Test persistent async session)
+    """
+    providers = [
+        OllamaProvider(model_name="mistral:7b", api_base=llm_stand_in_server.url, pool_size=2)
+        for _ in range(3)
+    ]
+    results = await asyncio.gather(*[
+        providers[i % 3].generate_text(f"Prompt {i}") for i in range(6)
+    ])
+    assert results == [f"Echo: Prompt {i}" for i in range(6)]
+    
+    # Each provider counts its own requests, all over the same two connections
+    stats = [provider.get_connection_stats() for provider in providers]
+    assert sum(s["async_opened"] for s in stats) <= 2
+    assert all(s["async_opened"] + s["async_reused"] == 2 for s in stats)
+    assert llm_stand_in_server.connections <= 2
+    assert llm_stand_in_server.max_in_flight <= 2
+    
+    session = providers[0]._get_async_session()
+    await close_shared_sessions()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_fluxus_textus_ollama(llm_stand_in_server):
+    """
+    Test that stream_text yields Ollama's NDJSON chunks as they arrive.
+    (Test text streaming)
+    """
+    async with OllamaProvider(model_name="mistral:7b", api_base=llm_stand_in_server.url) as provider:
+        chunks = [chunk async for chunk in provider.stream_text("Ave Caesar", priority=1)]
+    await close_shared_sessions()
+    
+    assert chunks == ["Echo: ", "Ave ", "Caesar"]
+
+
 # --- Integration tests for both providers ---
 
 @needs_openai
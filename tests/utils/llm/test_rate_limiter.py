@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Roman Senate AI Game - LLM Rate Limiter Tests
+Tests for the shared rate limiter and retry scheduler using Latin function names.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+
+from roman_senate.utils.llm.ollama_provider import OllamaProvider, close_shared_sessions
+from roman_senate.utils.llm.rate_limiter import (
+    RateLimiter, RequestPriority, TokenBucket, is_retryable
+)
+
+
+class StatusError(Exception):
+    """Error carrying an HTTP status code, like the provider client errors."""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.mark.asyncio
+async def test_ordo_prioritatis():
+    """
+    Test that queued speech requests are admitted before background ones.
+    (Test priority order)
+    """
+    limiter = RateLimiter(requests_per_minute=1200)
+    limiter._requests.tokens = 0  # Start with an empty bucket so requests queue up
+    admitted = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority=priority)
+        admitted.append(name)
+
+    background = [asyncio.create_task(request(f"rumor{i}", RequestPriority.BACKGROUND)) for i in range(3)]
+    await asyncio.sleep(0)
+    speech = asyncio.create_task(request("speech", RequestPriority.SPEECH))
+    await asyncio.gather(speech, *background)
+
+    assert admitted[0] == "speech"
+    assert admitted[1:] == ["rumor0", "rumor1", "rumor2"]
+    assert limiter.get_stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_limes_per_minutam():
+    """
+    Test that the request bucket spaces requests at the configured rate.
+    (Test requests per minute)
+    """
+    limiter = RateLimiter(requests_per_minute=600)  # One request per 0.1s once drained
+    limiter._requests.tokens = 0
+
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.25
+    assert limiter.get_stats()["admitted"] == 3
+
+
+def test_situla_signorum():
+    """
+    Test the token bucket arithmetic for the tokens-per-minute budget.
+    (Test token bucket)
+    """
+    bucket = TokenBucket(rate_per_minute=600)
+    now = bucket.updated
+
+    assert bucket.delay_for(600, now) == 0.0
+    bucket.consume(600)
+    assert bucket.delay_for(60, now) == pytest.approx(6.0)
+    # Requests larger than the bucket are clamped to its capacity
+    assert bucket.delay_for(10 ** 6, now + 60) == 0.0
+    assert TokenBucket(None).delay_for(10 ** 6, now) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_iteratio_post_errorem():
+    """
+    Test retries with backoff on 429/5xx and adaptive slowdown on 429.
+    (Test retry after error)
+    """
+    limiter = RateLimiter(requests_per_minute=600, max_retries=3, base_delay=0.01, max_delay=0.05)
+    errors = [StatusError(429), StatusError(503)]
+
+    async def flaky():
+        if errors:
+            raise errors.pop(0)
+        return "Veni, vidi, vici"
+
+    assert await limiter.run(flaky) == "Veni, vidi, vici"
+
+    stats = limiter.get_stats()
+    assert stats["retries"] == 2
+    assert stats["throttled"] == 1
+    assert stats["current_requests_per_minute"] < 600
+
+
+@pytest.mark.asyncio
+async def test_error_non_iterandus():
+    """
+    Test that client errors are raised without retrying.
+    (Test non-retryable errors)
+    """
+    limiter = RateLimiter(max_retries=3, base_delay=0.01)
+    calls = []
+
+    async def invalid():
+        calls.append(1)
+        raise StatusError(400)
+
+    with pytest.raises(StatusError):
+        await limiter.run(invalid)
+
+    assert len(calls) == 1
+    assert is_retryable(StatusError(502))
+    assert is_retryable(ConnectionResetError())
+    assert not is_retryable(ValueError("bad prompt"))
+
+
+def test_mora_aleatoria():
+    """
+    Test that retry delays use full jitter below the exponential ceiling.
+    (Test backoff jitter)
+    """
+    limiter = RateLimiter(base_delay=1.0, max_delay=8.0)
+    delays = [limiter.backoff_delay(2) for _ in range(200)]
+
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert min(delays) < 2.0
+    assert all(delay <= 8.0 for delay in (limiter.backoff_delay(10) for _ in range(20)))
+
+
+@pytest.mark.asyncio
+async def test_provider_iterat_ollama(llm_stand_in_server):
+    """
+    Test that the Ollama provider retries 503s instead of returning error text.
+    (Test provider retries)
+    """
+    llm_stand_in_server.fail_next = 2
+    with patch("roman_senate.utils.config.LLM_RETRY_BASE_DELAY", 0.01):
+        async with OllamaProvider(model_name="mistral:7b", api_base=llm_stand_in_server.url) as provider:
+            result = await provider.generate_text("Salve", priority=RequestPriority.SPEECH)
+    await close_shared_sessions()
+
+    assert result == "Echo: Salve"
+    assert llm_stand_in_server.requests == 1
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Roman Senate AI Game - LLM Response Cache Tests
+Tests for the content-addressed response cache using Latin function names.
+"""
+
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from roman_senate.utils.llm.base import LLMProvider
+from roman_senate.utils.llm.factory import get_llm_provider
+from roman_senate.utils.llm.ollama_provider import OllamaProvider
+from roman_senate.utils.llm.response_cache import ResponseCache, CachedLLMProvider
+
+
+class CountingProvider(LLMProvider):
+    """Provider stub that counts the calls reaching it."""
+
+    def __init__(self, model_name="counting-model", fail=False):
+        self.model_name = model_name
+        self.fail = fail
+        self.calls = 0
+
+    def generate_completion(self, prompt, temperature=0.7, max_tokens=500, **kwargs):
+        self.calls += 1
+        if self.fail:
+            return "[Error generating text: offline]"
+        return f"Response {self.calls} to {prompt}"
+
+    def generate_chat_completion(self, messages, temperature=0.7, max_tokens=500, **kwargs):
+        self.calls += 1
+        return {"choices": [{"message": {"role": "assistant", "content": f"Reply {self.calls}"}, "index": 0}]}
+
+    async def generate_text(self, prompt, **kwargs):
+        self.calls += 1
+        return f"Text {self.calls} for {prompt}"
+
+
+def test_memoria_responsionum():
+    """
+    Test that repeated deterministic requests are served from memory.
+    (Test response memory)
+    """
+    inner = CountingProvider()
+    provider = CachedLLMProvider(inner)
+
+    first = provider.generate_completion("Carthago delenda est", temperature=0)
+    second = provider.generate_completion("Carthago delenda est", temperature=0)
+    other = provider.generate_completion("Carthago delenda est", temperature=0, max_tokens=50)
+
+    assert first == second
+    assert other != first
+    assert inner.calls == 2
+
+    stats = provider.get_cache_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+def test_archivum_in_disco(tmp_path):
+    """
+    Test that the SQLite tier survives a new cache instance.
+    (Test on-disk archive)
+    """
+    path = str(tmp_path / "responses.sqlite3")
+    first_cache = ResponseCache(path)
+    CachedLLMProvider(CountingProvider(), cache=first_cache).generate_chat_completion(
+        [{"role": "user", "content": "Salve"}], temperature=0
+    )
+    first_cache.close()
+
+    inner = CountingProvider()
+    second_cache = ResponseCache(path)
+    result = CachedLLMProvider(inner, cache=second_cache).generate_chat_completion(
+        [{"role": "user", "content": "Salve"}], temperature=0
+    )
+
+    assert result["choices"][0]["message"]["content"] == "Reply 1"
+    assert inner.calls == 0
+    assert second_cache.get_stats()["disk_hits"] == 1
+    second_cache.close()
+
+
+def test_expiratio_et_evictio(tmp_path):
+    """
+    Test TTL expiry and size-based eviction.
+    (Test expiry and eviction)
+    """
+    cache = ResponseCache(str(tmp_path / "responses.sqlite3"), ttl=60, max_memory_entries=2, max_disk_entries=3)
+
+    for i in range(5):
+        cache.set(f"key{i}", f"value{i}")
+
+    stats = cache.get_stats()
+    assert stats["memory_entries"] == 2
+    assert cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 3
+    assert cache.get("key0") is None
+    assert cache.get("key4") == "value4"
+
+    # Entries older than the TTL are treated as misses and removed
+    with patch("roman_senate.utils.llm.response_cache.time.time", return_value=10 ** 12):
+        assert cache.get("key4") is None
+    assert cache.get_stats()["expired"] >= 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_temperatura_praeterit():
+    """
+    Test that sampled requests bypass the cache unless opted in.
+    (Test temperature bypass)
+    """
+    inner = CountingProvider()
+    provider = CachedLLMProvider(inner)
+
+    await provider.generate_text("Oratio", temperature=0.8)
+    await provider.generate_text("Oratio", temperature=0.8)
+    assert inner.calls == 2
+    assert provider.get_cache_stats()["bypassed"] == 2
+
+    opted_in = CachedLLMProvider(inner, cache_nondeterministic=True)
+    await opted_in.generate_text("Oratio", temperature=0.8)
+    await opted_in.generate_text("Oratio", temperature=0.8)
+    assert inner.calls == 3
+
+
+def test_errores_non_servantur():
+    """
+    Test that provider error strings are never cached.
+    (Test errors are not cached)
+    """
+    inner = CountingProvider(fail=True)
+    provider = CachedLLMProvider(inner)
+
+    provider.generate_completion("Prompt", temperature=0)
+    provider.generate_completion("Prompt", temperature=0)
+
+    assert inner.calls == 2
+    assert provider.get_cache_stats()["stores"] == 0
+
+
+def test_fabrica_cum_memoria(tmp_path):
+    """
+    Test that the factory wraps providers in the shared cache on request.
+    (Test factory cache selection)
+    """
+    with patch("roman_senate.utils.config.LLM_RESPONSE_CACHE_PATH", str(tmp_path / "shared.sqlite3")):
+        provider = get_llm_provider(provider_type="ollama", model_name="mistral:7b", cache=True)
+        another = get_llm_provider(provider_type="ollama", model_name="mistral:7b", cache=True)
+
+    assert isinstance(provider, CachedLLMProvider)
+    assert isinstance(provider.provider, OllamaProvider)
+    assert provider.model_name == "mistral:7b"
+    assert provider.cache is another.cache
+
+    plain = get_llm_provider(provider_type="ollama", model_name="mistral:7b", cache=False)
+    assert isinstance(plain, OllamaProvider)
+
+
+@pytest.mark.asyncio
+async def test_fluxus_e_memoria():
+    """
+    Test that a streamed response is stored and replayed for later calls.
+    (Test streaming through the cache)
+    """
+    inner = CountingProvider()
+    provider = CachedLLMProvider(inner)
+
+    first = [chunk async for chunk in provider.stream_text("Oratio", temperature=0)]
+    second = [chunk async for chunk in provider.stream_text("Oratio", temperature=0)]
+    text = await provider.generate_text("Oratio", temperature=0)
+
+    # The default stream_text yields the whole generate_text result as one chunk
+    assert first == second == ["Text 1 for Oratio"]
+    assert text == "Text 1 for Oratio"
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_discus_extra_ansam(tmp_path):
+    """
+    Test that async lookups and stores do their SQLite work off the event loop.
+    (Test disk I/O off the loop)
+    """
+    path = str(tmp_path / "responses.sqlite3")
+    cache = ResponseCache(path, max_memory_entries=1, max_disk_entries=2)
+    provider = CachedLLMProvider(CountingProvider(), cache=cache)
+    loop_thread = threading.get_ident()
+    disk_threads = []
+    original_set_disk = cache._set_disk
+
+    def recording_set_disk(*args):
+        disk_threads.append(threading.get_ident())
+        original_set_disk(*args)
+
+    with patch.object(cache, "_set_disk", recording_set_disk):
+        for prompt in ("Prima", "Secunda", "Tertia"):
+            await provider.generate_text(prompt, temperature=0)
+        # The memory tier holds only "Tertia", so this is a disk hit
+        assert await provider.generate_text("Secunda", temperature=0) == "Text 2 for Secunda"
+
+    assert len(disk_threads) == 3 and loop_thread not in disk_threads
+    assert cache.get_stats()["disk_hits"] == 1
+    assert cache._disk_entries == 2
+    cache.close()
+
+    # The running row count is restored from the table
+    reopened = ResponseCache(path)
+    assert reopened._disk_entries == 2
+    reopened.close()